@@ -0,0 +1,18 @@
+from typing import List
+
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption("--run-benchmarks", action="store_true", default=False, help="run the benchmarks, as well")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item]) -> None:
+    # Benchmarks are skipped (unless requested), no matter what markers are selected using "-m".
+    if config.getoption("--run-benchmarks"):
+        return
+
+    skip_benchmark = pytest.mark.skip(reason="benchmark (run using: pytest --run-benchmarks -m benchmark -s multiversx_sdk/benchmarks)")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
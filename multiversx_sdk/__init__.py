@@ -1,3 +1,6 @@
+from multiversx_sdk.adapters.caching_query_runner import (CachingQueryRunner,
+                                                          QueryCachePolicy,
+                                                          QueryCacheStats)
 from multiversx_sdk.adapters.query_runner_adapter import QueryRunnerAdapter
 from multiversx_sdk.converters.transactions_converter import \
     TransactionsConverter
@@ -16,6 +19,8 @@ from multiversx_sdk.core.token_payment import TokenPayment
 from multiversx_sdk.core.tokens import (Token, TokenComputer,
                                         TokenIdentifierParts, TokenTransfer)
 from multiversx_sdk.core.transaction import Transaction
+from multiversx_sdk.core.transaction_batch import (TransactionBatch,
+                                                   TransactionInBatch)
 from multiversx_sdk.core.transaction_computer import TransactionComputer
 from multiversx_sdk.core.transaction_payload import TransactionPayload
 from multiversx_sdk.core.transactions_factories.account_transactions_factory import \
@@ -35,8 +40,9 @@ from multiversx_sdk.core.transactions_factories.transfer_transactions_factory im
 from multiversx_sdk.core.transactions_outcome_parsers.delegation_transactions_outcome_parser import \
     DelegationTransactionsOutcomeParser
 from multiversx_sdk.core.transactions_outcome_parsers.resources import (
-    SmartContractResult, TransactionEvent, TransactionLogs, TransactionOutcome,
-    find_events_by_first_topic, find_events_by_identifier)
+    SmartContractResult, TransactionEvent, TransactionEventsIndex,
+    TransactionLogs, TransactionOutcome, find_events_by_first_topic,
+    find_events_by_identifier)
 from multiversx_sdk.core.transactions_outcome_parsers.smart_contract_transactions_outcome_parser import \
     SmartContractTransactionsOutcomeParser
 from multiversx_sdk.core.transactions_outcome_parsers.token_management_transactions_outcome_parser import \
@@ -46,13 +52,39 @@ from multiversx_sdk.core.transactions_outcome_parsers.transaction_events_parser
 from multiversx_sdk.network_providers.api_network_provider import \
     ApiNetworkProvider
 from multiversx_sdk.network_providers.errors import GenericError
+from multiversx_sdk.network_providers.gas_estimator import (GasEstimate,
+                                                            GasEstimator)
+from multiversx_sdk.network_providers.hyperblock_follower import \
+    HyperblockFollower
+from multiversx_sdk.network_providers.hyperblocks import (
+    FileCheckpointStore, HyperblockOnNetwork, InMemoryCheckpointStore)
+from multiversx_sdk.network_providers.hyperblocks_backfiller import (
+    BackfillProgress, HyperblocksBackfiller)
+from multiversx_sdk.network_providers.instrumentation import (IRequestHook,
+                                                              MetricsCollector,
+                                                              RequestEvent)
+from multiversx_sdk.network_providers.local_proxy_server import \
+    LocalProxyServer
+from multiversx_sdk.network_providers.network_simulator import (
+    NetworkSimulator, SimulatedAccount, TransactionRejectedError,
+    create_simulator_proxy_server)
+from multiversx_sdk.network_providers.nonce_manager import (NonceManager,
+                                                            NonceSyncResult)
 from multiversx_sdk.network_providers.proxy_network_provider import \
     ProxyNetworkProvider
+from multiversx_sdk.network_providers.rate_limiter import (RateLimiter,
+                                                           RateLimiterMetrics,
+                                                           RetryPolicy)
+from multiversx_sdk.network_providers.recording import (
+    RecordingReader, RecordingWriter, create_recording_session,
+    create_replay_session)
 from multiversx_sdk.network_providers.resources import GenericResponse
 from multiversx_sdk.network_providers.transaction_awaiter import \
     TransactionAwaiter
 from multiversx_sdk.network_providers.transaction_decoder import (
     TransactionDecoder, TransactionMetadata)
+from multiversx_sdk.network_providers.transactions_broadcaster import (
+    BroadcastedTransaction, BroadcastResult, TransactionsBroadcaster)
 from multiversx_sdk.wallet.mnemonic import Mnemonic
 from multiversx_sdk.wallet.user_keys import UserPublicKey, UserSecretKey
 from multiversx_sdk.wallet.user_pem import UserPEM
@@ -68,11 +100,12 @@ from multiversx_sdk.wallet.validator_verifier import ValidatorVerifier
 __all__ = [
     "AccountNonceHolder", "Address", "AddressFactory", "AddressComputer",
     "Transaction", "TransactionPayload", "TransactionComputer",
+    "TransactionBatch", "TransactionInBatch",
     "Message", "MessageComputer", "CodeMetadata", "TokenPayment",
     "ContractQuery", "ContractQueryBuilder",
     "Token", "TokenComputer", "TokenTransfer", "TokenIdentifierParts",
     "TokenManagementTransactionsOutcomeParser", "SmartContractResult",
-    "TransactionEvent", "TransactionLogs", "TransactionOutcome",
+    "TransactionEvent", "TransactionEventsIndex", "TransactionLogs", "TransactionOutcome",
     "DelegationTransactionsFactory", "TokenManagementTransactionsFactory",
     "RegisterAndSetAllRolesTokenType", "TransactionsFactoryConfig",
     "SmartContractTransactionsFactory", "TransferTransactionsFactory",
@@ -83,5 +116,15 @@ __all__ = [
     "UserWallet", "UserPEM", "QueryRunnerAdapter", "TransactionsConverter", "DelegationTransactionsOutcomeParser",
     "find_events_by_identifier", "find_events_by_first_topic", "SmartContractTransactionsOutcomeParser", "TransactionAwaiter",
     "SmartContractQueriesController", "SmartContractQuery", "SmartContractQueryResponse",
-    "TransactionDecoder", "TransactionMetadata", "TransactionEventsParser"
+    "TransactionDecoder", "TransactionMetadata", "TransactionEventsParser",
+    "TransactionsBroadcaster", "BroadcastResult", "BroadcastedTransaction",
+    "HyperblockFollower", "HyperblockOnNetwork", "InMemoryCheckpointStore", "FileCheckpointStore",
+    "HyperblocksBackfiller", "BackfillProgress",
+    "RateLimiter", "RateLimiterMetrics", "RetryPolicy",
+    "IRequestHook", "RequestEvent", "MetricsCollector",
+    "RecordingReader", "RecordingWriter", "create_recording_session", "create_replay_session",
+    "CachingQueryRunner", "QueryCachePolicy", "QueryCacheStats",
+    "NonceManager", "NonceSyncResult",
+    "GasEstimator", "GasEstimate",
+    "NetworkSimulator", "SimulatedAccount", "TransactionRejectedError", "create_simulator_proxy_server", "LocalProxyServer"
 ]
@@ -1,3 +1,6 @@
+from multiversx_sdk.adapters.caching_query_runner import (CachingQueryRunner,
+                                                          QueryCachePolicy,
+                                                          QueryCacheStats)
 from multiversx_sdk.adapters.query_runner_adapter import QueryRunnerAdapter
 
-__all__ = ["QueryRunnerAdapter"]
+__all__ = ["QueryRunnerAdapter", "CachingQueryRunner", "QueryCachePolicy", "QueryCacheStats"]
@@ -0,0 +1,248 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import (Any, Dict, Hashable, List, Optional, Protocol, Sequence,
+                    Tuple)
+
+from multiversx_sdk.adapters.query_runner_adapter import get_query_key
+from multiversx_sdk.core.smart_contract_query import (
+    SmartContractQuery, SmartContractQueryResponse)
+
+ONE_SECOND_IN_MILLISECONDS = 1000
+
+logger = logging.getLogger(__name__)
+
+
+class IQueryRunner(Protocol):
+    def run_query(self, query: SmartContractQuery) -> SmartContractQueryResponse:
+        ...
+
+
+class INetworkStatus(Protocol):
+    nonce: int
+    current_round: int
+
+
+class INetworkStatusProvider(Protocol):
+    def get_network_status(self) -> INetworkStatus:
+        ...
+
+
+class QueryCachePolicy:
+    def __init__(self, ttl_in_milliseconds: Optional[int] = None, expire_on_new_block: bool = True, cacheable: bool = True) -> None:
+        """
+        Args:
+            ttl_in_milliseconds (Optional[int]): If provided, the cached responses expire after this long.
+            expire_on_new_block (bool): If set, the cached responses expire when a new block (or round) is seen.
+            cacheable (bool): If not set, the responses are never cached.
+        """
+        self.ttl_in_milliseconds = ttl_in_milliseconds
+        self.expire_on_new_block = expire_on_new_block
+        self.cacheable = cacheable
+
+    @staticmethod
+    def forever() -> "QueryCachePolicy":
+        """For immutable getters (e.g. the identifier of a token issued by the contract)."""
+        return QueryCachePolicy(expire_on_new_block=False)
+
+    @staticmethod
+    def never() -> "QueryCachePolicy":
+        return QueryCachePolicy(cacheable=False)
+
+
+class QueryCacheStats:
+    def __init__(self) -> None:
+        self.num_hits = 0
+        self.num_misses = 0
+        self.num_evictions = 0
+        self.num_entries = 0
+
+    def to_dictionary(self) -> Dict[str, Any]:
+        return {
+            "numHits": self.num_hits,
+            "numMisses": self.num_misses,
+            "numEvictions": self.num_evictions,
+            "numEntries": self.num_entries
+        }
+
+
+class _CacheEntry:
+    def __init__(self, response: SmartContractQueryResponse, block_marker: Tuple[int, int], expires_at: Optional[float], expire_on_new_block: bool) -> None:
+        self.response = response
+        self.block_marker = block_marker
+        self.expires_at = expires_at
+        self.expire_on_new_block = expire_on_new_block
+
+
+class CachingQueryRunner:
+    """
+    Wraps a query runner (e.g. "QueryRunnerAdapter"), caching the successful query responses, keyed by contract,
+    function, arguments, caller and value. By default, cached responses expire when a new block (or round) is seen
+    through "get_network_status()" (which is polled at most once per "block_check_interval_in_milliseconds"),
+    or after a TTL. Per-function policies can override this (e.g. "QueryCachePolicy.forever()").
+
+    Can be used as the query runner of "SmartContractQueriesController".
+    """
+
+    def __init__(self,
+                 query_runner: IQueryRunner,
+                 network_status_provider: Optional[INetworkStatusProvider] = None,
+                 ttl_in_milliseconds: Optional[int] = 6000,
+                 max_entries: int = 10000,
+                 block_check_interval_in_milliseconds: int = 1000,
+                 policies: Optional[Dict[str, QueryCachePolicy]] = None) -> None:
+        """
+        Args:
+            query_runner (IQueryRunner): The wrapped query runner.
+            network_status_provider (Optional[INetworkStatusProvider]): Used to detect new blocks (e.g. a network provider). If not provided, only the TTL applies (unless "notify_new_block()" is called). If fetching the status fails, the last block seen is kept.
+            ttl_in_milliseconds (Optional[int]): The default time to live of the cached responses. If None, they only expire on new blocks.
+            max_entries (int): The maximum number of cached responses; the least recently used ones are evicted first.
+            block_check_interval_in_milliseconds (int): How often (at most) the network status is fetched.
+            policies (Optional[Dict[str, QueryCachePolicy]]): Caching policies, by function name.
+        """
+        self.query_runner = query_runner
+        self.network_status_provider = network_status_provider
+        self.default_policy = QueryCachePolicy(ttl_in_milliseconds)
+        self.max_entries = max_entries
+        self.block_check_interval_in_milliseconds = block_check_interval_in_milliseconds
+        self.policies: Dict[str, QueryCachePolicy] = dict(policies or {})
+
+        self._entries: "OrderedDict[Tuple[Hashable, ...], _CacheEntry]" = OrderedDict()
+        self._block_marker: Tuple[int, int] = (0, 0)
+        self._block_checked_at: Optional[float] = None
+        self._stats = QueryCacheStats()
+        self._lock = threading.Lock()
+
+    def set_policy(self, function: str, policy: QueryCachePolicy) -> None:
+        self.policies[function] = policy
+
+    def run_query(self, query: SmartContractQuery) -> SmartContractQueryResponse:
+        return self.run_queries([query])[0]
+
+    def run_queries(self, queries: Sequence[SmartContractQuery]) -> List[SmartContractQueryResponse]:
+        """Returns the cached responses, and runs the other queries (as a batch, if supported by the wrapped runner)."""
+        self._refresh_block_marker()
+
+        # The responses are bound to the block seen before running the queries: if a new block is seen meanwhile, they are already stale.
+        with self._lock:
+            block_marker = self._block_marker
+
+        responses: List[Optional[SmartContractQueryResponse]] = [self._get_cached(query) for query in queries]
+        missing = [index for index, response in enumerate(responses) if response is None]
+
+        if missing:
+            missing_responses = self._run_queries([queries[index] for index in missing])
+
+            for index, response in zip(missing, missing_responses):
+                responses[index] = response
+                self._put(queries[index], response, block_marker)
+
+        return [response for response in responses if response is not None]
+
+    def notify_new_block(self, nonce: int, round: int = 0) -> None:
+        """Signals a new block (e.g. as seen by a "HyperblockFollower"), so that the block-bound responses expire."""
+        with self._lock:
+            self._block_marker = (nonce, round)
+            self._block_checked_at = time.monotonic()
+
+    def invalidate(self, contract: Optional[str] = None) -> None:
+        """Removes the cached responses (all of them, or the ones of a contract)."""
+        with self._lock:
+            if contract is None:
+                self._entries.clear()
+                return
+
+            for key in [key for key in self._entries if key[0] == contract]:
+                del self._entries[key]
+
+    def get_stats(self) -> QueryCacheStats:
+        with self._lock:
+            stats = QueryCacheStats()
+            stats.num_hits = self._stats.num_hits
+            stats.num_misses = self._stats.num_misses
+            stats.num_evictions = self._stats.num_evictions
+            stats.num_entries = len(self._entries)
+            return stats
+
+    def _run_queries(self, queries: List[SmartContractQuery]) -> List[SmartContractQueryResponse]:
+        run_queries = getattr(self.query_runner, "run_queries", None)
+
+        if run_queries is None:
+            return [self.query_runner.run_query(query) for query in queries]
+
+        responses: List[SmartContractQueryResponse] = run_queries(queries)
+        return responses
+
+    def _get_policy(self, query: SmartContractQuery) -> QueryCachePolicy:
+        return self.policies.get(query.function, self.default_policy)
+
+    def _get_cached(self, query: SmartContractQuery) -> Optional[SmartContractQueryResponse]:
+        key = get_query_key(query)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and self._is_expired(entry):
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                self._stats.num_misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats.num_hits += 1
+            return entry.response
+
+    def _put(self, query: SmartContractQuery, response: SmartContractQueryResponse, block_marker: Tuple[int, int]) -> None:
+        policy = self._get_policy(query)
+
+        if not policy.cacheable or response.return_code != "ok":
+            return
+
+        expires_at = None
+        if policy.ttl_in_milliseconds is not None:
+            expires_at = time.monotonic() + policy.ttl_in_milliseconds / ONE_SECOND_IN_MILLISECONDS
+
+        key = get_query_key(query)
+
+        with self._lock:
+            self._entries[key] = _CacheEntry(response, block_marker, expires_at, policy.expire_on_new_block)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.num_evictions += 1
+
+    def _is_expired(self, entry: _CacheEntry) -> bool:
+        if entry.expires_at is not None and time.monotonic() >= entry.expires_at:
+            return True
+        return entry.expire_on_new_block and entry.block_marker != self._block_marker
+
+    def _refresh_block_marker(self) -> None:
+        if self.network_status_provider is None:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            checked_recently = self._block_checked_at is not None and (now - self._block_checked_at) * ONE_SECOND_IN_MILLISECONDS < self.block_check_interval_in_milliseconds
+            if checked_recently:
+                return
+
+            # Concurrent callers don't fetch the status again, while it's being fetched.
+            previously_checked_at = self._block_checked_at
+            self._block_checked_at = now
+
+        try:
+            status = self.network_status_provider.get_network_status()
+        except Exception as error:
+            # The previous block marker is kept (the TTL still applies), and the status is fetched again on the next call.
+            logger.warning(f"cannot fetch the network status, the cached responses are kept: {error}")
+            with self._lock:
+                if self._block_checked_at == now:
+                    self._block_checked_at = previously_checked_at
+            return
+
+        with self._lock:
+            self._block_marker = (status.nonce, status.current_round)
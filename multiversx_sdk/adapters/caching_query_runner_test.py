@@ -0,0 +1,202 @@
+import time
+from typing import List
+
+from multiversx_sdk.adapters.caching_query_runner import (CachingQueryRunner,
+                                                          QueryCachePolicy)
+from multiversx_sdk.core.smart_contract_queries_controller import \
+    SmartContractQueriesController
+from multiversx_sdk.core.smart_contract_query import (
+    SmartContractQuery, SmartContractQueryResponse)
+from multiversx_sdk.network_providers.network_status import NetworkStatus
+from multiversx_sdk.testutils.addresses import CONTRACT, OTHER_CONTRACT
+
+
+class CountingQueryRunner:
+    def __init__(self) -> None:
+        self.queries: List[SmartContractQuery] = []
+
+    def run_query(self, query: SmartContractQuery) -> SmartContractQueryResponse:
+        self.queries.append(query)
+        return_code = "user error" if query.function == "fail" else "ok"
+        return SmartContractQueryResponse(query.function, return_code, "", [len(self.queries).to_bytes(1, "big")])
+
+
+class FakeNetworkStatusProvider:
+    def __init__(self) -> None:
+        self.status = NetworkStatus()
+        self.num_requests = 0
+        self.num_failures = 0
+
+    def get_network_status(self) -> NetworkStatus:
+        self.num_requests += 1
+        if self.num_failures > 0:
+            self.num_failures -= 1
+            raise Exception("cannot fetch the network status")
+        return self.status
+
+
+def test_responses_are_cached_by_query():
+    runner = CountingQueryRunner()
+    cache = CachingQueryRunner(runner)
+
+    first = cache.run_query(SmartContractQuery(CONTRACT, "getSum", [b"\x01"]))
+    assert cache.run_query(SmartContractQuery(CONTRACT, "getSum", [b"\x01"])) is first
+    assert len(runner.queries) == 1
+
+    # Any difference in contract, function, arguments, caller or value is a different query.
+    cache.run_query(SmartContractQuery(OTHER_CONTRACT, "getSum", [b"\x01"]))
+    cache.run_query(SmartContractQuery(CONTRACT, "getProduct", [b"\x01"]))
+    cache.run_query(SmartContractQuery(CONTRACT, "getSum", [b"\x02"]))
+    cache.run_query(SmartContractQuery(CONTRACT, "getSum", [b"\x01"], caller=CONTRACT))
+    cache.run_query(SmartContractQuery(CONTRACT, "getSum", [b"\x01"], value=1))
+    assert len(runner.queries) == 6
+
+    stats = cache.get_stats().to_dictionary()
+    assert stats == {"numHits": 1, "numMisses": 6, "numEvictions": 0, "numEntries": 6}
+
+
+def test_failed_queries_are_not_cached():
+    runner = CountingQueryRunner()
+    cache = CachingQueryRunner(runner)
+
+    cache.run_query(SmartContractQuery(CONTRACT, "fail", []))
+    cache.run_query(SmartContractQuery(CONTRACT, "fail", []))
+    assert len(runner.queries) == 2
+
+
+def test_responses_expire_on_new_block():
+    runner = CountingQueryRunner()
+    status_provider = FakeNetworkStatusProvider()
+    cache = CachingQueryRunner(runner, status_provider, ttl_in_milliseconds=None, block_check_interval_in_milliseconds=0)
+    cache.set_policy("getTokenIdentifier", QueryCachePolicy.forever())
+
+    sum_query = SmartContractQuery(CONTRACT, "getSum", [])
+    token_query = SmartContractQuery(CONTRACT, "getTokenIdentifier", [])
+
+    cache.run_queries([sum_query, token_query])
+    cache.run_queries([sum_query, token_query])
+    assert len(runner.queries) == 2
+
+    status_provider.status.nonce = 1
+    cache.run_queries([sum_query, token_query])
+    assert [query.function for query in runner.queries] == ["getSum", "getTokenIdentifier", "getSum"]
+
+    status_provider.status.current_round = 2
+    cache.run_query(sum_query)
+    assert len(runner.queries) == 4
+
+    cache.notify_new_block(nonce=3, round=3)
+    cache.run_query(token_query)
+    assert len(runner.queries) == 4
+
+
+def test_responses_are_bound_to_the_block_seen_before_running_the_queries():
+    runner = CountingQueryRunner()
+    cache = CachingQueryRunner(runner, ttl_in_milliseconds=None)
+    query = SmartContractQuery(CONTRACT, "getSum", [])
+
+    class RunnerSeeingNewBlock:
+        def run_query(self, query: SmartContractQuery) -> SmartContractQueryResponse:
+            # A new block is seen while the query is running.
+            cache.notify_new_block(nonce=1)
+            return runner.run_query(query)
+
+    cache.query_runner = RunnerSeeingNewBlock()
+    cache.run_query(query)
+    cache.run_query(query)
+    assert len(runner.queries) == 2
+
+
+def test_network_status_is_polled_at_most_once_per_interval():
+    status_provider = FakeNetworkStatusProvider()
+    cache = CachingQueryRunner(CountingQueryRunner(), status_provider, block_check_interval_in_milliseconds=60000)
+
+    for _ in range(10):
+        cache.run_query(SmartContractQuery(CONTRACT, "getSum", []))
+
+    assert status_provider.num_requests == 1
+
+
+def test_failures_of_the_network_status_provider():
+    runner = CountingQueryRunner()
+    status_provider = FakeNetworkStatusProvider()
+    status_provider.num_failures = 3
+    cache = CachingQueryRunner(runner, status_provider, ttl_in_milliseconds=50, block_check_interval_in_milliseconds=60000)
+    query = SmartContractQuery(CONTRACT, "getSum", [])
+
+    # The queries don't fail, and the cached responses are still served (the last block seen is kept).
+    assert cache.run_query(query).return_data_parts == [b"\x01"]
+    assert cache.run_queries([query])[0].return_data_parts == [b"\x01"]
+    assert len(runner.queries) == 1
+
+    # The TTL still applies.
+    time.sleep(0.06)
+    assert cache.run_query(query).return_data_parts == [b"\x02"]
+
+    # The status is fetched again on each call (instead of once per interval), until it's available: then, the new block is seen.
+    status_provider.status.nonce = 1
+    assert cache.run_query(query).return_data_parts == [b"\x03"]
+    assert status_provider.num_requests == 4
+
+    cache.run_query(query)
+    assert status_provider.num_requests == 4
+
+
+def test_responses_expire_after_ttl():
+    runner = CountingQueryRunner()
+    cache = CachingQueryRunner(runner, ttl_in_milliseconds=50, policies={"getConfig": QueryCachePolicy(ttl_in_milliseconds=60000)})
+
+    cache.run_queries([SmartContractQuery(CONTRACT, "getSum", []), SmartContractQuery(CONTRACT, "getConfig", [])])
+    time.sleep(0.06)
+    cache.run_queries([SmartContractQuery(CONTRACT, "getSum", []), SmartContractQuery(CONTRACT, "getConfig", [])])
+
+    assert [query.function for query in runner.queries] == ["getSum", "getConfig", "getSum"]
+
+
+def test_never_policy():
+    runner = CountingQueryRunner()
+    cache = CachingQueryRunner(runner, policies={"getRandom": QueryCachePolicy.never()})
+
+    cache.run_query(SmartContractQuery(CONTRACT, "getRandom", []))
+    cache.run_query(SmartContractQuery(CONTRACT, "getRandom", []))
+    assert len(runner.queries) == 2
+
+
+def test_least_recently_used_entries_are_evicted():
+    runner = CountingQueryRunner()
+    cache = CachingQueryRunner(runner, max_entries=2)
+    queries = [SmartContractQuery(CONTRACT, "get", [bytes([index])]) for index in range(3)]
+
+    cache.run_query(queries[0])
+    cache.run_query(queries[1])
+    cache.run_query(queries[0])
+    cache.run_query(queries[2])
+    assert cache.get_stats().num_evictions == 1
+
+    # The second query was the least recently used, thus evicted.
+    cache.run_query(queries[0])
+    cache.run_query(queries[1])
+    assert [query.arguments for query in runner.queries] == [[b"\x00"], [b"\x01"], [b"\x02"], [b"\x01"]]
+
+
+def test_invalidate():
+    runner = CountingQueryRunner()
+    cache = CachingQueryRunner(runner)
+
+    cache.run_queries([SmartContractQuery(CONTRACT, "getSum", []), SmartContractQuery(OTHER_CONTRACT, "getSum", [])])
+    cache.invalidate(CONTRACT)
+    cache.run_queries([SmartContractQuery(CONTRACT, "getSum", []), SmartContractQuery(OTHER_CONTRACT, "getSum", [])])
+    assert len(runner.queries) == 3
+
+    cache.invalidate()
+    assert cache.get_stats().num_entries == 0
+
+
+def test_with_controller():
+    runner = CountingQueryRunner()
+    controller = SmartContractQueriesController(CachingQueryRunner(runner))
+
+    assert controller.query(CONTRACT, "getSum", [b"\x07"]) == [b"\x01"]
+    assert controller.query(CONTRACT, "getSum", [b"\x07"]) == [b"\x01"]
+    assert controller.query_multiple([controller.create_query(CONTRACT, "getSum", [7]), controller.create_query(CONTRACT, "getSum", [8])]) == [[b"\x01"], [b"\x02"]]
+    assert len(runner.queries) == 2
@@ -1,4 +1,5 @@
-from typing import List, Optional, Protocol, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Hashable, List, Optional, Protocol, Sequence, Tuple
 
 from multiversx_sdk.core.address import Address
 from multiversx_sdk.core.contract_query import ContractQuery
@@ -40,8 +41,14 @@ class INetworkProvider(Protocol):
 
 
 class QueryRunnerAdapter:
-    def __init__(self, network_provider: INetworkProvider) -> None:
+    def __init__(self, network_provider: INetworkProvider, max_concurrent_queries: int = 16) -> None:
+        """
+        Args:
+            network_provider (INetworkProvider): Used to run the queries (e.g. "ProxyNetworkProvider").
+            max_concurrent_queries (int): How many queries are run at once by "run_queries()".
+        """
         self.network_provider = network_provider
+        self.max_concurrent_queries = max_concurrent_queries
 
     def run_query(self, query: SmartContractQuery) -> SmartContractQueryResponse:
         adapted_query = ContractQuery(
@@ -60,3 +67,30 @@ class QueryRunnerAdapter:
             return_message=adapted_query_response.return_message,
             return_data_parts=adapted_query_response.get_return_data_parts()
         )
+
+    def run_queries(self, queries: Sequence[SmartContractQuery]) -> List[SmartContractQueryResponse]:
+        """
+        Runs the queries concurrently (see "max_concurrent_queries"). Identical queries (same contract, function,
+        arguments, caller and value) are only run once, and share the response object.
+        The responses are returned in the order of the queries.
+        """
+        unique_queries: Dict[Tuple[Hashable, ...], SmartContractQuery] = {}
+
+        for query in queries:
+            unique_queries.setdefault(get_query_key(query), query)
+
+        num_workers = min(self.max_concurrent_queries, len(unique_queries))
+
+        if num_workers <= 1:
+            responses = [self.run_query(query) for query in unique_queries.values()]
+        else:
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                responses = list(executor.map(self.run_query, unique_queries.values()))
+
+        responses_by_key = dict(zip(unique_queries.keys(), responses))
+        return [responses_by_key[get_query_key(query)] for query in queries]
+
+
+def get_query_key(query: SmartContractQuery) -> Tuple[Hashable, ...]:
+    """Identifies a query (by contract, function, arguments, caller and value): e.g. to de-duplicate queries, or to cache their responses."""
+    return (query.contract, query.function, tuple(query.arguments), query.caller, query.value or 0)
@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+from multiversx_sdk.converters.json_codec import (create_json_codec,
+                                                  get_installed_json_backends)
+from multiversx_sdk.converters.transactions_converter import \
+    TransactionsConverter
+from multiversx_sdk.core.transaction import Transaction
+from multiversx_sdk.network_providers.transactions import TransactionOnNetwork
+from multiversx_sdk.testutils.addresses import ALICE, BOB
+from multiversx_sdk.testutils.benchmarks import (measure_peak_memory,
+                                                 measure_time, report)
+from multiversx_sdk.testutils.hyperblocks import (create_hyperblock,
+                                                  create_hyperblock_response)
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_decode_hyperblocks():
+    responses = [json.dumps(create_hyperblock_response(nonce, 1000)).encode() for nonce in range(10)]
+    size = sum(len(response) for response in responses)
+
+    for backend in get_installed_json_backends():
+        codec = create_json_codec(backend)
+        duration, _ = measure_time(lambda: [codec.loads(response) for response in responses], repeat=5)
+        report(f"decode hyperblocks ({backend})", megabytes=size / 1024 / 1024, seconds=duration, megabytes_per_second=size / 1024 / 1024 / duration)
+
+
+def test_encode_transactions():
+    transactions = [Transaction(sender=ALICE, receiver=BOB, gas_limit=50000, chain_id="D", nonce=nonce, value=10**18, signature=bytes(64)) for nonce in range(50000)]
+
+    for backend in get_installed_json_backends():
+        converter = TransactionsConverter(create_json_codec(backend))
+        duration, _ = measure_time(lambda: converter.transactions_to_json(transactions), repeat=3)
+        report(f"encode transactions ({backend})", transactions=len(transactions), seconds=duration)
+
+
+def test_transactions_to_json_stream():
+    converter = TransactionsConverter()
+    transactions = [Transaction(sender=ALICE, receiver=BOB, gas_limit=50000, chain_id="D", nonce=nonce, signature=bytes(64)) for nonce in range(50000)]
+
+    def consume_stream():
+        for _ in converter.transactions_to_json_stream(transactions):
+            pass
+
+    in_memory_bytes, _ = measure_peak_memory(lambda: converter.transactions_to_json(transactions))
+    streamed_bytes, _ = measure_peak_memory(consume_stream)
+
+    report("JSON of 50k transactions (peak memory)", in_memory_megabytes=in_memory_bytes / 1024 / 1024, streamed_megabytes=streamed_bytes / 1024 / 1024)
+
+
+def test_transactions_on_network_to_outcomes():
+    converter = TransactionsConverter()
+    transactions = [TransactionOnNetwork.from_proxy_http_response(item["hash"], item) for item in create_hyperblock(1, 20000)["transactions"]]
+
+    one_by_one_seconds, _ = measure_time(lambda: [converter.transaction_on_network_to_outcome(item) for item in transactions], repeat=3)
+    batch_seconds, _ = measure_time(lambda: converter.transactions_on_network_to_outcomes(transactions), repeat=3)
+    skipping_seconds, _ = measure_time(lambda: converter.transactions_on_network_to_outcomes(transactions, True, True), repeat=3)
+
+    report("Outcomes of 20k (synthetic) transactions (per second)",
+           one_by_one=len(transactions) / one_by_one_seconds,
+           batch=len(transactions) / batch_seconds,
+           batch_with_skipping=len(transactions) / skipping_seconds)
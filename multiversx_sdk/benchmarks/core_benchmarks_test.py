@@ -0,0 +1,269 @@
+import os
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+from multiversx_sdk.core.address import Address
+from multiversx_sdk.core.errors import ParseTransactionOutcomeError
+from multiversx_sdk.core.serializer import args_to_string
+from multiversx_sdk.core.tokens import Token, TokenTransfer
+from multiversx_sdk.core.transaction import Transaction
+from multiversx_sdk.core.transaction_batch import TransactionBatch
+from multiversx_sdk.core.transactions_factories.relayed_transactions_factory import \
+    RelayedTransactionsFactory
+from multiversx_sdk.core.transactions_factories.smart_contract_transactions_factory import \
+    SmartContractTransactionsFactory
+from multiversx_sdk.core.transactions_factories.transactions_factory_config import \
+    TransactionsFactoryConfig
+from multiversx_sdk.core.transactions_factories.transfer_transactions_factory import \
+    TransferTransactionsFactory
+from multiversx_sdk.core.transactions_outcome_parsers import \
+    token_management_transactions_outcome_parser
+from multiversx_sdk.core.transactions_outcome_parsers.resources import (
+    SmartContractResult, TransactionEvent, TransactionLogs, TransactionOutcome,
+    gather_all_events)
+from multiversx_sdk.core.transactions_outcome_parsers.token_management_transactions_outcome_parser import \
+    TokenManagementTransactionsOutcomeParser
+from multiversx_sdk.testutils.addresses import ALICE, BOB, CAROL
+from multiversx_sdk.testutils.benchmarks import (measure_peak_memory,
+                                                 measure_time, report)
+
+pytestmark = pytest.mark.benchmark
+
+
+def previous_arg_to_buffer(arg: Any) -> bytes:
+    """The previous implementation of "arg_to_buffer()" (an "isinstance" chain, fixed-size encoding of unsigned integers)."""
+    if isinstance(arg, str):
+        return arg.encode("utf-8")
+    if isinstance(arg, int):
+        if arg < 0:
+            length = ((arg + (arg < 0)).bit_length() + 7 + 1) // 8
+            return arg.to_bytes(length, byteorder="big", signed=True)
+        return arg.to_bytes(64, byteorder="big", signed=False).lstrip(bytes([0]))
+    if isinstance(arg, bytes):
+        return arg
+    if isinstance(arg, bytearray):
+        return bytes(arg)
+    return arg.serialize()
+
+
+def test_transaction_batch_memory():
+    num_transactions = 100000
+    receivers = [BOB, CAROL]
+
+    def create_list():
+        return [
+            Transaction(
+                sender=ALICE,
+                receiver=receivers[index % 2],
+                gas_limit=50000 + 1500 * (index % 7),
+                chain_id="D",
+                nonce=index,
+                value=index * 10**18,
+                data=b"x" * (index % 7),
+                signature=bytes(64)
+            ) for index in range(num_transactions)
+        ]
+
+    def create_batch():
+        batch = TransactionBatch(sender=ALICE, chain_id="D")
+        for index in range(num_transactions):
+            item = batch.append(receiver=receivers[index % 2], gas_limit=50000 + 1500 * (index % 7), nonce=index, value=index * 10**18, data=b"x" * (index % 7))
+            item.signature = bytes(64)
+        return batch
+
+    list_memory, _ = measure_peak_memory(create_list)
+    batch_memory, batch = measure_peak_memory(create_batch)
+
+    report("100k transactions in memory",
+           list_megabytes=list_memory / 1024 / 1024,
+           batch_megabytes=batch_memory / 1024 / 1024,
+           batch_buffers_megabytes=batch.get_size_in_bytes() / 1024 / 1024)
+
+
+def test_create_transactions_for_esdt_token_transfers():
+    factory = TransferTransactionsFactory(TransactionsFactoryConfig("D"))
+    alice = Address.new_from_bech32(ALICE)
+    token = Token("FOO-123456")
+    num_transactions = 100000
+    transfers = [(Address(index.to_bytes(32, "big"), "erd"), 10**18 + index) for index in range(num_transactions)]
+
+    def create_one_by_one():
+        return [factory.create_transaction_for_esdt_token_transfer(alice, receiver, [TokenTransfer(token, amount)]) for receiver, amount in transfers]
+
+    def create_in_bulk():
+        return list(factory.create_transactions_for_esdt_token_transfers(alice, [token], transfers))
+
+    def add_to_batch():
+        batch = TransactionBatch(sender=ALICE, chain_id="D")
+        factory.add_esdt_token_transfers_to_batch(batch, [token], transfers)
+
+    one_by_one_seconds, expected = measure_time(create_one_by_one)
+    bulk_seconds, transactions = measure_time(create_in_bulk)
+    batch_seconds, _ = measure_time(add_to_batch)
+    assert transactions == expected
+
+    report("100k ESDT transfers", one_by_one_seconds=one_by_one_seconds, bulk_seconds=bulk_seconds, batch_seconds=batch_seconds)
+
+
+def test_create_transaction_for_esdt_token_transfer():
+    factory = TransferTransactionsFactory(TransactionsFactoryConfig("D"))
+    alice = Address.new_from_bech32(ALICE)
+    bob = Address.new_from_bech32(BOB)
+    num_transactions = 20000
+    nfts = [Token(f"NFT{index % 100}-123456", index + 1) for index in range(num_transactions)]
+
+    def create_multiple_nft_transfers():
+        for index in range(num_transactions):
+            transfers = [TokenTransfer(nfts[index], 1), TokenTransfer(nfts[index - 1], 1)]
+            factory.create_transaction_for_esdt_token_transfer(alice, bob, transfers)
+
+    seconds, _ = measure_time(create_multiple_nft_transfers, repeat=3)
+    report("20k transfers of 2 NFTs (100 collections)", transactions_per_second=num_transactions / seconds)
+
+
+def test_args_to_string():
+    args = ["ESDTNFTTransfer", "NFT-123456", 42, 10**18, bytes(32), 0]
+    num_calls = 100000
+
+    previous_seconds, _ = measure_time(lambda: ["@".join(previous_arg_to_buffer(arg).hex() for arg in args) for _ in range(num_calls)], repeat=3)
+    seconds, _ = measure_time(lambda: [args_to_string(args) for _ in range(num_calls)], repeat=3)
+
+    report("args_to_string() of 6 arguments",
+           previous_calls_per_second=num_calls / previous_seconds,
+           calls_per_second=num_calls / seconds)
+
+
+def test_find_events(monkeypatch: pytest.MonkeyPatch):
+    parser = TokenManagementTransactionsOutcomeParser()
+    parse_methods = [getattr(parser, name) for name in dir(parser) if name.startswith("parse_") and name not in ["parse_outcomes", "parse_outcome"]]
+    identifiers = ["ESDTTransfer", "ESDTNFTTransfer", "writeLog", "completedTxEvent"]
+
+    # Mostly transfers, with a single token management event (as for a mass distribution performed by a contract).
+    def create_large_outcome(num_events: int) -> TransactionOutcome:
+        results = [
+            SmartContractResult(logs=TransactionLogs(events=[TransactionEvent(identifier=identifiers[index % len(identifiers)], topics=[b"TKN-123456"])]))
+            for index in range(num_events)
+        ]
+
+        logs = TransactionLogs(events=[TransactionEvent(identifier="ESDTNFTCreate", topics=[b"NFT-123456", b"\x01", b"\x01"])])
+        return TransactionOutcome(transaction_results=results, transaction_logs=logs)
+
+    # The lookups before the index, as the reference.
+    def find_by_identifier_reference(outcome: TransactionOutcome, identifier: str) -> List[TransactionEvent]:
+        return [event for event in gather_all_events(outcome) if event.identifier == identifier]
+
+    def parse_with_all_methods(outcome: TransactionOutcome):
+        for parse in parse_methods:
+            parse(outcome)
+
+    for num_events, num_outcomes in [(1000, 200), (200, 1000), (5, 40_000)]:
+        for title, parse in [("every parse_*() method", parse_with_all_methods), ("parse_nft_create()", parser.parse_nft_create)]:
+            # Each run gets fresh outcomes (without an index).
+            with monkeypatch.context() as patch:
+                patch.setattr(token_management_transactions_outcome_parser, "find_events_by_identifier", find_by_identifier_reference)
+                outcomes = [create_large_outcome(num_events) for _ in range(num_outcomes)]
+                reference_seconds, _ = measure_time(lambda: [parse(outcome) for outcome in outcomes])
+
+            outcomes = [create_large_outcome(num_events) for _ in range(num_outcomes)]
+            seconds, _ = measure_time(lambda: [parse(outcome) for outcome in outcomes])
+            report(f"{title} on each of {num_outcomes} fresh outcomes, with {num_events} events (seconds)",
+                   without_index=reference_seconds,
+                   with_index=seconds)
+
+
+def test_parse_outcomes():
+    parser = TokenManagementTransactionsOutcomeParser()
+    parse_methods = [getattr(parser, name) for name in dir(parser) if name.startswith("parse_") and name not in ["parse_outcomes", "parse_outcome"]]
+    bob = Address.new_from_bech32(BOB).get_public_key()
+
+    def create_outcome(log_events: List[TransactionEvent], result_events: List[TransactionEvent]) -> TransactionOutcome:
+        result = SmartContractResult(logs=TransactionLogs(ALICE, result_events))
+        return TransactionOutcome(transaction_results=[result], transaction_logs=TransactionLogs(ALICE, log_events))
+
+    def create_outcomes() -> List[TransactionOutcome]:
+        return [
+            create_outcome(
+                [TransactionEvent(ALICE, "ESDTNFTCreate", [b"NFT-f01d1e", b"\x01", b"\x01"]), TransactionEvent(ALICE, "completedTxEvent")],
+                [TransactionEvent(ALICE, "ESDTLocalMint", [b"AAA-29c4c9", b"", b"\x64"]), TransactionEvent(ALICE, "writeLog")]
+            ),
+            create_outcome(
+                [TransactionEvent(ALICE, "ESDTFreeze", [b"AAA-29c4c9", b"", b"\x0a", bob])],
+                [TransactionEvent(ALICE, "ESDTNFTUpdateAttributes", [b"NFT-f01d1e", b"\x01", b"", b"metadata"])]
+            ),
+            create_outcome([], [])
+        ]
+
+    def parse_with_all_methods(transaction_outcomes: List[TransactionOutcome]):
+        for transaction_outcome in transaction_outcomes:
+            for parse in parse_methods:
+                try:
+                    parse(transaction_outcome)
+                except ParseTransactionOutcomeError:
+                    pass
+
+    # Each run gets fresh outcomes (without an events index).
+    transaction_outcomes = [outcome for _ in range(10000) for outcome in create_outcomes()]
+    all_methods_seconds, _ = measure_time(lambda: parse_with_all_methods(transaction_outcomes))
+    transaction_outcomes = [outcome for _ in range(10000) for outcome in create_outcomes()]
+    seconds, _ = measure_time(lambda: list(parser.parse_outcomes(transaction_outcomes)))
+
+    report("Token management records of 30k outcomes",
+           all_methods_outcomes_per_second=len(transaction_outcomes) / all_methods_seconds,
+           outcomes_per_second=len(transaction_outcomes) / seconds)
+
+
+def test_create_relayed_transactions():
+    factory = RelayedTransactionsFactory(TransactionsFactoryConfig("T"))
+    relayer = Address.new_from_bech32(CAROL)
+
+    def create_inner_transactions(gas_limit: int) -> List[Transaction]:
+        return [
+            Transaction(
+                sender=[ALICE, BOB][index % 2],
+                receiver=CAROL,
+                gas_limit=gas_limit,
+                chain_id="T",
+                nonce=index,
+                value=index * 10**16,
+                data=f"hello@{index:02x}".encode(),
+                signature=bytes(64)
+            ) for index in range(20000)
+        ]
+
+    inner_transactions = create_inner_transactions(50000)
+    inner_transactions_v2 = create_inner_transactions(0)
+
+    v1_seconds, _ = measure_time(lambda: [factory.create_relayed_v1_transaction(transaction, relayer) for transaction in inner_transactions])
+    v1_batch_seconds, _ = measure_time(lambda: list(factory.create_relayed_v1_transactions(inner_transactions, relayer)))
+    v2_seconds, _ = measure_time(lambda: [factory.create_relayed_v2_transaction(transaction, 50000, relayer) for transaction in inner_transactions_v2])
+    v2_batch_seconds, _ = measure_time(lambda: list(factory.create_relayed_v2_transactions([(transaction, 50000) for transaction in inner_transactions_v2], relayer)))
+
+    report("Relayed transactions (per second)",
+           v1=len(inner_transactions) / v1_seconds,
+           v1_batch=len(inner_transactions) / v1_batch_seconds,
+           v2=len(inner_transactions) / v2_seconds,
+           v2_batch=len(inner_transactions) / v2_batch_seconds)
+
+
+def test_deploy_with_bytecode_from_file(tmp_path: Path):
+    factory = SmartContractTransactionsFactory(TransactionsFactoryConfig("D"))
+    sender = Address.new_from_bech32(ALICE)
+    path = tmp_path / "contract.wasm"
+    path.write_bytes(os.urandom(4 * 1024 * 1024))
+
+    def deploy_with_bytes():
+        return factory.create_transaction_for_deploy(sender=sender, bytecode=path.read_bytes(), gas_limit=60000000, arguments=[1])
+
+    def deploy_with_file():
+        return factory.create_transaction_for_deploy(sender=sender, bytecode=path, gas_limit=60000000, arguments=[1])
+
+    bytes_memory, transaction = measure_peak_memory(deploy_with_bytes)
+    file_memory, transaction_from_file = measure_peak_memory(deploy_with_file)
+    assert transaction_from_file == transaction
+
+    report("Deploy of a 4 MB contract, peak memory",
+           bytes_megabytes=bytes_memory / 1024 / 1024,
+           file_megabytes=file_memory / 1024 / 1024,
+           payload_megabytes=len(transaction.data) / 1024 / 1024)
@@ -0,0 +1,277 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from multiversx_sdk.core.address import Address
+from multiversx_sdk.core.transaction import Transaction
+from multiversx_sdk.network_providers.gas_estimator import GasEstimator
+from multiversx_sdk.network_providers.hyperblock_follower import \
+    HyperblockFollower
+from multiversx_sdk.network_providers.hyperblocks import HyperblockOnNetwork
+from multiversx_sdk.network_providers.hyperblocks_backfiller import \
+    HyperblocksBackfiller
+from multiversx_sdk.network_providers.network_simulator import (
+    NetworkSimulator, create_simulator_proxy_server)
+from multiversx_sdk.network_providers.proxy_network_provider import \
+    ProxyNetworkProvider
+from multiversx_sdk.network_providers.rate_limiter import RateLimiter
+from multiversx_sdk.network_providers.recording import (
+    RecordingReader, RecordingWriter, create_recording_session,
+    create_replay_session)
+from multiversx_sdk.network_providers.transaction_decoder import \
+    TransactionDecoder
+from multiversx_sdk.network_providers.transactions import (
+    LazyTransactionOnNetwork, TransactionOnNetwork)
+from multiversx_sdk.network_providers.transactions_broadcaster import \
+    TransactionsBroadcaster
+from multiversx_sdk.testutils.addresses import ALICE, BOB, CONTRACT
+from multiversx_sdk.testutils.benchmarks import (measure_peak_memory,
+                                                 measure_time, report)
+from multiversx_sdk.testutils.hyperblocks import create_hyperblock
+from multiversx_sdk.testutils.mock_proxy_server import (MockProxyServer,
+                                                        MockRequest)
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_broadcast_against_mock_proxy():
+    num_senders = 50
+    num_transactions_per_sender = 1000
+    transactions = [
+        Transaction(sender=f"sender-{index}", receiver=BOB, gas_limit=50000, chain_id="D", nonce=nonce, signature=bytes(64))
+        for index in range(num_senders) for nonce in range(num_transactions_per_sender)
+    ]
+
+    with MockProxyServer(latency_in_milliseconds=100) as server:
+        proxy = ProxyNetworkProvider(server.url)
+
+        duration_single, _ = measure_time(lambda: proxy.send_transactions(transactions))
+
+        broadcaster = TransactionsBroadcaster(proxy, max_transactions_per_chunk=1000, num_workers=8)
+        duration_broadcaster, result = measure_time(lambda: broadcaster.broadcast(transactions))
+
+    assert result.num_sent == len(transactions)
+    report(
+        "broadcast",
+        transactions=len(transactions),
+        single_request_seconds=duration_single,
+        broadcaster_seconds=duration_broadcaster,
+        chunks=result.num_chunks
+    )
+
+
+def test_lazy_parsing():
+    responses: List[Dict[str, Any]] = create_hyperblock(1, 100_000)["transactions"]
+
+    def parse_eager() -> List[TransactionOnNetwork]:
+        return [TransactionOnNetwork.from_proxy_http_response(response["hash"], response) for response in responses]
+
+    def parse_lazy() -> List[TransactionOnNetwork]:
+        return [LazyTransactionOnNetwork.from_proxy_http_response(response["hash"], response) for response in responses]
+
+    def get_statuses(transactions: List[TransactionOnNetwork]) -> List[str]:
+        return [f"{transaction.hash}: {transaction.status}" for transaction in transactions]
+
+    for name, parse in [("eager", parse_eager), ("lazy", parse_lazy)]:
+        duration, _ = measure_time(lambda: get_statuses(parse()))
+        report(f"parse transactions ({name})", transactions=len(responses), seconds=duration)
+
+    for name, parse in [("eager", parse_eager), ("lazy", parse_lazy)]:
+        peak_memory, _ = measure_peak_memory(parse)
+        report(f"parse transactions ({name})", transactions=len(responses), peak_memory_megabytes=peak_memory / 1024 / 1024)
+
+
+def test_follow_using_proxy():
+    num_hyperblocks = 200
+
+    with MockProxyServer(latency_in_milliseconds=50) as server:
+        server.serve_hyperblocks(highest_nonce=num_hyperblocks, num_transactions_per_hyperblock=100)
+        proxy = ProxyNetworkProvider(server.url)
+
+        for read_ahead in [1, 8, 32]:
+            follower = HyperblockFollower(proxy, start_nonce=1, read_ahead=read_ahead)
+            duration, _ = measure_time(lambda: list(follower.follow(until_nonce=num_hyperblocks)))
+            report("follow hyperblocks", read_ahead=read_ahead, hyperblocks=num_hyperblocks, seconds=duration,
+                   hyperblocks_per_second=num_hyperblocks / duration)
+
+
+def test_backfill_using_proxy():
+    num_hyperblocks = 300
+
+    with MockProxyServer(latency_in_milliseconds=50) as server:
+        server.serve_hyperblocks(highest_nonce=num_hyperblocks, num_transactions_per_hyperblock=100)
+        proxy = ProxyNetworkProvider(server.url)
+
+        for num_workers in [1, 8, 32]:
+            backfiller = HyperblocksBackfiller(proxy, num_workers=num_workers)
+            duration, _ = measure_time(lambda: list(backfiller.backfill(1, num_hyperblocks)))
+            report("backfill hyperblocks", num_workers=num_workers, hyperblocks=num_hyperblocks, seconds=duration,
+                   hyperblocks_per_second=num_hyperblocks / duration)
+
+
+def test_rate_limiter():
+    num_requests = 400
+    max_requests_per_second = 200
+
+    def throttle(server: MockProxyServer):
+        # Emulates a gateway which rejects the requests exceeding a given rate.
+        lock = threading.Lock()
+        timestamps: List[float] = []
+
+        def handle(request: MockRequest) -> Tuple[int, Any]:
+            with lock:
+                now = time.monotonic()
+                timestamps[:] = [timestamp for timestamp in timestamps if timestamp > now - 1]
+                if len(timestamps) >= max_requests_per_second:
+                    return 429, {"error": "too many requests", "code": "internal_issue"}
+                timestamps.append(now)
+            return 200, {"data": {"status": {"erd_highest_final_nonce": 1}}, "code": "successful"}
+
+        server.on("GET", r"/network/status/4294967295", handle)
+
+    for limiter in [RateLimiter(num_retries=10, retry_delay_in_milliseconds=50), RateLimiter(max_requests_per_second=max_requests_per_second * 0.95, burst=10)]:
+        with MockProxyServer(latency_in_milliseconds=20) as server:
+            throttle(server)
+            proxy = ProxyNetworkProvider(server.url, rate_limiter=limiter)
+
+            with ThreadPoolExecutor(max_workers=32) as executor:
+                duration, _ = measure_time(lambda: list(executor.map(lambda _: proxy.get_network_status(), range(num_requests))))
+
+            report("rate limiter", with_token_bucket=limiter.token_bucket is not None, requests=num_requests, seconds=duration,
+                   http_requests=server.num_requests, **limiter.get_metrics().to_dictionary())
+
+
+def test_replay(tmp_path: Path):
+    path = tmp_path / "proxy.recording"
+    num_hyperblocks = 200
+
+    with MockProxyServer() as server, RecordingWriter(path) as writer:
+        server.serve_hyperblocks(highest_nonce=num_hyperblocks, num_transactions_per_hyperblock=100)
+        proxy = ProxyNetworkProvider(server.url, session=create_recording_session(writer))
+
+        for nonce in range(1, num_hyperblocks + 1):
+            proxy.get_hyperblock(nonce)
+
+    proxy = ProxyNetworkProvider("http://localhost", session=create_replay_session(RecordingReader(path)))
+
+    def replay():
+        return [HyperblockOnNetwork.from_http_response(proxy.get_hyperblock(nonce), decode_transactions=True) for nonce in range(1, num_hyperblocks + 1)]
+
+    duration, _ = measure_time(replay, repeat=3)
+    report("replay hyperblocks", hyperblocks=num_hyperblocks, seconds=duration, recording_megabytes=os.path.getsize(path) / 1024 / 1024)
+
+
+def test_send_transactions_to_simulator_through_proxy():
+    num_senders = 100
+    num_transactions_per_sender = 500
+    batch_size = 1000
+
+    senders = [Address(index.to_bytes(32, "big"), "erd") for index in range(1, num_senders + 1)]
+    simulator = NetworkSimulator()
+    transactions: List[Transaction] = []
+
+    for sender in senders:
+        simulator.add_account(sender, balance=num_transactions_per_sender * (50000 * 1000000000 + 1))
+
+        for nonce in range(num_transactions_per_sender):
+            transactions.append(Transaction(sender=sender.to_bech32(), receiver=BOB, gas_limit=50000, chain_id="localnet", nonce=nonce, value=1))
+
+    with create_simulator_proxy_server(simulator) as server, simulator:
+        proxy = ProxyNetworkProvider(server.url)
+        start = time.perf_counter()
+
+        for index in range(0, len(transactions), batch_size):
+            num_sent, _ = proxy.send_transactions(transactions[index:index + batch_size])
+            assert num_sent == len(transactions[index:index + batch_size])
+
+        duration = time.perf_counter() - start
+
+        while simulator.get_account(senders[-1]).nonce < num_transactions_per_sender:
+            time.sleep(0.01)
+
+    report("send transactions to the simulator, through the proxy provider",
+           transactions=len(transactions),
+           seconds=duration,
+           transactions_per_second=len(transactions) / duration)
+
+
+def test_get_tokens_of_account():
+    with MockProxyServer() as server:
+        server.serve_tokens(num_fungible_tokens=100, num_nonfungible_tokens=20000)
+        proxy = ProxyNetworkProvider(server.url)
+        alice = Address.new_from_bech32(ALICE)
+
+        def get_separately():
+            return proxy.get_fungible_tokens_of_account(alice), proxy.get_nonfungible_tokens_of_account(alice)
+
+        separately_duration, _ = measure_time(get_separately, repeat=3)
+        num_requests_separately = server.num_requests
+
+        combined_duration, _ = measure_time(lambda: proxy.get_tokens_of_account(alice), repeat=3)
+        num_requests_combined = server.num_requests - num_requests_separately
+
+        report("tokens of account (100 fungible, 20000 non-fungible)",
+               separately_seconds=separately_duration,
+               combined_seconds=combined_duration,
+               requests_separately=num_requests_separately // 3,
+               requests_combined=num_requests_combined // 3)
+
+
+def test_estimate_gas_limits():
+    num_transactions = 10000
+    num_distinct_calls = 20
+    transactions = [
+        Transaction(sender=ALICE, receiver=CONTRACT, gas_limit=600000000, chain_id="D", data=f"function{index % num_distinct_calls}@{index:08x}".encode())
+        for index in range(num_transactions)
+    ]
+
+    with MockProxyServer() as server:
+        def handle_cost(request: MockRequest) -> Tuple[int, Any]:
+            time.sleep(0.01)
+            return 200, {"data": {"txGasUnits": 1000000, "returnMessage": ""}, "code": "successful"}
+
+        server.on("POST", r"/transaction/cost", handle_cost)
+        estimator = GasEstimator(ProxyNetworkProvider(server.url))
+
+        # Simulating the transactions one by one would take about "num_transactions * latency" (100 seconds).
+        duration, _ = measure_time(lambda: estimator.apply_gas_limits(transactions))
+
+        report("estimate gas limits (10 ms per simulation)",
+               transactions=num_transactions,
+               simulations=server.num_requests,
+               seconds=duration)
+
+
+def test_get_transactions_metadata():
+    decoder = TransactionDecoder()
+    contract = "00000000000000000500df3bebe1afa10c40925e833c14a460e10a849f50a468"
+    data_fields = [
+        "",
+        "hello world",
+        "withdrawGlobalOffer@0173d0",
+        "ESDTTransfer@544553542d326534306437@02540be400",
+        "ESDTTransfer@544553542d326534306437@02540be400@73776170@01",
+        f"ESDTNFTTransfer@4c4b4d45582d616162393130@2fb4e9@e40f1699@{contract}@73776170@0b37@",
+        f"MultiESDTNFTTransfer@{contract}@02@4c4b4d45582d616162393130@2fe3b0@09b9@555344432d333530633465@@0126@7061795f6d657461@0ede",
+        f"MultiESDTNFTTransfer@{contract}@01@4c4b4d45582d616162393130@@09b9"
+    ]
+
+    transactions: List[TransactionOnNetwork] = []
+    for index in range(40000):
+        transaction = TransactionOnNetwork()
+        transaction.sender = Address.new_from_bech32(ALICE)
+        transaction.receiver = Address.new_from_bech32(BOB)
+        transaction.data = data_fields[index % len(data_fields)]
+        transactions.append(transaction)
+
+    one_by_one_seconds, _ = measure_time(lambda: [decoder.get_transaction_metadata(transaction) for transaction in transactions])
+    batch_seconds, _ = measure_time(lambda: decoder.get_transactions_metadata(transactions))
+
+    report("Metadata of 40k transactions",
+           one_by_one_transactions_per_second=len(transactions) / one_by_one_seconds,
+           batch_transactions_per_second=len(transactions) / batch_seconds)
@@ -1,4 +1,5 @@
+from multiversx_sdk.converters.json_codec import IJsonCodec, create_json_codec
 from multiversx_sdk.converters.transactions_converter import \
     TransactionsConverter
 
-__all__ = ["TransactionsConverter"]
+__all__ = ["TransactionsConverter", "IJsonCodec", "create_json_codec"]
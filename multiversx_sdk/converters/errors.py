@@ -1,3 +1,13 @@
 class MissingFieldError(Exception):
     def __init__(self, message: str) -> None:
         super().__init__(message)
+
+
+class UnknownJsonBackendError(Exception):
+    def __init__(self, backend: str) -> None:
+        super().__init__(f"Unknown or not installed JSON backend: {backend}")
+
+
+class StreamConsumedError(Exception):
+    def __init__(self) -> None:
+        super().__init__("The stream cannot be iterated again: its source (an iterator) has been consumed. Provide a sequence instead.")
@@ -0,0 +1,135 @@
+import importlib
+import json
+from types import ModuleType
+from typing import Any, List, Optional, Protocol, Union
+
+from multiversx_sdk.converters.errors import UnknownJsonBackendError
+
+# Numbers having at least 20 digits might not fit in 64 bits. Some of the fast parsers silently convert them to floats
+# (thus losing precision) or fail on them, so, in such cases, the standard library is used instead.
+_LARGE_INTEGER_MIN_DIGITS = 20
+_NUMBER_PREFIXES = [b":", b",", b"["]
+# Maps digits to "0" and everything else to "x", so that long sequences of digits can be found using "bytes.find()".
+_DIGITS_MASK = bytes(ord("0") if chr(byte).isdigit() else ord("x") for byte in range(256))
+
+_BACKENDS_BY_PRIORITY = ["orjson", "ujson", "json"]
+
+
+class IJsonCodec(Protocol):
+    name: str
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        ...
+
+    def dumps(self, obj: Any) -> bytes:
+        ...
+
+
+class StandardJsonCodec:
+    name = "json"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+
+class OrjsonCodec:
+    name = "orjson"
+
+    def __init__(self) -> None:
+        self._orjson = _import_backend("orjson")
+        self._fallback = StandardJsonCodec()
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        if _has_large_integers(data):
+            return self._fallback.loads(data)
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._orjson.dumps(obj)
+        except TypeError:
+            # E.g. integers larger than 64 bits.
+            return self._fallback.dumps(obj)
+
+
+class UjsonCodec:
+    name = "ujson"
+
+    def __init__(self) -> None:
+        self._ujson = _import_backend("ujson")
+        self._fallback = StandardJsonCodec()
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        if _has_large_integers(data):
+            return self._fallback.loads(data)
+        return self._ujson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode()
+        except (TypeError, OverflowError):
+            return self._fallback.dumps(obj)
+
+
+def create_json_codec(backend: Optional[str] = None) -> IJsonCodec:
+    """
+    Creates a JSON codec.
+
+    Args:
+        backend (Optional[str]): one of "orjson", "ujson" or "json" (the standard library). If not provided, the fastest installed backend is used.
+    """
+    if backend is None:
+        backend = get_installed_json_backends()[0]
+
+    if backend == "orjson":
+        return OrjsonCodec()
+    if backend == "ujson":
+        return UjsonCodec()
+    if backend == "json":
+        return StandardJsonCodec()
+
+    raise UnknownJsonBackendError(backend)
+
+
+def get_installed_json_backends() -> List[str]:
+    """Returns the names of the installed JSON backends, fastest first."""
+    return [backend for backend in _BACKENDS_BY_PRIORITY if _is_installed(backend)]
+
+
+def _has_large_integers(data: Union[str, bytes]) -> bool:
+    data_as_bytes = data.encode() if isinstance(data, str) else data
+
+    masked = data_as_bytes.translate(_DIGITS_MASK)
+    start = masked.find(b"0" * _LARGE_INTEGER_MIN_DIGITS)
+
+    # Long sequences of digits are rare (e.g. within hashes), so we only look around the ones we find:
+    # they are a number if they are preceded by ":", "," or "[" (and, optionally, whitespace or a minus sign).
+    while start != -1:
+        preceding = data_as_bytes[max(0, start - 32):start].rstrip(b"-").rstrip()
+        if not preceding or preceding[-1:] in _NUMBER_PREFIXES:
+            return True
+
+        end = masked.find(b"x", start)
+        if end == -1:
+            return False
+        start = masked.find(b"0" * _LARGE_INTEGER_MIN_DIGITS, end)
+
+    return False
+
+
+def _is_installed(backend: str) -> bool:
+    try:
+        importlib.import_module(backend)
+        return True
+    except ImportError:
+        return False
+
+
+def _import_backend(backend: str) -> ModuleType:
+    try:
+        return importlib.import_module(backend)
+    except ImportError:
+        raise UnknownJsonBackendError(backend)
@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+from multiversx_sdk.converters.errors import UnknownJsonBackendError
+from multiversx_sdk.converters.json_codec import (StandardJsonCodec,
+                                                  create_json_codec,
+                                                  get_installed_json_backends)
+from multiversx_sdk.converters.transactions_converter import \
+    TransactionsConverter
+from multiversx_sdk.core.transaction import Transaction
+from multiversx_sdk.network_providers.proxy_network_provider import \
+    ProxyNetworkProvider
+from multiversx_sdk.testutils.hyperblocks import create_hyperblock_response
+from multiversx_sdk.testutils.mock_proxy_server import MockProxyServer
+
+installed_backends = get_installed_json_backends()
+
+
+def test_standard_library_is_always_available():
+    assert installed_backends[-1] == "json"
+    assert isinstance(create_json_codec("json"), StandardJsonCodec)
+
+
+def test_create_codec_with_unknown_backend():
+    with pytest.raises(UnknownJsonBackendError):
+        create_json_codec("foobar")
+
+
+def test_create_codec_picks_fastest_backend():
+    assert create_json_codec().name == installed_backends[0]
+
+
+@pytest.mark.parametrize("backend", installed_backends)
+def test_roundtrip(backend: str):
+    codec = create_json_codec(backend)
+    obj = {"nonce": 42, "value": "1000000000000000000", "data": "dGVzdA==", "items": [1, 2.5, None, True], "text": "ünicode / slash"}
+
+    assert codec.loads(codec.dumps(obj)) == obj
+    assert codec.loads(json.dumps(obj)) == obj
+    assert json.loads(codec.dumps(obj)) == obj
+
+
+@pytest.mark.parametrize("backend", installed_backends)
+def test_large_integers_are_not_altered(backend: str):
+    codec = create_json_codec(backend)
+    large_integer = 123456789012345678901234567890
+
+    assert codec.loads(b'{"balance": 123456789012345678901234567890}') == {"balance": large_integer}
+    assert codec.loads('[1, -123456789012345678901234567890]') == [1, -large_integer]
+    assert json.loads(codec.dumps({"balance": large_integer})) == {"balance": large_integer}
+
+
+@pytest.mark.parametrize("backend", installed_backends)
+def test_transactions_converter_with_codec(backend: str):
+    converter = TransactionsConverter(create_json_codec(backend))
+    transaction = Transaction(
+        sender="erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th",
+        receiver="erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx",
+        gas_limit=50000,
+        chain_id="D",
+        nonce=7,
+        value=123456789000000000000000000000,
+        data=b"hello",
+        signature=bytes(64)
+    )
+
+    assert converter.json_to_transaction(converter.transaction_to_json(transaction)) == transaction
+    assert json.loads(converter.transactions_to_json([transaction, transaction])) == [converter.transaction_to_dictionary(transaction)] * 2
+
+
+@pytest.mark.parametrize("backend", installed_backends)
+def test_provider_with_codec(backend: str):
+    codec = create_json_codec(backend)
+
+    with MockProxyServer() as server:
+        server.on("GET", r"/hyperblock/by-nonce/(\d+)", lambda request: (200, create_hyperblock_response(int(request.match.group(1)), 10)))
+        proxy = ProxyNetworkProvider(server.url, json_codec=codec)
+
+        hyperblock = proxy.get_hyperblock(42)
+        num_sent, hashes = proxy.send_transactions([
+            Transaction(sender="alice", receiver="bob", gas_limit=50000, chain_id="D", value=10**30)
+        ])
+
+    assert hyperblock["nonce"] == 42
+    assert len(hyperblock["transactions"]) == 10
+    assert num_sent == 1
+    assert len(hashes["0"]) == 64
@@ -1,21 +1,29 @@
 import base64
-from typing import Any, Dict, Union
+from typing import (Any, Dict, Iterable, Iterator, List, Optional, Sequence,
+                    Tuple, Union)
 
-from multiversx_sdk.converters.errors import MissingFieldError
+from multiversx_sdk.converters.errors import (MissingFieldError,
+                                              StreamConsumedError)
+from multiversx_sdk.converters.json_codec import IJsonCodec, create_json_codec
 from multiversx_sdk.core.interfaces import ITransaction
 from multiversx_sdk.core.transaction import Transaction
 from multiversx_sdk.core.transactions_outcome_parsers.resources import (
     SmartContractResult, TransactionEvent, TransactionLogs, TransactionOutcome)
 from multiversx_sdk.network_providers.contract_results import \
     ContractResultItem as SCResultItemOnNetwork
+from multiversx_sdk.network_providers.interface import IAddress
 from multiversx_sdk.network_providers.transaction_events import \
     TransactionEvent as TransactionEventOnNetwork
+from multiversx_sdk.network_providers.transaction_logs import \
+    TransactionLogs as TransactionLogsOnNetwork
 from multiversx_sdk.network_providers.transactions import TransactionOnNetwork
 
+DEFAULT_JSON_CHUNK_SIZE_IN_BYTES = 64 * 1024
+
 
 class TransactionsConverter:
-    def __init__(self) -> None:
-        pass
+    def __init__(self, json_codec: Optional[IJsonCodec] = None) -> None:
+        self.json_codec = json_codec or create_json_codec()
 
     def transaction_to_dictionary(self, transaction: ITransaction) -> Dict[str, Any]:
         return {
@@ -36,6 +44,26 @@ class TransactionsConverter:
             "guardianSignature": self._value_to_hex_or_empty(transaction.guardian_signature)
         }
 
+    def transaction_to_json(self, transaction: ITransaction) -> bytes:
+        return self.json_codec.dumps(self.transaction_to_dictionary(transaction))
+
+    def transactions_to_json(self, transactions: Sequence[ITransaction]) -> bytes:
+        return self.json_codec.dumps([self.transaction_to_dictionary(transaction) for transaction in transactions])
+
+    def transactions_to_json_stream(self,
+                                    transactions: Iterable[ITransaction],
+                                    chunk_size_in_bytes: int = DEFAULT_JSON_CHUNK_SIZE_IN_BYTES) -> Iterable[bytes]:
+        """
+        Same as "transactions_to_json()", but the JSON array is produced incrementally, in chunks of (about) the given size,
+        as the transactions are iterated - so that the whole array is never held in memory (e.g. when sent as a chunked HTTP request).
+
+        The stream can be iterated again (e.g. when a request is retried) if the transactions are given as a sequence (not as an iterator).
+        """
+        return _TransactionsJsonStream(self, transactions, chunk_size_in_bytes)
+
+    def json_to_transaction(self, data: Union[str, bytes]) -> Transaction:
+        return self.dictionary_to_transaction(self.json_codec.loads(data))
+
     def dictionary_to_transaction(self, dictionary: Dict[str, Any]) -> Transaction:
         self._ensure_mandatory_fields_for_transaction(dictionary)
 
@@ -58,46 +86,23 @@ class TransactionsConverter:
         )
 
     def transaction_on_network_to_outcome(self, transaction_on_network: TransactionOnNetwork) -> TransactionOutcome:
-        results = [self._sc_result_item_on_network_to_sc_result(item) for item in transaction_on_network.contract_results.items]
-        logs = TransactionLogs(
-            address=transaction_on_network.logs.address.to_bech32(),
-            events=[self._event_on_network_to_event(event) for event in transaction_on_network.logs.events]
-        )
-
-        return TransactionOutcome(
-            transaction_results=results,
-            transaction_logs=logs
-        )
-
-    def _event_on_network_to_event(self, event: TransactionEventOnNetwork) -> TransactionEvent:
-        address = event.address.to_bech32()
-        identifier = event.identifier
-        topics = [topic.raw for topic in event.topics]
-
-        legacy_data = event.data_payload.raw if event.data_payload else b'' or event.data.encode()
-        data_items = [data.raw for data in event.additional_data] if event.additional_data else []
-
-        if len(data_items) == 0:
-            if len(legacy_data):
-                data_items.append(legacy_data)
-
-        return TransactionEvent(address, identifier, topics, data_items)
-
-    def _sc_result_item_on_network_to_sc_result(self, sc_result_item: SCResultItemOnNetwork) -> SmartContractResult:
-        sender = sc_result_item.sender.to_bech32()
-        receiver = sc_result_item.receiver.to_bech32()
-        data = sc_result_item.data.encode()
-        logs = TransactionLogs(
-            address=sc_result_item.logs.address.to_bech32(),
-            events=[self._event_on_network_to_event(event) for event in sc_result_item.logs.events]
-        )
-
-        return SmartContractResult(
-            sender=sender,
-            receiver=receiver,
-            data=data,
-            logs=logs
-        )
+        return _OutcomesConverter().convert(transaction_on_network)
+
+    def transactions_on_network_to_outcomes(self,
+                                            transactions_on_network: Sequence[TransactionOnNetwork],
+                                            skip_results_without_data: bool = False,
+                                            skip_logs_without_events: bool = False) -> List[TransactionOutcome]:
+        """
+        Same as "transaction_on_network_to_outcome()", for many transactions (e.g. the ones of a hyperblock). The bech32 addresses
+        (mostly, the ones of a few contracts) are computed only once for the whole batch.
+
+        Args:
+            transactions_on_network (Sequence[TransactionOnNetwork]): the transactions to convert.
+            skip_results_without_data (bool): whether to leave out the smart contract results without data and without events (e.g. gas refunds).
+            skip_logs_without_events (bool): whether to leave out the logs without events (their address is left empty).
+        """
+        converter = _OutcomesConverter(skip_results_without_data, skip_logs_without_events)
+        return [converter.convert(transaction_on_network) for transaction_on_network in transactions_on_network]
 
     def _ensure_mandatory_fields_for_transaction(self, dictionary: Dict[str, Any]) -> None:
         sender = dictionary.get("sender", None)
@@ -137,3 +142,100 @@ class TransactionsConverter:
         if len(value):
             return bytes.fromhex(value)
         return b""
+
+
+class _TransactionsJsonStream:
+    def __init__(self, converter: TransactionsConverter, transactions: Iterable[ITransaction], chunk_size_in_bytes: int) -> None:
+        self.converter = converter
+        self.transactions = transactions
+        self.chunk_size_in_bytes = chunk_size_in_bytes
+        self._is_one_shot = iter(transactions) is transactions
+        self._num_iterations = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self._is_one_shot and self._num_iterations > 0:
+            raise StreamConsumedError()
+
+        self._num_iterations += 1
+        return self._generate_chunks()
+
+    def _generate_chunks(self) -> Iterator[bytes]:
+        buffer = bytearray(b"[")
+
+        for index, transaction in enumerate(self.transactions):
+            if index > 0:
+                buffer += b","
+            buffer += self.converter.transaction_to_json(transaction)
+
+            if len(buffer) >= self.chunk_size_in_bytes:
+                yield bytes(buffer)
+                buffer.clear()
+
+        buffer += b"]"
+        yield bytes(buffer)
+
+
+class _OutcomesConverter:
+    def __init__(self, skip_results_without_data: bool = False, skip_logs_without_events: bool = False) -> None:
+        self.skip_results_without_data = skip_results_without_data
+        self.skip_logs_without_events = skip_logs_without_events
+        self._bech32_addresses: Dict[Tuple[str, str], str] = {}
+
+    def convert(self, transaction_on_network: TransactionOnNetwork) -> TransactionOutcome:
+        results = [self._sc_result_item_on_network_to_sc_result(item) for item in transaction_on_network.contract_results.items
+                   if not self._should_skip_result(item)]
+        logs = self._logs_on_network_to_logs(transaction_on_network.logs)
+
+        return TransactionOutcome(
+            transaction_results=results,
+            transaction_logs=logs
+        )
+
+    def _should_skip_result(self, sc_result_item: SCResultItemOnNetwork) -> bool:
+        return self.skip_results_without_data and not sc_result_item.data and not sc_result_item.logs.events
+
+    def _logs_on_network_to_logs(self, logs: TransactionLogsOnNetwork) -> TransactionLogs:
+        if self.skip_logs_without_events and not logs.events:
+            return TransactionLogs()
+
+        return TransactionLogs(
+            address=self._to_bech32(logs.address),
+            events=[self._event_on_network_to_event(event) for event in logs.events]
+        )
+
+    def _event_on_network_to_event(self, event: TransactionEventOnNetwork) -> TransactionEvent:
+        address = self._to_bech32(event.address)
+        identifier = event.identifier
+        topics = [topic.raw for topic in event.topics]
+
+        legacy_data = event.data_payload.raw if event.data_payload else b'' or event.data.encode()
+        data_items = [data.raw for data in event.additional_data] if event.additional_data else []
+
+        if len(data_items) == 0:
+            if len(legacy_data):
+                data_items.append(legacy_data)
+
+        return TransactionEvent(address, identifier, topics, data_items)
+
+    def _sc_result_item_on_network_to_sc_result(self, sc_result_item: SCResultItemOnNetwork) -> SmartContractResult:
+        sender = self._to_bech32(sc_result_item.sender)
+        receiver = self._to_bech32(sc_result_item.receiver)
+        data = sc_result_item.data.encode()
+        logs = self._logs_on_network_to_logs(sc_result_item.logs)
+
+        return SmartContractResult(
+            sender=sender,
+            receiver=receiver,
+            data=data,
+            logs=logs
+        )
+
+    def _to_bech32(self, address: IAddress) -> str:
+        key = (getattr(address, "hrp", ""), address.to_hex())
+        bech32_address = self._bech32_addresses.get(key)
+
+        if bech32_address is None:
+            bech32_address = address.to_bech32()
+            self._bech32_addresses[key] = bech32_address
+
+        return bech32_address
@@ -1,5 +1,10 @@
 import base64
+import json
+from typing import Any, List, Tuple
 
+import pytest
+
+from multiversx_sdk.converters.errors import StreamConsumedError
 from multiversx_sdk.converters.transactions_converter import \
     TransactionsConverter
 from multiversx_sdk.core.address import Address
@@ -19,6 +24,8 @@ from multiversx_sdk.network_providers.transaction_events import \
 from multiversx_sdk.network_providers.transaction_logs import \
     TransactionLogs as TxLogsOnNetwork
 from multiversx_sdk.network_providers.transactions import TransactionOnNetwork
+from multiversx_sdk.testutils.addresses import ALICE, BOB
+from multiversx_sdk.testutils.hyperblocks import create_hyperblock
 
 
 class TransactionMatcher:
@@ -67,6 +74,40 @@ def test_transaction_converter():
     assert TransactionMatcher(transaction) == restored_tx
 
 
+def create_transactions(count: int) -> List[Transaction]:
+    return [
+        Transaction(
+            nonce=nonce,
+            sender=ALICE,
+            receiver=BOB,
+            gas_limit=50000,
+            chain_id="D",
+            signature=bytes(64)
+        ) for nonce in range(count)
+    ]
+
+
+def test_transactions_to_json_stream():
+    converter = TransactionsConverter()
+    transactions = create_transactions(100)
+
+    stream = converter.transactions_to_json_stream(transactions, chunk_size_in_bytes=2000)
+    chunks = list(stream)
+    assert len(chunks) > 1
+    assert all(len(chunk) < 2000 + len(converter.transaction_to_json(transactions[0])) + 1 for chunk in chunks)
+    assert json.loads(b"".join(chunks)) == json.loads(converter.transactions_to_json(transactions))
+
+    # Can be iterated again (e.g. for retries), since its source is a sequence.
+    assert list(stream) == chunks
+    assert list(converter.transactions_to_json_stream([])) == [b"[]"]
+
+    stream = converter.transactions_to_json_stream(iter(transactions))
+    assert json.loads(b"".join(stream)) == json.loads(converter.transactions_to_json(transactions))
+
+    with pytest.raises(StreamConsumedError):
+        list(stream)
+
+
 def test_convert_tx_on_network_to_outcome():
     converter = TransactionsConverter()
 
@@ -209,3 +250,39 @@ def test_convert_tx_on_network_to_outcome_with_signal_error():
     assert actual_tx_outcome.transaction_results[0].logs.events[0].identifier == expected_tx_outcome.transaction_results[0].logs.events[0].identifier
     assert actual_tx_outcome.transaction_results[0].logs.events[0].data_items == expected_tx_outcome.transaction_results[0].logs.events[0].data_items
     assert actual_tx_outcome.transaction_results[0].logs.events[0].topics == expected_tx_outcome.transaction_results[0].logs.events[0].topics
+
+
+def test_convert_many_txs_on_network_to_outcomes():
+    converter = TransactionsConverter()
+    transactions = [TransactionOnNetwork.from_proxy_http_response(item["hash"], item) for item in create_hyperblock(1, 8)["transactions"]]
+
+    outcomes = converter.transactions_on_network_to_outcomes(transactions)
+    assert [describe_outcome(outcome) for outcome in outcomes] == [describe_outcome(converter.transaction_on_network_to_outcome(item)) for item in transactions]
+
+    # Results without data (and without events), and logs without events, can be left out.
+    refund = ContractResultItemOnNetwork()
+    refund.sender = Address.new_from_bech32("erd1qqqqqqqqqqqqqpgqj8k976l59n7fyth8ujl4as5uyn3twn0ha0wsge5r5x")
+    refund.value = 42
+    call = ContractResultItemOnNetwork()
+    call.data = "@6f6b"
+
+    tx_on_network = TransactionOnNetwork()
+    tx_on_network.contract_results = ContractResultOnNetwork([refund, call])
+    tx_on_network.logs = TxLogsOnNetwork()
+    tx_on_network.logs.address = Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th")
+
+    [outcome] = converter.transactions_on_network_to_outcomes([tx_on_network])
+    assert [result.data for result in outcome.transaction_results] == [b"", b"@6f6b"]
+    assert outcome.logs.address == "erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th"
+
+    [outcome] = converter.transactions_on_network_to_outcomes([tx_on_network], skip_results_without_data=True, skip_logs_without_events=True)
+    assert [result.data for result in outcome.transaction_results] == [b"@6f6b"]
+    assert outcome.logs.address == ""
+
+
+def describe_outcome(outcome: TransactionOutcome) -> Tuple[Any, ...]:
+    def describe_logs(logs: TransactionLogs) -> Tuple[Any, ...]:
+        return (logs.address, [(event.address, event.identifier, event.topics, event.data_items) for event in logs.events])
+
+    results = [(result.sender, result.receiver, result.data, describe_logs(result.logs)) for result in outcome.transaction_results]
+    return (results, describe_logs(outcome.logs))
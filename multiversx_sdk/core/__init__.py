@@ -13,6 +13,8 @@ from multiversx_sdk.core.token_payment import TokenPayment
 from multiversx_sdk.core.tokens import (Token, TokenComputer,
                                         TokenIdentifierParts, TokenTransfer)
 from multiversx_sdk.core.transaction import Transaction
+from multiversx_sdk.core.transaction_batch import (TransactionBatch,
+                                                   TransactionInBatch)
 from multiversx_sdk.core.transaction_computer import TransactionComputer
 from multiversx_sdk.core.transaction_payload import TransactionPayload
 from multiversx_sdk.core.transactions_factories.account_transactions_factory import \
@@ -32,8 +34,9 @@ from multiversx_sdk.core.transactions_factories.transfer_transactions_factory im
 from multiversx_sdk.core.transactions_outcome_parsers.delegation_transactions_outcome_parser import \
     DelegationTransactionsOutcomeParser
 from multiversx_sdk.core.transactions_outcome_parsers.resources import (
-    SmartContractResult, TransactionEvent, TransactionLogs, TransactionOutcome,
-    find_events_by_first_topic, find_events_by_identifier)
+    SmartContractResult, TransactionEvent, TransactionEventsIndex,
+    TransactionLogs, TransactionOutcome, find_events_by_first_topic,
+    find_events_by_identifier)
 from multiversx_sdk.core.transactions_outcome_parsers.smart_contract_transactions_outcome_parser import \
     SmartContractTransactionsOutcomeParser
 from multiversx_sdk.core.transactions_outcome_parsers.token_management_transactions_outcome_parser import \
@@ -44,11 +47,12 @@ from multiversx_sdk.core.transactions_outcome_parsers.transaction_events_parser
 __all__ = [
     "AccountNonceHolder", "Address", "AddressFactory", "AddressComputer",
     "Transaction", "TransactionPayload", "TransactionComputer",
+    "TransactionBatch", "TransactionInBatch",
     "Message", "MessageComputer", "CodeMetadata", "TokenPayment",
     "ContractQuery", "ContractQueryBuilder",
     "Token", "TokenComputer", "TokenTransfer", "TokenIdentifierParts",
     "TokenManagementTransactionsOutcomeParser", "SmartContractResult",
-    "TransactionEvent", "TransactionLogs", "TransactionOutcome",
+    "TransactionEvent", "TransactionEventsIndex", "TransactionLogs", "TransactionOutcome",
     "DelegationTransactionsFactory", "TokenManagementTransactionsFactory",
     "RegisterAndSetAllRolesTokenType", "TransactionsFactoryConfig",
     "SmartContractTransactionsFactory", "TransferTransactionsFactory",
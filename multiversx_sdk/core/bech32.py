@@ -24,17 +24,25 @@
 from typing import List, Union
 
 CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+GENERATOR = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
+
+
+def _xor_generators(top: int) -> int:
+    result = 0
+    for i in range(5):
+        result ^= GENERATOR[i] if ((top >> i) & 1) else 0
+    return result
+
+
+# For each value of the top 5 bits of the checksum, the XOR of the corresponding generators (so that a value is processed in one step).
+GENERATOR_BY_TOP = [_xor_generators(top) for top in range(32)]
 
 
 def bech32_polymod(values: List[int]):
     """Internal function that computes the Bech32 checksum."""
-    generator = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
     chk = 1
     for value in values:
-        top = chk >> 25
-        chk = (chk & 0x1ffffff) << 5 ^ value
-        for i in range(5):
-            chk ^= generator[i] if ((top >> i) & 1) else 0
+        chk = (chk & 0x1ffffff) << 5 ^ value ^ GENERATOR_BY_TOP[chk >> 25]
     return chk
 
 
@@ -80,6 +88,9 @@ def bech32_decode(bech: str):
 
 def convertbits(data: Union[List[int], bytes], frombits: int, tobits: int, pad: bool = True) -> Union[List[int], None]:
     """General power-of-2 base conversion."""
+    if isinstance(data, bytes) and frombits == 8 and pad:
+        return _convert_bytes(data, tobits)
+
     acc: int = 0
     bits: int = 0
     ret: List[int] = []
@@ -101,6 +112,14 @@ def convertbits(data: Union[List[int], bytes], frombits: int, tobits: int, pad:
     return ret
 
 
+def _convert_bytes(data: bytes, tobits: int) -> List[int]:
+    """Same as "convertbits()" (with padding), for byte strings, but faster (through a big integer)."""
+    num_groups = (len(data) * 8 + tobits - 1) // tobits
+    acc = int.from_bytes(data, "big") << (num_groups * tobits - len(data) * 8)
+    maxv = (1 << tobits) - 1
+    return [(acc >> (tobits * i)) & maxv for i in range(num_groups - 1, -1, -1)]
+
+
 def decode(hrp: str, addr: str):
     """Decode a segwit address."""
     hrpgot, data = bech32_decode(addr)
@@ -0,0 +1,85 @@
+from typing import List, Union
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from multiversx_sdk.core.address import Address
+from multiversx_sdk.core.bech32 import (CHARSET, bech32_decode, bech32_encode,
+                                        bech32_hrp_expand, bech32_polymod,
+                                        convertbits)
+
+
+# The reference implementation (BIP 173), before it was optimized.
+def reference_bech32_polymod(values: List[int]) -> int:
+    generator = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
+    chk = 1
+    for value in values:
+        top = chk >> 25
+        chk = (chk & 0x1ffffff) << 5 ^ value
+        for i in range(5):
+            chk ^= generator[i] if ((top >> i) & 1) else 0
+    return chk
+
+
+def reference_convertbits(data: Union[List[int], bytes], frombits: int, tobits: int, pad: bool = True) -> Union[List[int], None]:
+    acc = 0
+    bits = 0
+    ret: List[int] = []
+    maxv = (1 << tobits) - 1
+    max_acc = (1 << (frombits + tobits - 1)) - 1
+    for value in data:
+        if value < 0 or (value >> frombits):
+            return None
+        acc = ((acc << frombits) | value) & max_acc
+        bits += frombits
+        while bits >= tobits:
+            bits -= tobits
+            ret.append((acc >> bits) & maxv)
+    if pad:
+        if bits:
+            ret.append((acc << (tobits - bits)) & maxv)
+    elif bits >= frombits or ((acc << (tobits - bits)) & maxv):
+        return None
+    return ret
+
+
+hrps = st.text(alphabet=[chr(code) for code in range(33, 127) if not chr(code).isupper()], min_size=1, max_size=10)
+
+
+@given(st.lists(st.integers(min_value=0, max_value=31)))
+def test_polymod_is_the_same_as_the_reference(values: List[int]):
+    assert bech32_polymod(values) == reference_bech32_polymod(values)
+
+
+@given(st.binary(max_size=100), st.integers(min_value=1, max_value=16), st.booleans())
+def test_convertbits_is_the_same_as_the_reference(data: bytes, tobits: int, pad: bool):
+    assert convertbits(data, 8, tobits, pad) == reference_convertbits(data, 8, tobits, pad)
+    assert convertbits(list(data), 8, tobits, pad) == reference_convertbits(list(data), 8, tobits, pad)
+
+
+@given(hrps, st.binary(max_size=40))
+def test_encode_then_decode(hrp: str, data: bytes):
+    words = convertbits(data, 8, 5)
+    assert words is not None
+
+    encoded = bech32_encode(hrp, words)
+    decoded_hrp, decoded_words = bech32_decode(encoded)
+
+    assert decoded_hrp == hrp
+    assert decoded_words == words
+    assert decoded_words is not None and convertbits(decoded_words, 5, 8, False) == list(data)
+
+    # The checksum is valid according to the reference implementation, too.
+    values = [CHARSET.find(x) for x in encoded[len(hrp) + 1:]]
+    assert reference_bech32_polymod(bech32_hrp_expand(hrp) + values) == 1
+
+
+@given(st.binary(min_size=32, max_size=32))
+def test_address_round_trip(pubkey: bytes):
+    address = Address(pubkey, "erd")
+    assert Address.new_from_bech32(address.to_bech32()).get_public_key() == pubkey
+
+
+def test_known_address():
+    pubkey = bytes.fromhex("0139472eff6886771a982f3083da5d421f24c29181e63888228dc81ca60d69e1")
+    assert Address(pubkey, "erd").to_bech32() == "erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th"
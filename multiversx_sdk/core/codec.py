@@ -3,7 +3,10 @@ from multiversx_sdk.core.constants import INTEGER_MAX_NUM_BYTES
 
 
 def encode_unsigned_number(arg: int) -> bytes:
-    return arg.to_bytes(INTEGER_MAX_NUM_BYTES, byteorder="big", signed=False).lstrip(bytes([0]))
+    length = (arg.bit_length() + 7) // 8
+    if length > INTEGER_MAX_NUM_BYTES:
+        raise OverflowError("int too big to convert")
+    return arg.to_bytes(length, byteorder="big", signed=False)
 
 
 def encode_signed_number(arg: int) -> bytes:
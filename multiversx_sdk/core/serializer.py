@@ -1,4 +1,5 @@
-from typing import Any, List, Protocol, Sequence, runtime_checkable
+from typing import (Any, Callable, Dict, List, Protocol, Sequence,
+                    runtime_checkable)
 
 from multiversx_sdk.core.codec import (encode_signed_number,
                                        encode_unsigned_number)
@@ -17,8 +18,7 @@ def args_to_string(args: Sequence[Any]) -> str:
 
 
 def args_to_strings(args: Sequence[Any]) -> List[str]:
-    buffers = args_to_buffers(args)
-    return [buffer.hex() for buffer in buffers]
+    return [arg_to_string(arg) for arg in args]
 
 
 def args_to_buffers(args: Sequence[Any]) -> List[bytes]:
@@ -26,17 +26,24 @@ def args_to_buffers(args: Sequence[Any]) -> List[bytes]:
 
 
 def arg_to_string(arg: Any) -> str:
+    # Fast path, for the common types (exact type match, instead of a chain of "isinstance()" checks).
+    encoder = _hex_encoders.get(type(arg))
+    if encoder is not None:
+        return encoder(arg)
+
     buffer = arg_to_buffer(arg)
     return buffer.hex()
 
 
 def arg_to_buffer(arg: Any) -> bytes:
+    encoder = _buffer_encoders.get(type(arg))
+    if encoder is not None:
+        return encoder(arg)
+
     if isinstance(arg, str):
         return arg.encode("utf-8")
     if isinstance(arg, int):
-        if arg < 0:
-            return encode_signed_number(arg)
-        return encode_unsigned_number(arg)
+        return _int_to_buffer(arg)
     if isinstance(arg, bytes):
         return arg
     if isinstance(arg, bytearray):
@@ -44,3 +51,32 @@ def arg_to_buffer(arg: Any) -> bytes:
     if isinstance(arg, IArgument):
         return arg.serialize()
     raise ErrCannotSerializeArgument(arg)
+
+
+def _int_to_buffer(arg: int) -> bytes:
+    if arg < 0:
+        return encode_signed_number(arg)
+    return encode_unsigned_number(arg)
+
+
+def _int_to_hex(arg: int) -> str:
+    return _int_to_buffer(arg).hex()
+
+
+def _str_to_hex(arg: str) -> str:
+    return arg.encode("utf-8").hex()
+
+
+_buffer_encoders: Dict[type, Callable[[Any], bytes]] = {
+    str: lambda arg: arg.encode("utf-8"),
+    int: _int_to_buffer,
+    bytes: lambda arg: arg,
+    bytearray: bytes
+}
+
+_hex_encoders: Dict[type, Callable[[Any], str]] = {
+    str: _str_to_hex,
+    int: _int_to_hex,
+    bytes: bytes.hex,
+    bytearray: bytearray.hex
+}
@@ -0,0 +1,74 @@
+from typing import Any, List
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from multiversx_sdk.core.address import Address
+from multiversx_sdk.core.errors import ErrCannotSerializeArgument
+from multiversx_sdk.core.serializer import (arg_to_buffer, arg_to_string,
+                                            args_to_buffers, args_to_string,
+                                            args_to_strings)
+
+
+def reference_arg_to_buffer(arg: Any) -> bytes:
+    """The previous implementation (an "isinstance" chain, fixed-size encoding of unsigned integers)."""
+    if isinstance(arg, str):
+        return arg.encode("utf-8")
+    if isinstance(arg, int):
+        if arg < 0:
+            length = ((arg + (arg < 0)).bit_length() + 7 + 1) // 8
+            return arg.to_bytes(length, byteorder="big", signed=True)
+        return arg.to_bytes(64, byteorder="big", signed=False).lstrip(bytes([0]))
+    if isinstance(arg, bytes):
+        return arg
+    if isinstance(arg, bytearray):
+        return bytes(arg)
+    return arg.serialize()
+
+
+def reference_args_to_string(args: List[Any]) -> str:
+    return "@".join(reference_arg_to_buffer(arg).hex() for arg in args)
+
+
+class Flag(int):
+    pass
+
+
+arguments = st.one_of(
+    st.integers(min_value=-2**511, max_value=2**512 - 1),
+    st.integers(min_value=-300, max_value=300),
+    st.booleans(),
+    st.builds(Flag, st.integers(min_value=0, max_value=2**64)),
+    st.text(),
+    st.binary(),
+    st.builds(bytearray, st.binary()),
+    st.builds(lambda pubkey: Address(pubkey, "erd"), st.binary(min_size=32, max_size=32))
+)
+
+
+@given(arguments)
+def test_arg_to_buffer_and_arg_to_string(arg: Any):
+    expected = reference_arg_to_buffer(arg)
+
+    assert arg_to_buffer(arg) == expected
+    assert type(arg_to_buffer(arg)) is bytes
+    assert arg_to_string(arg) == expected.hex()
+
+
+@given(st.lists(arguments))
+def test_args_to_string(args: List[Any]):
+    assert args_to_string(args) == reference_args_to_string(args)
+    assert args_to_strings(args) == [reference_arg_to_buffer(arg).hex() for arg in args]
+    assert args_to_buffers(args) == [reference_arg_to_buffer(arg) for arg in args]
+
+
+def test_bad_arguments():
+    with pytest.raises(OverflowError):
+        arg_to_string(2**512)
+
+    with pytest.raises(OverflowError):
+        arg_to_buffer(2**512)
+
+    with pytest.raises(ErrCannotSerializeArgument):
+        arg_to_string(1.5)
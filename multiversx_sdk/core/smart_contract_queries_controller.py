@@ -1,4 +1,4 @@
-from typing import Any, List, Optional, Protocol
+from typing import Any, List, Optional, Protocol, Sequence
 
 from multiversx_sdk.abi import Serializer
 from multiversx_sdk.abi.typesystem import (is_list_of_bytes,
@@ -49,6 +49,15 @@ class SmartContractQueriesController:
         self._raise_for_status(query_response)
         return self.parse_query_response(query_response)
 
+    def query_multiple(self, queries: Sequence[SmartContractQuery]) -> List[List[Any]]:
+        """Runs the queries (see "run_queries()") and parses their responses. Raises if any of the queries has failed."""
+        query_responses = self.run_queries(queries)
+
+        for query_response in query_responses:
+            self._raise_for_status(query_response)
+
+        return [self.parse_query_response(query_response) for query_response in query_responses]
+
     def _raise_for_status(self, query_response: SmartContractQueryResponse):
         is_ok = query_response.return_code == "ok"
         if not is_ok:
@@ -88,6 +97,19 @@ class SmartContractQueriesController:
         query_response = self.query_runner.run_query(query)
         return query_response
 
+    def run_queries(self, queries: Sequence[SmartContractQuery]) -> List[SmartContractQueryResponse]:
+        """
+        Runs the queries, returning the responses in the same order. If the query runner supports it
+        (e.g. "QueryRunnerAdapter"), identical queries are deduplicated and the rest are run concurrently.
+        """
+        run_queries = getattr(self.query_runner, "run_queries", None)
+
+        if run_queries is None:
+            return [self.run_query(query) for query in queries]
+
+        query_responses: List[SmartContractQueryResponse] = run_queries(queries)
+        return query_responses
+
     def parse_query_response(self, response: SmartContractQueryResponse) -> List[Any]:
         encoded_values = response.return_data_parts
 
@@ -1,5 +1,8 @@
 import base64
+import threading
+import time
 from pathlib import Path
+from typing import List
 
 import pytest
 
@@ -7,17 +10,38 @@ from multiversx_sdk.abi.abi import Abi
 from multiversx_sdk.abi.string_value import StringValue
 from multiversx_sdk.adapters.query_runner_adapter import QueryRunnerAdapter
 from multiversx_sdk.core.codec import encode_unsigned_number
+from multiversx_sdk.core.errors import SmartContractQueryError
 from multiversx_sdk.core.smart_contract_queries_controller import \
     SmartContractQueriesController
 from multiversx_sdk.core.smart_contract_query import (
     SmartContractQuery, SmartContractQueryResponse)
 from multiversx_sdk.network_providers.contract_query_response import \
     ContractQueryResponse
+from multiversx_sdk.network_providers.interface import IContractQuery
 from multiversx_sdk.network_providers.proxy_network_provider import \
     ProxyNetworkProvider
 from multiversx_sdk.testutils.mock_network_provider import MockNetworkProvider
 
 
+class SlowNetworkProvider(MockNetworkProvider):
+    def __init__(self) -> None:
+        super().__init__()
+        self.queried_arguments: List[List[str]] = []
+        self.lock = threading.Lock()
+
+    def query_contract(self, query: IContractQuery) -> ContractQueryResponse:
+        with self.lock:
+            self.queried_arguments.append(list(query.get_encoded_arguments()))
+
+        time.sleep(0.05)
+
+        # Echoes the first argument.
+        response = ContractQueryResponse()
+        response.return_code = "ok" if query.get_function() != "fail" else "user error"
+        response.return_data = [base64.b64encode(bytes.fromhex(argument)).decode() for argument in query.get_encoded_arguments()[:1]]
+        return response
+
+
 class TestSmartContractQueriesController:
     testdata = Path(__file__).parent.parent / "testutils" / "testdata"
 
@@ -105,6 +129,40 @@ class TestSmartContractQueriesController:
         assert response.return_code == "ok"
         assert response.return_data_parts == ["abba".encode()]
 
+    def test_run_queries(self):
+        network_provider = SlowNetworkProvider()
+        query_runner = QueryRunnerAdapter(network_provider, max_concurrent_queries=8)
+        controller = SmartContractQueriesController(query_runner)
+        contract = "erd1qqqqqqqqqqqqqpgqvc7gdl0p4s97guh498wgz75k8sav6sjfjlwqh679jy"
+
+        queries = [SmartContractQuery(contract, "echo", [bytes([index % 8])]) for index in range(32)]
+        queries.append(SmartContractQuery(contract, "echo", [bytes([0])], caller="erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th"))
+
+        start = time.perf_counter()
+        responses = controller.run_queries(queries)
+        duration = time.perf_counter() - start
+
+        assert [response.return_data_parts for response in responses] == [[bytes([index % 8])] for index in range(32)] + [[bytes([0])]]
+        # Only the distinct queries reach the network, and they run concurrently.
+        assert sorted(network_provider.queried_arguments) == sorted([[bytes([index]).hex()] for index in range(8)] + [["00"]])
+        assert duration < 0.05 * 9 / 2
+
+        assert controller.query_multiple(queries[:3]) == [[bytes([0])], [bytes([1])], [bytes([2])]]
+        assert controller.run_queries([]) == []
+
+        with pytest.raises(SmartContractQueryError):
+            controller.query_multiple([queries[0], SmartContractQuery(contract, "fail", [])])
+
+    def test_run_queries_without_batching_support(self):
+        class QueryRunner:
+            def run_query(self, query: SmartContractQuery) -> SmartContractQueryResponse:
+                return SmartContractQueryResponse(query.function, "ok", "", query.arguments)
+
+        controller = SmartContractQueriesController(QueryRunner())
+        queries = [SmartContractQuery("erd1qqqqqqqqqqqqqpgqvc7gdl0p4s97guh498wgz75k8sav6sjfjlwqh679jy", "echo", [bytes([index])]) for index in range(3)]
+
+        assert controller.query_multiple(queries) == [[bytes([0])], [bytes([1])], [bytes([2])]]
+
     def test_parse_query_response(self):
         query_runner = QueryRunnerAdapter(MockNetworkProvider())
         controller = SmartContractQueriesController(query_runner)
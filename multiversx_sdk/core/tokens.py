@@ -1,4 +1,5 @@
-from typing import List
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
 
 from multiversx_sdk.core.codec import (decode_unsigned_number,
                                        encode_unsigned_number)
@@ -7,6 +8,11 @@ from multiversx_sdk.core.errors import (BadUsageError,
                                         InvalidTokenIdentifierError)
 from multiversx_sdk.core.interfaces import IToken, ITokenIdentifierParts
 
+MIN_TICKER_LENGTH = 3
+MAX_TICKER_LENGTH = 10
+# The maximum number of (distinct) identifiers whose parsed parts are cached (see "TokenComputer").
+MAX_CACHED_IDENTIFIERS = 16384
+
 
 class Token:
     def __init__(self, identifier: str, nonce: int = 0) -> None:
@@ -29,6 +35,11 @@ class TokenIdentifierParts:
 
 
 class TokenComputer:
+    """
+    The parts of the (valid) identifiers are cached (shared by all instances, bounded by "MAX_CACHED_IDENTIFIERS"),
+    so that the identifiers handled repeatedly (e.g. by the transactions factories and the outcome parsers) are parsed and validated only once.
+    """
+
     def __init__(self) -> None:
         pass
 
@@ -36,6 +47,10 @@ class TokenComputer:
         return token.nonce == 0
 
     def extract_nonce_from_extended_identifier(self, identifier: str) -> int:
+        cached = _parse_extended_identifier(identifier)
+        if cached:
+            return cached[2]
+
         parts = identifier.split("-")
 
         self._check_if_extended_identifier_was_provided(parts)
@@ -49,6 +64,10 @@ class TokenComputer:
         return decode_unsigned_number(hex_nonce)
 
     def extract_identifier_from_extended_identifier(self, identifier: str) -> str:
+        cached = _parse_extended_identifier(identifier)
+        if cached:
+            return cached[0] + "-" + cached[1]
+
         parts = identifier.split("-")
 
         self._check_if_extended_identifier_was_provided(parts)
@@ -65,6 +84,10 @@ class TokenComputer:
         return parts[0]
 
     def parse_extended_identifier_parts(self, identifier: str) -> TokenIdentifierParts:
+        cached = _parse_extended_identifier(identifier)
+        if cached:
+            return TokenIdentifierParts(*cached)
+
         parts = identifier.split("-")
 
         self._check_if_extended_identifier_was_provided(parts)
@@ -74,6 +97,10 @@ class TokenComputer:
         nonce = decode_unsigned_number(bytes.fromhex(parts[2])) if len(parts) == 3 else 0
         return TokenIdentifierParts(parts[0], parts[1], nonce)
 
+    def parse_extended_identifiers_parts(self, identifiers: Sequence[str]) -> List[TokenIdentifierParts]:
+        """Same as "parse_extended_identifier_parts()", for many identifiers (e.g. the tokens of an account)."""
+        return [self.parse_extended_identifier_parts(identifier) for identifier in identifiers]
+
     def compute_extended_identifier_from_identifier_and_nonce(self, identifier: str, nonce: int) -> str:
         identifier_parts = identifier.split("-")
 
@@ -103,9 +130,6 @@ class TokenComputer:
             raise InvalidTokenIdentifierError("Invalid extended token identifier provided")
 
     def _ensure_token_ticker_validity(self, ticker: str) -> None:
-        MIN_TICKER_LENGTH = 3
-        MAX_TICKER_LENGTH = 10
-
         if len(ticker) < MIN_TICKER_LENGTH or len(ticker) > MAX_TICKER_LENGTH:
             raise InvalidTokenIdentifierError(f"The token ticker should be between {MIN_TICKER_LENGTH} and {MAX_TICKER_LENGTH} characters")
 
@@ -118,3 +142,25 @@ class TokenComputer:
     def _check_length_of_random_sequence(self, random_sequence: str) -> None:
         if len(random_sequence) != TOKEN_RANDOM_SEQUENCE_LENGTH:
             raise InvalidTokenIdentifierError("The identifier is not valid. The random sequence does not have the right length")
+
+
+@lru_cache(maxsize=MAX_CACHED_IDENTIFIERS)
+def _parse_extended_identifier(identifier: str) -> Optional[Tuple[str, str, int]]:
+    """
+    Returns the ticker, the random sequence and the nonce of a valid (extended) identifier, or None otherwise
+    (in which case, the slower, per-method validation applies, raising the appropriate error).
+    """
+    parts = identifier.split("-")
+    if len(parts) not in (2, 3) or len(parts[1]) != TOKEN_RANDOM_SEQUENCE_LENGTH:
+        return None
+
+    ticker = parts[0]
+    if not (MIN_TICKER_LENGTH <= len(ticker) <= MAX_TICKER_LENGTH and ticker.isalnum() and ticker.isupper()):
+        return None
+
+    try:
+        nonce = decode_unsigned_number(bytes.fromhex(parts[2])) if len(parts) == 3 else 0
+    except ValueError:
+        return None
+
+    return ticker, parts[1], nonce
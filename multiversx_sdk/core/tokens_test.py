@@ -1,6 +1,7 @@
 import pytest
 
-from multiversx_sdk.core.errors import BadUsageError
+from multiversx_sdk.core.errors import (BadUsageError,
+                                        InvalidTokenIdentifierError)
 from multiversx_sdk.core.tokens import (Token, TokenComputer,
                                         TokenIdentifierParts)
 
@@ -86,3 +87,24 @@ class TestTokenComputer:
 
         assert fungible_identifier == "FNG-123456"
         assert nft_identifier == "NFT-987654-0a"
+
+    def test_parse_extended_identifiers_parts(self):
+        identifiers = ["FNG-123456", "NFT-987654-0a", "FNG-123456"]
+
+        parts = self.token_computer.parse_extended_identifiers_parts(identifiers)
+        assert [(item.ticker, item.random_sequence, item.nonce) for item in parts] == [("FNG", "123456", 0), ("NFT", "987654", 10), ("FNG", "123456", 0)]
+
+        # The parts are not shared (they can be altered by the caller).
+        parts[0].nonce = 7
+        assert self.token_computer.parse_extended_identifier_parts("FNG-123456").nonce == 0
+
+    def test_cached_parsing_keeps_the_validation_of_each_method(self):
+        # Not cached (the ticker is lowercase), but the nonce can still be extracted.
+        assert self.token_computer.extract_nonce_from_extended_identifier("nft-987654-0a") == 10
+
+        for _ in range(2):
+            with pytest.raises(InvalidTokenIdentifierError, match="should be upper case"):
+                self.token_computer.parse_extended_identifier_parts("nft-987654-0a")
+
+            with pytest.raises(InvalidTokenIdentifierError, match="random sequence does not have the right length"):
+                self.token_computer.extract_identifier_from_extended_identifier("NFT-98765-0a")
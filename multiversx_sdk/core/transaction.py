@@ -6,6 +6,10 @@ from multiversx_sdk.core.constants import (TRANSACTION_MIN_GAS_PRICE,
 
 
 class Transaction:
+    # Transactions are often held in large numbers (e.g. for distributions): slots save the per-instance dictionary.
+    __slots__ = ("chain_id", "sender", "receiver", "gas_limit", "nonce", "value", "data", "signature",
+                 "sender_username", "receiver_username", "gas_price", "version", "options", "guardian", "guardian_signature")
+
     def __init__(self,
                  sender: str,
                  receiver: str,
@@ -46,4 +50,4 @@ class Transaction:
         if not isinstance(other, Transaction):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, name) == getattr(other, name) for name in Transaction.__slots__)
@@ -0,0 +1,364 @@
+from array import array
+from typing import Any, Iterator, Optional, Sequence, Union, overload
+
+from multiversx_sdk.core.address import Address
+from multiversx_sdk.core.constants import (TRANSACTION_MIN_GAS_PRICE,
+                                           TRANSACTION_OPTIONS_DEFAULT,
+                                           TRANSACTION_VERSION_DEFAULT)
+from multiversx_sdk.core.errors import BadUsageError
+from multiversx_sdk.core.interfaces import IAddress, ITransaction
+from multiversx_sdk.core.transaction import Transaction
+
+PUBKEY_LENGTH = 32
+SIGNATURE_LENGTH = 64
+# The values (in atomic units of EGLD) are stored as unsigned 128-bit integers (the total supply is below 2^85).
+VALUE_LENGTH = 16
+HAS_SIGNATURE_FLAG = 1
+HAS_GUARDIAN_SIGNATURE_FLAG = 2
+
+
+class TransactionBatch:
+    """
+    Holds many transactions of the same sender, column-wise: the fields shared by all the transactions (sender, chain ID,
+    gas price, version, options, guardian, usernames) are stored once, while the nonces, gas limits, receivers, values,
+    data and signatures are stored in compact arrays and buffers (instead of one Python object per field, per transaction).
+
+    Items are accessed through views ("TransactionInBatch", see "batch[index]"), which implement "ITransaction",
+    thus can be signed (e.g. by "TransactionComputer" and a signer) or sent (e.g. by "ProxyNetworkProvider.send_transactions()").
+    """
+
+    def __init__(self,
+                 sender: str,
+                 chain_id: str,
+                 gas_price: Optional[int] = None,
+                 version: Optional[int] = None,
+                 options: Optional[int] = None,
+                 guardian: Optional[str] = None,
+                 sender_username: Optional[str] = None,
+                 receiver_username: Optional[str] = None) -> None:
+        """
+        Args:
+            sender (str): the (bech32) address of the sender of all the transactions.
+            chain_id (str): the chain ID of all the transactions.
+            gas_price (Optional[int]): the gas price of all the transactions.
+            version (Optional[int]): the version of all the transactions.
+            options (Optional[int]): the options of all the transactions.
+            guardian (Optional[str]): the (bech32) address of the guardian of all the transactions, if any.
+            sender_username (Optional[str]): the username of the sender, if any.
+            receiver_username (Optional[str]): the username of the receivers, if any (rarely used).
+        """
+        self.sender = sender
+        self.chain_id = chain_id
+        self.gas_price = gas_price or TRANSACTION_MIN_GAS_PRICE
+        self.version = version or TRANSACTION_VERSION_DEFAULT
+        self.options = options or TRANSACTION_OPTIONS_DEFAULT
+        self.guardian = guardian or ""
+        self.sender_username = sender_username or ""
+        self.receiver_username = receiver_username or ""
+        self.hrp = Address.new_from_bech32(sender).get_hrp()
+
+        self._nonces = array("Q")
+        self._gas_limits = array("Q")
+        self._receivers = bytearray()
+        self._values = bytearray()
+        # The data of the transactions is appended to a single buffer: each transaction points to a slice of it.
+        self._data = bytearray()
+        self._data_offsets = array("Q")
+        self._data_lengths = array("I")
+        self._signatures = bytearray()
+        # Only allocated for guarded transactions.
+        self._guardian_signatures = bytearray()
+        # See "HAS_SIGNATURE_FLAG" and "HAS_GUARDIAN_SIGNATURE_FLAG".
+        self._flags = bytearray()
+
+    @staticmethod
+    def new_from_transactions(transactions: Sequence[ITransaction]) -> "TransactionBatch":
+        """Creates a batch holding (copies of) the given transactions, which must share the sender, the chain ID, the gas price etc."""
+        if not transactions:
+            raise BadUsageError("Cannot create a batch without transactions")
+
+        first = transactions[0]
+        batch = TransactionBatch(
+            sender=first.sender,
+            chain_id=first.chain_id,
+            gas_price=first.gas_price,
+            version=first.version,
+            options=first.options,
+            guardian=first.guardian,
+            sender_username=first.sender_username,
+            receiver_username=first.receiver_username
+        )
+
+        for transaction in transactions:
+            batch._ensure_shared_fields(transaction)
+            item = batch.append(
+                receiver=transaction.receiver,
+                gas_limit=transaction.gas_limit,
+                nonce=transaction.nonce,
+                value=transaction.value,
+                data=transaction.data
+            )
+            item.signature = transaction.signature
+            item.guardian_signature = transaction.guardian_signature
+
+        return batch
+
+    def append(self, receiver: Union[str, IAddress], gas_limit: int, nonce: int = 0, value: int = 0, data: bytes = b"") -> "TransactionInBatch":
+        """
+        Appends a transaction. The receiver is given either as a bech32 address (which must have the same HRP as the sender),
+        or as an address object (which is assumed to have the HRP of the sender, and is not converted to bech32).
+        """
+        if isinstance(receiver, str):
+            receiver_address = Address.new_from_bech32(receiver)
+            if receiver_address.get_hrp() != self.hrp:
+                raise BadUsageError(f"The receiver must have the same HRP as the sender: {receiver}")
+            receiver_pubkey = receiver_address.get_public_key()
+        else:
+            receiver_pubkey = bytes.fromhex(receiver.to_hex())
+            if len(receiver_pubkey) != PUBKEY_LENGTH:
+                raise BadUsageError(f"Bad receiver: {receiver.to_hex()}")
+
+        self._nonces.append(nonce)
+        self._gas_limits.append(gas_limit)
+        self._receivers += receiver_pubkey
+        self._values += _encode_value(value)
+        self._data_offsets.append(len(self._data))
+        self._data_lengths.append(len(data))
+        self._data += data
+        self._signatures += bytes(SIGNATURE_LENGTH)
+        if self.guardian:
+            self._guardian_signatures += bytes(SIGNATURE_LENGTH)
+        self._flags.append(0)
+
+        return TransactionInBatch(self, len(self._nonces) - 1)
+
+    def to_transaction(self, index: int) -> Transaction:
+        """Creates a standalone copy of a transaction of the batch."""
+        item = self[index]
+
+        return Transaction(
+            sender=self.sender,
+            receiver=item.receiver,
+            gas_limit=item.gas_limit,
+            chain_id=self.chain_id,
+            nonce=item.nonce,
+            value=item.value,
+            sender_username=self.sender_username,
+            receiver_username=self.receiver_username,
+            gas_price=self.gas_price,
+            data=item.data,
+            version=self.version,
+            options=self.options,
+            guardian=self.guardian,
+            signature=item.signature,
+            guardian_signature=item.guardian_signature
+        )
+
+    def get_size_in_bytes(self) -> int:
+        """The size of the buffers holding the per-transaction fields (allocation overhead not included)."""
+        arrays = [self._nonces, self._gas_limits, self._data_offsets, self._data_lengths]
+        buffers = [self._receivers, self._values, self._data, self._signatures, self._guardian_signatures, self._flags]
+        return sum(item.itemsize * len(item) for item in arrays) + sum(len(item) for item in buffers)
+
+    def __len__(self) -> int:
+        return len(self._nonces)
+
+    @overload
+    def __getitem__(self, index: int) -> "TransactionInBatch":
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence["TransactionInBatch"]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union["TransactionInBatch", Sequence["TransactionInBatch"]]:
+        if isinstance(index, slice):
+            return [TransactionInBatch(self, position) for position in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("transaction index out of range")
+
+        return TransactionInBatch(self, index)
+
+    def __iter__(self) -> Iterator["TransactionInBatch"]:
+        return (TransactionInBatch(self, index) for index in range(len(self)))
+
+    def _ensure_shared_fields(self, transaction: ITransaction) -> None:
+        for name in ["sender", "chain_id", "gas_price", "version", "options", "guardian", "sender_username", "receiver_username"]:
+            if getattr(transaction, name) != getattr(self, name):
+                raise BadUsageError(f"All the transactions of a batch must have the same `{name}`")
+
+    def _set_shared_field(self, name: str, value: Any) -> None:
+        if getattr(self, name) != value:
+            raise BadUsageError(f"The `{name}` field is shared by all the transactions of the batch, thus cannot be changed for a single transaction")
+
+
+class TransactionInBatch:
+    """A view of a transaction of a "TransactionBatch" (implements "ITransaction"). Changes are written to the batch."""
+
+    __slots__ = ("batch", "index")
+
+    def __init__(self, batch: TransactionBatch, index: int) -> None:
+        self.batch = batch
+        self.index = index
+
+    @property
+    def sender(self) -> str:
+        return self.batch.sender
+
+    @sender.setter
+    def sender(self, value: str) -> None:
+        self.batch._set_shared_field("sender", value)
+
+    @property
+    def receiver(self) -> str:
+        start = self.index * PUBKEY_LENGTH
+        return Address(bytes(self.batch._receivers[start:start + PUBKEY_LENGTH]), self.batch.hrp).to_bech32()
+
+    @receiver.setter
+    def receiver(self, value: str) -> None:
+        start = self.index * PUBKEY_LENGTH
+        self.batch._receivers[start:start + PUBKEY_LENGTH] = Address.new_from_bech32(value).get_public_key()
+
+    @property
+    def gas_limit(self) -> int:
+        return self.batch._gas_limits[self.index]
+
+    @gas_limit.setter
+    def gas_limit(self, value: int) -> None:
+        self.batch._gas_limits[self.index] = value
+
+    @property
+    def chain_id(self) -> str:
+        return self.batch.chain_id
+
+    @chain_id.setter
+    def chain_id(self, value: str) -> None:
+        self.batch._set_shared_field("chain_id", value)
+
+    @property
+    def nonce(self) -> int:
+        return self.batch._nonces[self.index]
+
+    @nonce.setter
+    def nonce(self, value: int) -> None:
+        self.batch._nonces[self.index] = value
+
+    @property
+    def value(self) -> int:
+        start = self.index * VALUE_LENGTH
+        return int.from_bytes(self.batch._values[start:start + VALUE_LENGTH], "big")
+
+    @value.setter
+    def value(self, value: int) -> None:
+        start = self.index * VALUE_LENGTH
+        self.batch._values[start:start + VALUE_LENGTH] = _encode_value(value)
+
+    @property
+    def sender_username(self) -> str:
+        return self.batch.sender_username
+
+    @sender_username.setter
+    def sender_username(self, value: str) -> None:
+        self.batch._set_shared_field("sender_username", value)
+
+    @property
+    def receiver_username(self) -> str:
+        return self.batch.receiver_username
+
+    @receiver_username.setter
+    def receiver_username(self, value: str) -> None:
+        self.batch._set_shared_field("receiver_username", value)
+
+    @property
+    def gas_price(self) -> int:
+        return self.batch.gas_price
+
+    @gas_price.setter
+    def gas_price(self, value: int) -> None:
+        self.batch._set_shared_field("gas_price", value)
+
+    @property
+    def data(self) -> bytes:
+        offset = self.batch._data_offsets[self.index]
+        return bytes(self.batch._data[offset:offset + self.batch._data_lengths[self.index]])
+
+    @data.setter
+    def data(self, value: bytes) -> None:
+        # The previous data is left in the buffer (unreferenced).
+        self.batch._data_offsets[self.index] = len(self.batch._data)
+        self.batch._data_lengths[self.index] = len(value)
+        self.batch._data += value
+
+    @property
+    def version(self) -> int:
+        return self.batch.version
+
+    @version.setter
+    def version(self, value: int) -> None:
+        self.batch._set_shared_field("version", value)
+
+    @property
+    def options(self) -> int:
+        return self.batch.options
+
+    @options.setter
+    def options(self, value: int) -> None:
+        self.batch._set_shared_field("options", value)
+
+    @property
+    def guardian(self) -> str:
+        return self.batch.guardian
+
+    @guardian.setter
+    def guardian(self, value: str) -> None:
+        self.batch._set_shared_field("guardian", value)
+
+    @property
+    def signature(self) -> bytes:
+        return self._get_signature(self.batch._signatures, HAS_SIGNATURE_FLAG)
+
+    @signature.setter
+    def signature(self, value: bytes) -> None:
+        self._set_signature(self.batch._signatures, HAS_SIGNATURE_FLAG, value)
+
+    @property
+    def guardian_signature(self) -> bytes:
+        return self._get_signature(self.batch._guardian_signatures, HAS_GUARDIAN_SIGNATURE_FLAG)
+
+    @guardian_signature.setter
+    def guardian_signature(self, value: bytes) -> None:
+        self._set_signature(self.batch._guardian_signatures, HAS_GUARDIAN_SIGNATURE_FLAG, value)
+
+    def _get_signature(self, buffer: bytearray, flag: int) -> bytes:
+        if not self.batch._flags[self.index] & flag:
+            return b""
+
+        start = self.index * SIGNATURE_LENGTH
+        return bytes(buffer[start:start + SIGNATURE_LENGTH])
+
+    def _set_signature(self, buffer: bytearray, flag: int, value: bytes) -> None:
+        if flag == HAS_GUARDIAN_SIGNATURE_FLAG and not self.batch.guardian:
+            if value:
+                raise BadUsageError("The transactions of the batch are not guarded (the guardian is not set)")
+            return
+
+        if value and len(value) != SIGNATURE_LENGTH:
+            raise BadUsageError(f"The signatures of the transactions of a batch must have {SIGNATURE_LENGTH} bytes")
+
+        start = self.index * SIGNATURE_LENGTH
+        buffer[start:start + SIGNATURE_LENGTH] = value or bytes(SIGNATURE_LENGTH)
+
+        if value:
+            self.batch._flags[self.index] |= flag
+        else:
+            self.batch._flags[self.index] &= ~flag & 0xFF
+
+
+def _encode_value(value: int) -> bytes:
+    try:
+        return value.to_bytes(VALUE_LENGTH, "big")
+    except OverflowError:
+        raise BadUsageError(f"The value of a transaction of a batch must fit in {VALUE_LENGTH * 8} bits: {value}")
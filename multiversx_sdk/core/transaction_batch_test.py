@@ -0,0 +1,126 @@
+from typing import List, cast
+
+import pytest
+
+from multiversx_sdk.converters.transactions_converter import \
+    TransactionsConverter
+from multiversx_sdk.core.address import Address
+from multiversx_sdk.core.errors import BadUsageError
+from multiversx_sdk.core.interfaces import ITransaction
+from multiversx_sdk.core.transaction import Transaction
+from multiversx_sdk.core.transaction_batch import TransactionBatch
+from multiversx_sdk.core.transaction_computer import TransactionComputer
+from multiversx_sdk.testutils.addresses import ALICE, BOB, CAROL
+from multiversx_sdk.testutils.wallets import load_wallets
+
+
+def create_transactions(count: int) -> List[Transaction]:
+    receivers = [BOB, CAROL]
+
+    return [
+        Transaction(
+            sender=ALICE,
+            receiver=receivers[index % 2],
+            gas_limit=50000 + 1500 * (index % 7),
+            chain_id="D",
+            nonce=index,
+            value=index * 10**18,
+            data=b"x" * (index % 7)
+        ) for index in range(count)
+    ]
+
+
+def test_slotted_transaction():
+    transaction = create_transactions(1)[0]
+
+    assert not hasattr(transaction, "__dict__")
+    assert transaction == create_transactions(1)[0]
+
+    other = create_transactions(1)[0]
+    other.signature = bytes(64)
+    assert transaction != other
+
+
+def test_batch_holds_the_transactions():
+    transactions = create_transactions(10)
+    batch = TransactionBatch.new_from_transactions(transactions)
+
+    assert len(batch) == 10
+    assert [batch.to_transaction(index) for index in range(10)] == transactions
+    assert [item.nonce for item in batch] == list(range(10))
+    assert batch[-1].receiver == CAROL
+    assert [item.value for item in batch[2:4]] == [2 * 10**18, 3 * 10**18]
+
+    with pytest.raises(IndexError):
+        batch[10]
+
+
+def test_views_can_be_changed():
+    batch = TransactionBatch(sender=ALICE, chain_id="D")
+    item = batch.append(receiver=BOB, gas_limit=50000, value=1)
+
+    item.nonce = 42
+    item.gas_limit = 60000
+    item.value = 10**25
+    item.receiver = CAROL
+    item.data = b"hello"
+    item.signature = bytes(range(64))
+
+    expected = Transaction(sender=ALICE, receiver=CAROL, gas_limit=60000, chain_id="D", nonce=42, value=10**25, data=b"hello", signature=bytes(range(64)))
+    assert batch.to_transaction(0) == expected
+
+    # Fields shared by all the transactions can't be changed for a single one.
+    item.chain_id = "D"
+    with pytest.raises(BadUsageError, match="shared by all the transactions"):
+        item.chain_id = "T"
+
+    with pytest.raises(BadUsageError, match="64 bytes"):
+        item.signature = b"short"
+
+    with pytest.raises(BadUsageError, match="not guarded"):
+        item.guardian_signature = bytes(64)
+
+    with pytest.raises(BadUsageError, match="128 bits"):
+        item.value = 2**128
+
+    with pytest.raises(BadUsageError, match="same `gas_price`"):
+        TransactionBatch.new_from_transactions([expected, Transaction(sender=ALICE, receiver=BOB, gas_limit=50000, chain_id="D", gas_price=2000000000)])
+
+
+def test_views_are_signed_and_serialized_as_transactions():
+    alice = load_wallets()["alice"]
+    computer = TransactionComputer()
+    converter = TransactionsConverter()
+    transactions = create_transactions(4)
+    batch = TransactionBatch.new_from_transactions(transactions)
+
+    for transaction, view in zip(transactions, batch):
+        # Static checkers don't match properties against the (mutable) attributes of protocols.
+        item = cast(ITransaction, view)
+        transaction.signature = alice.secret_key.sign(computer.compute_bytes_for_signing(transaction))
+        item.signature = alice.secret_key.sign(computer.compute_bytes_for_signing(item))
+
+        assert item.signature == transaction.signature
+        assert computer.compute_transaction_hash(item) == computer.compute_transaction_hash(transaction)
+        assert converter.transaction_to_dictionary(item) == converter.transaction_to_dictionary(transaction)
+
+
+def test_guarded_transactions():
+    guardian = Address.new_from_bech32(CAROL).to_bech32()
+    batch = TransactionBatch(sender=ALICE, chain_id="D", version=2, options=2, guardian=guardian)
+    item = batch.append(receiver=BOB, gas_limit=100000)
+
+    assert item.guardian_signature == b""
+    item.guardian_signature = bytes([1] * 64)
+    assert batch.to_transaction(0).guardian_signature == bytes([1] * 64)
+    assert batch.to_transaction(0).guardian == guardian
+
+
+def test_append_with_address_objects():
+    batch = TransactionBatch(sender=ALICE, chain_id="D")
+    batch.append(receiver=Address.new_from_bech32(BOB), gas_limit=50000)
+
+    assert batch[0].receiver == BOB
+
+    with pytest.raises(BadUsageError, match="same HRP"):
+        batch.append(receiver=Address(bytes(32), "test").to_bech32(), gas_limit=50000)
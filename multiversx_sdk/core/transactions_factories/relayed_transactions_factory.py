@@ -1,6 +1,6 @@
 import base64
 import json
-from typing import Any, Dict, List, Protocol
+from typing import Any, Dict, Iterable, Iterator, List, Protocol, Tuple
 
 from multiversx_sdk.core.address import Address
 from multiversx_sdk.core.errors import InvalidInnerTransactionError
@@ -22,20 +22,44 @@ class RelayedTransactionsFactory:
     def create_relayed_v1_transaction(self,
                                       inner_transaction: ITransaction,
                                       relayer_address: IAddress) -> Transaction:
+        return self._create_relayed_v1_transaction(inner_transaction, relayer_address.to_bech32(), {})
+
+    def create_relayed_v1_transactions(self,
+                                       inner_transactions: Iterable[ITransaction],
+                                       relayer_address: IAddress) -> Iterator[Transaction]:
+        """
+        Creates (lazily) a relayed V1 transaction for each inner transaction (e.g. for relayers of gasless transactions).
+        The transactions are identical to the ones created by "create_relayed_v1_transaction()", but the addresses
+        are decoded only once, for all the transactions.
+
+        Args:
+            inner_transactions (Iterable[ITransaction]): the (signed) inner transactions.
+            relayer_address (IAddress): the relayer, the sender of all the relayed transactions.
+        """
+        relayer = relayer_address.to_bech32()
+        base64_addresses: Dict[str, str] = {}
+
+        for inner_transaction in inner_transactions:
+            yield self._create_relayed_v1_transaction(inner_transaction, relayer, base64_addresses)
+
+    def _create_relayed_v1_transaction(self,
+                                       inner_transaction: ITransaction,
+                                       relayer: str,
+                                       base64_addresses: Dict[str, str]) -> Transaction:
         if not inner_transaction.gas_limit:
             raise InvalidInnerTransactionError("The gas limit is not set for the inner transaction")
 
         if not inner_transaction.signature:
             raise InvalidInnerTransactionError("The inner transaction is not signed")
 
-        serialized_transaction = self._prepare_inner_transaction_for_relayed_v1(inner_transaction)
+        serialized_transaction = self._prepare_inner_transaction_for_relayed_v1(inner_transaction, base64_addresses)
         data = f"relayedTx@{serialized_transaction.encode().hex()}"
 
         gas_limit = self._config.min_gas_limit + self._config.gas_limit_per_byte * len(data) + inner_transaction.gas_limit
 
         return Transaction(
             chain_id=self._config.chain_id,
-            sender=relayer_address.to_bech32(),
+            sender=relayer,
             receiver=inner_transaction.sender,
             gas_limit=gas_limit,
             data=data.encode()
@@ -45,24 +69,53 @@ class RelayedTransactionsFactory:
                                       inner_transaction: ITransaction,
                                       inner_transaction_gas_limit: int,
                                       relayer_address: IAddress) -> Transaction:
+        return self._create_relayed_v2_transaction(inner_transaction, inner_transaction_gas_limit, relayer_address.to_bech32(), {})
+
+    def create_relayed_v2_transactions(self,
+                                       inner_transactions: Iterable[Tuple[ITransaction, int]],
+                                       relayer_address: IAddress) -> Iterator[Transaction]:
+        """
+        Creates (lazily) a relayed V2 transaction for each inner transaction.
+        The transactions are identical to the ones created by "create_relayed_v2_transaction()", but the addresses
+        are decoded only once, for all the transactions.
+
+        Args:
+            inner_transactions (Iterable[Tuple[ITransaction, int]]): the (signed) inner transactions, each with its gas limit.
+            relayer_address (IAddress): the relayer, the sender of all the relayed transactions.
+        """
+        relayer = relayer_address.to_bech32()
+        hex_addresses: Dict[str, str] = {}
+
+        for inner_transaction, inner_transaction_gas_limit in inner_transactions:
+            yield self._create_relayed_v2_transaction(inner_transaction, inner_transaction_gas_limit, relayer, hex_addresses)
+
+    def _create_relayed_v2_transaction(self,
+                                       inner_transaction: ITransaction,
+                                       inner_transaction_gas_limit: int,
+                                       relayer: str,
+                                       hex_addresses: Dict[str, str]) -> Transaction:
         if inner_transaction.gas_limit:
             raise InvalidInnerTransactionError("The gas limit should not be set for the inner transaction")
 
         if not inner_transaction.signature:
             raise InvalidInnerTransactionError("The inner transaction is not signed")
 
+        receiver = hex_addresses.get(inner_transaction.receiver)
+        if receiver is None:
+            receiver = Address.new_from_bech32(inner_transaction.receiver).to_hex()
+            hex_addresses[inner_transaction.receiver] = receiver
+
         arguments: List[Any] = [
-            Address.new_from_bech32(inner_transaction.receiver),
             inner_transaction.nonce,
             inner_transaction.data,
             inner_transaction.signature
         ]
 
-        data = f"relayedTxV2@{args_to_string(arguments)}"
+        data = f"relayedTxV2@{receiver}@{args_to_string(arguments)}"
         gas_limit = inner_transaction_gas_limit + self._config.min_gas_limit + self._config.gas_limit_per_byte * len(data)
 
         return Transaction(
-            sender=relayer_address.to_bech32(),
+            sender=relayer,
             receiver=inner_transaction.sender,
             value=0,
             gas_limit=gas_limit,
@@ -72,7 +125,48 @@ class RelayedTransactionsFactory:
             options=inner_transaction.options
         )
 
-    def _prepare_inner_transaction_for_relayed_v1(self, inner_transaction: ITransaction) -> str:
+    def _prepare_inner_transaction_for_relayed_v1(self, inner_transaction: ITransaction, base64_addresses: Dict[str, str]) -> str:
+        numbers = [inner_transaction.nonce, inner_transaction.value, inner_transaction.gas_price, inner_transaction.gas_limit, inner_transaction.version]
+        if inner_transaction.options:
+            numbers.append(inner_transaction.options)
+
+        # The JSON is written directly (the keys are fixed and the base64 strings don't need escaping), unless a number isn't a plain "int"
+        # (e.g. a "bool"), which "json.dumps()" would render differently.
+        if not all(type(number) is int for number in numbers):
+            return self._prepare_inner_transaction_for_relayed_v1_as_dictionary(inner_transaction)
+
+        parts = [
+            '{"nonce":', str(inner_transaction.nonce),
+            ',"sender":"', self._address_to_base64(inner_transaction.sender, base64_addresses),
+            '","receiver":"', self._address_to_base64(inner_transaction.receiver, base64_addresses),
+            '","value":', str(inner_transaction.value),
+            ',"gasPrice":', str(inner_transaction.gas_price),
+            ',"gasLimit":', str(inner_transaction.gas_limit),
+            ',"data":"', base64.b64encode(inner_transaction.data).decode(),
+            '","signature":"', base64.b64encode(inner_transaction.signature).decode(),
+            '","chainID":"', base64.b64encode(inner_transaction.chain_id.encode()).decode(),
+            '","version":', str(inner_transaction.version)
+        ]
+
+        if inner_transaction.options:
+            parts += [',"options":', str(inner_transaction.options)]
+
+        if inner_transaction.guardian:
+            parts += [',"guardian":"', self._address_to_base64(inner_transaction.guardian, base64_addresses), '"']
+
+        if inner_transaction.guardian_signature:
+            parts += [',"guardianSignature":"', base64.b64encode(inner_transaction.guardian_signature).decode(), '"']
+
+        if inner_transaction.sender_username:
+            parts += [',"sndUserName":"', base64.b64encode(inner_transaction.sender_username.encode()).decode(), '"']
+
+        if inner_transaction.receiver_username:
+            parts += [',"rcvUserName":"', base64.b64encode(inner_transaction.receiver_username.encode()).decode(), '"']
+
+        parts.append("}")
+        return "".join(parts)
+
+    def _prepare_inner_transaction_for_relayed_v1_as_dictionary(self, inner_transaction: ITransaction) -> str:
         sender = Address.new_from_bech32(inner_transaction.sender).to_hex()
         receiver = Address.new_from_bech32(inner_transaction.receiver).to_hex()
 
@@ -106,3 +200,12 @@ class RelayedTransactionsFactory:
             tx["rcvUserName"] = base64.b64encode(inner_transaction.receiver_username.encode()).decode()
 
         return json.dumps(tx, separators=(",", ":"))
+
+    def _address_to_base64(self, address: str, base64_addresses: Dict[str, str]) -> str:
+        encoded_address = base64_addresses.get(address)
+
+        if encoded_address is None:
+            encoded_address = base64.b64encode(Address.new_from_bech32(address).get_public_key()).decode()
+            base64_addresses[address] = encoded_address
+
+        return encoded_address
@@ -1,4 +1,8 @@
+from typing import List
+
 import pytest
+from hypothesis import given
+from hypothesis import strategies as st
 
 from multiversx_sdk.core.address import Address
 from multiversx_sdk.core.errors import InvalidInnerTransactionError
@@ -8,9 +12,25 @@ from multiversx_sdk.core.transactions_factories.relayed_transactions_factory imp
     RelayedTransactionsFactory
 from multiversx_sdk.core.transactions_factories.transactions_factory_config import \
     TransactionsFactoryConfig
+from multiversx_sdk.testutils.addresses import ALICE, BOB, CAROL
 from multiversx_sdk.testutils.wallets import load_wallets
 
 
+def create_inner_transactions(count: int, gas_limit: int = 50000) -> List[Transaction]:
+    return [
+        Transaction(
+            sender=[ALICE, BOB][index % 2],
+            receiver=CAROL,
+            gas_limit=gas_limit,
+            chain_id="T",
+            nonce=index,
+            value=index * 10**16,
+            data=f"hello@{index:02x}".encode(),
+            signature=bytes(64)
+        ) for index in range(count)
+    ]
+
+
 class TestRelayedTransactionsFactory:
     config = TransactionsFactoryConfig("T")
     factory = RelayedTransactionsFactory(config)
@@ -231,3 +251,54 @@ class TestRelayedTransactionsFactory:
         assert relayed_transaction.options == 0
         assert relayed_transaction.gas_limit == 60414500
         assert relayed_transaction.data.decode() == "relayedTxV2@000000000000000000010000000000000000000000000000000000000002ffff@0f@676574436f6e7472616374436f6e666967@fc3ed87a51ee659f937c1a1ed11c1ae677e99629fae9cc289461f033e6514d1a8cfad1144ae9c1b70f28554d196bd6ba1604240c1c1dc19c959e96c1c3b62d0c"
+
+    def test_create_relayed_transactions(self):
+        relayer = Address.new_from_bech32(CAROL)
+
+        inner_transactions = create_inner_transactions(10)
+        inner_transactions[1].guardian = BOB
+        inner_transactions[1].guardian_signature = bytes(range(64))
+        inner_transactions[1].options = 2
+        inner_transactions[2].sender_username = "alice"
+        inner_transactions[2].receiver_username = "carol"
+
+        relayed_transactions = list(self.factory.create_relayed_v1_transactions(inner_transactions, relayer))
+        assert relayed_transactions == [self.factory.create_relayed_v1_transaction(inner_transaction, relayer) for inner_transaction in inner_transactions]
+
+        inner_transactions = create_inner_transactions(10, gas_limit=0)
+        items = [(inner_transaction, 60000 + index) for index, inner_transaction in enumerate(inner_transactions)]
+
+        relayed_transactions = list(self.factory.create_relayed_v2_transactions(items, relayer))
+        assert relayed_transactions == [self.factory.create_relayed_v2_transaction(*item, relayer) for item in items]
+        assert relayed_transactions[0].data.decode() == f"relayedTxV2@{Address.new_from_bech32(CAROL).to_hex()}@@68656c6c6f403030@{bytes(64).hex()}"
+
+        with pytest.raises(InvalidInnerTransactionError, match="The gas limit is not set for the inner transaction"):
+            list(self.factory.create_relayed_v1_transactions(inner_transactions, relayer))
+
+    @given(
+        nonce=st.integers(min_value=0, max_value=2**64 - 1),
+        value=st.integers(min_value=0, max_value=2**128),
+        options=st.one_of(st.integers(min_value=0, max_value=255), st.booleans()),
+        data=st.binary(max_size=64),
+        guardian=st.sampled_from(["", BOB]),
+        username=st.text(max_size=8)
+    )
+    def test_relayed_v1_data_is_the_json_of_the_inner_transaction(self, nonce: int, value: int, options: int, data: bytes, guardian: str, username: str):
+        inner_transaction = Transaction(
+            sender=ALICE,
+            receiver=CAROL,
+            gas_limit=50000,
+            chain_id="T",
+            nonce=nonce,
+            value=value,
+            data=data,
+            options=options,
+            guardian=guardian,
+            signature=bytes(64),
+            guardian_signature=bytes(64) if guardian else b"",
+            sender_username=username,
+            receiver_username=username
+        )
+
+        assert self.factory._prepare_inner_transaction_for_relayed_v1(inner_transaction, {}) == \
+            self.factory._prepare_inner_transaction_for_relayed_v1_as_dictionary(inner_transaction)
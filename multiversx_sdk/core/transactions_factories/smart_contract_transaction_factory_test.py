@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 from multiversx_sdk.abi.abi import Abi
@@ -6,8 +7,8 @@ from multiversx_sdk.abi.small_int_values import U32Value
 from multiversx_sdk.core.address import Address
 from multiversx_sdk.core.constants import CONTRACT_DEPLOY_ADDRESS
 from multiversx_sdk.core.tokens import Token, TokenTransfer
-from multiversx_sdk.core.transactions_factories.smart_contract_transactions_factory import \
-    SmartContractTransactionsFactory
+from multiversx_sdk.core.transactions_factories.smart_contract_transactions_factory import (
+    BYTECODE_CHUNK_SIZE_IN_BYTES, SmartContractTransactionsFactory)
 from multiversx_sdk.core.transactions_factories.transactions_factory_config import \
     TransactionsFactoryConfig
 
@@ -324,3 +325,22 @@ class TestSmartContractTransactionsFactory:
         assert transaction.receiver == "erd1qqqqqqqqqqqqqpgqhy6nl6zq07rnzry8uyh6rtyq0uzgtk3e69fqgtz9l4"
         assert transaction.data.decode() == "ChangeOwnerAddress@8049d639e5a6980d1cd2392abcce41029cda74a1563523a202f09641cc2618f8"
         assert transaction.gas_limit == 6_000_000
+
+    def test_create_transactions_with_bytecode_from_file(self, tmp_path: Path):
+        sender = Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th")
+        contract_address = Address.new_from_bech32("erd1qqqqqqqqqqqqqpgqhy6nl6zq07rnzry8uyh6rtyq0uzgtk3e69fqgtz9l4")
+
+        for size in [0, 1, BYTECODE_CHUNK_SIZE_IN_BYTES, 2 * BYTECODE_CHUNK_SIZE_IN_BYTES + 7]:
+            bytecode = os.urandom(size)
+            path = tmp_path / f"contract-{size}.wasm"
+            path.write_bytes(bytecode)
+
+            deploy_from_file = self.factory.create_transaction_for_deploy(sender=sender, bytecode=path, gas_limit=6000000, arguments=[1, "a"])
+            deploy = self.factory.create_transaction_for_deploy(sender=sender, bytecode=bytecode, gas_limit=6000000, arguments=[1, "a"])
+            assert deploy_from_file == deploy
+            assert deploy_from_file.data == f"{bytecode.hex()}@0500@0504@01@61".encode()
+
+            upgrade_from_file = self.factory.create_transaction_for_upgrade(sender=sender, contract=contract_address, bytecode=path, gas_limit=6000000)
+            upgrade = self.factory.create_transaction_for_upgrade(sender=sender, contract=contract_address, bytecode=bytecode, gas_limit=6000000)
+            assert upgrade_from_file == upgrade
+            assert upgrade_from_file.data == f"upgradeContract@{bytecode.hex()}@0504".encode()
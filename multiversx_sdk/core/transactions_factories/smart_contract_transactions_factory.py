@@ -1,3 +1,7 @@
+import binascii
+import io
+import mmap
+import os
 from pathlib import Path
 from typing import Any, List, Optional, Protocol, Sequence, Union
 
@@ -18,6 +22,9 @@ from multiversx_sdk.core.transactions_factories.token_transfers_data_builder imp
 from multiversx_sdk.core.transactions_factories.transaction_builder import \
     TransactionBuilder
 
+# The bytecode (read from a file) is hex-encoded in chunks of this size.
+BYTECODE_CHUNK_SIZE_IN_BYTES = 64 * 1024
+
 
 class IConfig(Protocol):
     chain_id: str
@@ -56,29 +63,27 @@ class SmartContractTransactionsFactory:
                                       is_readable: bool = True,
                                       is_payable: bool = False,
                                       is_payable_by_sc: bool = True) -> Transaction:
-        if isinstance(bytecode, Path):
-            bytecode = bytecode.read_bytes()
-
         metadata = CodeMetadata(is_upgradeable, is_readable, is_payable, is_payable_by_sc)
 
-        parts = [
-            arg_to_string(bytecode),
+        parts_after_bytecode = [
             arg_to_string(VM_TYPE_WASM_VM),
             str(metadata)
         ]
 
         prepared_arguments = self._encode_deploy_arguments(list(arguments))
-        parts += [arg.hex() for arg in prepared_arguments]
+        parts_after_bytecode += [arg.hex() for arg in prepared_arguments]
+
+        payload = self._build_payload_with_bytecode([], bytecode, parts_after_bytecode)
 
         return TransactionBuilder(
             config=self.config,
             sender=sender,
             receiver=Address.new_from_bech32(CONTRACT_DEPLOY_ADDRESS),
-            data_parts=parts,
+            data_parts=[],
             gas_limit=gas_limit,
             add_data_movement_gas=False,
             amount=native_transfer_amount
-        ).build()
+        ).build_with_payload(payload)
 
     def create_transaction_for_execute(self,
                                        sender: IAddress,
@@ -136,29 +141,24 @@ class SmartContractTransactionsFactory:
                                        is_readable: bool = True,
                                        is_payable: bool = False,
                                        is_payable_by_sc: bool = True) -> Transaction:
-        if isinstance(bytecode, Path):
-            bytecode = bytecode.read_bytes()
-
         metadata = CodeMetadata(is_upgradeable, is_readable, is_payable, is_payable_by_sc)
 
-        parts = [
-            "upgradeContract",
-            arg_to_string(bytecode),
-            str(metadata)
-        ]
+        parts_after_bytecode = [str(metadata)]
 
         prepared_arguments = self._encode_upgrade_arguments(list(arguments))
-        parts += [arg.hex() for arg in prepared_arguments]
+        parts_after_bytecode += [arg.hex() for arg in prepared_arguments]
+
+        payload = self._build_payload_with_bytecode(["upgradeContract"], bytecode, parts_after_bytecode)
 
         return TransactionBuilder(
             config=self.config,
             sender=sender,
             receiver=contract,
-            data_parts=parts,
+            data_parts=[],
             gas_limit=gas_limit,
             add_data_movement_gas=False,
             amount=native_transfer_amount
-        ).build()
+        ).build_with_payload(payload)
 
     def create_transaction_for_claiming_developer_rewards(self,
                                                           sender: IAddress,
@@ -189,6 +189,33 @@ class SmartContractTransactionsFactory:
             add_data_movement_gas=False,
         ).build()
 
+    def _build_payload_with_bytecode(self,
+                                     parts_before_bytecode: List[str],
+                                     bytecode: Union[Path, bytes],
+                                     parts_after_bytecode: List[str]) -> bytes:
+        if not isinstance(bytecode, Path):
+            parts = [*parts_before_bytecode, arg_to_string(bytecode), *parts_after_bytecode]
+            return ARGS_SEPARATOR.join(parts).encode()
+
+        prefix = "".join(part + ARGS_SEPARATOR for part in parts_before_bytecode).encode()
+        suffix = "".join(ARGS_SEPARATOR + part for part in parts_after_bytecode).encode()
+
+        # The file is memory-mapped and hex-encoded in chunks, straight into the payload
+        # (the bytecode, its hex representation and the joined parts aren't held in memory as well).
+        # "getvalue()" doesn't copy the buffer of the stream.
+        with open(bytecode, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            payload = io.BytesIO()
+            payload.write(prefix)
+
+            if size:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as code:
+                    for offset in range(0, size, BYTECODE_CHUNK_SIZE_IN_BYTES):
+                        payload.write(binascii.hexlify(code[offset:offset + BYTECODE_CHUNK_SIZE_IN_BYTES]))
+
+            payload.write(suffix)
+            return payload.getvalue()
+
     def _encode_deploy_arguments(self, args: List[Any]) -> List[bytes]:
         if self.abi:
             return self.abi.encode_constructor_input_parameters(args)
@@ -43,6 +43,10 @@ class TransactionBuilder:
 
     def build(self) -> Transaction:
         data = self.build_transaction_payload(self.data_parts)
+        return self.build_with_payload(data)
+
+    def build_with_payload(self, data: bytes) -> Transaction:
+        """Builds the transaction given an already built payload (ignoring the data parts)."""
         gas_limit = self.compute_gas_limit(data)
 
         transaction = Transaction(
@@ -1,9 +1,13 @@
-from typing import List, Optional, Protocol, Sequence
+from typing import (Iterable, Iterator, List, Optional, Protocol, Sequence,
+                    Tuple, Union)
 
+from multiversx_sdk.core.constants import ARGS_SEPARATOR
 from multiversx_sdk.core.errors import BadUsageError
-from multiversx_sdk.core.interfaces import IAddress, ITokenTransfer
+from multiversx_sdk.core.interfaces import IAddress, IToken, ITokenTransfer
+from multiversx_sdk.core.serializer import arg_to_string
 from multiversx_sdk.core.tokens import TokenComputer
 from multiversx_sdk.core.transaction import Transaction
+from multiversx_sdk.core.transaction_batch import TransactionBatch
 from multiversx_sdk.core.transactions_factories.token_transfers_data_builder import \
     TokenTransfersDataBuilder
 from multiversx_sdk.core.transactions_factories.transaction_builder import \
@@ -12,6 +16,9 @@ from multiversx_sdk.core.transactions_factories.transaction_builder import \
 ADDITIONAL_GAS_FOR_ESDT_TRANSFER = 100000
 ADDITIONAL_GAS_FOR_ESDT_NFT_TRANSFER = 800000
 
+# A receiver, and the amount to transfer (or the amounts, one for each token of the set).
+BulkTransfer = Tuple[IAddress, Union[int, Sequence[int]]]
+
 
 class IConfig(Protocol):
     chain_id: str
@@ -76,3 +83,110 @@ class TransferTransactionsFactory:
             gas_limit=extra_gas_for_transfer,
             add_data_movement_gas=True
         ).build()
+
+    def create_transactions_for_esdt_token_transfers(self,
+                                                     sender: IAddress,
+                                                     tokens: Sequence[IToken],
+                                                     transfers: Iterable[BulkTransfer]) -> Iterator[Transaction]:
+        """
+        Creates (lazily) a transaction for each (receiver, amount) pair, transferring the given token (or set of tokens) - e.g. for airdrops.
+        The transactions are identical to the ones created by "create_transaction_for_esdt_token_transfer()", but the data prefix
+        and the gas limit are computed only once, for all the transactions.
+
+        Args:
+            sender (IAddress): the sender of all the transactions.
+            tokens (Sequence[IToken]): the token (or the set of tokens) to transfer.
+            transfers (Iterable[BulkTransfer]): the receivers and the amounts (a sequence of amounts, one for each token, for sets of tokens).
+        """
+        template = _TokenTransfersTemplate(self.config, self.token_computer, sender.to_bech32(), tokens)
+        chain_id = self.config.chain_id
+
+        for receiver, amounts in transfers:
+            data, gas_limit = template.build(receiver, amounts)
+
+            yield Transaction(
+                sender=template.sender,
+                receiver=template.sender if template.is_sent_to_self else receiver.to_bech32(),
+                gas_limit=gas_limit,
+                chain_id=chain_id,
+                data=data
+            )
+
+    def add_esdt_token_transfers_to_batch(self,
+                                          batch: TransactionBatch,
+                                          tokens: Sequence[IToken],
+                                          transfers: Iterable[BulkTransfer]) -> None:
+        """
+        Same as "create_transactions_for_esdt_token_transfers()", but the transactions (of the sender of the batch) are appended
+        to a "TransactionBatch", instead of being created as standalone objects.
+        """
+        if batch.chain_id != self.config.chain_id:
+            raise BadUsageError(f"The batch has a different chain ID: {batch.chain_id}")
+
+        template = _TokenTransfersTemplate(self.config, self.token_computer, batch.sender, tokens)
+
+        for receiver, amounts in transfers:
+            data, gas_limit = template.build(receiver, amounts)
+            batch.append(receiver=batch.sender if template.is_sent_to_self else receiver, gas_limit=gas_limit, data=data)
+
+
+class _TokenTransfersTemplate:
+    """
+    The data of a transfer (of a given token or set of tokens), split into the constant parts and the ones depending
+    on the receiver and the amounts. The constant parts are encoded (and validated) only once.
+    """
+
+    def __init__(self, config: IConfig, token_computer: TokenComputer, sender: str, tokens: Sequence[IToken]) -> None:
+        if len(tokens) == 0:
+            raise BadUsageError("No token has been provided")
+
+        self.sender = sender
+        self.num_tokens = len(tokens)
+        self.gas_limit_per_byte = config.gas_limit_per_byte
+        self.is_fungible = len(tokens) == 1 and token_computer.is_fungible(tokens[0])
+        self.is_single_nft = len(tokens) == 1 and not self.is_fungible
+        # Transfers of NFTs (or of sets of tokens) are sent to self, the actual receiver being given in the data.
+        self.is_sent_to_self = not self.is_fungible
+        # For sets of tokens: the constant parts preceding each amount.
+        self.parts_before_amounts: List[str] = []
+
+        if self.is_fungible:
+            # ESDTTransfer@<identifier>@<amount>
+            self.head = ARGS_SEPARATOR.join(["ESDTTransfer", arg_to_string(tokens[0].identifier), ""])
+            extra_gas = config.gas_limit_esdt_transfer + ADDITIONAL_GAS_FOR_ESDT_TRANSFER
+        elif self.is_single_nft:
+            # ESDTNFTTransfer@<identifier>@<nonce>@<amount>@<receiver>
+            token = tokens[0]
+            identifier = token_computer.extract_identifier_from_extended_identifier(token.identifier)
+            self.head = ARGS_SEPARATOR.join(["ESDTNFTTransfer", arg_to_string(identifier), arg_to_string(token.nonce), ""])
+            extra_gas = config.gas_limit_esdt_nft_transfer + ADDITIONAL_GAS_FOR_ESDT_NFT_TRANSFER
+        else:
+            # MultiESDTNFTTransfer@<receiver>@<number of tokens>(@<identifier>@<nonce>@<amount>)...
+            self.head = "MultiESDTNFTTransfer" + ARGS_SEPARATOR
+            for index, token in enumerate(tokens):
+                identifier = token_computer.extract_identifier_from_extended_identifier(token.identifier)
+                prefix = ARGS_SEPARATOR + arg_to_string(len(tokens)) if index == 0 else ""
+                self.parts_before_amounts.append(ARGS_SEPARATOR.join([prefix, arg_to_string(identifier), arg_to_string(token.nonce), ""]))
+            extra_gas = config.gas_limit_multi_esdt_nft_transfer * len(tokens) + ADDITIONAL_GAS_FOR_ESDT_NFT_TRANSFER
+
+        self.base_gas_limit = config.min_gas_limit + extra_gas
+
+    def build(self, receiver: IAddress, amounts: Union[int, Sequence[int]]) -> Tuple[bytes, int]:
+        """Returns the data of the transaction and its gas limit."""
+        amounts = [amounts] if isinstance(amounts, int) else amounts
+        if len(amounts) != self.num_tokens:
+            raise BadUsageError(f"Expected {self.num_tokens} amounts, got {len(amounts)}")
+
+        if self.is_fungible:
+            data = self.head + arg_to_string(amounts[0])
+        elif self.is_single_nft:
+            data = self.head + arg_to_string(amounts[0]) + ARGS_SEPARATOR + receiver.to_hex()
+        else:
+            pieces = [self.head, receiver.to_hex()]
+            for part, amount in zip(self.parts_before_amounts, amounts):
+                pieces.append(part)
+                pieces.append(arg_to_string(amount))
+            data = "".join(pieces)
+
+        # The data is made of ASCII characters only (hex-encoded arguments), so its length is the same in bytes.
+        return data.encode(), self.base_gas_limit + self.gas_limit_per_byte * len(data)
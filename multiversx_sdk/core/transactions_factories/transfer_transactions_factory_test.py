@@ -1,5 +1,9 @@
+import pytest
+
 from multiversx_sdk.core.address import Address
+from multiversx_sdk.core.errors import BadUsageError
 from multiversx_sdk.core.tokens import Token, TokenTransfer
+from multiversx_sdk.core.transaction_batch import TransactionBatch
 from multiversx_sdk.core.transactions_factories.transactions_factory_config import \
     TransactionsFactoryConfig
 from multiversx_sdk.core.transactions_factories.transfer_transactions_factory import \
@@ -106,3 +110,47 @@ class TestTransferTransactionsFactory:
         assert transaction.chain_id == "D"
         assert transaction.data.decode() == "MultiESDTNFTTransfer@8049d639e5a6980d1cd2392abcce41029cda74a1563523a202f09641cc2618f8@02@4e46542d313233343536@0a@01@544553542d393837363534@01@01"
         assert transaction.gas_limit == 1_466_000
+
+    def test_create_transactions_for_esdt_token_transfers(self):
+        alice = Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th")
+        bob = Address.new_from_bech32("erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx")
+        carol = Address.new_from_bech32("erd1k2s324ww2g0yj38qn2ch2jwctdy8mnfxep94q9arncc6xecg3xaq6mjse8")
+
+        token_sets = [[Token("FOO-123456")], [Token("NFT-123456", 10)], [Token("NFT-123456", 10), Token("TEST-987654", 1)]]
+        amounts = [0, 1, 255, 256, 1000000, 10**30]
+
+        for tokens in token_sets:
+            transfers = [(receiver, [amount] * len(tokens)) for receiver in [bob, carol] for amount in amounts]
+            transactions = list(self.transfer_factory.create_transactions_for_esdt_token_transfers(alice, tokens, transfers))
+
+            expected = [
+                self.transfer_factory.create_transaction_for_esdt_token_transfer(alice, receiver, [TokenTransfer(token, amount) for token, amount in zip(tokens, token_amounts)])
+                for receiver, token_amounts in transfers
+            ]
+
+            assert transactions == expected
+
+        # A single amount can be given for a single token.
+        transaction = next(self.transfer_factory.create_transactions_for_esdt_token_transfers(alice, [Token("FOO-123456")], [(bob, 1000000)]))
+        assert transaction.data.decode() == "ESDTTransfer@464f4f2d313233343536@0f4240"
+        assert transaction.gas_limit == 410_000
+
+        with pytest.raises(BadUsageError, match="Expected 2 amounts, got 1"):
+            list(self.transfer_factory.create_transactions_for_esdt_token_transfers(alice, token_sets[2], [(bob, 1)]))
+
+        with pytest.raises(BadUsageError, match="No token has been provided"):
+            list(self.transfer_factory.create_transactions_for_esdt_token_transfers(alice, [], [(bob, 1)]))
+
+    def test_add_esdt_token_transfers_to_batch(self):
+        alice = Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th")
+        bob = Address.new_from_bech32("erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx")
+        nft = Token("NFT-123456", 10)
+
+        batch = TransactionBatch(sender=alice.to_bech32(), chain_id="D")
+        self.transfer_factory.add_esdt_token_transfers_to_batch(batch, [nft], [(bob, 1), (bob, 2)])
+
+        assert len(batch) == 2
+        assert batch.to_transaction(1) == self.transfer_factory.create_transaction_for_esdt_token_transfer(alice, bob, [TokenTransfer(nft, 2)])
+
+        with pytest.raises(BadUsageError, match="different chain ID"):
+            self.transfer_factory.add_esdt_token_transfers_to_batch(TransactionBatch(sender=alice.to_bech32(), chain_id="T"), [nft], [])
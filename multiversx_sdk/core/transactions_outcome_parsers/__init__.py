@@ -1,8 +1,9 @@
 from multiversx_sdk.core.transactions_outcome_parsers.delegation_transactions_outcome_parser import \
     DelegationTransactionsOutcomeParser
 from multiversx_sdk.core.transactions_outcome_parsers.resources import (
-    SmartContractResult, TransactionEvent, TransactionLogs, TransactionOutcome,
-    find_events_by_first_topic, find_events_by_identifier)
+    SmartContractResult, TransactionEvent, TransactionEventsIndex,
+    TransactionLogs, TransactionOutcome, find_events_by_first_topic,
+    find_events_by_identifier)
 from multiversx_sdk.core.transactions_outcome_parsers.smart_contract_transactions_outcome_parser import \
     SmartContractTransactionsOutcomeParser
 from multiversx_sdk.core.transactions_outcome_parsers.token_management_transactions_outcome_parser import \
@@ -12,6 +13,6 @@ from multiversx_sdk.core.transactions_outcome_parsers.transaction_events_parser
 
 __all__ = [
     "TokenManagementTransactionsOutcomeParser", "SmartContractResult", "TransactionEvent",
-    "TransactionLogs", "TransactionOutcome", "find_events_by_identifier", "DelegationTransactionsOutcomeParser",
+    "TransactionEventsIndex", "TransactionLogs", "TransactionOutcome", "find_events_by_identifier", "DelegationTransactionsOutcomeParser",
     "SmartContractTransactionsOutcomeParser", "find_events_by_first_topic", "TransactionEventsParser"
 ]
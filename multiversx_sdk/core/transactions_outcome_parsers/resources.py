@@ -1,4 +1,4 @@
-from typing import Callable, List
+from typing import Callable, Dict, List, Optional
 
 
 class TransactionEvent:
@@ -45,6 +45,52 @@ class SmartContractCallOutcome:
         self.return_code = return_code
 
 
+class TransactionEventsIndex:
+    """
+    The events of an outcome (its own events and the ones of its results), indexed by identifier and by first topic.
+
+    Each map is built on its second use: a single lookup (the common case for a fresh outcome) is served by scanning
+    the events, which is cheaper than building the map. Topics are never touched by the lookups by identifier.
+    """
+
+    def __init__(self, events: List[TransactionEvent]) -> None:
+        self.events = events
+        self._by_identifier: Optional[Dict[str, List[TransactionEvent]]] = None
+        self._by_first_topic: Optional[Dict[bytes, List[TransactionEvent]]] = None
+        self._scanned_by_identifier = False
+        self._scanned_by_first_topic = False
+
+    def find_by_identifier(self, identifier: str) -> List[TransactionEvent]:
+        if self._by_identifier is None:
+            if not self._scanned_by_identifier:
+                self._scanned_by_identifier = True
+                return [event for event in self.events if event.identifier == identifier]
+
+            self._by_identifier = {}
+            for event in self.events:
+                self._by_identifier.setdefault(event.identifier, []).append(event)
+
+        return list(self._by_identifier.get(identifier, []))
+
+    def find_by_first_topic(self, topic: str) -> List[TransactionEvent]:
+        # Comparing the raw topics is equivalent to comparing the decoded ones, without decoding each of them.
+        encoded_topic = _encode_topic(topic)
+        if encoded_topic is None:
+            return []
+
+        if self._by_first_topic is None:
+            if not self._scanned_by_first_topic:
+                self._scanned_by_first_topic = True
+                return [event for event in self.events if len(event.topics) and event.topics[0] == encoded_topic]
+
+            self._by_first_topic = {}
+            for event in self.events:
+                if len(event.topics):
+                    self._by_first_topic.setdefault(bytes(event.topics[0]), []).append(event)
+
+        return list(self._by_first_topic.get(encoded_topic, []))
+
+
 class TransactionOutcome:
     def __init__(self,
                  direct_smart_contract_call_outcome: SmartContractCallOutcome = SmartContractCallOutcome(),
@@ -53,31 +99,37 @@ class TransactionOutcome:
         self.direct_smart_contract_call = direct_smart_contract_call_outcome
         self.transaction_results = transaction_results
         self.logs = transaction_logs
+        self._events_index: Optional[TransactionEventsIndex] = None
 
+    def get_events_index(self) -> TransactionEventsIndex:
+        """
+        Returns the index of the events, built on first use, then reused by the subsequent lookups (e.g. by all the outcome parsers).
 
-def find_events_by_identifier(transaction_outcome: TransactionOutcome, identifier: str) -> List[TransactionEvent]:
-    return find_events_by_predicate(transaction_outcome, lambda event: event.identifier == identifier)
+        The index is a snapshot of the events at the time of the first lookup: if the logs, the results or their events
+        are changed afterwards (including events replaced in place), call "reset_events_index()".
+        """
+        if self._events_index is None:
+            self._events_index = TransactionEventsIndex(gather_all_events(self))
+        return self._events_index
 
+    def reset_events_index(self) -> None:
+        """Drops the index of the events, so that it is rebuilt (from the current events) on the next lookup."""
+        self._events_index = None
 
-def find_events_by_first_topic(transaction_outcome: TransactionOutcome, topic: str) -> List[TransactionEvent]:
-    def is_topic_matching(event: TransactionEvent):
-        if not len(event.topics):
-            return False
 
-        try:
-            decoded_topic = event.topics[0].decode()
-            return decoded_topic == topic
-        except UnicodeDecodeError:
-            return False
+def find_events_by_identifier(transaction_outcome: TransactionOutcome, identifier: str) -> List[TransactionEvent]:
+    return transaction_outcome.get_events_index().find_by_identifier(identifier)
 
-    return find_events_by_predicate(transaction_outcome, is_topic_matching)
+
+def find_events_by_first_topic(transaction_outcome: TransactionOutcome, topic: str) -> List[TransactionEvent]:
+    return transaction_outcome.get_events_index().find_by_first_topic(topic)
 
 
 def find_events_by_predicate(
     transaction_outcome: TransactionOutcome,
     predicate: Callable[[TransactionEvent], bool]
 ) -> List[TransactionEvent]:
-    events = gather_all_events(transaction_outcome)
+    events = transaction_outcome.get_events_index().events
     return list(filter(predicate, events))
 
 
@@ -88,3 +140,11 @@ def gather_all_events(transaction_outcome: TransactionOutcome) -> List[Transacti
         all_events.extend(result.logs.events)
 
     return all_events
+
+
+def _encode_topic(topic: str) -> Optional[bytes]:
+    # A topic which cannot be encoded (e.g. holding lone surrogates) cannot be the result of decoding one, either.
+    try:
+        return topic.encode()
+    except UnicodeEncodeError:
+        return None
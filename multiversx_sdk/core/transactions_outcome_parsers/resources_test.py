@@ -0,0 +1,69 @@
+from multiversx_sdk.core.transactions_outcome_parsers.resources import (
+    SmartContractResult, TransactionEvent, TransactionEventsIndex,
+    TransactionLogs, TransactionOutcome, find_events_by_first_topic,
+    find_events_by_identifier, find_events_by_predicate, gather_all_events)
+
+
+def create_outcome(num_results: int) -> TransactionOutcome:
+    results = [
+        SmartContractResult(logs=TransactionLogs(events=[
+            TransactionEvent(identifier="ESDTNFTCreate", topics=[b"NFT-123456", index.to_bytes(2, "big"), b"\x01"]),
+            TransactionEvent(identifier="writeLog", topics=[bytes([0xff, index % 256])])
+        ])) for index in range(num_results)
+    ]
+
+    logs = TransactionLogs(events=[TransactionEvent(identifier="completedTxEvent", topics=[b"completed"])])
+    return TransactionOutcome(transaction_results=results, transaction_logs=logs)
+
+
+def test_find_events():
+    outcome = create_outcome(3)
+
+    assert [event.topics[1] for event in find_events_by_identifier(outcome, "ESDTNFTCreate")] == [b"\x00\x00", b"\x00\x01", b"\x00\x02"]
+    assert find_events_by_identifier(outcome, "missing") == []
+    assert len(find_events_by_first_topic(outcome, "NFT-123456")) == 3
+    assert find_events_by_first_topic(outcome, "completed") == outcome.logs.events
+    assert find_events_by_first_topic(outcome, "\ud800") == []
+    assert len(find_events_by_predicate(outcome, lambda event: event.identifier == "writeLog")) == 3
+
+    # The lookups share the same index.
+    assert outcome.get_events_index() is outcome.get_events_index()
+    assert outcome.get_events_index().events == gather_all_events(outcome)
+
+    # The returned lists can be altered by the caller.
+    find_events_by_identifier(outcome, "ESDTNFTCreate").clear()
+    assert len(find_events_by_identifier(outcome, "ESDTNFTCreate")) == 3
+
+
+def test_events_index_is_a_snapshot():
+    outcome = create_outcome(3)
+    assert len(find_events_by_identifier(outcome, "ESDTNFTCreate")) == 3
+
+    outcome.transaction_results[0].logs.events[0] = TransactionEvent(identifier="ESDTNFTBurn", topics=[b"NFT-123456"])
+    outcome.logs.events.append(TransactionEvent(identifier="ESDTNFTCreate"))
+    assert len(find_events_by_identifier(outcome, "ESDTNFTCreate")) == 3
+
+    outcome.reset_events_index()
+    assert len(find_events_by_identifier(outcome, "ESDTNFTCreate")) == 3
+    assert len(find_events_by_identifier(outcome, "ESDTNFTBurn")) == 1
+    assert find_events_by_identifier(outcome, "ESDTNFTCreate")[0] is outcome.logs.events[-1]
+
+
+def test_events_index():
+    outcome = create_outcome(3)
+    index = TransactionEventsIndex(gather_all_events(outcome))
+
+    # The first lookup scans the events, the second one builds the map.
+    assert [event.topics[1] for event in index.find_by_identifier("ESDTNFTCreate")] == [b"\x00\x00", b"\x00\x01", b"\x00\x02"]
+    assert index._by_identifier is None
+    assert index.find_by_identifier("missing") == []
+    assert index._by_identifier is not None
+    assert len(index.find_by_identifier("ESDTNFTCreate")) == 3
+    # The map by first topic is only built when needed.
+    assert index._by_first_topic is None
+
+    assert len(index.find_by_first_topic("NFT-123456")) == 3
+    assert index.find_by_first_topic("completed") == outcome.logs.events
+    assert index._by_first_topic is not None
+    assert len(index.find_by_first_topic("NFT-123456")) == 3
+    assert index.find_by_first_topic("\ud800") == []
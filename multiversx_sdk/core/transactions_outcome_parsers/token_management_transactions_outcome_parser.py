@@ -1,63 +1,139 @@
-from typing import List
+from typing import Callable, Dict, Iterable, Iterator, List
 
 from multiversx_sdk.core.address import Address
 from multiversx_sdk.core.codec import decode_unsigned_number
 from multiversx_sdk.core.constants import DEFAULT_HRP
-from multiversx_sdk.core.errors import ParseTransactionOutcomeError
+from multiversx_sdk.core.errors import (ErrBadPubkeyLength,
+                                        ParseTransactionOutcomeError)
 from multiversx_sdk.core.transactions_outcome_parsers.resources import (
     TransactionEvent, TransactionOutcome, find_events_by_identifier)
 from multiversx_sdk.core.transactions_outcome_parsers.token_management_transactions_outcome_parser_types import (
     AddQuantityOutcome, BurnOutcome, BurnQuantityOutcome, FreezeOutcome,
     IssueFungibleOutcome, IssueNonFungibleOutcome, IssueSemiFungibleOutcome,
-    MintOutcome, NFTCreateOutcome, PauseOutcome, RegisterAndSetAllRolesOutcome,
-    RegisterMetaEsdtOutcome, SetSpecialRoleOutcome, UnFreezeOutcome,
+    MintOutcome, NFTCreateOutcome, ParsedTokenManagementOutcome, PauseOutcome,
+    RegisterAndSetAllRolesOutcome, RegisterMetaEsdtOutcome,
+    SetSpecialRoleOutcome, TokenManagementOutcome, UnFreezeOutcome,
     UnPauseOutcome, UpdateAttributesOutcome, WipeOutcome)
 
 
 class TokenManagementTransactionsOutcomeParser:
     def __init__(self) -> None:
-        pass
+        # Used by "parse_outcomes()", to route each event to its parse routine.
+        # The "registerAndSetAllRoles" events are handled separately, since they are paired with the "ESDTSetRole" events.
+        self._create_outcome_by_identifier: Dict[str, Callable[[TransactionEvent], TokenManagementOutcome]] = {
+            "issue": self._create_issue_fungible_outcome,
+            "issueNonFungible": self._create_issue_non_fungible_outcome,
+            "issueSemiFungible": self._create_issue_semi_fungible_outcome,
+            "registerMetaESDT": self._create_register_meta_esdt_outcome,
+            "ESDTSetRole": self._create_set_special_role_outcome,
+            "ESDTNFTCreate": self._create_nft_create_outcome,
+            "ESDTLocalMint": self._create_mint_outcome,
+            "ESDTLocalBurn": self._create_burn_outcome,
+            "ESDTPause": self._create_pause_outcome,
+            "ESDTUnPause": self._create_unpause_outcome,
+            "ESDTFreeze": self._create_freeze_outcome,
+            "ESDTUnFreeze": self._create_unfreeze_outcome,
+            "ESDTWipe": self._create_wipe_outcome,
+            "ESDTNFTUpdateAttributes": self._create_update_attributes_outcome,
+            "ESDTNFTAddQuantity": self._create_add_quantity_outcome,
+            "ESDTNFTBurn": self._create_burn_quantity_outcome
+        }
+
+    def parse_outcomes(self, transaction_outcomes: Iterable[TransactionOutcome]) -> Iterator[ParsedTokenManagementOutcome]:
+        """
+        Lazily parses a stream of transaction outcomes, yielding the records of each one (see "parse_outcome()").
+        An outcome which cannot be parsed (e.g. of a failed transaction) does not end the stream: its error is reported
+        in the yielded item, instead.
+
+        Args:
+            transaction_outcomes: the outcomes to parse (a list, a generator etc.).
+        """
+        for transaction_outcome in transaction_outcomes:
+            try:
+                yield ParsedTokenManagementOutcome(self.parse_outcome(transaction_outcome))
+            except ParseTransactionOutcomeError as error:
+                yield ParsedTokenManagementOutcome([], str(error))
+
+    def parse_outcome(self, transaction_outcome: TransactionOutcome) -> List[TokenManagementOutcome]:
+        """
+        Parses all the token management events of an outcome, in a single traversal (instead of calling each "parse_*()" method).
+
+        The records are the ones the "parse_*()" methods would return, in the order of the events. An "ESDTSetRole" event
+        is reported as a "SetSpecialRoleOutcome" and, if the transaction has "registerAndSetAllRoles" events, it is also paired
+        with one of them, into a "RegisterAndSetAllRolesOutcome" (these records come last).
+
+        Raises ParseTransactionOutcomeError if the transaction has failed (as all the "parse_*()" methods do),
+        or if an event cannot be decoded (e.g. it has missing topics).
+        """
+        try:
+            return self._parse_outcome(transaction_outcome)
+        except (IndexError, ValueError, ErrBadPubkeyLength) as error:
+            raise ParseTransactionOutcomeError(f"cannot parse the transaction outcome: {error}") from error
+
+    def _parse_outcome(self, transaction_outcome: TransactionOutcome) -> List[TokenManagementOutcome]:
+        create_outcome_by_identifier = self._create_outcome_by_identifier
+        result: List[TokenManagementOutcome] = []
+        register_events: List[TransactionEvent] = []
+        set_role_events: List[TransactionEvent] = []
+
+        def handle_event(event: TransactionEvent) -> None:
+            identifier = event.identifier
+
+            if identifier == "registerAndSetAllRoles":
+                register_events.append(event)
+                return
+            if identifier == "ESDTSetRole":
+                set_role_events.append(event)
+
+            create_outcome = create_outcome_by_identifier.get(identifier)
+            if create_outcome is not None:
+                result.append(create_outcome(event))
+
+        for event in transaction_outcome.logs.events:
+            if event.identifier == "signalError":
+                self._raise_signal_error(event)
+
+            handle_event(event)
+
+        for transaction_result in transaction_outcome.transaction_results:
+            for event in transaction_result.logs.events:
+                handle_event(event)
+
+        if register_events:
+            result.extend(self._create_register_and_set_all_roles_outcomes(register_events, set_role_events))
+
+        return result
 
     def parse_issue_fungible(self, transaction_outcome: TransactionOutcome) -> List[IssueFungibleOutcome]:
         self._ensure_no_error(transaction_outcome.logs.events)
 
         events = find_events_by_identifier(transaction_outcome, "issue")
-        return [IssueFungibleOutcome(self._extract_token_identifier(event)) for event in events]
+        return [self._create_issue_fungible_outcome(event) for event in events]
 
     def parse_issue_non_fungible(self, transaction_outcome: TransactionOutcome) -> List[IssueNonFungibleOutcome]:
         self._ensure_no_error(transaction_outcome.logs.events)
 
         events = find_events_by_identifier(transaction_outcome, "issueNonFungible")
-        return [IssueNonFungibleOutcome(self._extract_token_identifier(event)) for event in events]
+        return [self._create_issue_non_fungible_outcome(event) for event in events]
 
     def parse_issue_semi_fungible(self, transaction_outcome: TransactionOutcome) -> List[IssueSemiFungibleOutcome]:
         self._ensure_no_error(transaction_outcome.logs.events)
 
         events = find_events_by_identifier(transaction_outcome, "issueSemiFungible")
-        return [IssueSemiFungibleOutcome(self._extract_token_identifier(event)) for event in events]
+        return [self._create_issue_semi_fungible_outcome(event) for event in events]
 
     def parse_register_meta_esdt(self, transaction_outcome: TransactionOutcome) -> List[RegisterMetaEsdtOutcome]:
         self._ensure_no_error(transaction_outcome.logs.events)
 
         events = find_events_by_identifier(transaction_outcome, "registerMetaESDT")
-        return [RegisterMetaEsdtOutcome(self._extract_token_identifier(event)) for event in events]
+        return [self._create_register_meta_esdt_outcome(event) for event in events]
 
     def parse_register_and_set_all_roles(self, transaction_outcome: TransactionOutcome) -> List[RegisterAndSetAllRolesOutcome]:
         self._ensure_no_error(transaction_outcome.logs.events)
 
         register_events = find_events_by_identifier(transaction_outcome, "registerAndSetAllRoles")
         set_role_events = find_events_by_identifier(transaction_outcome, "ESDTSetRole")
-
-        if len(register_events) != len(set_role_events):
-            raise ParseTransactionOutcomeError("The number of `registerAndSetAllRoles` events and `ESDTSetRole` events do not match")
-
-        result: List[RegisterAndSetAllRolesOutcome] = []
-        for register_event, set_role_event in zip(register_events, set_role_events):
-            identifier = self._extract_token_identifier(register_event)
-            roles = self._decode_roles(set_role_event)
-            result.append(RegisterAndSetAllRolesOutcome(identifier, roles))
-
-        return result
+        return self._create_register_and_set_all_roles_outcomes(register_events, set_role_events)
 
     def parse_set_burn_role_globally(self, transaction_outcome: TransactionOutcome) -> None:
         self._ensure_no_error(transaction_outcome.logs.events)
@@ -69,157 +145,191 @@ class TokenManagementTransactionsOutcomeParser:
         self._ensure_no_error(transaction_outcome.logs.events)
 
         events = find_events_by_identifier(transaction_outcome, "ESDTSetRole")
-        return [
-            SetSpecialRoleOutcome(
-                user_address=event.address,
-                token_identifier=self._extract_token_identifier(event),
-                roles=self._decode_roles(event)
-            )
-            for event in events
-        ]
+        return [self._create_set_special_role_outcome(event) for event in events]
 
     def parse_nft_create(self, transaction_outcome: TransactionOutcome) -> List[NFTCreateOutcome]:
         self._ensure_no_error(transaction_outcome.logs.events)
 
         events = find_events_by_identifier(transaction_outcome, "ESDTNFTCreate")
-
-        return [
-            NFTCreateOutcome(
-                token_identifier=self._extract_token_identifier(event),
-                nonce=self._extract_nonce(event),
-                initial_quantity=self._extract_amount(event)
-            )
-            for event in events
-        ]
+        return [self._create_nft_create_outcome(event) for event in events]
 
     def parse_local_mint(self, transaction_outcome: TransactionOutcome) -> List[MintOutcome]:
         self._ensure_no_error(transaction_outcome.logs.events)
 
         events = find_events_by_identifier(transaction_outcome, "ESDTLocalMint")
-        return [
-            MintOutcome(
-                user_address=event.address,
-                token_identifier=self._extract_token_identifier(event),
-                nonce=self._extract_nonce(event),
-                minted_supply=self._extract_amount(event)
-            )
-            for event in events
-        ]
+        return [self._create_mint_outcome(event) for event in events]
 
     def parse_local_burn(self, transaction_outcome: TransactionOutcome) -> List[BurnOutcome]:
         self._ensure_no_error(transaction_outcome.logs.events)
 
         events = find_events_by_identifier(transaction_outcome, "ESDTLocalBurn")
-        return [
-            BurnOutcome(
-                user_address=event.address,
-                token_identifier=self._extract_token_identifier(event),
-                nonce=self._extract_nonce(event),
-                burnt_supply=self._extract_amount(event)
-            )
-            for event in events
-        ]
+        return [self._create_burn_outcome(event) for event in events]
 
     def parse_pause(self, transaction_outcome: TransactionOutcome) -> List[PauseOutcome]:
         self._ensure_no_error(transaction_outcome.logs.events)
 
         events = find_events_by_identifier(transaction_outcome, "ESDTPause")
-        return [PauseOutcome(self._extract_token_identifier(event)) for event in events]
+        return [self._create_pause_outcome(event) for event in events]
 
     def parse_unpause(self, transaction_outcome: TransactionOutcome) -> List[UnPauseOutcome]:
         self._ensure_no_error(transaction_outcome.logs.events)
 
         events = find_events_by_identifier(transaction_outcome, "ESDTUnPause")
-        return [UnPauseOutcome(self._extract_token_identifier(event)) for event in events]
+        return [self._create_unpause_outcome(event) for event in events]
 
     def parse_freeze(self, transaction_outcome: TransactionOutcome) -> List[FreezeOutcome]:
         self._ensure_no_error(transaction_outcome.logs.events)
 
         events = find_events_by_identifier(transaction_outcome, "ESDTFreeze")
-        return [
-            FreezeOutcome(
-                user_address=self._extract_address(event),
-                token_identifier=self._extract_token_identifier(event),
-                nonce=self._extract_nonce(event),
-                balance=self._extract_amount(event)
-            )
-            for event in events
-        ]
+        return [self._create_freeze_outcome(event) for event in events]
 
     def parse_unfreeze(self, transaction_outcome: TransactionOutcome) -> List[UnFreezeOutcome]:
         self._ensure_no_error(transaction_outcome.logs.events)
 
         events = find_events_by_identifier(transaction_outcome, "ESDTUnFreeze")
-        return [
-            UnFreezeOutcome(
-                user_address=self._extract_address(event),
-                token_identifier=self._extract_token_identifier(event),
-                nonce=self._extract_nonce(event),
-                balance=self._extract_amount(event)
-            )
-            for event in events
-        ]
+        return [self._create_unfreeze_outcome(event) for event in events]
 
     def parse_wipe(self, transaction_outcome: TransactionOutcome) -> List[WipeOutcome]:
         self._ensure_no_error(transaction_outcome.logs.events)
 
         events = find_events_by_identifier(transaction_outcome, "ESDTWipe")
-        return [
-            WipeOutcome(
-                user_address=self._extract_address(event),
-                token_identifier=self._extract_token_identifier(event),
-                nonce=self._extract_nonce(event),
-                balance=self._extract_amount(event)
-            )
-            for event in events
-        ]
+        return [self._create_wipe_outcome(event) for event in events]
 
     def parse_update_attributes(self, transaction_outcome: TransactionOutcome) -> List[UpdateAttributesOutcome]:
         self._ensure_no_error(transaction_outcome.logs.events)
 
         events = find_events_by_identifier(transaction_outcome, "ESDTNFTUpdateAttributes")
-        return [
-            UpdateAttributesOutcome(
-                token_identifier=self._extract_token_identifier(event),
-                nonce=self._extract_nonce(event),
-                attributes=event.topics[3] if event.topics[3] else b""
-            )
-            for event in events
-        ]
+        return [self._create_update_attributes_outcome(event) for event in events]
 
     def parse_add_quantity(self, transaction_outcome: TransactionOutcome) -> List[AddQuantityOutcome]:
         self._ensure_no_error(transaction_outcome.logs.events)
 
         events = find_events_by_identifier(transaction_outcome, "ESDTNFTAddQuantity")
-        return [
-            AddQuantityOutcome(
-                token_identifier=self._extract_token_identifier(event),
-                nonce=self._extract_nonce(event),
-                added_quantity=self._extract_amount(event)
-            )
-            for event in events
-        ]
+        return [self._create_add_quantity_outcome(event) for event in events]
 
     def parse_burn_quantity(self, transaction_outcome: TransactionOutcome) -> List[BurnQuantityOutcome]:
         self._ensure_no_error(transaction_outcome.logs.events)
 
         events = find_events_by_identifier(transaction_outcome, "ESDTNFTBurn")
-        return [
-            BurnQuantityOutcome(
-                token_identifier=self._extract_token_identifier(event),
-                nonce=self._extract_nonce(event),
-                burnt_quantity=self._extract_amount(event)
-            )
-            for event in events
-        ]
+        return [self._create_burn_quantity_outcome(event) for event in events]
+
+    def _create_issue_fungible_outcome(self, event: TransactionEvent) -> IssueFungibleOutcome:
+        return IssueFungibleOutcome(self._extract_token_identifier(event))
+
+    def _create_issue_non_fungible_outcome(self, event: TransactionEvent) -> IssueNonFungibleOutcome:
+        return IssueNonFungibleOutcome(self._extract_token_identifier(event))
+
+    def _create_issue_semi_fungible_outcome(self, event: TransactionEvent) -> IssueSemiFungibleOutcome:
+        return IssueSemiFungibleOutcome(self._extract_token_identifier(event))
+
+    def _create_register_meta_esdt_outcome(self, event: TransactionEvent) -> RegisterMetaEsdtOutcome:
+        return RegisterMetaEsdtOutcome(self._extract_token_identifier(event))
+
+    def _create_register_and_set_all_roles_outcomes(self,
+                                                    register_events: List[TransactionEvent],
+                                                    set_role_events: List[TransactionEvent]) -> List[RegisterAndSetAllRolesOutcome]:
+        if len(register_events) != len(set_role_events):
+            raise ParseTransactionOutcomeError("The number of `registerAndSetAllRoles` events and `ESDTSetRole` events do not match")
+
+        result: List[RegisterAndSetAllRolesOutcome] = []
+        for register_event, set_role_event in zip(register_events, set_role_events):
+            identifier = self._extract_token_identifier(register_event)
+            roles = self._decode_roles(set_role_event)
+            result.append(RegisterAndSetAllRolesOutcome(identifier, roles))
+
+        return result
+
+    def _create_set_special_role_outcome(self, event: TransactionEvent) -> SetSpecialRoleOutcome:
+        return SetSpecialRoleOutcome(
+            user_address=event.address,
+            token_identifier=self._extract_token_identifier(event),
+            roles=self._decode_roles(event)
+        )
+
+    def _create_nft_create_outcome(self, event: TransactionEvent) -> NFTCreateOutcome:
+        return NFTCreateOutcome(
+            token_identifier=self._extract_token_identifier(event),
+            nonce=self._extract_nonce(event),
+            initial_quantity=self._extract_amount(event)
+        )
+
+    def _create_mint_outcome(self, event: TransactionEvent) -> MintOutcome:
+        return MintOutcome(
+            user_address=event.address,
+            token_identifier=self._extract_token_identifier(event),
+            nonce=self._extract_nonce(event),
+            minted_supply=self._extract_amount(event)
+        )
+
+    def _create_burn_outcome(self, event: TransactionEvent) -> BurnOutcome:
+        return BurnOutcome(
+            user_address=event.address,
+            token_identifier=self._extract_token_identifier(event),
+            nonce=self._extract_nonce(event),
+            burnt_supply=self._extract_amount(event)
+        )
+
+    def _create_pause_outcome(self, event: TransactionEvent) -> PauseOutcome:
+        return PauseOutcome(self._extract_token_identifier(event))
+
+    def _create_unpause_outcome(self, event: TransactionEvent) -> UnPauseOutcome:
+        return UnPauseOutcome(self._extract_token_identifier(event))
+
+    def _create_freeze_outcome(self, event: TransactionEvent) -> FreezeOutcome:
+        return FreezeOutcome(
+            user_address=self._extract_address(event),
+            token_identifier=self._extract_token_identifier(event),
+            nonce=self._extract_nonce(event),
+            balance=self._extract_amount(event)
+        )
+
+    def _create_unfreeze_outcome(self, event: TransactionEvent) -> UnFreezeOutcome:
+        return UnFreezeOutcome(
+            user_address=self._extract_address(event),
+            token_identifier=self._extract_token_identifier(event),
+            nonce=self._extract_nonce(event),
+            balance=self._extract_amount(event)
+        )
+
+    def _create_wipe_outcome(self, event: TransactionEvent) -> WipeOutcome:
+        return WipeOutcome(
+            user_address=self._extract_address(event),
+            token_identifier=self._extract_token_identifier(event),
+            nonce=self._extract_nonce(event),
+            balance=self._extract_amount(event)
+        )
+
+    def _create_update_attributes_outcome(self, event: TransactionEvent) -> UpdateAttributesOutcome:
+        return UpdateAttributesOutcome(
+            token_identifier=self._extract_token_identifier(event),
+            nonce=self._extract_nonce(event),
+            attributes=event.topics[3] if event.topics[3] else b""
+        )
+
+    def _create_add_quantity_outcome(self, event: TransactionEvent) -> AddQuantityOutcome:
+        return AddQuantityOutcome(
+            token_identifier=self._extract_token_identifier(event),
+            nonce=self._extract_nonce(event),
+            added_quantity=self._extract_amount(event)
+        )
+
+    def _create_burn_quantity_outcome(self, event: TransactionEvent) -> BurnQuantityOutcome:
+        return BurnQuantityOutcome(
+            token_identifier=self._extract_token_identifier(event),
+            nonce=self._extract_nonce(event),
+            burnt_quantity=self._extract_amount(event)
+        )
 
     def _ensure_no_error(self, transaction_events: List[TransactionEvent]) -> None:
         for event in transaction_events:
             if event.identifier == "signalError":
-                data = event.data_items[0].decode()[1:] if len(event.data_items[0]) else ""
-                message = event.topics[1].decode()
+                self._raise_signal_error(event)
+
+    def _raise_signal_error(self, event: TransactionEvent) -> None:
+        data = event.data_items[0].decode()[1:] if len(event.data_items[0]) else ""
+        message = event.topics[1].decode()
 
-                raise ParseTransactionOutcomeError(f"encountered signalError: {message} ({bytes.fromhex(data).decode()})")
+        raise ParseTransactionOutcomeError(f"encountered signalError: {message} ({bytes.fromhex(data).decode()})")
 
     def _decode_roles(self, event: TransactionEvent) -> List[str]:
         encoded_roles = event.topics[3:]
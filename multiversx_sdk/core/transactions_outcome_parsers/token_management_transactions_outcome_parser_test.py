@@ -1,15 +1,48 @@
 import base64
 import re
+from typing import Any, List
 
 import pytest
 
+from multiversx_sdk.core.address import Address
 from multiversx_sdk.core.errors import ParseTransactionOutcomeError
 from multiversx_sdk.core.transactions_outcome_parsers.resources import (
-    SmartContractResult, TransactionEvent, TransactionLogs, TransactionOutcome)
+    SmartContractResult, TransactionEvent, TransactionLogs, TransactionOutcome,
+    find_events_by_identifier)
 from multiversx_sdk.core.transactions_outcome_parsers.token_management_transactions_outcome_parser import \
     TokenManagementTransactionsOutcomeParser
+from multiversx_sdk.core.transactions_outcome_parsers.token_management_transactions_outcome_parser_types import (
+    FreezeOutcome, MintOutcome, NFTCreateOutcome, ParsedTokenManagementOutcome,
+    RegisterAndSetAllRolesOutcome, SetSpecialRoleOutcome,
+    UpdateAttributesOutcome)
+from multiversx_sdk.testutils.addresses import ALICE, BOB
 from multiversx_sdk.testutils.utils import base64_topics_to_bytes
 
+BOB_PUBKEY = Address.new_from_bech32(BOB).get_public_key()
+
+
+def create_outcome(log_events: List[TransactionEvent], result_events: List[TransactionEvent]) -> TransactionOutcome:
+    result = SmartContractResult(logs=TransactionLogs(ALICE, result_events))
+    return TransactionOutcome(transaction_results=[result], transaction_logs=TransactionLogs(ALICE, log_events))
+
+
+def create_outcomes() -> List[TransactionOutcome]:
+    return [
+        create_outcome(
+            [TransactionEvent(ALICE, "registerAndSetAllRoles", [b"LMAO-d9f892", b"LMAO", b"LMAO", b"FungibleESDT", b"\x02"])],
+            [TransactionEvent(ALICE, "ESDTSetRole", [b"LMAO-d9f892", b"", b"", b"ESDTRoleLocalMint", b"ESDTRoleLocalBurn"])]
+        ),
+        create_outcome(
+            [TransactionEvent(ALICE, "ESDTNFTCreate", [b"NFT-f01d1e", b"\x01", b"\x01"]), TransactionEvent(ALICE, "completedTxEvent")],
+            [TransactionEvent(ALICE, "ESDTLocalMint", [b"AAA-29c4c9", b"", b"\x64"]), TransactionEvent(ALICE, "writeLog")]
+        ),
+        create_outcome(
+            [TransactionEvent(ALICE, "ESDTFreeze", [b"AAA-29c4c9", b"", b"\x0a", BOB_PUBKEY])],
+            [TransactionEvent(ALICE, "ESDTNFTUpdateAttributes", [b"NFT-f01d1e", b"\x01", b"", b"metadata"])]
+        ),
+        create_outcome([], [])
+    ]
+
 
 class TestTokenManagementTransactionsOutcomeParser:
     parser = TokenManagementTransactionsOutcomeParser()
@@ -547,3 +580,64 @@ class TestTokenManagementTransactionsOutcomeParser:
         assert outcome[0].token_identifier == identifier
         assert outcome[0].nonce == nonce
         assert outcome[0].burnt_quantity == burnt_quantity
+
+    def test_parse_outcomes(self):
+        outcomes = list(self.parser.parse_outcomes(create_outcomes()))
+
+        assert outcomes == [
+            ParsedTokenManagementOutcome([
+                SetSpecialRoleOutcome(ALICE, "LMAO-d9f892", ["ESDTRoleLocalMint", "ESDTRoleLocalBurn"]),
+                RegisterAndSetAllRolesOutcome("LMAO-d9f892", ["ESDTRoleLocalMint", "ESDTRoleLocalBurn"])
+            ]),
+            ParsedTokenManagementOutcome([
+                NFTCreateOutcome("NFT-f01d1e", 1, 1),
+                MintOutcome(ALICE, "AAA-29c4c9", 0, 100)
+            ]),
+            ParsedTokenManagementOutcome([
+                FreezeOutcome(BOB, "AAA-29c4c9", 0, 10),
+                UpdateAttributesOutcome("NFT-f01d1e", 1, b"metadata")
+            ]),
+            ParsedTokenManagementOutcome([])
+        ]
+
+    def test_parse_outcomes_gives_the_records_of_all_parse_methods(self):
+        for transaction_outcome in create_outcomes():
+            records: List[Any] = []
+            for name in dir(self.parser):
+                if name.startswith("parse_") and name not in ["parse_outcomes", "parse_outcome", "parse_register_and_set_all_roles"]:
+                    records.extend(getattr(self.parser, name)(transaction_outcome) or [])
+
+            if find_events_by_identifier(transaction_outcome, "registerAndSetAllRoles"):
+                records.extend(self.parser.parse_register_and_set_all_roles(transaction_outcome))
+
+            assert sorted(map(repr, self.parser.parse_outcome(transaction_outcome))) == sorted(map(repr, records))
+
+    def test_parse_outcomes_with_errors(self):
+        error = TransactionEvent(ALICE, "signalError", [bytes(32), b"ticker name is not valid"], data_items=[b"@75736572206572726f72"])
+        failed = create_outcome([error], [])
+        unpaired = create_outcome([TransactionEvent(ALICE, "registerAndSetAllRoles", [b"LMAO-d9f892"])], [])
+        # Malformed events: a topic is missing, and the data of the error is not hex-encoded.
+        missing_topic = create_outcome([TransactionEvent(ALICE, "ESDTFreeze", [b"AAA-29c4c9", b"", b"\x0a"])], [])
+        bad_error = create_outcome([TransactionEvent(ALICE, "signalError", [bytes(32), b"bad"], data_items=[b"@zz"])], [])
+        ok = create_outcomes()[1]
+
+        # The failed outcomes are reported in place, and the stream goes on.
+        outcomes = list(self.parser.parse_outcomes(iter([ok, failed, ok, unpaired, ok, missing_topic, bad_error, ok])))
+
+        assert len(outcomes) == 8
+        assert [len(outcome.records) for outcome in outcomes] == [2, 0, 2, 0, 2, 0, 0, 2]
+        assert [outcome.error is None for outcome in outcomes] == [True, False, True, False, True, False, False, True]
+        assert outcomes[1].error == "encountered signalError: ticker name is not valid (user error)"
+        assert outcomes[3].error is not None and "do not match" in outcomes[3].error
+        assert outcomes[5].error is not None and outcomes[5].error.startswith("cannot parse the transaction outcome")
+        assert outcomes[6].error is not None and outcomes[6].error.startswith("cannot parse the transaction outcome")
+
+        # Parsing a single outcome raises, as the "parse_*()" methods do.
+        with pytest.raises(ParseTransactionOutcomeError, match=re.escape("encountered signalError: ticker name is not valid (user error)")):
+            self.parser.parse_outcome(failed)
+
+        with pytest.raises(ParseTransactionOutcomeError, match="do not match"):
+            self.parser.parse_outcome(unpaired)
+
+        with pytest.raises(ParseTransactionOutcomeError, match="cannot parse the transaction outcome"):
+            self.parser.parse_outcome(missing_topic)
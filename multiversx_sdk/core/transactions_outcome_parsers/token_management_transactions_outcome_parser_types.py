@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional, Union
 
 
 @dataclass
@@ -111,3 +111,19 @@ class BurnQuantityOutcome:
     token_identifier: str
     nonce: int
     burnt_quantity: int
+
+
+TokenManagementOutcome = Union[
+    IssueFungibleOutcome, IssueNonFungibleOutcome, IssueSemiFungibleOutcome,
+    RegisterMetaEsdtOutcome, RegisterAndSetAllRolesOutcome, SetSpecialRoleOutcome,
+    NFTCreateOutcome, MintOutcome, BurnOutcome, PauseOutcome, UnPauseOutcome,
+    FreezeOutcome, UnFreezeOutcome, WipeOutcome, UpdateAttributesOutcome,
+    AddQuantityOutcome, BurnQuantityOutcome
+]
+
+
+@dataclass
+class ParsedTokenManagementOutcome:
+    """The records of a transaction outcome, as yielded by "parse_outcomes()". If the outcome could not be parsed (e.g. the transaction has failed), "error" holds the reason and there are no records."""
+    records: List[TokenManagementOutcome]
+    error: Optional[str] = None
@@ -1,16 +1,51 @@
 from multiversx_sdk.network_providers.api_network_provider import \
     ApiNetworkProvider
 from multiversx_sdk.network_providers.errors import GenericError
+from multiversx_sdk.network_providers.gas_estimator import (GasEstimate,
+                                                            GasEstimator)
+from multiversx_sdk.network_providers.hyperblock_follower import \
+    HyperblockFollower
+from multiversx_sdk.network_providers.hyperblocks import (
+    FileCheckpointStore, HyperblockOnNetwork, InMemoryCheckpointStore)
+from multiversx_sdk.network_providers.hyperblocks_backfiller import (
+    BackfillProgress, HyperblocksBackfiller)
+from multiversx_sdk.network_providers.instrumentation import (IRequestHook,
+                                                              MetricsCollector,
+                                                              RequestEvent)
+from multiversx_sdk.network_providers.local_proxy_server import \
+    LocalProxyServer
+from multiversx_sdk.network_providers.network_simulator import (
+    NetworkSimulator, SimulatedAccount, TransactionRejectedError,
+    create_simulator_proxy_server)
+from multiversx_sdk.network_providers.nonce_manager import (NonceManager,
+                                                            NonceSyncResult)
 from multiversx_sdk.network_providers.proxy_network_provider import \
     ProxyNetworkProvider
+from multiversx_sdk.network_providers.rate_limiter import (RateLimiter,
+                                                           RateLimiterMetrics,
+                                                           RetryPolicy)
+from multiversx_sdk.network_providers.recording import (
+    RecordingReader, RecordingWriter, create_recording_session,
+    create_replay_session)
 from multiversx_sdk.network_providers.resources import GenericResponse
 from multiversx_sdk.network_providers.transaction_awaiter import \
     TransactionAwaiter
 from multiversx_sdk.network_providers.transaction_decoder import (
     TransactionDecoder, TransactionMetadata)
+from multiversx_sdk.network_providers.transactions_broadcaster import (
+    BroadcastedTransaction, BroadcastResult, TransactionsBroadcaster)
 
 __all__ = [
     "GenericError", "GenericResponse", "ApiNetworkProvider",
     "ProxyNetworkProvider", "TransactionAwaiter",
-    "TransactionDecoder", "TransactionMetadata"
+    "TransactionDecoder", "TransactionMetadata",
+    "TransactionsBroadcaster", "BroadcastResult", "BroadcastedTransaction",
+    "HyperblockFollower", "HyperblockOnNetwork", "InMemoryCheckpointStore", "FileCheckpointStore",
+    "HyperblocksBackfiller", "BackfillProgress",
+    "RateLimiter", "RateLimiterMetrics", "RetryPolicy",
+    "IRequestHook", "RequestEvent", "MetricsCollector",
+    "RecordingReader", "RecordingWriter", "create_recording_session", "create_replay_session",
+    "NonceManager", "NonceSyncResult",
+    "GasEstimator", "GasEstimate",
+    "NetworkSimulator", "SimulatedAccount", "TransactionRejectedError", "create_simulator_proxy_server", "LocalProxyServer"
 ]
@@ -1,10 +1,12 @@
-from typing import Any, Dict, List, Tuple, Union, cast
+from typing import (Any, Dict, Iterable, List, Optional, Sequence, Tuple,
+                    Union, cast)
 
 import requests
 from requests.auth import AuthBase
 
-from multiversx_sdk.converters.transactions_converter import \
-    TransactionsConverter
+from multiversx_sdk.converters.json_codec import IJsonCodec, create_json_codec
+from multiversx_sdk.converters.transactions_converter import (
+    DEFAULT_JSON_CHUNK_SIZE_IN_BYTES, TransactionsConverter)
 from multiversx_sdk.network_providers.accounts import (AccountOnNetwork,
                                                        GuardianData)
 from multiversx_sdk.network_providers.config import DefaultPagination
@@ -14,6 +16,9 @@ from multiversx_sdk.network_providers.contract_query_requests import \
 from multiversx_sdk.network_providers.contract_query_response import \
     ContractQueryResponse
 from multiversx_sdk.network_providers.errors import GenericError
+from multiversx_sdk.network_providers.http_requests import (RequestBody,
+                                                            send_request)
+from multiversx_sdk.network_providers.instrumentation import IRequestHook
 from multiversx_sdk.network_providers.interface import (IAddress,
                                                         IContractQuery,
                                                         IPagination)
@@ -24,6 +29,7 @@ from multiversx_sdk.network_providers.network_stake import NetworkStake
 from multiversx_sdk.network_providers.network_status import NetworkStatus
 from multiversx_sdk.network_providers.proxy_network_provider import \
     ProxyNetworkProvider
+from multiversx_sdk.network_providers.rate_limiter import RateLimiter
 from multiversx_sdk.network_providers.token_definitions import (
     DefinitionOfFungibleTokenOnNetwork, DefinitionOfTokenCollectionOnNetwork)
 from multiversx_sdk.network_providers.tokens import (
@@ -40,10 +46,18 @@ class ApiNetworkProvider:
             self,
             url: str,
             auth: Union[AuthBase, None] = None,
-            address_hrp: str = DEFAULT_ADDRESS_HRP
+            address_hrp: str = DEFAULT_ADDRESS_HRP,
+            json_codec: Optional[IJsonCodec] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            request_hooks: Optional[Sequence[IRequestHook]] = None,
+            session: Optional[requests.Session] = None
     ) -> None:
         self.url = url
-        self.backing_proxy = ProxyNetworkProvider(url, auth, address_hrp)
+        self.json_codec = json_codec or create_json_codec()
+        self.rate_limiter = rate_limiter
+        self.request_hooks: List[IRequestHook] = list(request_hooks or [])
+        self.session = session
+        self.backing_proxy = ProxyNetworkProvider(url, auth, address_hrp, self.json_codec, rate_limiter, self.request_hooks, session)
         self.auth = auth
 
     def get_network_config(self) -> NetworkConfig:
@@ -164,7 +178,7 @@ class ApiNetworkProvider:
 
     def send_transaction(self, transaction: ITransaction) -> str:
         url = 'transactions'
-        transactions_converter = TransactionsConverter()
+        transactions_converter = TransactionsConverter(self.json_codec)
         response = self.do_post_generic(url, transactions_converter.transaction_to_dictionary(transaction))
         tx_hash: str = response.get('txHash', '')
         return tx_hash
@@ -173,6 +187,12 @@ class ApiNetworkProvider:
         response = self.backing_proxy.send_transactions(transactions)
         return response
 
+    def send_transactions_streamed(self,
+                                   transactions: Iterable[ITransaction],
+                                   chunk_size_in_bytes: int = DEFAULT_JSON_CHUNK_SIZE_IN_BYTES) -> Tuple[int, Dict[str, str]]:
+        response = self.backing_proxy.send_transactions_streamed(transactions, chunk_size_in_bytes)
+        return response
+
     def _build_pagination_params(self, pagination: IPagination) -> str:
         return f'from={pagination.get_start()}&size={pagination.get_size()}'
 
@@ -193,13 +213,13 @@ class ApiNetworkProvider:
 
     def __do_get(self, url: str) -> Any:
         try:
-            response = requests.get(url, auth=self.auth)
+            response = self._send("GET", url)
             response.raise_for_status()
-            parsed = response.json()
+            parsed = self.json_codec.loads(response.content)
             return self._get_data(parsed, url)
         except requests.HTTPError as err:
             error_data = self._extract_error_from_response(err.response)
-            raise GenericError(url, error_data)
+            raise GenericError(url, error_data, err.response.status_code)
         except requests.ConnectionError as err:
             raise GenericError(url, err)
         except Exception as err:
@@ -207,13 +227,13 @@ class ApiNetworkProvider:
 
     def do_post(self, url: str, payload: Any) -> Dict[str, Any]:
         try:
-            response = requests.post(url, json=payload, auth=self.auth)
+            response = self._send("POST", url, self.json_codec.dumps(payload))
             response.raise_for_status()
-            parsed = response.json()
+            parsed = self.json_codec.loads(response.content)
             return cast(Dict[str, Any], self._get_data(parsed, url))
         except requests.HTTPError as err:
             error_data = self._extract_error_from_response(err.response)
-            raise GenericError(url, error_data)
+            raise GenericError(url, error_data, err.response.status_code)
         except requests.ConnectionError as err:
             raise GenericError(url, err)
         except Exception as err:
@@ -230,6 +250,9 @@ class ApiNetworkProvider:
             else:
                 return parsed
 
+    def _send(self, method: str, url: str, data: Optional[RequestBody] = None) -> requests.Response:
+        return send_request(method, url, data, self.auth, self.rate_limiter, self.request_hooks, self.url, self.session)
+
     def _extract_error_from_response(self, response: Any):
         try:
             return response.json()
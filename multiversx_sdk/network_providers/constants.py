@@ -4,3 +4,4 @@ ESDT_CONTRACT_ADDRESS = Address.new_from_bech32("erd1qqqqqqqqqqqqqqqpqqqqqqqqqqq
 METACHAIN_ID = 4294967295
 MAX_UINT64 = 18446744073709551615
 DEFAULT_ADDRESS_HRP = "erd"
+JSON_HEADERS = {"Content-Type": "application/json"}
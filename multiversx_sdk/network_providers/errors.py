@@ -1,11 +1,12 @@
-from typing import Any
+from typing import Any, Optional
 
 
 class GenericError(Exception):
-    def __init__(self, url: str, data: Any):
+    def __init__(self, url: str, data: Any, status_code: Optional[int] = None):
         super().__init__(f"Url = [{url}], error = {data}")
         self.url = url
         self.data = data
+        self.status_code = status_code
 
 
 class ExpectedTransactionStatusNotReached(Exception):
@@ -0,0 +1,178 @@
+import math
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Hashable, List, Optional, Protocol, Sequence, Tuple
+
+from multiversx_sdk.network_providers.resources import TransactionCostResponse
+from multiversx_sdk.network_providers.transactions import ITransaction
+
+
+class ITransactionCostEstimator(Protocol):
+    def estimate_transaction_cost(self, transaction: ITransaction) -> TransactionCostResponse:
+        ...
+
+
+class GasEstimate:
+    def __init__(self, gas_limit: int = 0, is_cached: bool = False, error: str = "") -> None:
+        """
+        Args:
+            gas_limit (int): the estimated gas limit (margin included), or 0 if the estimation failed.
+            is_cached (bool): whether the estimate was served from the cache (or shared with a similar transaction of the same batch).
+            error (str): the reason of the failure, if any (e.g. the return message of the simulation).
+        """
+        self.gas_limit = gas_limit
+        self.is_cached = is_cached
+        self.error = error
+
+    def is_successful(self) -> bool:
+        return not self.error
+
+    def to_dictionary(self) -> Dict[str, object]:
+        return {
+            "gasLimit": self.gas_limit,
+            "isCached": self.is_cached,
+            "error": self.error
+        }
+
+
+class GasEstimator:
+    """
+    Estimates the gas limits of many transactions, by simulating them concurrently (through "transaction/cost" - e.g. "ProxyNetworkProvider").
+    The estimates are cached by receiver, function and argument shape (the lengths of the arguments), so that similar calls
+    (e.g. the same endpoint, called with different values) are simulated only once.
+    """
+
+    def __init__(self,
+                 network_provider: ITransactionCostEstimator,
+                 gas_limit_multiplier: float = 1.1,
+                 num_workers: int = 8,
+                 max_cache_entries: int = 10000) -> None:
+        """
+        Args:
+            network_provider (ITransactionCostEstimator): used to simulate the transactions.
+            gas_limit_multiplier (float): the safety margin, applied to the simulated gas (e.g. 1.1 means +10%).
+            num_workers (int): the maximum number of concurrent simulations.
+            max_cache_entries (int): the maximum number of cached estimates; the least recently used ones are evicted first.
+        """
+        self.network_provider = network_provider
+        self.gas_limit_multiplier = gas_limit_multiplier
+        self.num_workers = num_workers
+        self.max_cache_entries = max_cache_entries
+
+        # The simulated gas (margin not included), by cache key.
+        self._cache: "OrderedDict[Tuple[Hashable, ...], int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def estimate_gas_limit(self, transaction: ITransaction) -> int:
+        """Returns the estimated gas limit of the transaction, or raises an error if the simulation fails."""
+        estimate = self.estimate_gas_limits([transaction])[0]
+        if estimate.error:
+            raise Exception(f"Cannot estimate the gas limit: {estimate.error}")
+        return estimate.gas_limit
+
+    def estimate_gas_limits(self, transactions: Sequence[ITransaction]) -> List[GasEstimate]:
+        """Returns an estimate for each transaction, in order. Only one transaction per (not yet cached) key is simulated."""
+        keys = [_get_cache_key(transaction) for transaction in transactions]
+        estimates: List[Optional[GasEstimate]] = [None] * len(transactions)
+        to_simulate: Dict[Tuple[Hashable, ...], List[int]] = {}
+
+        for index, key in enumerate(keys):
+            gas = self._get_cached(key)
+
+            if gas is not None:
+                estimates[index] = GasEstimate(self._apply_margin(gas), is_cached=True)
+            else:
+                to_simulate.setdefault(key, []).append(index)
+
+        if to_simulate:
+            with ThreadPoolExecutor(max_workers=min(self.num_workers, len(to_simulate))) as executor:
+                futures = {key: executor.submit(self._simulate, transactions[indices[0]]) for key, indices in to_simulate.items()}
+
+            for key, indices in to_simulate.items():
+                gas, error = futures[key].result()
+
+                if not error:
+                    self._put(key, gas)
+
+                for position, index in enumerate(indices):
+                    estimates[index] = GasEstimate(self._apply_margin(gas) if not error else 0, is_cached=position > 0 and not error, error=error)
+
+        return [estimate for estimate in estimates if estimate is not None]
+
+    def apply_gas_limits(self, transactions: Sequence[ITransaction]) -> List[GasEstimate]:
+        """Sets the gas limits of the transactions (to be signed afterwards). On failure, a gas limit is left unchanged."""
+        estimates = self.estimate_gas_limits(transactions)
+
+        for transaction, estimate in zip(transactions, estimates):
+            if estimate.is_successful():
+                transaction.gas_limit = estimate.gas_limit
+
+        return estimates
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def _simulate(self, transaction: ITransaction) -> Tuple[int, str]:
+        try:
+            response = self.network_provider.estimate_transaction_cost(transaction)
+        except Exception as error:
+            return 0, str(error)
+
+        if not response.is_successful():
+            return 0, response.return_message or "no gas estimate"
+
+        return response.gas_limit, ""
+
+    def _apply_margin(self, gas: int) -> int:
+        return math.ceil(gas * self.gas_limit_multiplier)
+
+    def _get_cached(self, key: Tuple[Hashable, ...]) -> Optional[int]:
+        with self._lock:
+            gas = self._cache.get(key)
+            if gas is not None:
+                self._cache.move_to_end(key)
+            return gas
+
+    def _put(self, key: Tuple[Hashable, ...], gas: int) -> None:
+        with self._lock:
+            self._cache[key] = gas
+            self._cache.move_to_end(key)
+
+            while len(self._cache) > self.max_cache_entries:
+                self._cache.popitem(last=False)
+
+
+def _get_cache_key(transaction: ITransaction) -> Tuple[Hashable, ...]:
+    """
+    The receiver, the function and the lengths of the arguments (which determine the gas for the data, and, usually, the execution path).
+    For transfers of tokens, the actual receiver and the called function (if any) are considered, as well.
+    Calls with value (payable functions) are distinguished from calls without value.
+    """
+    parts = transaction.data.decode(errors="replace").split("@") if transaction.data else [""]
+    function, arguments = parts[0], parts[1:]
+    receiver, called_function = _get_receiver_and_function_of_transfer(function, arguments)
+
+    shape = tuple(len(argument) for argument in arguments)
+    return (transaction.receiver, function, receiver, called_function, shape, transaction.value > 0)
+
+
+def _get_receiver_and_function_of_transfer(function: str, arguments: List[str]) -> Tuple[str, str]:
+    """For the built-in functions which transfer tokens (then, optionally, call a contract): the (hex-encoded) receiver and called function, if any."""
+    try:
+        if function == "ESDTTransfer":
+            return "", _get_item(arguments, 2)
+        if function == "ESDTNFTTransfer":
+            return _get_item(arguments, 3), _get_item(arguments, 4)
+        if function == "MultiESDTNFTTransfer":
+            num_transfers = int(arguments[1] or "0", 16)
+            return arguments[0], _get_item(arguments, 2 + 3 * num_transfers)
+    except (IndexError, ValueError):
+        pass
+
+    return "", ""
+
+
+def _get_item(arguments: List[str], index: int) -> str:
+    return arguments[index] if index < len(arguments) else ""
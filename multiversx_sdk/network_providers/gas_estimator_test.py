@@ -0,0 +1,135 @@
+import threading
+import time
+from typing import Any, List, Tuple
+
+import pytest
+
+from multiversx_sdk.core.address import Address
+from multiversx_sdk.core.transaction import Transaction
+from multiversx_sdk.network_providers.gas_estimator import GasEstimator
+from multiversx_sdk.network_providers.proxy_network_provider import \
+    ProxyNetworkProvider
+from multiversx_sdk.network_providers.resources import (
+    GenericResponse, TransactionCostResponse)
+from multiversx_sdk.network_providers.transactions import ITransaction
+from multiversx_sdk.testutils.addresses import ALICE, CONTRACT, OTHER_CONTRACT
+from multiversx_sdk.testutils.mock_proxy_server import (MockProxyServer,
+                                                        MockRequest)
+
+
+class FakeCostEstimator:
+    def __init__(self, latency_in_milliseconds: int = 0) -> None:
+        self.latency_in_milliseconds = latency_in_milliseconds
+        self.simulated: List[ITransaction] = []
+        self.max_concurrency = 0
+        self._concurrency = 0
+        self._lock = threading.Lock()
+
+    def estimate_transaction_cost(self, transaction: ITransaction) -> TransactionCostResponse:
+        with self._lock:
+            self.simulated.append(transaction)
+            self._concurrency += 1
+            self.max_concurrency = max(self.max_concurrency, self._concurrency)
+
+        time.sleep(self.latency_in_milliseconds / 1000)
+
+        with self._lock:
+            self._concurrency -= 1
+
+        if transaction.data.startswith(b"fail"):
+            return TransactionCostResponse(GenericResponse({"txGasUnits": 0, "returnMessage": "invalid function (not found)"}))
+        return TransactionCostResponse(GenericResponse({"txGasUnits": 1000000 + len(transaction.data), "returnMessage": ""}))
+
+
+def create_call(data: str, receiver: str = CONTRACT, value: int = 0) -> Transaction:
+    return Transaction(sender=ALICE, receiver=receiver, gas_limit=600000000, chain_id="D", value=value, data=data.encode())
+
+
+def test_estimates_are_cached_by_receiver_function_and_argument_shape():
+    network_provider = FakeCostEstimator()
+    estimator = GasEstimator(network_provider, gas_limit_multiplier=1.5)
+
+    transactions = [
+        create_call("add@01"),
+        create_call("add@02"),
+        create_call("add@0102"),
+        create_call("add@01", receiver=OTHER_CONTRACT),
+        create_call("add@01", value=1),
+        create_call("remove@01"),
+    ]
+    estimates = estimator.estimate_gas_limits(transactions)
+
+    assert len(network_provider.simulated) == 5
+    assert [estimate.gas_limit for estimate in estimates] == [1500009, 1500009, 1500012, 1500009, 1500009, 1500014]
+    assert [estimate.is_cached for estimate in estimates] == [False, True, False, False, False, False]
+
+    estimates = estimator.estimate_gas_limits([create_call("add@ff"), create_call("remove@ff")])
+    assert len(network_provider.simulated) == 5
+    assert all(estimate.is_cached for estimate in estimates)
+
+    estimator.clear_cache()
+    estimator.estimate_gas_limit(create_call("add@ff"))
+    assert len(network_provider.simulated) == 6
+
+
+def test_transfers_of_tokens_are_keyed_by_called_function():
+    network_provider = FakeCostEstimator()
+    estimator = GasEstimator(network_provider)
+    contract = Address.new_from_bech32(CONTRACT).to_hex()
+    other_contract = Address.new_from_bech32(OTHER_CONTRACT).to_hex()
+
+    estimator.estimate_gas_limits([
+        create_call("ESDTTransfer@544553542d313233343536@64@73776170"),
+        create_call("ESDTTransfer@544553542d313233343536@65@73776170"),
+        create_call("ESDTTransfer@544553542d313233343536@64@6164644c6971"),
+        create_call(f"MultiESDTNFTTransfer@{contract}@01@544553542d313233343536@@64@73776170", receiver=ALICE),
+        create_call(f"MultiESDTNFTTransfer@{other_contract}@01@544553542d313233343536@@64@73776170", receiver=ALICE),
+    ])
+
+    assert len(network_provider.simulated) == 4
+
+
+def test_apply_gas_limits():
+    network_provider = FakeCostEstimator()
+    estimator = GasEstimator(network_provider, gas_limit_multiplier=1)
+
+    transactions = [create_call("add@01"), create_call("fail@01"), create_call("fail@02")]
+    estimates = estimator.apply_gas_limits(transactions)
+
+    assert [transaction.gas_limit for transaction in transactions] == [1000006, 600000000, 600000000]
+    assert [estimate.to_dictionary() for estimate in estimates[1:]] == [
+        {"gasLimit": 0, "isCached": False, "error": "invalid function (not found)"},
+        {"gasLimit": 0, "isCached": False, "error": "invalid function (not found)"}
+    ]
+
+    # Failures are not cached.
+    estimator.apply_gas_limits([create_call("fail@01")])
+    assert len(network_provider.simulated) == 3
+
+    with pytest.raises(Exception, match="invalid function"):
+        estimator.estimate_gas_limit(create_call("fail@01"))
+
+
+def test_simulations_are_concurrent():
+    network_provider = FakeCostEstimator(latency_in_milliseconds=50)
+    estimator = GasEstimator(network_provider, num_workers=4)
+
+    start = time.perf_counter()
+    estimator.estimate_gas_limits([create_call(f"function{index}") for index in range(8)])
+    duration = time.perf_counter() - start
+
+    assert network_provider.max_concurrency == 4
+    assert duration < 0.3
+
+
+def test_with_proxy_network_provider():
+    with MockProxyServer() as server:
+        def handle_cost(request: MockRequest) -> Tuple[int, Any]:
+            transaction = request.json()
+            return 200, {"data": {"txGasUnits": 50000 + len(transaction.get("data", "")), "returnMessage": ""}, "code": "successful"}
+
+        server.on("POST", r"/transaction/cost", handle_cost)
+        estimator = GasEstimator(ProxyNetworkProvider(server.url))
+
+        assert estimator.estimate_gas_limit(create_call("add@01")) == 55009
+        assert server.num_requests == 1
@@ -0,0 +1,72 @@
+import time
+from typing import Iterable, Optional, Sequence, Union
+
+import requests
+from requests.auth import AuthBase
+
+from multiversx_sdk.network_providers.constants import JSON_HEADERS
+from multiversx_sdk.network_providers.instrumentation import (IRequestHook,
+                                                              RequestEvent)
+from multiversx_sdk.network_providers.rate_limiter import RateLimiter
+
+ONE_SECOND_IN_MILLISECONDS = 1000
+
+# Either the whole body, or its chunks (sent using the chunked transfer encoding).
+RequestBody = Union[bytes, Iterable[bytes]]
+
+
+def send_request(method: str,
+                 url: str,
+                 data: Optional[RequestBody],
+                 auth: Optional[AuthBase],
+                 rate_limiter: Optional[RateLimiter] = None,
+                 request_hooks: Sequence[IRequestHook] = (),
+                 base_url: str = "",
+                 session: Optional[requests.Session] = None,
+                 retryable: bool = True) -> requests.Response:
+    """
+    Sends an HTTP request on behalf of a network provider (using the given session, if any): through the rate limiter (if any), notifying the request hooks (if any).
+    Only GET requests are considered idempotent (see "RateLimiter").
+    For bodies given as chunks, the number of bytes sent is not known (thus not reported to the request hooks).
+    Requests which are not "retryable" (e.g. having a body which can only be iterated once) are never sent again by the rate limiter.
+    """
+    num_attempts = 0
+    headers = JSON_HEADERS if data is not None else None
+
+    def send() -> requests.Response:
+        nonlocal num_attempts
+        num_attempts += 1
+        if session is None:
+            return requests.request(method, url, data=data, headers=headers, auth=auth)
+        return session.request(method, url, data=data, headers=headers, auth=auth)
+
+    def send_limited() -> requests.Response:
+        if rate_limiter is None:
+            return send()
+        return rate_limiter.execute(send, idempotent=method == "GET", retryable=retryable)
+
+    if not request_hooks:
+        return send_limited()
+
+    event = RequestEvent(method, url, url[len(base_url):] if url.startswith(base_url) else url)
+    event.num_bytes_sent = len(data) if isinstance(data, bytes) else 0
+
+    for hook in request_hooks:
+        hook.before_request(event)
+
+    start = time.perf_counter()
+
+    try:
+        response = send_limited()
+        event.status_code = response.status_code
+        event.num_bytes_received = len(response.content)
+        return response
+    except Exception as error:
+        event.error = error
+        raise
+    finally:
+        event.latency_in_milliseconds = (time.perf_counter() - start) * ONE_SECOND_IN_MILLISECONDS
+        event.num_retries = max(num_attempts - 1, 0)
+
+        for hook in request_hooks:
+            hook.after_request(event)
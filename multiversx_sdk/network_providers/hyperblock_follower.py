@@ -0,0 +1,140 @@
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Iterator, Optional, Tuple
+
+from multiversx_sdk.network_providers.hyperblocks import (HyperblockOnNetwork,
+                                                          ICheckpointStore,
+                                                          IHyperblockFetcher,
+                                                          fetch_hyperblock)
+from multiversx_sdk.network_providers.rate_limiter import RetryPolicy
+
+ONE_SECOND_IN_MILLISECONDS = 1000
+
+
+class HyperblockFollower:
+    """
+    HyperblockFollower yields the hyperblocks of the chain, in order, starting from a given nonce. While catching up,
+    the next hyperblocks are fetched concurrently (within a bounded read-ahead window); once the chain tip is reached,
+    the network status is polled (with backoff) until new hyperblocks are available.
+    """
+    default_read_ahead = 8
+    default_polling_interval = 6000
+    default_max_polling_interval = default_polling_interval * 4
+    default_num_retries = 3
+    default_retry_delay = 1000
+
+    def __init__(self,
+                 fetcher: IHyperblockFetcher,
+                 start_nonce: Optional[int] = None,
+                 checkpoint_store: Optional[ICheckpointStore] = None,
+                 read_ahead: Optional[int] = None,
+                 polling_interval_in_milliseconds: Optional[int] = None,
+                 max_polling_interval_in_milliseconds: Optional[int] = None,
+                 num_retries: Optional[int] = None,
+                 retry_delay_in_milliseconds: Optional[int] = None,
+                 decode_transactions: bool = False) -> None:
+        """
+        Args:
+            fetcher (IHyperblockFetcher): Used to fetch the hyperblocks and the network status (e.g. a "ProxyNetworkProvider").
+            start_nonce (Optional[int]): The nonce of the first hyperblock. Ignored if the checkpoint store holds a nonce. If neither is available, the follower starts from the highest final nonce.
+            checkpoint_store (Optional[ICheckpointStore]): Where the nonce of the last processed hyperblock is saved, so that following can be resumed.
+            read_ahead (Optional[int]): The maximum number of hyperblocks fetched ahead (concurrently) of the one being processed.
+            polling_interval_in_milliseconds (Optional[int]): How long to wait for new hyperblocks, once the tip of the chain is reached. Doubled while no new hyperblocks are available.
+            max_polling_interval_in_milliseconds (Optional[int]): The upper bound of the polling interval.
+            num_retries (Optional[int]): How many times fetching a hyperblock is retried, before giving up.
+            retry_delay_in_milliseconds (Optional[int]): The delay before the first retry, doubled after each attempt.
+            decode_transactions (bool): If set, the transactions of the hyperblocks are decoded (see "HyperblockOnNetwork.transactions").
+        """
+        if read_ahead is not None and read_ahead < 1:
+            raise ValueError("read_ahead must be at least 1")
+
+        self.fetcher = fetcher
+        self.start_nonce = start_nonce
+        self.checkpoint_store = checkpoint_store
+        self.read_ahead = HyperblockFollower.default_read_ahead if read_ahead is None else read_ahead
+        self.polling_interval_in_milliseconds = polling_interval_in_milliseconds or HyperblockFollower.default_polling_interval
+        self.max_polling_interval_in_milliseconds = max(
+            max_polling_interval_in_milliseconds or HyperblockFollower.default_max_polling_interval,
+            self.polling_interval_in_milliseconds
+        )
+        self.retry_policy = RetryPolicy(
+            HyperblockFollower.default_num_retries if num_retries is None else num_retries,
+            HyperblockFollower.default_retry_delay if retry_delay_in_milliseconds is None else retry_delay_in_milliseconds
+        )
+        self.decode_transactions = decode_transactions
+        self._stop_event = threading.Event()
+
+    def follow(self, until_nonce: Optional[int] = None) -> Iterator[HyperblockOnNetwork]:
+        """
+        Yields the hyperblocks, in order. The checkpoint is saved after the consumer is done with a hyperblock
+        (i.e. when the next one is requested).
+
+        Args:
+            until_nonce (Optional[int]): If provided, the iteration stops after this hyperblock. Otherwise, it only stops when "stop()" is called.
+        """
+        self._stop_event.clear()
+        next_nonce = self._get_start_nonce()
+        chain_tip = self._get_chain_tip()
+        polling_interval = self.polling_interval_in_milliseconds
+        scheduled: Deque[Tuple[int, "Future[HyperblockOnNetwork]"]] = deque()
+        executor = ThreadPoolExecutor(max_workers=self.read_ahead)
+
+        try:
+            while not self._stop_event.is_set():
+                if until_nonce is not None and next_nonce > until_nonce:
+                    return
+
+                upper_nonce = chain_tip if until_nonce is None else min(chain_tip, until_nonce)
+                next_nonce_to_schedule = scheduled[-1][0] + 1 if scheduled else next_nonce
+
+                while len(scheduled) < self.read_ahead and next_nonce_to_schedule <= upper_nonce:
+                    scheduled.append((next_nonce_to_schedule, executor.submit(self._fetch, next_nonce_to_schedule)))
+                    next_nonce_to_schedule += 1
+
+                if not scheduled:
+                    # The network status is fetched once per polling cycle.
+                    new_chain_tip = self._get_chain_tip()
+
+                    if new_chain_tip > chain_tip:
+                        chain_tip = new_chain_tip
+                        polling_interval = self.polling_interval_in_milliseconds
+                        continue
+
+                    self._stop_event.wait(polling_interval / ONE_SECOND_IN_MILLISECONDS)
+                    polling_interval = min(polling_interval * 2, self.max_polling_interval_in_milliseconds)
+                    continue
+
+                nonce, future = scheduled.popleft()
+                yield future.result()
+
+                if self.checkpoint_store is not None:
+                    self.checkpoint_store.save(nonce)
+                next_nonce = nonce + 1
+        finally:
+            for _, future in scheduled:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def stop(self) -> None:
+        """Stops the iteration (possibly from another thread). The hyperblocks fetched in advance are dropped."""
+        self._stop_event.set()
+
+    def _get_start_nonce(self) -> int:
+        if self.checkpoint_store is not None:
+            last_processed_nonce = self.checkpoint_store.load()
+            if last_processed_nonce is not None:
+                return last_processed_nonce + 1
+
+        if self.start_nonce is not None:
+            return self.start_nonce
+
+        return self._get_chain_tip()
+
+    def _get_chain_tip(self) -> int:
+        # Retried as hyperblocks are, so that a transient failure of the status endpoint does not end the iteration.
+        status = self.retry_policy.run(self.fetcher.get_network_status, lambda _: True, stop_event=self._stop_event)
+        return status.highest_final_nonce
+
+    def _fetch(self, nonce: int) -> HyperblockOnNetwork:
+        return fetch_hyperblock(self.fetcher, nonce, self.retry_policy, self.decode_transactions, self._stop_event)
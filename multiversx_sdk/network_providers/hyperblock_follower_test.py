@@ -0,0 +1,201 @@
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Union
+
+import pytest
+
+from multiversx_sdk.network_providers.hyperblock_follower import \
+    HyperblockFollower
+from multiversx_sdk.network_providers.hyperblocks import (
+    FileCheckpointStore, InMemoryCheckpointStore)
+from multiversx_sdk.network_providers.network_status import NetworkStatus
+from multiversx_sdk.network_providers.proxy_network_provider import \
+    ProxyNetworkProvider
+from multiversx_sdk.testutils.hyperblocks import create_hyperblock
+from multiversx_sdk.testutils.mock_proxy_server import MockProxyServer
+
+
+class FakeFetcher:
+    def __init__(self, highest_final_nonce: int, num_transactions: int = 0) -> None:
+        self.highest_final_nonce = highest_final_nonce
+        self.num_transactions = num_transactions
+        self.num_failures_by_nonce: Dict[int, int] = {}
+        self.fetched_nonces: List[int] = []
+        self.num_status_requests = 0
+        self.num_status_failures = 0
+        self.lock = threading.Lock()
+        # Called on each status request, so that tests can simulate the progress of the chain.
+        self.on_status = lambda: None
+
+    def get_hyperblock(self, key: Union[int, str]) -> Dict[str, Any]:
+        nonce = int(key)
+        assert nonce <= self.highest_final_nonce
+
+        with self.lock:
+            self.fetched_nonces.append(nonce)
+            if self.num_failures_by_nonce.get(nonce, 0) > 0:
+                self.num_failures_by_nonce[nonce] -= 1
+                raise Exception("fetching failed")
+
+        return create_hyperblock(nonce, self.num_transactions)
+
+    def get_network_status(self) -> NetworkStatus:
+        self.num_status_requests += 1
+        if self.num_status_failures > 0:
+            self.num_status_failures -= 1
+            raise Exception("fetching the network status failed")
+
+        self.on_status()
+
+        status = NetworkStatus()
+        status.highest_final_nonce = self.highest_final_nonce
+        return status
+
+
+def test_follow_yields_hyperblocks_in_order():
+    fetcher = FakeFetcher(highest_final_nonce=100)
+    follower = HyperblockFollower(fetcher, start_nonce=42, read_ahead=4)
+
+    nonces = [hyperblock.nonce for hyperblock in follower.follow(until_nonce=60)]
+    assert nonces == list(range(42, 61))
+    # Besides the ones yielded, at most "read_ahead" hyperblocks are fetched in advance.
+    assert max(fetcher.fetched_nonces) <= 60
+
+
+def test_follow_starts_from_chain_tip_by_default():
+    fetcher = FakeFetcher(highest_final_nonce=7)
+    follower = HyperblockFollower(fetcher)
+
+    assert [hyperblock.nonce for hyperblock in follower.follow(until_nonce=7)] == [7]
+
+
+def test_follow_waits_for_new_hyperblocks_at_chain_tip():
+    fetcher = FakeFetcher(highest_final_nonce=3)
+    follower = HyperblockFollower(fetcher, start_nonce=1, polling_interval_in_milliseconds=1, max_polling_interval_in_milliseconds=4)
+
+    def advance_chain():
+        # The chain only advances every few status requests.
+        if fetcher.num_status_requests % 3 == 0:
+            fetcher.highest_final_nonce += 1
+
+    fetcher.on_status = advance_chain
+
+    nonces = [hyperblock.nonce for hyperblock in follower.follow(until_nonce=10)]
+    assert nonces == list(range(1, 11))
+    assert fetcher.num_status_requests > 7
+
+
+def test_follow_fetches_network_status_once_per_poll():
+    fetcher = FakeFetcher(highest_final_nonce=3)
+    follower = HyperblockFollower(fetcher, start_nonce=1, polling_interval_in_milliseconds=1)
+
+    def advance_chain():
+        if fetcher.num_status_requests == 5:
+            fetcher.highest_final_nonce += 1
+
+    fetcher.on_status = advance_chain
+
+    assert [hyperblock.nonce for hyperblock in follower.follow(until_nonce=4)] == [1, 2, 3, 4]
+    # One request to find the chain tip, then one per poll (3 of them without new hyperblocks).
+    assert fetcher.num_status_requests == 5
+
+
+def test_follow_validates_read_ahead():
+    with pytest.raises(ValueError, match="read_ahead must be at least 1"):
+        HyperblockFollower(FakeFetcher(highest_final_nonce=1), read_ahead=0)
+
+    assert HyperblockFollower(FakeFetcher(highest_final_nonce=1)).read_ahead == HyperblockFollower.default_read_ahead
+
+
+def test_follow_can_be_stopped():
+    fetcher = FakeFetcher(highest_final_nonce=1000)
+    follower = HyperblockFollower(fetcher, start_nonce=1)
+    nonces: List[int] = []
+
+    for hyperblock in follower.follow():
+        nonces.append(hyperblock.nonce)
+        if hyperblock.nonce == 5:
+            follower.stop()
+
+    assert nonces == [1, 2, 3, 4, 5]
+
+
+def test_follow_retries_failed_fetches():
+    fetcher = FakeFetcher(highest_final_nonce=10)
+    fetcher.num_failures_by_nonce = {3: 2}
+    follower = HyperblockFollower(fetcher, start_nonce=1, num_retries=2, retry_delay_in_milliseconds=1)
+
+    assert [hyperblock.nonce for hyperblock in follower.follow(until_nonce=5)] == [1, 2, 3, 4, 5]
+    assert fetcher.fetched_nonces.count(3) == 3
+
+    fetcher.num_failures_by_nonce = {3: 3}
+    with pytest.raises(Exception, match="fetching failed"):
+        list(follower.follow(until_nonce=5))
+
+
+def test_follow_retries_failed_status_requests():
+    fetcher = FakeFetcher(highest_final_nonce=3)
+    fetcher.num_status_failures = 1
+    follower = HyperblockFollower(fetcher, start_nonce=1, polling_interval_in_milliseconds=1, retry_delay_in_milliseconds=1)
+
+    def advance_chain():
+        fetcher.highest_final_nonce += 1
+        # The status endpoint fails (once) while polling, too.
+        if fetcher.highest_final_nonce == 5:
+            fetcher.num_status_failures = 1
+
+    fetcher.on_status = advance_chain
+
+    assert [hyperblock.nonce for hyperblock in follower.follow(until_nonce=8)] == list(range(1, 9))
+
+    fetcher.num_status_failures = HyperblockFollower.default_num_retries + 1
+    with pytest.raises(Exception, match="fetching the network status failed"):
+        list(follower.follow(until_nonce=20))
+
+
+def test_follow_resumes_from_checkpoint(tmp_path: Path):
+    fetcher = FakeFetcher(highest_final_nonce=100)
+    checkpoint_store = FileCheckpointStore(tmp_path / "checkpoint.json")
+    follower = HyperblockFollower(fetcher, start_nonce=10, checkpoint_store=checkpoint_store)
+
+    for hyperblock in follower.follow():
+        if hyperblock.nonce == 15:
+            # Crash while processing the hyperblock: it should be processed again, on resume.
+            break
+
+    assert checkpoint_store.load() == 14
+
+    follower = HyperblockFollower(fetcher, start_nonce=10, checkpoint_store=checkpoint_store)
+    assert [hyperblock.nonce for hyperblock in follower.follow(until_nonce=17)] == [15, 16, 17]
+    assert checkpoint_store.load() == 17
+
+
+def test_follow_decodes_transactions():
+    fetcher = FakeFetcher(highest_final_nonce=100, num_transactions=8)
+    checkpoint_store = InMemoryCheckpointStore(41)
+
+    follower = HyperblockFollower(fetcher, checkpoint_store=checkpoint_store)
+    hyperblock = next(iter(follower.follow()))
+    assert hyperblock.nonce == 42
+    assert hyperblock.num_transactions == 8
+    assert hyperblock.transactions == []
+    assert len(hyperblock.raw_response["transactions"]) == 8
+
+    follower = HyperblockFollower(fetcher, checkpoint_store=checkpoint_store, decode_transactions=True)
+    hyperblock = next(iter(follower.follow()))
+    assert hyperblock.nonce == 42
+    assert len(hyperblock.transactions) == 8
+    assert hyperblock.transactions[1].function == "ESDTTransfer"
+    assert len(hyperblock.transactions[2].contract_results.items) == 2
+
+
+def test_follow_using_proxy():
+    with MockProxyServer() as server:
+        server.serve_hyperblocks(highest_nonce=20, num_transactions_per_hyperblock=4)
+        proxy = ProxyNetworkProvider(server.url)
+        follower = HyperblockFollower(proxy, start_nonce=11, read_ahead=4, decode_transactions=True)
+
+        hyperblocks = list(follower.follow(until_nonce=20))
+
+    assert [hyperblock.nonce for hyperblock in hyperblocks] == list(range(11, 21))
+    assert all(len(hyperblock.transactions) == 4 for hyperblock in hyperblocks)
@@ -0,0 +1,123 @@
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Protocol, Union
+
+from multiversx_sdk.network_providers.network_status import NetworkStatus
+from multiversx_sdk.network_providers.rate_limiter import RetryPolicy
+from multiversx_sdk.network_providers.transactions import (
+    LazyTransactionOnNetwork, TransactionOnNetwork)
+
+
+class IHyperblockProvider(Protocol):
+    def get_hyperblock(self, key: Union[int, str]) -> Dict[str, Any]:
+        ...
+
+
+class IHyperblockFetcher(IHyperblockProvider, Protocol):
+    def get_network_status(self) -> NetworkStatus:
+        ...
+
+
+class ICheckpointStore(Protocol):
+    def load(self) -> Optional[int]:
+        ...
+
+    def save(self, nonce: int) -> None:
+        ...
+
+
+class HyperblockOnNetwork:
+    def __init__(self) -> None:
+        self.nonce: int = 0
+        self.hash: str = ""
+        self.round: int = 0
+        self.epoch: int = 0
+        self.timestamp: int = 0
+        self.num_transactions: int = 0
+        self.transactions: List[TransactionOnNetwork] = []
+        self.raw_response: Dict[str, Any] = {}
+
+    @staticmethod
+    def from_http_response(response: Dict[str, Any], decode_transactions: bool = False) -> "HyperblockOnNetwork":
+        """
+        Args:
+            response (Dict[str, Any]): the hyperblock, as returned by "ProxyNetworkProvider.get_hyperblock()".
+            decode_transactions (bool): if set, the transactions are decoded (lazily, see "LazyTransactionOnNetwork").
+        """
+        result = HyperblockOnNetwork()
+
+        result.nonce = response.get("nonce", 0)
+        result.hash = response.get("hash", "")
+        result.round = response.get("round", 0)
+        result.epoch = response.get("epoch", 0)
+        result.timestamp = response.get("timestamp", 0)
+        result.num_transactions = response.get("numTxs", 0)
+        result.raw_response = response
+
+        if decode_transactions:
+            transactions: List[Dict[str, Any]] = response.get("transactions") or []
+            result.transactions = [LazyTransactionOnNetwork.from_proxy_http_response(item.get("hash", ""), item) for item in transactions]
+
+        return result
+
+
+def fetch_hyperblock(provider: IHyperblockProvider,
+                     nonce: int,
+                     retry_policy: RetryPolicy,
+                     decode_transactions: bool = False,
+                     stop_event: Optional[threading.Event] = None,
+                     on_retry: Optional[Callable[[Exception], None]] = None) -> HyperblockOnNetwork:
+    """
+    Fetches (retrying on failure) and parses a hyperblock. Used by "HyperblockFollower" and "HyperblocksBackfiller".
+    Throttling (and request pacing) is handled by the rate limiter of the provider, if any (see "RateLimiter").
+
+    Args:
+        provider (IHyperblockProvider): e.g. a "ProxyNetworkProvider".
+        nonce (int): the nonce of the hyperblock.
+        retry_policy (RetryPolicy): how failed requests are retried.
+        decode_transactions (bool): if set, the transactions are decoded (see "HyperblockOnNetwork.transactions").
+        stop_event (Optional[threading.Event]): once set, no more retries are made.
+        on_retry (Optional[Callable[[Exception], None]]): called before each retry, with the error of the failed attempt.
+    """
+    def get_retry_delay(error: Exception, attempt: int) -> float:
+        if on_retry:
+            on_retry(error)
+        return retry_policy.get_delay(attempt)
+
+    response = retry_policy.run(lambda: provider.get_hyperblock(nonce), lambda _: True, get_retry_delay, stop_event)
+    return HyperblockOnNetwork.from_http_response(response, decode_transactions)
+
+
+class InMemoryCheckpointStore:
+    def __init__(self, nonce: Optional[int] = None) -> None:
+        self.nonce = nonce
+
+    def load(self) -> Optional[int]:
+        return self.nonce
+
+    def save(self, nonce: int) -> None:
+        self.nonce = nonce
+
+
+class FileCheckpointStore:
+    """Persists the nonce of the last processed hyperblock in a JSON file."""
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path = os.fspath(path)
+
+    def load(self) -> Optional[int]:
+        if not os.path.exists(self.path):
+            return None
+
+        with open(self.path) as file:
+            return json.load(file)["nonce"]
+
+    def save(self, nonce: int) -> None:
+        # The file is replaced atomically, so that a crash never leaves a corrupted checkpoint behind.
+        temporary_path = f"{self.path}.tmp"
+
+        with open(temporary_path, "w") as file:
+            json.dump({"nonce": nonce}, file)
+
+        os.replace(temporary_path, self.path)
@@ -0,0 +1,177 @@
+import threading
+import time
+from concurrent.futures import (FIRST_COMPLETED, Future, ThreadPoolExecutor,
+                                wait)
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from multiversx_sdk.network_providers.hyperblocks import (HyperblockOnNetwork,
+                                                          IHyperblockProvider,
+                                                          fetch_hyperblock)
+from multiversx_sdk.network_providers.rate_limiter import RetryPolicy
+
+ONE_SECOND_IN_MILLISECONDS = 1000
+
+
+class BackfillProgress:
+    def __init__(self, start_nonce: int, end_nonce: int) -> None:
+        self.start_nonce = start_nonce
+        self.end_nonce = end_nonce
+        self.last_nonce: Optional[int] = None
+        self.num_hyperblocks = 0
+        self.num_transactions = 0
+        self.num_retries = 0
+        self.num_buffered = 0
+        self.elapsed_seconds: float = 0
+
+    @property
+    def num_total_hyperblocks(self) -> int:
+        return max(self.end_nonce - self.start_nonce + 1, 0)
+
+    @property
+    def fraction_done(self) -> float:
+        if not self.num_total_hyperblocks:
+            return 1.0
+        return self.num_hyperblocks / self.num_total_hyperblocks
+
+    @property
+    def hyperblocks_per_second(self) -> float:
+        return self.num_hyperblocks / self.elapsed_seconds if self.elapsed_seconds else 0
+
+    @property
+    def transactions_per_second(self) -> float:
+        return self.num_transactions / self.elapsed_seconds if self.elapsed_seconds else 0
+
+    @property
+    def estimated_remaining_seconds(self) -> Optional[float]:
+        if not self.hyperblocks_per_second:
+            return None
+        return (self.num_total_hyperblocks - self.num_hyperblocks) / self.hyperblocks_per_second
+
+    def to_dictionary(self) -> Dict[str, Any]:
+        return {
+            "startNonce": self.start_nonce,
+            "endNonce": self.end_nonce,
+            "lastNonce": self.last_nonce,
+            "numHyperblocks": self.num_hyperblocks,
+            "numTransactions": self.num_transactions,
+            "numRetries": self.num_retries,
+            "numBuffered": self.num_buffered,
+            "elapsedSeconds": self.elapsed_seconds,
+            "hyperblocksPerSecond": self.hyperblocks_per_second,
+            "transactionsPerSecond": self.transactions_per_second
+        }
+
+
+class HyperblocksBackfiller:
+    """
+    HyperblocksBackfiller fetches (and parses) a range of hyperblocks using a pool of workers, and yields them in order.
+    Hyperblocks fetched out of order are held in a (bounded) reorder buffer, until the preceding ones are available.
+
+    Fetching (and retrying) is shared with "HyperblockFollower". To pace the requests and to back off when throttled,
+    give the provider a "RateLimiter" (e.g. "ProxyNetworkProvider(url, rate_limiter=RateLimiter(max_requests_per_second=...))").
+    """
+    default_num_workers = 8
+    default_num_retries = 5
+    default_retry_delay = 500
+
+    def __init__(self,
+                 provider: IHyperblockProvider,
+                 num_workers: Optional[int] = None,
+                 max_buffered_hyperblocks: Optional[int] = None,
+                 num_retries: Optional[int] = None,
+                 retry_delay_in_milliseconds: Optional[int] = None,
+                 decode_transactions: bool = False,
+                 on_progress: Optional[Callable[[BackfillProgress], None]] = None,
+                 progress_interval_in_milliseconds: int = 1000) -> None:
+        """
+        Args:
+            provider (IHyperblockProvider): Used to fetch the hyperblocks (e.g. a "ProxyNetworkProvider").
+            num_workers (Optional[int]): The number of concurrent requests.
+            max_buffered_hyperblocks (Optional[int]): The capacity of the reorder buffer. Defaults to 4 times the number of workers.
+            num_retries (Optional[int]): How many times fetching a hyperblock is retried, before giving up.
+            retry_delay_in_milliseconds (Optional[int]): The delay before the first retry, doubled after each attempt.
+            decode_transactions (bool): If set, the transactions of the hyperblocks are decoded (see "HyperblockOnNetwork.transactions").
+            on_progress (Optional[Callable[[BackfillProgress], None]]): Called (periodically) as hyperblocks are yielded, and once the range is done.
+            progress_interval_in_milliseconds (int): How often "on_progress" is called.
+        """
+        self.provider = provider
+        self.num_workers = num_workers or HyperblocksBackfiller.default_num_workers
+        self.max_buffered_hyperblocks = max(max_buffered_hyperblocks or self.num_workers * 4, self.num_workers)
+        self.retry_policy = RetryPolicy(
+            HyperblocksBackfiller.default_num_retries if num_retries is None else num_retries,
+            HyperblocksBackfiller.default_retry_delay if retry_delay_in_milliseconds is None else retry_delay_in_milliseconds
+        )
+        self.decode_transactions = decode_transactions
+        self.on_progress = on_progress
+        self.progress_interval_in_milliseconds = progress_interval_in_milliseconds
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._progress = BackfillProgress(0, -1)
+
+    def backfill(self, start_nonce: int, end_nonce: int) -> Iterator[HyperblockOnNetwork]:
+        """Yields the hyperblocks having the nonces in the range [start_nonce, end_nonce], in order."""
+        self._stop_event.clear()
+        self._progress = progress = BackfillProgress(start_nonce, end_nonce)
+
+        pending: Dict[int, "Future[HyperblockOnNetwork]"] = {}
+        reorder_buffer: Dict[int, HyperblockOnNetwork] = {}
+        next_nonce_to_schedule = start_nonce
+        next_nonce_to_yield = start_nonce
+        start_time = time.perf_counter()
+        last_report_time = start_time
+        executor = ThreadPoolExecutor(max_workers=self.num_workers)
+
+        try:
+            while next_nonce_to_yield <= end_nonce and not self._stop_event.is_set():
+                # Hyperblocks are only scheduled while there is room for them in the reorder buffer.
+                while next_nonce_to_schedule <= end_nonce and len(pending) + len(reorder_buffer) < self.max_buffered_hyperblocks:
+                    pending[next_nonce_to_schedule] = executor.submit(self._fetch, next_nonce_to_schedule)
+                    next_nonce_to_schedule += 1
+
+                if next_nonce_to_yield not in reorder_buffer:
+                    done, _ = wait(pending.values(), return_when=FIRST_COMPLETED)
+
+                    for nonce in [nonce for nonce, future in pending.items() if future in done]:
+                        reorder_buffer[nonce] = pending.pop(nonce).result()
+
+                progress.num_buffered = len(reorder_buffer)
+
+                while next_nonce_to_yield in reorder_buffer and not self._stop_event.is_set():
+                    hyperblock = reorder_buffer.pop(next_nonce_to_yield)
+                    next_nonce_to_yield += 1
+
+                    progress.last_nonce = hyperblock.nonce
+                    progress.num_hyperblocks += 1
+                    progress.num_transactions += hyperblock.num_transactions
+                    progress.elapsed_seconds = time.perf_counter() - start_time
+
+                    yield hyperblock
+
+                    if self.on_progress and (time.perf_counter() - last_report_time) * ONE_SECOND_IN_MILLISECONDS >= self.progress_interval_in_milliseconds:
+                        last_report_time = time.perf_counter()
+                        self.on_progress(progress)
+
+            progress.elapsed_seconds = time.perf_counter() - start_time
+
+            if self.on_progress:
+                self.on_progress(progress)
+        finally:
+            self._stop_event.set()
+            for future in pending.values():
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def stop(self) -> None:
+        """Stops the backfill (possibly from another thread)."""
+        self._stop_event.set()
+
+    def get_progress(self) -> BackfillProgress:
+        return self._progress
+
+    def _fetch(self, nonce: int) -> HyperblockOnNetwork:
+        return fetch_hyperblock(self.provider, nonce, self.retry_policy, self.decode_transactions, self._stop_event, self._on_retry)
+
+    def _on_retry(self, error: Exception) -> None:
+        with self._lock:
+            self._progress.num_retries += 1
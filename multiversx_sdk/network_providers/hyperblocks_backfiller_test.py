@@ -0,0 +1,135 @@
+import random
+import threading
+import time
+from typing import Any, Dict, List, Union
+
+import pytest
+
+from multiversx_sdk.network_providers.errors import GenericError
+from multiversx_sdk.network_providers.hyperblocks_backfiller import (
+    BackfillProgress, HyperblocksBackfiller)
+from multiversx_sdk.network_providers.proxy_network_provider import \
+    ProxyNetworkProvider
+from multiversx_sdk.network_providers.rate_limiter import RateLimiter
+from multiversx_sdk.testutils.hyperblocks import create_hyperblock
+from multiversx_sdk.testutils.mock_proxy_server import MockProxyServer
+
+
+class FakeProvider:
+    def __init__(self, num_transactions: int = 2) -> None:
+        self.num_transactions = num_transactions
+        self.num_failures_by_nonce: Dict[int, int] = {}
+        self.fetched_nonces: List[int] = []
+        self.lock = threading.Lock()
+
+    def get_hyperblock(self, key: Union[int, str]) -> Dict[str, Any]:
+        nonce = int(key)
+
+        with self.lock:
+            self.fetched_nonces.append(nonce)
+            if self.num_failures_by_nonce.get(nonce, 0) > 0:
+                self.num_failures_by_nonce[nonce] -= 1
+                raise GenericError(f"hyperblock/by-nonce/{nonce}", "too many requests", 429)
+
+        # Responses arrive out of order.
+        time.sleep(random.random() / 1000)
+        return create_hyperblock(nonce, self.num_transactions)
+
+
+def test_backfill_yields_hyperblocks_in_order():
+    provider = FakeProvider()
+    backfiller = HyperblocksBackfiller(provider, num_workers=8, max_buffered_hyperblocks=16)
+
+    nonces = [hyperblock.nonce for hyperblock in backfiller.backfill(100, 299)]
+    assert nonces == list(range(100, 300))
+    assert sorted(provider.fetched_nonces) == nonces
+
+
+def test_backfill_reports_progress():
+    reports: List[Dict[str, Any]] = []
+    backfiller = HyperblocksBackfiller(FakeProvider(num_transactions=3), on_progress=lambda progress: reports.append(progress.to_dictionary()), progress_interval_in_milliseconds=0)
+
+    list(backfiller.backfill(1, 10))
+
+    assert len(reports) == 11
+    assert [report["lastNonce"] for report in reports[:10]] == list(range(1, 11))
+    assert reports[-1]["numHyperblocks"] == 10
+    assert reports[-1]["numTransactions"] == 30
+
+    progress = backfiller.get_progress()
+    assert progress.fraction_done == 1
+    assert progress.hyperblocks_per_second > 0
+    assert progress.estimated_remaining_seconds == 0
+
+
+def test_backfill_progress_of_empty_range():
+    progress = BackfillProgress(10, 9)
+
+    assert progress.num_total_hyperblocks == 0
+    assert progress.fraction_done == 1
+
+    backfiller = HyperblocksBackfiller(FakeProvider())
+    assert list(backfiller.backfill(10, 9)) == []
+    assert backfiller.get_progress().fraction_done == 1
+
+
+def test_backfill_retries_failed_requests():
+    provider = FakeProvider()
+    provider.num_failures_by_nonce = {5: 1, 6: 2}
+    backfiller = HyperblocksBackfiller(provider, num_workers=4, num_retries=2, retry_delay_in_milliseconds=1)
+
+    assert [hyperblock.nonce for hyperblock in backfiller.backfill(1, 10)] == list(range(1, 11))
+    assert backfiller.get_progress().num_retries == 3
+
+    provider.num_failures_by_nonce = {5: 3}
+
+    with pytest.raises(GenericError, match="too many requests"):
+        list(backfiller.backfill(1, 10))
+
+
+def test_backfill_is_paced_by_the_rate_limiter_of_the_provider():
+    with MockProxyServer() as server:
+        server.serve_hyperblocks(highest_nonce=100, num_transactions_per_hyperblock=1)
+        proxy = ProxyNetworkProvider(server.url, rate_limiter=RateLimiter(max_requests_per_second=200, burst=1))
+        backfiller = HyperblocksBackfiller(proxy, num_workers=8)
+
+        start = time.perf_counter()
+        list(backfiller.backfill(1, 21))
+        duration = time.perf_counter() - start
+
+    # 21 requests, 5 milliseconds apart.
+    assert duration >= 0.1
+
+
+def test_backfill_can_be_stopped():
+    provider = FakeProvider()
+    backfiller = HyperblocksBackfiller(provider, num_workers=4, max_buffered_hyperblocks=4)
+    nonces: List[int] = []
+
+    for hyperblock in backfiller.backfill(1, 1000):
+        nonces.append(hyperblock.nonce)
+        if hyperblock.nonce == 5:
+            backfiller.stop()
+
+    assert nonces == [1, 2, 3, 4, 5]
+    assert len(provider.fetched_nonces) < 20
+
+
+def test_backfill_using_proxy():
+    progress_reports: List[BackfillProgress] = []
+
+    with MockProxyServer() as server:
+        server.serve_hyperblocks(highest_nonce=1000, num_transactions_per_hyperblock=4)
+        server.inject_failures(3, status=429)
+
+        rate_limiter = RateLimiter(retry_delay_in_milliseconds=10)
+        proxy = ProxyNetworkProvider(server.url, rate_limiter=rate_limiter)
+        backfiller = HyperblocksBackfiller(proxy, num_workers=4, retry_delay_in_milliseconds=10, decode_transactions=True, on_progress=progress_reports.append)
+        hyperblocks = list(backfiller.backfill(901, 950))
+
+    assert [hyperblock.nonce for hyperblock in hyperblocks] == list(range(901, 951))
+    assert all(len(hyperblock.transactions) == 4 for hyperblock in hyperblocks)
+    # Throttled requests are retried by the rate limiter, not by the backfiller.
+    assert rate_limiter.get_metrics().num_throttled == 3
+    assert progress_reports[-1].num_retries == 0
+    assert progress_reports[-1].num_transactions == 200
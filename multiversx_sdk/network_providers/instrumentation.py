@@ -0,0 +1,210 @@
+import bisect
+import re
+import threading
+from typing import Any, Dict, List, Optional, Protocol, Tuple
+
+# Variable segments of the resource paths are replaced by placeholders, so that metrics can be aggregated per endpoint
+# (e.g. "address/erd1.../nonce" becomes "address/{address}/nonce").
+_PATH_SEGMENT_PLACEHOLDERS = [
+    (re.compile(r"^[a-z]+1[02-9ac-hj-np-z]{58}$"), "{address}"),
+    (re.compile(r"^[0-9a-fA-F]{64}$"), "{hash}"),
+    (re.compile(r"^\d+$"), "{number}"),
+    (re.compile(r"^[A-Z0-9]{3,10}-[0-9a-f]{6}(-[0-9a-f]+)?$"), "{token}"),
+]
+
+DEFAULT_LATENCY_BUCKETS_IN_MILLISECONDS: List[float] = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+
+class RequestEvent:
+    """Describes an HTTP request of a network provider. Filled in as the request progresses."""
+
+    def __init__(self, method: str, url: str, path: str) -> None:
+        self.method = method
+        self.url = url
+        self.path = path
+        self.path_template = get_path_template(path)
+        self.num_bytes_sent: int = 0
+        self.status_code: Optional[int] = None
+        self.num_bytes_received: int = 0
+        self.latency_in_milliseconds: float = 0
+        self.num_retries: int = 0
+        self.error: Optional[Exception] = None
+
+
+class IRequestHook(Protocol):
+    def before_request(self, event: RequestEvent) -> None:
+        ...
+
+    def after_request(self, event: RequestEvent) -> None:
+        """Called once the response is received (or the request failed), after all retries."""
+        ...
+
+
+def get_path_template(path: str) -> str:
+    """Strips the query string and replaces the variable segments (addresses, hashes, numbers, token identifiers) with placeholders."""
+    path = path.split("?")[0].strip("/")
+    segments = path.split("/")
+
+    for index, segment in enumerate(segments):
+        for pattern, placeholder in _PATH_SEGMENT_PLACEHOLDERS:
+            if pattern.match(segment):
+                segments[index] = placeholder
+                break
+
+    return "/".join(segments)
+
+
+class LatencyHistogram:
+    def __init__(self, buckets_in_milliseconds: List[float]) -> None:
+        self.buckets = sorted(buckets_in_milliseconds)
+        # The last counter holds the observations above the highest bucket.
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum: float = 0
+        self.max: float = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def get_percentile(self, percentile: float) -> float:
+        """Estimates the percentile (0 - 100), by linear interpolation within the bucket it falls into."""
+        if not self.count:
+            return 0
+
+        rank = percentile / 100 * self.count
+        cumulative = 0
+
+        for index, count in enumerate(self.counts):
+            if count and cumulative + count >= rank:
+                lower = self.buckets[index - 1] if index > 0 else 0
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                return min(lower + (upper - lower) * (rank - cumulative) / count, self.max)
+            cumulative += count
+
+        return self.max
+
+
+class EndpointMetrics:
+    def __init__(self, method: str, path_template: str, buckets_in_milliseconds: List[float]) -> None:
+        self.method = method
+        self.path_template = path_template
+        self.num_requests = 0
+        self.num_errors = 0
+        self.num_retries = 0
+        self.num_bytes_sent = 0
+        self.num_bytes_received = 0
+        self.status_codes: Dict[int, int] = {}
+        self.latency = LatencyHistogram(buckets_in_milliseconds)
+
+    def to_dictionary(self) -> Dict[str, Any]:
+        return {
+            "method": self.method,
+            "pathTemplate": self.path_template,
+            "numRequests": self.num_requests,
+            "numErrors": self.num_errors,
+            "numRetries": self.num_retries,
+            "numBytesSent": self.num_bytes_sent,
+            "numBytesReceived": self.num_bytes_received,
+            "statusCodes": dict(self.status_codes),
+            "latencyInMilliseconds": {
+                "mean": self.latency.sum / self.latency.count if self.latency.count else 0,
+                "p50": self.latency.get_percentile(50),
+                "p90": self.latency.get_percentile(90),
+                "p99": self.latency.get_percentile(99),
+                "max": self.latency.max
+            }
+        }
+
+
+class MetricsCollector:
+    """
+    An in-process collector of per-endpoint metrics (requests, errors, retries, bytes, latency histograms).
+    Pass it as a request hook to the network providers, then call "dump()" or "to_prometheus()".
+    """
+
+    def __init__(self, latency_buckets_in_milliseconds: Optional[List[float]] = None) -> None:
+        self.latency_buckets_in_milliseconds = latency_buckets_in_milliseconds or DEFAULT_LATENCY_BUCKETS_IN_MILLISECONDS
+        self._endpoints: Dict[Tuple[str, str], EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def before_request(self, event: RequestEvent) -> None:
+        pass
+
+    def after_request(self, event: RequestEvent) -> None:
+        key = (event.method, event.path_template)
+
+        with self._lock:
+            metrics = self._endpoints.get(key)
+            if metrics is None:
+                metrics = self._endpoints[key] = EndpointMetrics(event.method, event.path_template, self.latency_buckets_in_milliseconds)
+
+            metrics.num_requests += 1
+            metrics.num_retries += event.num_retries
+            metrics.num_bytes_sent += event.num_bytes_sent
+            metrics.num_bytes_received += event.num_bytes_received
+            metrics.latency.observe(event.latency_in_milliseconds)
+
+            if event.status_code is not None:
+                metrics.status_codes[event.status_code] = metrics.status_codes.get(event.status_code, 0) + 1
+            if event.error is not None or event.status_code is None or event.status_code >= 400:
+                metrics.num_errors += 1
+
+    def get_endpoint_metrics(self, method: str, path_template: str) -> Optional[EndpointMetrics]:
+        return self._endpoints.get((method, path_template))
+
+    def get_percentile(self, method: str, path_template: str, percentile: float) -> float:
+        with self._lock:
+            metrics = self._endpoints.get((method, path_template))
+            return metrics.latency.get_percentile(percentile) if metrics else 0
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Returns the metrics of all endpoints, slowest (by p99 latency) first."""
+        with self._lock:
+            items = [metrics.to_dictionary() for metrics in self._endpoints.values()]
+
+        return sorted(items, key=lambda item: item["latencyInMilliseconds"]["p99"], reverse=True)
+
+    def dump(self) -> str:
+        """Renders the metrics as a human-readable table."""
+        header = f"{'endpoint':<56} {'requests':>9} {'errors':>7} {'retries':>8} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'sent':>10} {'received':>12}"
+        lines = [header]
+
+        for item in self.snapshot():
+            latency = item["latencyInMilliseconds"]
+            endpoint = f"{item['method']} {item['pathTemplate']}"
+            lines.append(f"{endpoint:<56} {item['numRequests']:>9} {item['numErrors']:>7} {item['numRetries']:>8} "
+                         f"{latency['p50']:>9.1f} {latency['p90']:>9.1f} {latency['p99']:>9.1f} "
+                         f"{item['numBytesSent']:>10} {item['numBytesReceived']:>12}")
+
+        return "\n".join(lines)
+
+    def to_prometheus(self, prefix: str = "multiversx_sdk_http") -> str:
+        """Renders the metrics in the Prometheus text exposition format (for scraping)."""
+        lines: List[str] = []
+
+        with self._lock:
+            for metrics in self._endpoints.values():
+                labels = f'method="{metrics.method}",path="{metrics.path_template}"'
+                histogram = metrics.latency
+                cumulative = 0
+
+                for bucket, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f'{prefix}_request_duration_milliseconds_bucket{{{labels},le="{bucket}"}} {cumulative}')
+
+                lines.append(f'{prefix}_request_duration_milliseconds_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                lines.append(f"{prefix}_request_duration_milliseconds_sum{{{labels}}} {histogram.sum}")
+                lines.append(f"{prefix}_request_duration_milliseconds_count{{{labels}}} {histogram.count}")
+                lines.append(f"{prefix}_request_errors_total{{{labels}}} {metrics.num_errors}")
+                lines.append(f"{prefix}_request_retries_total{{{labels}}} {metrics.num_retries}")
+                lines.append(f"{prefix}_bytes_sent_total{{{labels}}} {metrics.num_bytes_sent}")
+                lines.append(f"{prefix}_bytes_received_total{{{labels}}} {metrics.num_bytes_received}")
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
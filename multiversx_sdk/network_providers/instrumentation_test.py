@@ -0,0 +1,110 @@
+from typing import List
+
+import pytest
+
+from multiversx_sdk.network_providers.errors import GenericError
+from multiversx_sdk.network_providers.instrumentation import (
+    LatencyHistogram, MetricsCollector, RequestEvent, get_path_template)
+from multiversx_sdk.network_providers.proxy_network_provider import \
+    ProxyNetworkProvider
+from multiversx_sdk.network_providers.rate_limiter import RateLimiter
+from multiversx_sdk.testutils.mock_proxy_server import MockProxyServer
+
+
+class RecordingHook:
+    def __init__(self) -> None:
+        self.started: List[str] = []
+        self.events: List[RequestEvent] = []
+
+    def before_request(self, event: RequestEvent) -> None:
+        self.started.append(event.path_template)
+
+    def after_request(self, event: RequestEvent) -> None:
+        self.events.append(event)
+
+
+def test_get_path_template():
+    assert get_path_template("/network/status/4294967295") == "network/status/{number}"
+    assert get_path_template("address/erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th/esdt") == "address/{address}/esdt"
+    assert get_path_template("transaction/2e6bd2671dbb57f1f1013c89f044359c2465f1514e0ea718583900e43c1931fe?withResults=true") == "transaction/{hash}"
+    assert get_path_template("accounts/erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th/nfts/NFT-123456-0a") == "accounts/{address}/nfts/{token}"
+    assert get_path_template("tokens/USDC-c76f1f") == "tokens/{token}"
+    assert get_path_template("transaction/send-multiple") == "transaction/send-multiple"
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram([10, 20, 50, 100])
+
+    for value in range(1, 101):
+        histogram.observe(value)
+
+    assert histogram.count == 100
+    assert histogram.max == 100
+    assert histogram.get_percentile(10) == 10
+    assert histogram.get_percentile(50) == 50
+    assert histogram.get_percentile(75) == 75
+    assert histogram.get_percentile(99) == 99
+
+    histogram.observe(1000)
+    assert histogram.get_percentile(100) == 1000
+    assert LatencyHistogram([10]).get_percentile(99) == 0
+
+
+def test_request_hooks_and_metrics_collector():
+    hook = RecordingHook()
+    collector = MetricsCollector()
+
+    with MockProxyServer() as server:
+        server.serve_hyperblocks(highest_nonce=10, num_transactions_per_hyperblock=2)
+        proxy = ProxyNetworkProvider(server.url, rate_limiter=RateLimiter(retry_delay_in_milliseconds=1), request_hooks=[hook, collector])
+
+        for nonce in range(1, 6):
+            proxy.get_hyperblock(nonce)
+
+        server.inject_failures(2, status=429)
+        proxy.get_network_status()
+
+        with pytest.raises(GenericError):
+            proxy.get_hyperblock(42)
+
+        proxy.do_post_generic("transaction/send-multiple", [{"nonce": 1}])
+
+    assert hook.started == ["hyperblock/by-nonce/{number}"] * 5 + ["network/status/{number}", "hyperblock/by-nonce/{number}", "transaction/send-multiple"]
+    assert [event.status_code for event in hook.events] == [200] * 6 + [404, 200]
+    assert hook.events[5].num_retries == 2
+    assert hook.events[7].num_bytes_sent == len(proxy.json_codec.dumps([{"nonce": 1}]))
+    assert all(event.num_bytes_received > 0 and event.latency_in_milliseconds > 0 for event in hook.events)
+
+    hyperblocks = collector.get_endpoint_metrics("GET", "hyperblock/by-nonce/{number}")
+    assert hyperblocks is not None
+    assert hyperblocks.num_requests == 6
+    assert hyperblocks.num_errors == 1
+    assert hyperblocks.status_codes == {200: 5, 404: 1}
+    assert collector.get_percentile("GET", "hyperblock/by-nonce/{number}", 99) > 0
+
+    snapshot = collector.snapshot()
+    assert len(snapshot) == 3
+    assert {item["pathTemplate"] for item in snapshot} == {"hyperblock/by-nonce/{number}", "network/status/{number}", "transaction/send-multiple"}
+
+    dump = collector.dump()
+    assert "GET hyperblock/by-nonce/{number}" in dump
+    assert "POST transaction/send-multiple" in dump
+
+    exposition = collector.to_prometheus()
+    assert 'multiversx_sdk_http_request_duration_milliseconds_count{method="GET",path="hyperblock/by-nonce/{number}"} 6' in exposition
+    assert 'multiversx_sdk_http_request_retries_total{method="GET",path="network/status/{number}"} 2' in exposition
+
+    collector.reset()
+    assert collector.snapshot() == []
+
+
+def test_request_hooks_on_connection_error():
+    hook = RecordingHook()
+    proxy = ProxyNetworkProvider("http://127.0.0.1:1", request_hooks=[hook])
+
+    with pytest.raises(GenericError):
+        proxy.get_network_status()
+
+    assert len(hook.events) == 1
+    assert hook.events[0].status_code is None
+    assert hook.events[0].error is not None
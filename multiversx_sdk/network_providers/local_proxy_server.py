@@ -0,0 +1,161 @@
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+
+ProxyRouteHandler = Callable[["ProxyRequest"], Tuple[int, Any]]
+
+
+class ProxyRequest:
+    def __init__(self, method: str, path: str, match: "re.Match[str]", body: bytes) -> None:
+        self.method = method
+        self.path = path
+        self.match = match
+        self.body = body
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class ProxyRoute:
+    def __init__(self, method: str, pattern: Pattern[str], handler: ProxyRouteHandler) -> None:
+        self.method = method
+        self.pattern = pattern
+        self.handler = handler
+
+
+class LocalProxyServer:
+    """
+    A small, local HTTP server, which serves the registered routes (see "on()"), e.g. to mimic the Proxy for a "ProxyNetworkProvider"
+    in load tests and benchmarks, where a real network is not available (see "create_simulator_proxy_server()").
+    """
+
+    def __init__(self, latency_in_milliseconds: int = 0) -> None:
+        self.latency_in_milliseconds = latency_in_milliseconds
+        self.routes: List[ProxyRoute] = []
+        self.num_requests = 0
+        self.num_bytes_received = 0
+        self.failures_to_inject: List[Tuple[int, Dict[str, str]]] = []
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise Exception("The server is not started")
+
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def on(self, method: str, path_pattern: str, handler: ProxyRouteHandler) -> None:
+        """Registers a handler. Routes registered later take precedence over the older ones."""
+        route = ProxyRoute(method, re.compile(f"^{path_pattern}$"), handler)
+        self.routes.insert(0, route)
+
+    def inject_failures(self, count: int, status: int = 500, headers: Optional[Dict[str, str]] = None) -> None:
+        """The next `count` requests will fail with the given HTTP status."""
+        with self._lock:
+            self.failures_to_inject.extend([(status, headers or {})] * count)
+
+    def start(self) -> "LocalProxyServer":
+        server = ThreadingHTTPServer(("127.0.0.1", 0), self._create_request_handler())
+        server.daemon_threads = True
+
+        self._server = server
+        self._thread = threading.Thread(target=server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+
+    def __enter__(self) -> "LocalProxyServer":
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def _handle(self, method: str, path: str, body: bytes) -> Tuple[int, Dict[str, str], bytes]:
+        with self._lock:
+            self.num_requests += 1
+            self.num_bytes_received += len(body)
+            failure = self.failures_to_inject.pop(0) if self.failures_to_inject else None
+
+        if self.latency_in_milliseconds:
+            time.sleep(self.latency_in_milliseconds / 1000)
+
+        if failure:
+            status, headers = failure
+            return status, headers, _encode_response({"error": "injected failure", "code": "internal_issue"})
+
+        path = path.split("?")[0]
+
+        for route in self.routes:
+            if route.method != method:
+                continue
+
+            match = route.pattern.match(path)
+            if match:
+                status, payload = route.handler(ProxyRequest(method, path, match, body))
+                if isinstance(payload, bytes):
+                    return status, {}, payload
+                return status, {}, _encode_response(payload)
+
+        return 404, {}, _encode_response({"error": f"no route for {method} {path}", "code": "bad_request"})
+
+    def _create_request_handler(self) -> Any:
+        server = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                self._respond(*server._handle("GET", self.path, b""))
+
+            def do_POST(self) -> None:
+                self._respond(*server._handle("POST", self.path, self._read_body()))
+
+            def _read_body(self) -> bytes:
+                if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+                    return self._read_chunked_body()
+
+                length = int(self.headers.get("Content-Length", 0))
+                return self.rfile.read(length)
+
+            def _read_chunked_body(self) -> bytes:
+                chunks: List[bytes] = []
+
+                while True:
+                    size = int(self.rfile.readline().strip(), 16)
+                    if size == 0:
+                        self.rfile.readline()
+                        return b"".join(chunks)
+
+                    chunks.append(self.rfile.read(size))
+                    self.rfile.readline()
+
+            def _respond(self, status: int, headers: Dict[str, str], body: bytes) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return RequestHandler
+
+
+def _encode_response(payload: Any) -> bytes:
+    return json.dumps(payload).encode()
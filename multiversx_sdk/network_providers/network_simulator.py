@@ -0,0 +1,484 @@
+import base64
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from multiversx_sdk.converters.transactions_converter import \
+    TransactionsConverter
+from multiversx_sdk.core.address import Address
+from multiversx_sdk.core.interfaces import IAddress
+from multiversx_sdk.core.transaction import Transaction
+from multiversx_sdk.core.transaction_computer import TransactionComputer
+from multiversx_sdk.network_providers.accounts import AccountOnNetwork
+from multiversx_sdk.network_providers.contract_query_response import \
+    ContractQueryResponse
+from multiversx_sdk.network_providers.interface import IContractQuery
+from multiversx_sdk.network_providers.local_proxy_server import (
+    LocalProxyServer, ProxyRequest)
+from multiversx_sdk.network_providers.network_config import NetworkConfig
+from multiversx_sdk.network_providers.network_status import NetworkStatus
+from multiversx_sdk.network_providers.proxy_network_provider import \
+    ContractQuery
+from multiversx_sdk.network_providers.tokens import (
+    FungibleTokenOfAccountOnNetwork, NonFungibleTokenOfAccountOnNetwork)
+from multiversx_sdk.network_providers.transaction_status import \
+    TransactionStatus
+from multiversx_sdk.network_providers.transactions import TransactionOnNetwork
+from multiversx_sdk.network_providers.utils import decimal_to_padded_hex
+
+ONE_SECOND_IN_MILLISECONDS = 1000
+
+SimulatorQueryHandler = Callable[[IContractQuery], List[bytes]]
+
+
+class TransactionRejectedError(Exception):
+    def __init__(self, message: str) -> None:
+        super().__init__(f"Transaction rejected: {message}")
+
+
+class SimulatedAccount:
+    def __init__(self, address: str, nonce: int = 0, balance: int = 0) -> None:
+        self.address = address
+        self.nonce = nonce
+        self.balance = balance
+        # Token balances, by identifier (e.g. "TEST-123456" or, for SFTs and NFTs, "TEST-123456-0a").
+        self.tokens: Dict[str, int] = {}
+
+
+class _SimulatedTransaction:
+    def __init__(self, hash: str, transaction: Transaction) -> None:
+        self.hash = hash
+        self.transaction = transaction
+        self.status = "pending"
+        self.round = 0
+
+    def to_http_response(self) -> Dict[str, Any]:
+        transaction = self.transaction
+
+        return {
+            "type": "normal",
+            "nonce": transaction.nonce,
+            "round": self.round,
+            "epoch": 0,
+            "value": str(transaction.value),
+            "receiver": transaction.receiver,
+            "sender": transaction.sender,
+            "gasPrice": transaction.gas_price,
+            "gasLimit": transaction.gas_limit,
+            "data": base64.b64encode(transaction.data).decode(),
+            "signature": transaction.signature.hex(),
+            "status": self.status,
+            "blockNonce": self.round,
+            "hyperblockNonce": self.round,
+        }
+
+
+class NetworkSimulator:
+    """
+    An in-memory chain, for load tests and benchmarks: it implements (a subset of) the network provider interface,
+    applies EGLD and ESDT transfers (no smart contracts, though queries can be answered by handlers, see "on_query()")
+    and executes the pending transactions, in nonce order, at each (simulated) round. Signatures are not verified.
+
+    Rounds are advanced either explicitly, by "advance_round()" (deterministic, for tests), or by a background thread (see "start()").
+    Safe to share between threads. Can be served over HTTP, for a real "ProxyNetworkProvider" (see "create_simulator_proxy_server()").
+    """
+
+    def __init__(self,
+                 chain_id: str = "localnet",
+                 round_duration_in_milliseconds: int = 100,
+                 min_gas_limit: int = 50000,
+                 gas_per_data_byte: int = 1500,
+                 min_gas_price: int = 1000000000) -> None:
+        """
+        Args:
+            chain_id (str): Transactions for other chains are rejected.
+            round_duration_in_milliseconds (int): How often the rounds are advanced, once the simulator is started.
+            min_gas_limit (int): The gas limit of a transaction without data (transactions with less gas are rejected).
+            gas_per_data_byte (int): The gas limit required for each byte of data.
+            min_gas_price (int): Transactions with a lower gas price are rejected.
+        """
+        self.chain_id = chain_id
+        self.round_duration_in_milliseconds = round_duration_in_milliseconds
+        self.min_gas_limit = min_gas_limit
+        self.gas_per_data_byte = gas_per_data_byte
+        self.min_gas_price = min_gas_price
+        self.current_round = 0
+
+        self._accounts: Dict[str, SimulatedAccount] = {}
+        self._transactions: Dict[str, _SimulatedTransaction] = {}
+        # Pending transactions, by sender.
+        self._pending: Dict[str, List[_SimulatedTransaction]] = defaultdict(list)
+        self._query_handlers: Dict[str, SimulatorQueryHandler] = {}
+        self._transaction_computer = TransactionComputer()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add_account(self, address: IAddress, balance: int = 0, nonce: int = 0, tokens: Optional[Dict[str, int]] = None) -> None:
+        account = SimulatedAccount(address.to_bech32(), nonce, balance)
+        account.tokens.update(tokens or {})
+
+        with self._lock:
+            self._accounts[account.address] = account
+
+    def on_query(self, function: str, handler: SimulatorQueryHandler) -> None:
+        """Registers a handler which answers the queries of a function (for any contract) with "return data"."""
+        with self._lock:
+            self._query_handlers[function] = handler
+
+    def start(self) -> "NetworkSimulator":
+        """Starts advancing the rounds in the background, once per "round_duration_in_milliseconds"."""
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._advance_rounds, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "NetworkSimulator":
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def advance_round(self) -> int:
+        """Executes the pending transactions (the ones with the expected nonces) and returns the number of executed transactions."""
+        with self._lock:
+            self.current_round += 1
+            num_executed = 0
+
+            for sender, transactions in list(self._pending.items()):
+                account = self._get_or_create_account(sender)
+                transactions.sort(key=lambda item: item.transaction.nonce)
+                remaining: List[_SimulatedTransaction] = []
+
+                for item in transactions:
+                    if item.transaction.nonce < account.nonce:
+                        # Another transaction with the same nonce has been executed.
+                        item.status = "invalid"
+                        item.round = self.current_round
+                    elif item.transaction.nonce == account.nonce:
+                        self._execute(item, account)
+                        num_executed += item.status != "invalid"
+                    else:
+                        remaining.append(item)
+
+                if remaining:
+                    self._pending[sender] = remaining
+                else:
+                    del self._pending[sender]
+
+            return num_executed
+
+    def get_network_config(self) -> NetworkConfig:
+        return NetworkConfig.from_http_response(self.get_network_config_payload())
+
+    def get_network_status(self, shard: Optional[int] = None) -> NetworkStatus:
+        return NetworkStatus.from_http_response(self.get_network_status_payload())
+
+    def get_account(self, address: IAddress) -> AccountOnNetwork:
+        return AccountOnNetwork.from_http_response(self.get_account_payload(address.to_bech32()))
+
+    def get_fungible_tokens_of_account(self, address: IAddress) -> List[FungibleTokenOfAccountOnNetwork]:
+        tokens = self.get_tokens_payload(address.to_bech32())
+        return [FungibleTokenOfAccountOnNetwork.from_http_response(token) for token in tokens.values() if "nonce" not in token]
+
+    def get_nonfungible_tokens_of_account(self, address: IAddress) -> List[NonFungibleTokenOfAccountOnNetwork]:
+        tokens = self.get_tokens_payload(address.to_bech32())
+        return [NonFungibleTokenOfAccountOnNetwork.from_proxy_http_response(token) for token in tokens.values() if "nonce" in token]
+
+    def send_transaction(self, transaction: Transaction) -> str:
+        tx_hash = self._transaction_computer.compute_transaction_hash(transaction).hex()
+
+        with self._lock:
+            self._accept(tx_hash, transaction)
+
+        return tx_hash
+
+    def send_transactions(self, transactions: Sequence[Transaction]) -> Tuple[int, Dict[str, str]]:
+        """Same as the Proxy: the rejected transactions are skipped (their indices are missing from the returned hashes)."""
+        hashes = [self._transaction_computer.compute_transaction_hash(transaction).hex() for transaction in transactions]
+        accepted: Dict[str, str] = {}
+
+        with self._lock:
+            for index, (tx_hash, transaction) in enumerate(zip(hashes, transactions)):
+                try:
+                    self._accept(tx_hash, transaction)
+                    accepted[str(index)] = tx_hash
+                except TransactionRejectedError:
+                    continue
+
+        return len(accepted), accepted
+
+    def get_transaction(self, tx_hash: str, with_process_status: Optional[bool] = False) -> TransactionOnNetwork:
+        response = self.get_transaction_payload(tx_hash)
+        process_status = TransactionStatus(response["status"]) if with_process_status else None
+        return TransactionOnNetwork.from_proxy_http_response(tx_hash, response, process_status)
+
+    def get_transaction_status(self, tx_hash: str) -> TransactionStatus:
+        with self._lock:
+            return TransactionStatus(self._get_transaction(tx_hash).status)
+
+    def query_contract(self, query: IContractQuery) -> ContractQueryResponse:
+        with self._lock:
+            handler = self._query_handlers.get(query.get_function())
+
+        if handler is None:
+            return ContractQueryResponse.from_http_response({"returnCode": "function not found", "returnMessage": "invalid function (not found)"})
+
+        return_data = [base64.b64encode(item).decode() for item in handler(query)]
+        return ContractQueryResponse.from_http_response({"returnData": return_data, "returnCode": "ok"})
+
+    def get_transaction_payload(self, tx_hash: str) -> Dict[str, Any]:
+        """The transaction, as returned by the "transaction/{hash}" route of the Proxy."""
+        with self._lock:
+            return self._get_transaction(tx_hash).to_http_response()
+
+    def get_network_config_payload(self) -> Dict[str, Any]:
+        """The network config, as returned by the "network/config" route of the Proxy."""
+        return {
+            "erd_chain_id": self.chain_id,
+            "erd_min_gas_limit": self.min_gas_limit,
+            "erd_gas_per_data_byte": self.gas_per_data_byte,
+            "erd_min_gas_price": self.min_gas_price,
+            "erd_gas_price_modifier": "0.01",
+            "erd_min_transaction_version": 1,
+            "erd_round_duration": self.round_duration_in_milliseconds,
+            "erd_num_shards_without_meta": 1,
+        }
+
+    def get_network_status_payload(self) -> Dict[str, Any]:
+        """The network status, as returned by the "network/status/{shard}" route of the Proxy."""
+        with self._lock:
+            return {
+                "erd_current_round": self.current_round,
+                "erd_nonce": self.current_round,
+                "erd_highest_final_nonce": self.current_round,
+                "erd_epoch_number": 0,
+            }
+
+    def get_account_payload(self, address: str) -> Dict[str, Any]:
+        """The account, as returned by the "address/{address}" route of the Proxy."""
+        with self._lock:
+            account = self._accounts.get(address) or SimulatedAccount(address)
+            return {"address": account.address, "nonce": account.nonce, "balance": str(account.balance)}
+
+    def get_tokens_payload(self, address: str) -> Dict[str, Dict[str, Any]]:
+        """The tokens of an account, as returned by the "address/{address}/esdt" route of the Proxy."""
+        with self._lock:
+            account = self._accounts.get(address)
+            tokens = dict(account.tokens) if account else {}
+
+        payload: Dict[str, Dict[str, Any]] = {}
+
+        for identifier, balance in tokens.items():
+            if balance == 0:
+                continue
+
+            parts = identifier.split("-")
+            if len(parts) == 3:
+                payload[identifier] = {"tokenIdentifier": identifier, "balance": str(balance), "nonce": int(parts[2], 16)}
+            else:
+                payload[identifier] = {"tokenIdentifier": identifier, "balance": str(balance)}
+
+        return payload
+
+    def _advance_rounds(self) -> None:
+        while not self._stop_event.wait(self.round_duration_in_milliseconds / ONE_SECOND_IN_MILLISECONDS):
+            self.advance_round()
+
+    def _accept(self, tx_hash: str, transaction: Transaction) -> None:
+        if transaction.chain_id != self.chain_id:
+            raise TransactionRejectedError(f"invalid chain ID: {transaction.chain_id}")
+        if transaction.gas_price < self.min_gas_price:
+            raise TransactionRejectedError("insufficient gas price in tx")
+        if transaction.gas_limit < self.min_gas_limit + self.gas_per_data_byte * len(transaction.data):
+            raise TransactionRejectedError("insufficient gas limit in tx")
+        if tx_hash in self._transactions:
+            raise TransactionRejectedError("duplicated transaction")
+
+        account = self._accounts.get(transaction.sender)
+        if account is not None and transaction.nonce < account.nonce:
+            raise TransactionRejectedError("lowerNonceInTx: true")
+
+        # As on the real chain, the sender must be able to pay the fee (the value is only checked at execution).
+        balance = account.balance if account is not None else 0
+        if balance < self._compute_fee(transaction):
+            raise TransactionRejectedError("insufficient funds")
+
+        item = _SimulatedTransaction(tx_hash, transaction)
+        self._transactions[tx_hash] = item
+        self._pending[transaction.sender].append(item)
+
+    def _execute(self, item: _SimulatedTransaction, sender: SimulatedAccount) -> None:
+        transaction = item.transaction
+        fee = self._compute_fee(transaction)
+        item.round = self.current_round
+
+        if sender.balance < fee:
+            # The fee was affordable when the transaction was accepted, but not anymore (after the previous transactions of the sender).
+            # Such a transaction is dropped (not executed), thus the nonce is not consumed.
+            item.status = "invalid"
+            return
+
+        sender.nonce += 1
+        sender.balance -= fee
+        transfers, receiver_address = self._parse_token_transfers(transaction)
+        has_enough_tokens = all(sender.tokens.get(token, 0) >= amount for token, amount in transfers)
+
+        if sender.balance < transaction.value or not has_enough_tokens:
+            item.status = "fail"
+            return
+
+        receiver = self._get_or_create_account(receiver_address)
+        sender.balance -= transaction.value
+        receiver.balance += transaction.value
+
+        for token, amount in transfers:
+            sender.tokens[token] -= amount
+            receiver.tokens[token] = receiver.tokens.get(token, 0) + amount
+
+        item.status = "success"
+
+    def _compute_fee(self, transaction: Transaction) -> int:
+        return transaction.gas_limit * transaction.gas_price
+
+    def _parse_token_transfers(self, transaction: Transaction) -> Tuple[List[Tuple[str, int]], str]:
+        """Returns the token transfers (identifier and amount) of "ESDTTransfer", "ESDTNFTTransfer" and "MultiESDTNFTTransfer", and the actual receiver."""
+        parts = transaction.data.decode(errors="replace").split("@")
+        function, arguments = parts[0], parts[1:]
+
+        if function not in ("ESDTTransfer", "ESDTNFTTransfer", "MultiESDTNFTTransfer"):
+            return [], transaction.receiver
+
+        try:
+            hrp = Address.new_from_bech32(transaction.sender).get_hrp()
+
+            if function == "ESDTTransfer" and len(arguments) >= 2:
+                return [(_decode_string(arguments[0]), _decode_int(arguments[1]))], transaction.receiver
+
+            if function == "ESDTNFTTransfer" and len(arguments) >= 4:
+                token = _get_token_key(_decode_string(arguments[0]), _decode_int(arguments[1]))
+                return [(token, _decode_int(arguments[2]))], _decode_address(arguments[3], hrp)
+
+            if function == "MultiESDTNFTTransfer" and len(arguments) >= 2:
+                receiver = _decode_address(arguments[0], hrp)
+                num_transfers = _decode_int(arguments[1])
+                transfers = [
+                    (_get_token_key(_decode_string(arguments[index]), _decode_int(arguments[index + 1])), _decode_int(arguments[index + 2]))
+                    for index in range(2, 2 + num_transfers * 3, 3)
+                ]
+                return transfers, receiver
+        except (ValueError, IndexError):
+            pass
+
+        return [], transaction.receiver
+
+    def _get_or_create_account(self, address: str) -> SimulatedAccount:
+        account = self._accounts.get(address)
+        if account is None:
+            account = SimulatedAccount(address)
+            self._accounts[address] = account
+        return account
+
+    def _get_transaction(self, tx_hash: str) -> _SimulatedTransaction:
+        item = self._transactions.get(tx_hash)
+        if item is None:
+            raise Exception("Transaction not found")
+        return item
+
+
+def _get_token_key(identifier: str, nonce: int) -> str:
+    return f"{identifier}-{decimal_to_padded_hex(nonce)}" if nonce else identifier
+
+
+def _decode_string(argument: str) -> str:
+    return bytes.fromhex(argument).decode()
+
+
+def _decode_int(argument: str) -> int:
+    return int(argument, 16) if argument else 0
+
+
+def _decode_address(argument: str, hrp: str) -> str:
+    return Address(bytes.fromhex(argument), hrp).to_bech32()
+
+
+def create_simulator_proxy_server(simulator: NetworkSimulator, latency_in_milliseconds: int = 0) -> LocalProxyServer:
+    """
+    Creates a (not yet started) HTTP front-end of the simulator, which mimics the Proxy routes used by "ProxyNetworkProvider":
+    network config and status, accounts and their tokens, sending transactions, fetching transactions (and their status) and queries.
+    """
+    server = LocalProxyServer(latency_in_milliseconds)
+    converter = TransactionsConverter()
+
+    def ok(data: Dict[str, Any]) -> Tuple[int, Any]:
+        return 200, {"data": data, "code": "successful"}
+
+    def error(status: int, message: str) -> Tuple[int, Any]:
+        return status, {"error": message, "code": "bad_request" if status == 400 else "internal_issue"}
+
+    def handle_get_network_config(request: ProxyRequest) -> Tuple[int, Any]:
+        return ok({"config": simulator.get_network_config_payload()})
+
+    def handle_get_network_status(request: ProxyRequest) -> Tuple[int, Any]:
+        return ok({"status": simulator.get_network_status_payload()})
+
+    def handle_get_account(request: ProxyRequest) -> Tuple[int, Any]:
+        return ok({"account": simulator.get_account_payload(request.match.group(1))})
+
+    def handle_get_tokens(request: ProxyRequest) -> Tuple[int, Any]:
+        return ok({"esdts": simulator.get_tokens_payload(request.match.group(1))})
+
+    def handle_send(request: ProxyRequest) -> Tuple[int, Any]:
+        try:
+            return ok({"txHash": simulator.send_transaction(converter.dictionary_to_transaction(request.json()))})
+        except TransactionRejectedError as err:
+            return error(400, str(err))
+
+    def handle_send_multiple(request: ProxyRequest) -> Tuple[int, Any]:
+        transactions = [converter.dictionary_to_transaction(item) for item in request.json()]
+        num_sent, hashes = simulator.send_transactions(transactions)
+        return ok({"numOfSentTxs": num_sent, "txsHashes": hashes})
+
+    def handle_get_transaction(request: ProxyRequest) -> Tuple[int, Any]:
+        try:
+            return ok({"transaction": simulator.get_transaction_payload(request.match.group(1))})
+        except Exception:
+            return error(404, "transaction not found")
+
+    def handle_get_transaction_status(request: ProxyRequest) -> Tuple[int, Any]:
+        try:
+            return ok({"status": simulator.get_transaction_status(request.match.group(1)).status})
+        except Exception:
+            return error(404, "transaction not found")
+
+    def handle_query(request: ProxyRequest) -> Tuple[int, Any]:
+        payload = request.json()
+        caller = payload.get("caller")
+        query = ContractQuery(
+            address=Address.new_from_bech32(payload["scAddress"]),
+            function=payload["funcName"],
+            value=int(payload.get("value") or 0),
+            arguments=[bytes.fromhex(argument) for argument in payload.get("args", [])],
+            caller=Address.new_from_bech32(caller) if caller else None
+        )
+        response = simulator.query_contract(query)
+        return ok({"data": {"returnData": response.return_data, "returnCode": response.return_code, "returnMessage": response.return_message}})
+
+    server.on("GET", r"/network/config", handle_get_network_config)
+    server.on("GET", r"/network/status/(\d+)", handle_get_network_status)
+    server.on("GET", r"/address/(\w+)", handle_get_account)
+    server.on("GET", r"/address/(\w+)/esdt", handle_get_tokens)
+    server.on("POST", r"/transaction/send", handle_send)
+    server.on("POST", r"/transaction/send-multiple", handle_send_multiple)
+    server.on("GET", r"/transaction/(\w+)", handle_get_transaction)
+    server.on("GET", r"/transaction/(\w+)/process-status", handle_get_transaction_status)
+    server.on("POST", r"/vm-values/query", handle_query)
+
+    return server
@@ -0,0 +1,223 @@
+import threading
+import time
+from typing import List
+
+import pytest
+
+from multiversx_sdk.core.address import Address
+from multiversx_sdk.core.transaction import Transaction
+from multiversx_sdk.network_providers.errors import GenericError
+from multiversx_sdk.network_providers.interface import IContractQuery
+from multiversx_sdk.network_providers.network_simulator import (
+    NetworkSimulator, TransactionRejectedError, create_simulator_proxy_server)
+from multiversx_sdk.network_providers.proxy_network_provider import (
+    ContractQuery, ProxyNetworkProvider)
+from multiversx_sdk.testutils import addresses
+
+ALICE = Address.new_from_bech32(addresses.ALICE)
+BOB = Address.new_from_bech32(addresses.BOB)
+CAROL = Address.new_from_bech32(addresses.CAROL)
+FEE = 50000 * 1000000000
+
+
+def create_transfer(nonce: int, value: int = 0, data: bytes = b"", receiver: Address = BOB) -> Transaction:
+    return Transaction(
+        sender=ALICE.to_bech32(),
+        receiver=receiver.to_bech32(),
+        gas_limit=50000 + 1500 * len(data),
+        chain_id="localnet",
+        nonce=nonce,
+        value=value,
+        data=data
+    )
+
+
+def test_egld_transfers():
+    simulator = NetworkSimulator()
+    simulator.add_account(ALICE, balance=10 * FEE + 100)
+
+    first_hash = simulator.send_transaction(create_transfer(nonce=0, value=40))
+    second_hash = simulator.send_transaction(create_transfer(nonce=1, value=60))
+    assert simulator.get_transaction_status(first_hash).is_pending()
+
+    assert simulator.advance_round() == 2
+    assert simulator.get_transaction_status(first_hash).is_successful()
+    assert simulator.get_transaction(second_hash, with_process_status=True).is_completed
+
+    alice = simulator.get_account(ALICE)
+    assert alice.nonce == 2
+    assert alice.balance == 8 * FEE
+    assert simulator.get_account(BOB).balance == 100
+
+    # Not enough balance: the transaction fails, but the nonce is consumed and the fee is paid.
+    failed_hash = simulator.send_transaction(create_transfer(nonce=2, value=8 * FEE))
+    simulator.advance_round()
+    assert simulator.get_transaction_status(failed_hash).is_failed()
+    assert simulator.get_account(ALICE).nonce == 3
+    assert simulator.get_account(ALICE).balance == 7 * FEE
+
+
+def test_transactions_are_executed_in_nonce_order():
+    simulator = NetworkSimulator()
+    simulator.add_account(ALICE, balance=10 * FEE, nonce=5)
+
+    with pytest.raises(TransactionRejectedError, match="lowerNonceInTx"):
+        simulator.send_transaction(create_transfer(nonce=4))
+
+    # A gap: the later transaction waits for the missing nonce.
+    later_hash = simulator.send_transaction(create_transfer(nonce=7))
+    simulator.advance_round()
+    assert simulator.get_transaction_status(later_hash).is_pending()
+
+    simulator.send_transaction(create_transfer(nonce=6))
+    simulator.send_transaction(create_transfer(nonce=5))
+    assert simulator.advance_round() == 3
+    assert simulator.get_transaction_status(later_hash).is_successful()
+    assert simulator.get_account(ALICE).nonce == 8
+
+    # Same nonce, different transactions: only the first one is executed.
+    first_hash = simulator.send_transaction(create_transfer(nonce=8, value=1))
+    second_hash = simulator.send_transaction(create_transfer(nonce=8, value=2))
+    simulator.advance_round()
+    assert simulator.get_transaction_status(first_hash).is_successful()
+    assert simulator.get_transaction_status(second_hash).is_invalid()
+
+
+def test_transactions_are_validated():
+    simulator = NetworkSimulator()
+    simulator.add_account(ALICE, balance=10 * FEE)
+    transaction = create_transfer(nonce=0)
+
+    transaction.chain_id = "D"
+    with pytest.raises(TransactionRejectedError, match="invalid chain ID"):
+        simulator.send_transaction(transaction)
+
+    transaction = create_transfer(nonce=0, data=b"hello")
+    transaction.gas_limit = 50000
+    with pytest.raises(TransactionRejectedError, match="insufficient gas limit"):
+        simulator.send_transaction(transaction)
+
+    simulator.send_transaction(create_transfer(nonce=0))
+    num_sent, hashes = simulator.send_transactions([create_transfer(nonce=0), create_transfer(nonce=1)])
+    assert num_sent == 1
+    assert list(hashes.keys()) == ["1"]
+
+
+def test_transactions_which_cannot_pay_the_fee_are_rejected():
+    simulator = NetworkSimulator()
+
+    with pytest.raises(TransactionRejectedError, match="insufficient funds"):
+        simulator.send_transaction(create_transfer(nonce=0))
+
+    simulator.add_account(ALICE, balance=FEE + 10)
+    with pytest.raises(TransactionRejectedError, match="insufficient funds"):
+        simulator.send_transaction(create_transfer(nonce=0, data=b"hello"))
+
+    # Both are accepted (each can pay the fee), but only the first one can be executed: the second one is dropped.
+    first_hash = simulator.send_transaction(create_transfer(nonce=0, value=10))
+    second_hash = simulator.send_transaction(create_transfer(nonce=1))
+    assert simulator.advance_round() == 1
+
+    assert simulator.get_transaction_status(first_hash).is_successful()
+    assert simulator.get_transaction_status(second_hash).is_invalid()
+    assert simulator.get_account(ALICE).nonce == 1
+    assert simulator.get_account(ALICE).balance == 0
+
+
+def test_esdt_transfers():
+    simulator = NetworkSimulator()
+    simulator.add_account(ALICE, balance=10 * FEE, tokens={"TEST-123456": 1000, "NFT-123456-0a": 1})
+
+    simulator.send_transaction(create_transfer(nonce=0, data=b"ESDTTransfer@544553542d313233343536@64"))
+    simulator.send_transaction(create_transfer(
+        nonce=1,
+        receiver=ALICE,
+        data=f"MultiESDTNFTTransfer@{CAROL.to_hex()}@02@544553542d313233343536@@0a@4e46542d313233343536@0a@01".encode()
+    ))
+    # Not enough tokens.
+    failed_hash = simulator.send_transaction(create_transfer(nonce=2, data=b"ESDTTransfer@544553542d313233343536@0f4240"))
+    simulator.advance_round()
+
+    assert simulator.get_transaction_status(failed_hash).is_failed()
+    assert [(token.identifier, token.balance) for token in simulator.get_fungible_tokens_of_account(ALICE)] == [("TEST-123456", 890)]
+    assert [(token.identifier, token.balance) for token in simulator.get_fungible_tokens_of_account(BOB)] == [("TEST-123456", 100)]
+    assert [(token.identifier, token.balance) for token in simulator.get_fungible_tokens_of_account(CAROL)] == [("TEST-123456", 10)]
+    assert simulator.get_nonfungible_tokens_of_account(ALICE) == []
+    assert [(token.identifier, token.nonce) for token in simulator.get_nonfungible_tokens_of_account(CAROL)] == [("NFT-123456-0a", 10)]
+
+
+def test_query_contract():
+    simulator = NetworkSimulator()
+
+    def get_sum(query: IContractQuery) -> List[bytes]:
+        return [bytes([sum(bytes.fromhex(argument)[0] for argument in query.get_encoded_arguments())])]
+
+    simulator.on_query("getSum", get_sum)
+
+    response = simulator.query_contract(ContractQuery(BOB, "getSum", 0, [b"\x01", b"\x02"]))
+    assert response.return_code == "ok"
+    assert response.get_return_data_parts() == [b"\x03"]
+    assert simulator.query_contract(ContractQuery(BOB, "getProduct", 0, [])).return_code == "function not found"
+
+
+def test_concurrent_senders():
+    simulator = NetworkSimulator(round_duration_in_milliseconds=5)
+    senders = [Address(bytes([index]) * 32, "erd") for index in range(8)]
+    num_transactions_per_sender = 100
+
+    for sender in senders:
+        simulator.add_account(sender, balance=num_transactions_per_sender * (FEE + 1))
+
+    def send(sender: Address):
+        for nonce in range(num_transactions_per_sender):
+            transaction = create_transfer(nonce=nonce, value=1)
+            transaction.sender = sender.to_bech32()
+            simulator.send_transaction(transaction)
+
+    with simulator:
+        threads = [threading.Thread(target=send, args=(sender,)) for sender in senders]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        while any(simulator.get_account(sender).nonce < num_transactions_per_sender for sender in senders):
+            time.sleep(0.01)
+
+    assert simulator.get_account(BOB).balance == len(senders) * num_transactions_per_sender
+    assert all(simulator.get_account(sender).balance == 0 for sender in senders)
+
+
+def test_with_proxy_network_provider():
+    simulator = NetworkSimulator()
+    simulator.add_account(ALICE, balance=10 * FEE, tokens={"TEST-123456": 1000})
+    simulator.on_query("getAnswer", lambda query: [bytes([42])])
+
+    with create_simulator_proxy_server(simulator) as server:
+        proxy = ProxyNetworkProvider(server.url)
+
+        assert proxy.get_network_config().chain_id == "localnet"
+        assert proxy.get_account(ALICE).balance == 10 * FEE
+
+        tx_hash = proxy.send_transaction(create_transfer(nonce=0, value=10))
+        # The duplicated transaction is skipped.
+        num_sent, hashes = proxy.send_transactions([create_transfer(nonce=1, value=20), create_transfer(nonce=0, value=10)])
+        assert num_sent == 1
+        assert proxy.get_transaction_status(tx_hash).is_pending()
+
+        simulator.advance_round()
+        assert proxy.get_network_status().nonce == 1
+
+        with pytest.raises(GenericError, match="lowerNonceInTx"):
+            proxy.send_transaction(create_transfer(nonce=0, value=30))
+
+        transaction = proxy.get_transaction(hashes["0"], with_process_status=True)
+        assert transaction.is_completed
+        assert transaction.status.is_successful()
+        assert transaction.value == "20"
+        assert transaction.sender.to_bech32() == ALICE.to_bech32()
+
+        assert proxy.get_account(ALICE).nonce == 2
+        assert proxy.get_account(BOB).balance == 30
+        assert [token.identifier for token in proxy.get_fungible_tokens_of_account(ALICE)] == ["TEST-123456"]
+        assert proxy.query_contract(ContractQuery(BOB, "getAnswer", 0, [])).get_return_data_parts() == [bytes([42])]
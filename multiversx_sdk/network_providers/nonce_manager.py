@@ -0,0 +1,219 @@
+import heapq
+import threading
+from typing import Any, Callable, Dict, List, Protocol, Sequence, Set, Tuple
+
+from multiversx_sdk.core.address import Address
+from multiversx_sdk.network_providers.interface import IAddress
+from multiversx_sdk.network_providers.transactions import ITransaction
+
+
+class IAccount(Protocol):
+    nonce: int
+
+
+class ITransactionInMempool(Protocol):
+    nonce: int
+
+
+class IAccountProvider(Protocol):
+    def get_account(self, address: IAddress) -> IAccount:
+        ...
+
+
+class ITransactionsSender(Protocol):
+    def send_transactions(self, transactions: Sequence[ITransaction]) -> Tuple[int, Dict[str, str]]:
+        ...
+
+
+class NonceSyncResult:
+    def __init__(self, address: str, account_nonce: int, next_nonce: int, mempool_nonces: List[int], gaps: List[int]) -> None:
+        """
+        Args:
+            address (str): the (bech32) address of the account.
+            account_nonce (int): the nonce of the account, as seen by the network (the nonce of the next executed transaction).
+            next_nonce (int): the nonce to be handed out after the gaps (if any) are filled.
+            mempool_nonces (List[int]): the nonces of the pending transactions of the account (in the mempool).
+            gaps (List[int]): the missing nonces, between the account nonce and the highest nonce in the mempool.
+        """
+        self.address = address
+        self.account_nonce = account_nonce
+        self.next_nonce = next_nonce
+        self.mempool_nonces = mempool_nonces
+        self.gaps = gaps
+
+    def to_dictionary(self) -> Dict[str, Any]:
+        return {
+            "address": self.address,
+            "accountNonce": self.account_nonce,
+            "nextNonce": self.next_nonce,
+            "mempoolNonces": self.mempool_nonces,
+            "gaps": self.gaps
+        }
+
+
+class _AccountNonces:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.is_synced = False
+        self.next_nonce = 0
+        # Nonces to be handed out before "next_nonce": the gaps found when syncing and the released nonces (a min-heap).
+        self.free_nonces: List[int] = []
+        # Gap nonces being filled (see "NonceManager.fill_gaps()"): not handed out (not even after a resync), until released.
+        self.in_flight: Set[int] = set()
+
+    def take(self) -> int:
+        if self.free_nonces:
+            return heapq.heappop(self.free_nonces)
+
+        nonce = self.next_nonce
+        self.next_nonce += 1
+        return nonce
+
+    def give_back(self, nonce: int) -> None:
+        self.in_flight.discard(nonce)
+
+        if nonce < self.next_nonce and nonce not in self.free_nonces:
+            heapq.heappush(self.free_nonces, nonce)
+
+
+class NonceManager:
+    """
+    Hands out the nonces of many senders, atomically (can be shared by concurrent workers). The nonces of an account are
+    fetched from the network on first use, and can be re-synced at any time (e.g. after failed broadcasts), using "get_account()" and,
+    if the network provider supports it (e.g. "ApiNetworkProvider"), "get_transactions_in_mempool_for_account()".
+
+    When syncing, the nonces missing from the mempool (gaps, which block the execution of the later transactions) are detected:
+    they are handed out first (so that new transactions fill them), unless they are explicitly filled (see "fill_gaps()").
+    """
+
+    def __init__(self, network_provider: IAccountProvider, use_mempool: bool = True) -> None:
+        """
+        Args:
+            network_provider (IAccountProvider): used to fetch the accounts (and, if supported, the transactions in the mempool).
+            use_mempool (bool): whether to take the transactions in the mempool into account, when syncing.
+        """
+        self.network_provider = network_provider
+        self.use_mempool = use_mempool
+        self._accounts: Dict[str, _AccountNonces] = {}
+        self._lock = threading.Lock()
+
+    def get_nonce(self, address: IAddress) -> int:
+        """Returns the nonce to be used by the next transaction of the sender."""
+        return self.reserve_nonces(address, 1)[0]
+
+    def reserve_nonces(self, address: IAddress, count: int) -> List[int]:
+        """
+        Reserves nonces for a batch of transactions of the sender. The nonces are ascending, and contiguous
+        unless gaps (or released nonces) are filled first.
+        """
+        account = self._get_account_nonces(address)
+
+        with account.lock:
+            self._ensure_synced(address, account)
+            return [account.take() for _ in range(count)]
+
+    def apply_nonces(self, transactions: Sequence[ITransaction]) -> None:
+        """Sets the nonces of the given transactions (of any senders), in order, reserving them atomically per sender."""
+        by_sender: Dict[str, List[ITransaction]] = {}
+        for transaction in transactions:
+            by_sender.setdefault(transaction.sender, []).append(transaction)
+
+        for sender, sender_transactions in by_sender.items():
+            nonces = self.reserve_nonces(Address.new_from_bech32(sender), len(sender_transactions))
+
+            for transaction, nonce in zip(sender_transactions, nonces):
+                transaction.nonce = nonce
+
+    def release_nonces(self, address: IAddress, nonces: Sequence[int]) -> None:
+        """Gives back nonces which won't be used (e.g. the transactions could not be sent), so that they are handed out again first."""
+        account = self._get_account_nonces(address)
+
+        with account.lock:
+            for nonce in nonces:
+                account.give_back(nonce)
+
+    def get_gaps(self, address: IAddress) -> List[int]:
+        """Returns the nonces to be filled: the gaps found when syncing, and the released nonces."""
+        account = self._get_account_nonces(address)
+
+        with account.lock:
+            return sorted(account.free_nonces)
+
+    def resync(self, address: IAddress) -> NonceSyncResult:
+        """Fetches the nonce of the account (and its transactions in the mempool), discarding the local state of the sender."""
+        account = self._get_account_nonces(address)
+
+        with account.lock:
+            return self._sync(address, account)
+
+    def fill_gaps(self,
+                  address: IAddress,
+                  create_transaction: Callable[[int], ITransaction],
+                  transactions_sender: ITransactionsSender) -> Dict[int, str]:
+        """
+        Sends a transaction (e.g. a zero-value transfer to self), created (and signed) by the given callback, for each gap.
+        The nonces of the transactions which are not accepted are released. Returns the hashes of the sent transactions, by nonce.
+        While the transactions are being sent, their nonces are not handed out, even if the account is re-synced meanwhile.
+        """
+        account = self._get_account_nonces(address)
+
+        with account.lock:
+            self._ensure_synced(address, account)
+            nonces = sorted(account.free_nonces)
+            account.free_nonces.clear()
+            account.in_flight.update(nonces)
+
+        if not nonces:
+            return {}
+
+        transactions = [create_transaction(nonce) for nonce in nonces]
+        hashes_by_nonce: Dict[int, str] = {}
+
+        try:
+            _, hashes = transactions_sender.send_transactions(transactions)
+            hashes_by_nonce = {nonces[int(index)]: tx_hash for index, tx_hash in (hashes or {}).items()}
+        finally:
+            with account.lock:
+                account.in_flight.difference_update(hashes_by_nonce)
+
+            self.release_nonces(address, [nonce for nonce in nonces if nonce not in hashes_by_nonce])
+
+        return hashes_by_nonce
+
+    def _get_account_nonces(self, address: IAddress) -> _AccountNonces:
+        key = address.to_bech32()
+
+        with self._lock:
+            account = self._accounts.get(key)
+            if account is None:
+                account = _AccountNonces()
+                self._accounts[key] = account
+            return account
+
+    def _ensure_synced(self, address: IAddress, account: _AccountNonces) -> None:
+        if not account.is_synced:
+            self._sync(address, account)
+
+    def _sync(self, address: IAddress, account: _AccountNonces) -> NonceSyncResult:
+        account_nonce = self.network_provider.get_account(address).nonce
+        mempool_nonces = sorted({nonce for nonce in self._get_mempool_nonces(address) if nonce >= account_nonce})
+
+        next_nonce = mempool_nonces[-1] + 1 if mempool_nonces else account_nonce
+        in_mempool = set(mempool_nonces)
+        gaps = [nonce for nonce in range(account_nonce, next_nonce) if nonce not in in_mempool and nonce not in account.in_flight]
+
+        account.next_nonce = next_nonce
+        account.free_nonces = list(gaps)
+        heapq.heapify(account.free_nonces)
+        account.is_synced = True
+
+        return NonceSyncResult(address.to_bech32(), account_nonce, next_nonce, mempool_nonces, gaps)
+
+    def _get_mempool_nonces(self, address: IAddress) -> List[int]:
+        get_transactions_in_mempool = getattr(self.network_provider, "get_transactions_in_mempool_for_account", None)
+
+        if not self.use_mempool or get_transactions_in_mempool is None:
+            return []
+
+        transactions: Sequence[ITransactionInMempool] = get_transactions_in_mempool(address)
+        return [transaction.nonce for transaction in transactions]
@@ -0,0 +1,181 @@
+import threading
+from typing import Dict, List, Sequence, Set, Tuple
+
+from multiversx_sdk.core.address import Address
+from multiversx_sdk.core.transaction import Transaction
+from multiversx_sdk.network_providers.accounts import AccountOnNetwork
+from multiversx_sdk.network_providers.interface import IAddress
+from multiversx_sdk.network_providers.nonce_manager import NonceManager
+from multiversx_sdk.network_providers.transactions import (
+    ITransaction, TransactionInMempool)
+
+ALICE = Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th")
+BOB = Address.new_from_bech32("erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx")
+
+
+class FakeNetworkProvider:
+    def __init__(self) -> None:
+        self.nonces: Dict[str, int] = {}
+        self.mempool: Dict[str, List[int]] = {}
+        self.num_get_account = 0
+
+    def get_account(self, address: IAddress) -> AccountOnNetwork:
+        self.num_get_account += 1
+        account = AccountOnNetwork()
+        account.nonce = self.nonces.get(address.to_bech32(), 0)
+        return account
+
+    def get_transactions_in_mempool_for_account(self, address: IAddress) -> List[TransactionInMempool]:
+        transactions: List[TransactionInMempool] = []
+
+        for nonce in self.mempool.get(address.to_bech32(), []):
+            transaction = TransactionInMempool()
+            transaction.nonce = nonce
+            transactions.append(transaction)
+
+        return transactions
+
+
+class FakeTransactionsSender:
+    def __init__(self, rejected_nonces: Set[int]) -> None:
+        self.rejected_nonces = rejected_nonces
+        self.sent: List[ITransaction] = []
+
+    def send_transactions(self, transactions: Sequence[ITransaction]) -> Tuple[int, Dict[str, str]]:
+        hashes = {str(index): f"hash-{transaction.nonce}" for index, transaction in enumerate(transactions) if transaction.nonce not in self.rejected_nonces}
+        self.sent.extend(transaction for transaction in transactions if transaction.nonce not in self.rejected_nonces)
+        return len(hashes), hashes
+
+
+def create_transaction(sender: Address) -> Transaction:
+    return Transaction(sender=sender.to_bech32(), receiver=BOB.to_bech32(), gas_limit=50000, chain_id="D")
+
+
+def test_nonces_are_fetched_on_first_use():
+    provider = FakeNetworkProvider()
+    provider.nonces[ALICE.to_bech32()] = 42
+    manager = NonceManager(provider)
+
+    assert manager.get_nonce(ALICE) == 42
+    assert manager.get_nonce(ALICE) == 43
+    assert manager.reserve_nonces(ALICE, 3) == [44, 45, 46]
+    assert manager.get_nonce(BOB) == 0
+    assert provider.num_get_account == 2
+
+
+def test_concurrent_workers_get_distinct_nonces():
+    provider = FakeNetworkProvider()
+    manager = NonceManager(provider)
+    nonces: List[int] = []
+    nonces_lock = threading.Lock()
+
+    def work():
+        reserved = [manager.get_nonce(ALICE) for _ in range(100)] + manager.reserve_nonces(ALICE, 50)
+        with nonces_lock:
+            nonces.extend(reserved)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(nonces) == list(range(8 * 150))
+    assert provider.num_get_account == 1
+
+
+def test_apply_nonces():
+    manager = NonceManager(FakeNetworkProvider())
+    manager.get_nonce(ALICE)
+
+    transactions = [create_transaction(ALICE), create_transaction(BOB), create_transaction(ALICE)]
+    manager.apply_nonces(transactions)
+    assert [transaction.nonce for transaction in transactions] == [1, 0, 2]
+
+
+def test_released_nonces_are_handed_out_first():
+    manager = NonceManager(FakeNetworkProvider())
+
+    assert manager.reserve_nonces(ALICE, 5) == [0, 1, 2, 3, 4]
+    manager.release_nonces(ALICE, [3, 1, 7])
+    assert manager.get_gaps(ALICE) == [1, 3]
+
+    assert manager.reserve_nonces(ALICE, 3) == [1, 3, 5]
+
+
+def test_resync_detects_gaps_in_mempool():
+    provider = FakeNetworkProvider()
+    provider.nonces[ALICE.to_bech32()] = 10
+    provider.mempool[ALICE.to_bech32()] = [9, 10, 11, 13, 16]
+    manager = NonceManager(provider)
+
+    result = manager.resync(ALICE)
+    assert result.to_dictionary() == {
+        "address": ALICE.to_bech32(),
+        "accountNonce": 10,
+        "nextNonce": 17,
+        "mempoolNonces": [10, 11, 13, 16],
+        "gaps": [12, 14, 15]
+    }
+
+    # New transactions fill the gaps first.
+    assert manager.reserve_nonces(ALICE, 2) == [12, 14]
+    assert manager.get_gaps(ALICE) == [15]
+    assert manager.reserve_nonces(ALICE, 2) == [15, 17]
+
+    # Without the mempool, only the account nonce is considered.
+    manager = NonceManager(provider, use_mempool=False)
+    assert manager.resync(ALICE).gaps == []
+    assert manager.get_nonce(ALICE) == 10
+
+
+def test_fill_gaps():
+    provider = FakeNetworkProvider()
+    provider.mempool[ALICE.to_bech32()] = [1, 4]
+    manager = NonceManager(provider)
+    sender = FakeTransactionsSender(rejected_nonces={3})
+
+    def create_filler(nonce: int) -> Transaction:
+        transaction = create_transaction(ALICE)
+        transaction.receiver = ALICE.to_bech32()
+        transaction.nonce = nonce
+        return transaction
+
+    assert manager.fill_gaps(ALICE, create_filler, sender) == {0: "hash-0", 2: "hash-2"}
+    assert [transaction.nonce for transaction in sender.sent] == [0, 2]
+
+    # The nonce of the rejected filler is handed out again.
+    assert manager.get_gaps(ALICE) == [3]
+    assert manager.reserve_nonces(ALICE, 2) == [3, 5]
+    assert manager.fill_gaps(ALICE, create_filler, sender) == {}
+
+
+def test_fill_gaps_keeps_nonces_reserved_while_sending():
+    provider = FakeNetworkProvider()
+    provider.mempool[ALICE.to_bech32()] = [2]
+    manager = NonceManager(provider)
+    manager.resync(ALICE)
+
+    class ResyncingSender:
+        def send_transactions(self, transactions: Sequence[ITransaction]) -> Tuple[int, Dict[str, str]]:
+            # A concurrent resync (the fillers are not in the mempool yet) must not hand out the nonces being filled.
+            assert manager.resync(ALICE).gaps == []
+            assert manager.get_nonce(ALICE) == 3
+            return 1, {"0": "hash-0"}
+
+    assert manager.fill_gaps(ALICE, lambda nonce: create_transaction(ALICE), ResyncingSender()) == {0: "hash-0"}
+    # The rejected filler is released.
+    assert manager.get_gaps(ALICE) == [1]
+
+
+def test_fill_gaps_when_no_hashes_are_returned():
+    provider = FakeNetworkProvider()
+    provider.mempool[ALICE.to_bech32()] = [1]
+    manager = NonceManager(provider)
+
+    class RejectingSender:
+        def send_transactions(self, transactions: Sequence[ITransaction]) -> Tuple[int, Dict[str, str]]:
+            return 0, None  # type: ignore
+
+    assert manager.fill_gaps(ALICE, lambda nonce: create_transaction(ALICE), RejectingSender()) == {}
+    assert manager.get_gaps(ALICE) == [0]
@@ -1,11 +1,13 @@
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from typing import (Any, Dict, Iterable, Iterator, List, Optional, Sequence,
+                    Tuple, Union)
 
 import requests
 from requests.auth import AuthBase
 
-from multiversx_sdk.converters.transactions_converter import \
-    TransactionsConverter
+from multiversx_sdk.converters.json_codec import IJsonCodec, create_json_codec
+from multiversx_sdk.converters.transactions_converter import (
+    DEFAULT_JSON_CHUNK_SIZE_IN_BYTES, TransactionsConverter)
 from multiversx_sdk.network_providers.accounts import (AccountOnNetwork,
                                                        GuardianData)
 from multiversx_sdk.network_providers.constants import (DEFAULT_ADDRESS_HRP,
@@ -16,15 +18,20 @@ from multiversx_sdk.network_providers.contract_query_requests import \
 from multiversx_sdk.network_providers.contract_query_response import \
     ContractQueryResponse
 from multiversx_sdk.network_providers.errors import GenericError
+from multiversx_sdk.network_providers.http_requests import (RequestBody,
+                                                            send_request)
+from multiversx_sdk.network_providers.instrumentation import IRequestHook
 from multiversx_sdk.network_providers.interface import IAddress, IContractQuery
 from multiversx_sdk.network_providers.network_config import NetworkConfig
 from multiversx_sdk.network_providers.network_status import NetworkStatus
-from multiversx_sdk.network_providers.resources import (GenericResponse,
-                                                        SimulateResponse)
+from multiversx_sdk.network_providers.rate_limiter import RateLimiter
+from multiversx_sdk.network_providers.resources import (
+    GenericResponse, SimulateResponse, TransactionCostResponse)
 from multiversx_sdk.network_providers.token_definitions import (
     DefinitionOfFungibleTokenOnNetwork, DefinitionOfTokenCollectionOnNetwork)
 from multiversx_sdk.network_providers.tokens import (
-    FungibleTokenOfAccountOnNetwork, NonFungibleTokenOfAccountOnNetwork)
+    FungibleTokenOfAccountOnNetwork, NonFungibleTokenOfAccountOnNetwork,
+    TokensOfAccountOnNetwork)
 from multiversx_sdk.network_providers.transaction_status import \
     TransactionStatus
 from multiversx_sdk.network_providers.transactions import (
@@ -36,11 +43,19 @@ class ProxyNetworkProvider:
             self,
             url: str,
             auth: Union[AuthBase, None] = None,
-            address_hrp: str = DEFAULT_ADDRESS_HRP
+            address_hrp: str = DEFAULT_ADDRESS_HRP,
+            json_codec: Optional[IJsonCodec] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            request_hooks: Optional[Sequence[IRequestHook]] = None,
+            session: Optional[requests.Session] = None
     ) -> None:
         self.url = url
         self.auth = auth
         self.address_hrp = address_hrp
+        self.json_codec = json_codec or create_json_codec()
+        self.rate_limiter = rate_limiter
+        self.request_hooks: List[IRequestHook] = list(request_hooks or [])
+        self.session = session
 
     def get_network_config(self) -> NetworkConfig:
         response = self.do_get_generic('network/config')
@@ -82,6 +97,42 @@ class ProxyNetworkProvider:
         result = [NonFungibleTokenOfAccountOnNetwork.from_proxy_http_response(nft) for nft in nfts]
         return list(result)
 
+    def get_tokens_of_account(self, address: IAddress, limit: Optional[int] = None) -> TokensOfAccountOnNetwork:
+        """
+        Fetches all the tokens of the account (fungible and non-fungible) with a single request, splitting them in one pass.
+        If `limit` is provided, at most that many tokens are parsed and returned (see "is_truncated").
+        """
+        result = TokensOfAccountOnNetwork()
+
+        for token in self.iterate_tokens_of_account(address):
+            if limit is not None and len(result.fungible_tokens) + len(result.nonfungible_tokens) >= limit:
+                result.is_truncated = True
+                break
+
+            if isinstance(token, FungibleTokenOfAccountOnNetwork):
+                result.fungible_tokens.append(token)
+            else:
+                result.nonfungible_tokens.append(token)
+
+        return result
+
+    def iterate_tokens_of_account(self, address: IAddress) -> Iterator[Union[FungibleTokenOfAccountOnNetwork, NonFungibleTokenOfAccountOnNetwork]]:
+        """
+        Fetches all the tokens of the account with a single request, then parses and yields them one by one (in the order returned by the Proxy),
+        so that callers can stop early, or process very large inventories without holding all the parsed tokens in memory.
+        """
+        url = f'address/{address.to_bech32()}/esdt'
+        response = self.do_get_generic(url)
+        items: Dict[str, Any] = response.get('esdts') or {}
+
+        for item in items.values():
+            nonce = item.get('nonce', '')
+
+            if nonce == '':
+                yield FungibleTokenOfAccountOnNetwork.from_http_response(item)
+            elif nonce > 0:
+                yield NonFungibleTokenOfAccountOnNetwork.from_proxy_http_response(item)
+
     def get_fungible_token_of_account(self, address: IAddress, identifier: str) -> FungibleTokenOfAccountOnNetwork:
         response = self.do_get_generic(f'address/{address.to_bech32()}/esdt/{identifier}')
         token = FungibleTokenOfAccountOnNetwork.from_http_response(response.get('tokenData'))
@@ -119,14 +170,36 @@ class ProxyNetworkProvider:
         return status
 
     def send_transaction(self, transaction: ITransaction) -> str:
-        transactions_converter = TransactionsConverter()
+        transactions_converter = TransactionsConverter(self.json_codec)
         response = self.do_post_generic('transaction/send', transactions_converter.transaction_to_dictionary(transaction))
         return response.get('txHash', '')
 
     def send_transactions(self, transactions: Sequence[ITransaction]) -> Tuple[int, Dict[str, str]]:
-        transactions_converter = TransactionsConverter()
+        transactions_converter = TransactionsConverter(self.json_codec)
         transactions_as_dictionaries = [transactions_converter.transaction_to_dictionary(transaction) for transaction in transactions]
         response = self.do_post_generic('transaction/send-multiple', transactions_as_dictionaries)
+        return self._get_sent_transactions(response)
+
+    def send_transactions_streamed(self,
+                                   transactions: Iterable[ITransaction],
+                                   chunk_size_in_bytes: int = DEFAULT_JSON_CHUNK_SIZE_IN_BYTES) -> Tuple[int, Dict[str, str]]:
+        """
+        Same as "send_transactions()", but the request body is serialized incrementally, as the transactions are iterated,
+        and sent using the chunked transfer encoding - so that the memory used does not grow with the number of transactions.
+        The request is only retried (e.g. when throttled) if the transactions are given as a sequence: an iterator can only be consumed once,
+        thus a throttled request holding an iterator results in an error (and the caller decides what to do).
+
+        Args:
+            transactions (Iterable[ITransaction]): the transactions to send (e.g. a "TransactionBatch", or a generator).
+            chunk_size_in_bytes (int): the (approximate) size of the chunks of the request body.
+        """
+        transactions_converter = TransactionsConverter(self.json_codec)
+        body = transactions_converter.transactions_to_json_stream(transactions, chunk_size_in_bytes)
+        is_iterator = iter(transactions) is transactions
+        response = self._post_body(f'{self.url}/transaction/send-multiple', body, retryable=not is_iterator)
+        return self._get_sent_transactions(response)
+
+    def _get_sent_transactions(self, response: GenericResponse) -> Tuple[int, Dict[str, str]]:
         # Proxy and Observers have different response format:
         num_sent = response.get("numOfSentTxs", 0) or response.get("txsSent", 0)
         hashes = response.get("txsHashes")
@@ -156,10 +229,16 @@ class ProxyNetworkProvider:
 
     def simulate_transaction(self, transaction: ITransaction) -> SimulateResponse:
         url = "transaction/simulate"
-        transactions_converter = TransactionsConverter()
+        transactions_converter = TransactionsConverter(self.json_codec)
         response = self.do_post_generic(url, transactions_converter.transaction_to_dictionary(transaction))
         return SimulateResponse(response)
 
+    def estimate_transaction_cost(self, transaction: ITransaction) -> TransactionCostResponse:
+        """Simulates the transaction and returns the gas it requires (see "GasEstimator", for many transactions)."""
+        transactions_converter = TransactionsConverter(self.json_codec)
+        response = self.do_post_generic("transaction/cost", transactions_converter.transaction_to_dictionary(transaction))
+        return TransactionCostResponse(response)
+
     def get_hyperblock(self, key: Union[int, str]) -> Dict[str, Any]:
         url = f"hyperblock/by-hash/{key}"
         if str(key).isnumeric():
@@ -181,27 +260,30 @@ class ProxyNetworkProvider:
 
     def do_get(self, url: str) -> GenericResponse:
         try:
-            response = requests.get(url, auth=self.auth)
+            response = self._send("GET", url)
             response.raise_for_status()
-            parsed = response.json()
+            parsed = self.json_codec.loads(response.content)
             return self.get_data(parsed, url)
         except requests.HTTPError as err:
             error_data = self._extract_error_from_response(err.response)
-            raise GenericError(url, error_data)
+            raise GenericError(url, error_data, err.response.status_code)
         except requests.ConnectionError as err:
             raise GenericError(url, err)
         except Exception as err:
             raise GenericError(url, err)
 
     def do_post(self, url: str, payload: Any) -> GenericResponse:
+        return self._post_body(url, self.json_codec.dumps(payload))
+
+    def _post_body(self, url: str, body: RequestBody, retryable: bool = True) -> GenericResponse:
         try:
-            response = requests.post(url, json=payload, auth=self.auth)
+            response = self._send("POST", url, body, retryable)
             response.raise_for_status()
-            parsed = response.json()
+            parsed = self.json_codec.loads(response.content)
             return self.get_data(parsed, url)
         except requests.HTTPError as err:
             error_data = self._extract_error_from_response(err.response)
-            raise GenericError(url, error_data)
+            raise GenericError(url, error_data, err.response.status_code)
         except requests.ConnectionError as err:
             raise GenericError(url, err)
         except Exception as err:
@@ -217,6 +299,9 @@ class ProxyNetworkProvider:
         data: Dict[str, Any] = parsed.get("data", dict())
         return GenericResponse(data)
 
+    def _send(self, method: str, url: str, data: Optional[RequestBody] = None, retryable: bool = True) -> requests.Response:
+        return send_request(method, url, data, self.auth, self.rate_limiter, self.request_hooks, self.url, self.session, retryable)
+
     def _extract_error_from_response(self, response: Any):
         try:
             return response.json()
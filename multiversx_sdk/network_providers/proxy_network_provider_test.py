@@ -1,9 +1,19 @@
+from typing import Any, Tuple
+
 import pytest
 
 from multiversx_sdk.core.address import Address
 from multiversx_sdk.core.transaction import Transaction
+from multiversx_sdk.network_providers.errors import GenericError
 from multiversx_sdk.network_providers.proxy_network_provider import (
     ContractQuery, ProxyNetworkProvider)
+from multiversx_sdk.network_providers.rate_limiter import RateLimiter
+from multiversx_sdk.network_providers.tokens import \
+    NonFungibleTokenOfAccountOnNetwork
+from multiversx_sdk.testutils import addresses
+from multiversx_sdk.testutils.mock_proxy_server import MockProxyServer
+
+ALICE = Address.new_from_bech32(addresses.ALICE)
 
 
 @pytest.mark.networkInteraction
@@ -77,6 +87,18 @@ class TestProxy:
         assert result.type == ""
         assert result.royalties == 25
 
+    def test_get_tokens_of_account(self):
+        address = Address.new_from_bech32(
+            "erd1487vz5m4zpxjyqw4flwa3xhnkzg4yrr3mkzf5sf0zgt94hjprc8qazcccl"
+        )
+        result = self.proxy.get_tokens_of_account(address)
+
+        fungible_tokens = self.proxy.get_fungible_tokens_of_account(address)
+        nonfungible_tokens = self.proxy.get_nonfungible_tokens_of_account(address)
+        assert [token.identifier for token in result.fungible_tokens] == [token.identifier for token in fungible_tokens]
+        assert [token.identifier for token in result.nonfungible_tokens] == [token.identifier for token in nonfungible_tokens]
+        assert not result.is_truncated
+
     def test_get_transaction_status(self):
         result = self.proxy.get_transaction_status(
             "9d47c4b4669cbcaa26f5dec79902dd20e55a0aa5f4b92454a74e7dbd0183ad6c"
@@ -232,3 +254,81 @@ class TestProxy:
         num_txs, hashes = self.proxy.send_transactions(transactions)
         assert num_txs == 2
         assert hashes == {"0": f"{expected_hashes[0]}", "1": f"{expected_hashes[1]}"}
+
+
+def test_get_tokens_of_account_with_a_single_request():
+    with MockProxyServer() as server:
+        server.serve_tokens(num_fungible_tokens=3, num_nonfungible_tokens=2)
+        proxy = ProxyNetworkProvider(server.url)
+
+        result = proxy.get_tokens_of_account(ALICE)
+        assert server.num_requests == 1
+
+        assert [(token.identifier, token.balance) for token in result.fungible_tokens] == [("FUNG0-abcdef", 1), ("FUNG1-abcdef", 2), ("FUNG2-abcdef", 3)]
+        assert [(token.identifier, token.collection, token.nonce) for token in result.nonfungible_tokens] == [("NFT-abcdef-01", "NFT-abcdef", 1), ("NFT-abcdef-02", "NFT-abcdef", 2)]
+        assert result.nonfungible_tokens[0].royalties == 7.5
+        assert not result.is_truncated
+
+        # Same as the dedicated (but separately fetched) lists.
+        fungible_tokens = proxy.get_fungible_tokens_of_account(ALICE)
+        nonfungible_tokens = proxy.get_nonfungible_tokens_of_account(ALICE)
+        assert [token.raw_response for token in result.fungible_tokens] == [token.raw_response for token in fungible_tokens]
+        assert [_describe_nonfungible_token(token) for token in result.nonfungible_tokens] == [_describe_nonfungible_token(token) for token in nonfungible_tokens]
+
+
+def test_get_tokens_of_account_with_limit():
+    with MockProxyServer() as server:
+        server.serve_tokens(num_fungible_tokens=3, num_nonfungible_tokens=2)
+        proxy = ProxyNetworkProvider(server.url)
+
+        result = proxy.get_tokens_of_account(ALICE, limit=4)
+        assert len(result.fungible_tokens) == 3
+        assert len(result.nonfungible_tokens) == 1
+        assert result.is_truncated
+
+        result = proxy.get_tokens_of_account(ALICE, limit=5)
+        assert len(result.fungible_tokens) + len(result.nonfungible_tokens) == 5
+        assert not result.is_truncated
+
+
+def test_iterate_tokens_of_account():
+    with MockProxyServer() as server:
+        server.serve_tokens(num_fungible_tokens=2, num_nonfungible_tokens=1000)
+        proxy = ProxyNetworkProvider(server.url)
+
+        tokens = proxy.iterate_tokens_of_account(ALICE)
+        assert [next(tokens).identifier for _ in range(3)] == ["FUNG0-abcdef", "FUNG1-abcdef", "NFT-abcdef-01"]
+        assert server.num_requests == 1
+
+        assert next(tokens).identifier == "NFT-abcdef-02"
+        assert sum(1 for _ in tokens) == 998
+
+
+def test_send_transactions_streamed():
+    transactions = [Transaction(sender=ALICE.to_bech32(), receiver=ALICE.to_bech32(), gas_limit=50000, chain_id="D", nonce=nonce) for nonce in range(100)]
+
+    with MockProxyServer() as server:
+        proxy = ProxyNetworkProvider(server.url, rate_limiter=RateLimiter(retry_delay_in_milliseconds=1))
+        expected = proxy.send_transactions(transactions)
+        assert expected[0] == 100
+
+        assert proxy.send_transactions_streamed((transaction for transaction in transactions), chunk_size_in_bytes=1024) == expected
+
+        # When throttled, the request is sent again (the transactions are serialized again).
+        server.inject_failures(1, status=429)
+        assert proxy.send_transactions_streamed(transactions, chunk_size_in_bytes=1024) == expected
+        assert server.num_requests == 4
+
+        # An iterator can only be consumed once: when throttled, the request is not sent again.
+        server.inject_failures(1, status=429)
+        with pytest.raises(GenericError) as error:
+            proxy.send_transactions_streamed((transaction for transaction in transactions), chunk_size_in_bytes=1024)
+
+        assert error.value.status_code == 429
+        assert server.num_requests == 5
+        assert proxy.rate_limiter is not None
+        assert proxy.rate_limiter.get_metrics().num_in_flight == 0
+
+
+def _describe_nonfungible_token(token: NonFungibleTokenOfAccountOnNetwork) -> Tuple[Any, ...]:
+    return (token.identifier, token.collection, token.nonce, token.balance, token.attributes, token.creator.to_bech32(), token.royalties)
@@ -0,0 +1,302 @@
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+import requests
+
+ONE_SECOND_IN_MILLISECONDS = 1000
+# The gateway rejected the request (it wasn't processed), thus it can be safely retried, whatever the HTTP method.
+THROTTLING_STATUS_CODES = [429, 503]
+# The request might have been processed, thus it's only retried if it's idempotent.
+TRANSIENT_STATUS_CODES = [502, 504]
+# Same as above: the request might have reached the gateway.
+TRANSIENT_ERRORS = (requests.ConnectionError, requests.Timeout)
+
+T = TypeVar("T")
+
+
+class RateLimiterMetrics:
+    def __init__(self) -> None:
+        self.concurrency_limit: int = 0
+        self.num_in_flight: int = 0
+        self.queue_depth: int = 0
+        self.num_requests: int = 0
+        self.num_throttled: int = 0
+        self.num_retries: int = 0
+
+    def to_dictionary(self) -> Dict[str, Any]:
+        return {
+            "concurrencyLimit": self.concurrency_limit,
+            "numInFlight": self.num_in_flight,
+            "queueDepth": self.queue_depth,
+            "numRequests": self.num_requests,
+            "numThrottled": self.num_throttled,
+            "numRetries": self.num_retries
+        }
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        """
+        Args:
+            rate (float): the number of tokens added each second.
+            capacity (Optional[float]): the maximum number of tokens (i.e. the size of a burst). Defaults to the rate (but at least one token).
+        """
+        self.rate = rate
+        self.capacity = max(capacity or rate, 1)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Takes a token, waiting for one to become available, if necessary."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait_time = (1 - self._tokens) / self.rate
+
+            time.sleep(wait_time)
+
+
+class RetryPolicy:
+    """
+    Retries with bounded exponential backoff. Used by the rate limiter (for HTTP requests),
+    and by the components which call the network providers (e.g. "TransactionsBroadcaster", "HyperblockFollower").
+    """
+
+    def __init__(self,
+                 num_retries: int = 3,
+                 retry_delay_in_milliseconds: int = 500,
+                 max_retry_delay_in_milliseconds: int = 10000) -> None:
+        """
+        Args:
+            num_retries (int): How many times an operation is retried, before giving up.
+            retry_delay_in_milliseconds (int): The delay before the first retry, doubled after each attempt.
+            max_retry_delay_in_milliseconds (int): The upper bound of the delay between retries.
+        """
+        self.num_retries = num_retries
+        self.retry_delay_in_milliseconds = retry_delay_in_milliseconds
+        self.max_retry_delay_in_milliseconds = max_retry_delay_in_milliseconds
+
+    def get_delay(self, attempt: int) -> float:
+        """Returns the delay (in seconds) before retrying the given (failed) attempt, counted from 0."""
+        delay = min(self.retry_delay_in_milliseconds * (2 ** attempt), self.max_retry_delay_in_milliseconds)
+        return delay / ONE_SECOND_IN_MILLISECONDS
+
+    def run(self,
+            operation: Callable[[], T],
+            is_retryable: Callable[[Exception], bool],
+            get_retry_delay: Optional[Callable[[Exception, int], float]] = None,
+            stop_event: Optional[threading.Event] = None) -> T:
+        """
+        Calls the operation, and calls it again while it fails with a retryable error (and retries are not exhausted).
+        The last error is raised when giving up.
+
+        Args:
+            operation (Callable[[], T]): the operation to run.
+            is_retryable (Callable[[Exception], bool]): tells whether an error is worth a retry.
+            get_retry_delay (Optional[Callable[[Exception, int], float]]): computes the delay (in seconds) before a retry, given the error and the attempt. Defaults to "get_delay()".
+            stop_event (Optional[threading.Event]): once set, waiting between retries is interrupted, and no more retries are made.
+        """
+        attempt = 0
+
+        while True:
+            try:
+                return operation()
+            except Exception as error:
+                if attempt >= self.num_retries or not is_retryable(error) or (stop_event is not None and stop_event.is_set()):
+                    raise
+
+                delay = get_retry_delay(error, attempt) if get_retry_delay else self.get_delay(attempt)
+
+                if stop_event is None:
+                    time.sleep(delay)
+                elif stop_event.wait(delay):
+                    raise
+
+            attempt += 1
+
+
+class _RetryableResponse(Exception):
+    def __init__(self, response: requests.Response) -> None:
+        super().__init__(f"HTTP {response.status_code}")
+        self.response = response
+
+
+class RateLimiter:
+    """
+    Limits the requests of a network provider:
+     - the request rate, using a token bucket;
+     - the number of concurrent requests, using AIMD (additive increase, multiplicative decrease): the limit grows slowly
+       while requests succeed, and is halved when the gateway throttles us (HTTP 429 or 503);
+     - throttled requests are retried (with bounded exponential backoff, or as instructed by the "Retry-After" header);
+       other failures (connection errors, timeouts, HTTP 502 or 504) are only retried for idempotent requests.
+
+    The same instance should be shared by all the providers (and threads) which talk to a given gateway.
+    """
+
+    def __init__(self,
+                 max_requests_per_second: Optional[float] = None,
+                 burst: Optional[int] = None,
+                 initial_concurrency: int = 8,
+                 min_concurrency: int = 1,
+                 max_concurrency: int = 64,
+                 num_retries: int = 3,
+                 retry_delay_in_milliseconds: int = 500,
+                 max_retry_delay_in_milliseconds: int = 10000) -> None:
+        """
+        Args:
+            max_requests_per_second (Optional[float]): If provided, the request rate is limited accordingly.
+            burst (Optional[int]): How many requests can be sent at once (after a period of inactivity), despite the rate limit.
+            initial_concurrency (int): The initial limit of concurrent requests.
+            min_concurrency (int): The lower bound of the concurrency limit.
+            max_concurrency (int): The upper bound of the concurrency limit.
+            num_retries (int): How many times a request is retried, before giving up.
+            retry_delay_in_milliseconds (int): The delay before the first retry, doubled after each attempt.
+            max_retry_delay_in_milliseconds (int): The upper bound of the delay between retries (also applied to "Retry-After").
+        """
+        self.token_bucket = TokenBucket(max_requests_per_second, burst) if max_requests_per_second else None
+        self.min_concurrency = max(min_concurrency, 1)
+        self.max_concurrency = max(max_concurrency, self.min_concurrency)
+        self.retry_policy = RetryPolicy(num_retries, retry_delay_in_milliseconds, max_retry_delay_in_milliseconds)
+
+        self._concurrency_limit = float(min(max(initial_concurrency, self.min_concurrency), self.max_concurrency))
+        # Incremented on each decrease of the limit: the throttled responses of requests started before a decrease
+        # (i.e. sent within the same "window") must not decrease the limit again.
+        self._generation = 0
+        self._paused_until: float = 0
+        self._num_in_flight = 0
+        self._queue_depth = 0
+        self._num_requests = 0
+        self._num_throttled = 0
+        self._num_retries = 0
+        self._condition = threading.Condition()
+
+    def execute(self, send: Callable[[], requests.Response], idempotent: bool, retryable: bool = True) -> requests.Response:
+        """
+        Sends a request (by calling `send`), once allowed to, and retries it if necessary.
+        The last response is returned (or the last error is raised) when retries are exhausted.
+
+        Args:
+            send (Callable[[], requests.Response]): sends the request.
+            idempotent (bool): whether the request can be retried after transient failures (not only when throttled).
+            retryable (bool): whether the request can be sent again at all (e.g. not when its body can only be iterated once).
+        """
+        def send_once() -> requests.Response:
+            generation = self._acquire()
+
+            try:
+                response = send()
+            except BaseException:
+                # Whatever the error (e.g. a timeout, a broken body stream), the slot is given back.
+                self._release(generation, throttled=False, failed=True)
+                raise
+
+            throttled = response.status_code in THROTTLING_STATUS_CODES
+            self._release(generation, throttled)
+
+            if throttled or (idempotent and response.status_code in TRANSIENT_STATUS_CODES):
+                raise _RetryableResponse(response)
+            return response
+
+        def is_retryable(error: Exception) -> bool:
+            if not retryable:
+                return False
+            return isinstance(error, _RetryableResponse) or (idempotent and isinstance(error, TRANSIENT_ERRORS))
+
+        try:
+            return self.retry_policy.run(send_once, is_retryable, self._get_retry_delay)
+        except _RetryableResponse as error:
+            return error.response
+
+    def get_metrics(self) -> RateLimiterMetrics:
+        with self._condition:
+            metrics = RateLimiterMetrics()
+            metrics.concurrency_limit = int(self._concurrency_limit)
+            metrics.num_in_flight = self._num_in_flight
+            metrics.queue_depth = self._queue_depth
+            metrics.num_requests = self._num_requests
+            metrics.num_throttled = self._num_throttled
+            metrics.num_retries = self._num_retries
+            return metrics
+
+    def _acquire(self) -> int:
+        with self._condition:
+            self._queue_depth += 1
+
+            while True:
+                pause = self._paused_until - time.monotonic()
+
+                if pause > 0:
+                    self._condition.wait(pause)
+                elif self._num_in_flight >= int(self._concurrency_limit):
+                    self._condition.wait()
+                else:
+                    break
+
+            self._num_in_flight += 1
+
+        if self.token_bucket:
+            self.token_bucket.acquire()
+
+        with self._condition:
+            self._queue_depth -= 1
+            self._num_requests += 1
+            return self._generation
+
+    def _release(self, generation: int, throttled: bool, failed: bool = False) -> None:
+        with self._condition:
+            self._num_in_flight -= 1
+
+            if throttled:
+                self._num_throttled += 1
+
+                if generation == self._generation:
+                    self._concurrency_limit = max(self.min_concurrency, self._concurrency_limit / 2)
+                    self._generation += 1
+            elif not failed:
+                self._concurrency_limit = min(self.max_concurrency, self._concurrency_limit + 1 / self._concurrency_limit)
+
+            self._condition.notify_all()
+
+    def _pause(self, delay: float) -> None:
+        with self._condition:
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+
+    def _get_retry_delay(self, error: Exception, attempt: int) -> float:
+        delay = self.retry_policy.get_delay(attempt)
+
+        if isinstance(error, _RetryableResponse):
+            retry_after = self._get_retry_after(error.response)
+            delay = delay if retry_after is None else retry_after
+
+            if error.response.status_code in THROTTLING_STATUS_CODES:
+                self._pause(delay)
+
+        with self._condition:
+            self._num_retries += 1
+
+        return delay
+
+    def _get_retry_after(self, response: requests.Response) -> Optional[float]:
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+
+        return min(max(delay, 0), self.retry_policy.max_retry_delay_in_milliseconds / ONE_SECOND_IN_MILLISECONDS)
@@ -0,0 +1,241 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import pytest
+import requests
+
+from multiversx_sdk.network_providers.errors import GenericError
+from multiversx_sdk.network_providers.proxy_network_provider import \
+    ProxyNetworkProvider
+from multiversx_sdk.network_providers.rate_limiter import (RateLimiter,
+                                                           RetryPolicy,
+                                                           TokenBucket)
+from multiversx_sdk.testutils.mock_proxy_server import MockProxyServer
+
+
+def create_response(status_code: int, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return response
+
+
+class FakeGateway:
+    def __init__(self, statuses: List[int], headers: Optional[Dict[str, str]] = None) -> None:
+        self.statuses = statuses
+        self.headers = headers
+        self.num_calls = 0
+
+    def send(self) -> requests.Response:
+        status = self.statuses[min(self.num_calls, len(self.statuses) - 1)]
+        self.num_calls += 1
+        return create_response(status, self.headers)
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=100, capacity=5)
+
+    start = time.perf_counter()
+    for _ in range(15):
+        bucket.acquire()
+    duration = time.perf_counter() - start
+
+    # The first 5 tokens are available right away, the next ones come every 10 milliseconds.
+    assert 0.09 <= duration < 0.5
+
+
+def test_concurrency_limit_decreases_multiplicatively_and_increases_additively():
+    limiter = RateLimiter(initial_concurrency=16, num_retries=0)
+
+    limiter.execute(FakeGateway([429]).send, idempotent=True)
+    assert limiter.get_metrics().concurrency_limit == 8
+
+    limiter.execute(FakeGateway([503]).send, idempotent=True)
+    assert limiter.get_metrics().concurrency_limit == 4
+
+    # The limit grows by one after (about) "limit" successful requests.
+    for _ in range(5):
+        limiter.execute(FakeGateway([200]).send, idempotent=True)
+    assert limiter.get_metrics().concurrency_limit == 5
+
+    metrics = limiter.get_metrics().to_dictionary()
+    assert metrics["numRequests"] == 7
+    assert metrics["numThrottled"] == 2
+
+
+def test_concurrency_limit_is_bounded():
+    limiter = RateLimiter(initial_concurrency=2, min_concurrency=2, max_concurrency=3, num_retries=0)
+
+    for _ in range(3):
+        limiter.execute(FakeGateway([429]).send, idempotent=True)
+    assert limiter.get_metrics().concurrency_limit == 2
+
+    for _ in range(20):
+        limiter.execute(FakeGateway([200]).send, idempotent=True)
+    assert limiter.get_metrics().concurrency_limit == 3
+
+
+def test_throttled_requests_within_same_window_decrease_limit_once():
+    limiter = RateLimiter(initial_concurrency=8, num_retries=0)
+    barrier = threading.Barrier(4)
+
+    def send() -> requests.Response:
+        barrier.wait()
+        return create_response(429)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: limiter.execute(send, idempotent=True), range(4)))
+
+    assert limiter.get_metrics().concurrency_limit == 4
+    assert limiter.get_metrics().num_throttled == 4
+
+
+def test_concurrent_requests_do_not_exceed_limit():
+    limiter = RateLimiter(initial_concurrency=3, max_concurrency=3)
+    lock = threading.Lock()
+    in_flight: List[int] = [0]
+    max_in_flight: List[int] = [0]
+    max_queue_depth: List[int] = [0]
+
+    def send() -> requests.Response:
+        with lock:
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+            max_queue_depth[0] = max(max_queue_depth[0], limiter.get_metrics().queue_depth)
+        time.sleep(0.005)
+        with lock:
+            in_flight[0] -= 1
+        return create_response(200)
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        list(executor.map(lambda _: limiter.execute(send, idempotent=True), range(30)))
+
+    assert max_in_flight[0] == 3
+    assert max_queue_depth[0] > 0
+    assert limiter.get_metrics().num_in_flight == 0
+    assert limiter.get_metrics().queue_depth == 0
+
+
+def test_retries():
+    limiter = RateLimiter(num_retries=2, retry_delay_in_milliseconds=1)
+
+    # Throttled requests are retried, even if not idempotent.
+    gateway = FakeGateway([429, 429, 200])
+    assert limiter.execute(gateway.send, idempotent=False).status_code == 200
+    assert gateway.num_calls == 3
+
+    # Retries are bounded.
+    gateway = FakeGateway([503])
+    assert limiter.execute(gateway.send, idempotent=True).status_code == 503
+    assert gateway.num_calls == 3
+
+    # Other failures are only retried for idempotent requests.
+    gateway = FakeGateway([502, 200])
+    assert limiter.execute(gateway.send, idempotent=True).status_code == 200
+    gateway = FakeGateway([502, 200])
+    assert limiter.execute(gateway.send, idempotent=False).status_code == 502
+
+    # Client errors are never retried.
+    gateway = FakeGateway([400, 200])
+    assert limiter.execute(gateway.send, idempotent=True).status_code == 400
+
+    def fail() -> requests.Response:
+        raise requests.ConnectionError("connection refused")
+
+    with pytest.raises(requests.ConnectionError):
+        limiter.execute(fail, idempotent=False)
+
+    assert limiter.get_metrics().num_retries == 5
+
+
+def test_failed_requests_give_back_their_slot():
+    limiter = RateLimiter(initial_concurrency=1, max_concurrency=1, num_retries=1, retry_delay_in_milliseconds=1)
+
+    for error in [requests.ReadTimeout("timed out"), requests.exceptions.ChunkedEncodingError("broken"), ValueError("stream consumed")]:
+        def fail() -> requests.Response:
+            raise error
+
+        with pytest.raises(type(error)):
+            limiter.execute(fail, idempotent=False)
+
+        assert limiter.get_metrics().num_in_flight == 0
+        assert limiter.get_metrics().concurrency_limit == 1
+
+    # Timeouts are retried for idempotent requests (and the slot of the failed attempt is given back).
+    calls: List[str] = []
+
+    def time_out_once() -> requests.Response:
+        calls.append("call")
+        if len(calls) == 1:
+            raise requests.ReadTimeout("timed out")
+        return create_response(200)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(limiter.execute, time_out_once, True).result(timeout=5).status_code == 200
+
+    assert len(calls) == 2
+    assert limiter.get_metrics().num_in_flight == 0
+
+
+def test_retry_policy():
+    policy = RetryPolicy(num_retries=2, retry_delay_in_milliseconds=1, max_retry_delay_in_milliseconds=3)
+    assert [policy.get_delay(attempt) for attempt in range(4)] == [0.001, 0.002, 0.003, 0.003]
+
+    calls: List[int] = []
+
+    def fail() -> None:
+        calls.append(len(calls))
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError):
+        policy.run(fail, is_retryable=lambda _: True)
+    assert len(calls) == 3
+
+    calls.clear()
+    with pytest.raises(ValueError):
+        policy.run(fail, is_retryable=lambda error: "other" in str(error))
+    assert len(calls) == 1
+
+    # Once stopped, no more retries are made.
+    calls.clear()
+    stop_event = threading.Event()
+    stop_event.set()
+    with pytest.raises(ValueError):
+        policy.run(fail, is_retryable=lambda _: True, stop_event=stop_event)
+    assert len(calls) == 1
+
+
+def test_retry_after_is_honored():
+    limiter = RateLimiter(num_retries=1, retry_delay_in_milliseconds=1)
+    gateway = FakeGateway([429, 200], headers={"Retry-After": "0.2"})
+
+    start = time.perf_counter()
+    assert limiter.execute(gateway.send, idempotent=True).status_code == 200
+    assert time.perf_counter() - start >= 0.2
+
+    # "Retry-After" is capped.
+    limiter = RateLimiter(num_retries=1, max_retry_delay_in_milliseconds=10)
+    gateway = FakeGateway([429, 200], headers={"Retry-After": "Wed, 21 Oct 2099 07:28:00 GMT"})
+
+    start = time.perf_counter()
+    assert limiter.execute(gateway.send, idempotent=True).status_code == 200
+    assert time.perf_counter() - start < 1
+
+
+def test_proxy_with_rate_limiter():
+    with MockProxyServer() as server:
+        server.serve_hyperblocks(highest_nonce=10)
+
+        proxy = ProxyNetworkProvider(server.url)
+        server.inject_failures(1, status=429, headers={"Retry-After": "0"})
+        with pytest.raises(GenericError) as error:
+            proxy.get_network_status()
+        assert error.value.status_code == 429
+
+        limiter = RateLimiter(retry_delay_in_milliseconds=1)
+        proxy = ProxyNetworkProvider(server.url, rate_limiter=limiter)
+        server.inject_failures(2, status=429, headers={"Retry-After": "0"})
+        assert proxy.get_network_status().highest_final_nonce == 10
+        assert limiter.get_metrics().num_throttled == 2
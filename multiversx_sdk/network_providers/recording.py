@@ -0,0 +1,222 @@
+import hashlib
+import json
+import mmap
+import os
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+ONE_SECOND_IN_MILLISECONDS = 1000
+RECORDING_FORMAT_VERSION = 1
+INDEX_FILE_SUFFIX = ".index.json"
+
+# A recorded response: (offset, length) of its compressed body in the data file, HTTP status and the original latency.
+RecordedResponse = Tuple[int, int, int, float]
+
+
+class RecordingNotFoundError(Exception):
+    def __init__(self, method: str, url: str) -> None:
+        super().__init__(f"No recorded response for {method} {url}")
+
+
+class RecordingFormatError(Exception):
+    def __init__(self, path: str, message: str) -> None:
+        super().__init__(f"Bad recording [{path}]: {message}")
+
+
+def get_request_key(method: str, url: str, body: Union[bytes, str, None]) -> str:
+    """
+    The lookup key of a request: only the path and the query of the URL are considered, so that recordings are portable across hosts.
+    Streamed bodies (sent in chunks) are not considered, so that they aren't consumed (repeated requests are replayed in order, anyway).
+    """
+    parts = urlsplit(url)
+    target = f"{parts.path}?{parts.query}" if parts.query else parts.path
+    body_as_bytes = body.encode() if isinstance(body, str) else (body if isinstance(body, bytes) else b"")
+
+    digest = hashlib.sha256()
+    digest.update(f"{method.upper()} {target}\n".encode())
+    digest.update(body_as_bytes)
+    return digest.hexdigest()[:32]
+
+
+class RecordingWriter:
+    """
+    Saves HTTP responses in a compact format: the (zlib-compressed) bodies are appended to a data file, while the
+    index (request key -> offsets, statuses and latencies) is saved, as JSON, next to it (see "INDEX_FILE_SUFFIX").
+    The same request might be recorded more than once (e.g. when polling), in which case the responses are replayed in order.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path = os.fspath(path)
+        self._index: Dict[str, List[RecordedResponse]] = {}
+        self._requests: Dict[str, str] = {}
+        self._file = open(self.path, "wb")
+        self._offset = 0
+        self._lock = threading.Lock()
+
+    def record(self, method: str, url: str, request_body: Union[bytes, str, None], status_code: int, response_body: bytes, latency_in_milliseconds: float) -> None:
+        key = get_request_key(method, url, request_body)
+        compressed = zlib.compress(response_body)
+
+        with self._lock:
+            self._file.write(compressed)
+            self._index.setdefault(key, []).append((self._offset, len(compressed), status_code, round(latency_in_milliseconds, 3)))
+            self._requests.setdefault(key, f"{method.upper()} {url}")
+            self._offset += len(compressed)
+
+    def flush(self) -> None:
+        """Writes the index (atomically) and flushes the data file, so that the recording can be replayed."""
+        with self._lock:
+            self._file.flush()
+
+            index = {"version": RECORDING_FORMAT_VERSION, "responses": self._index, "requests": self._requests}
+            temporary_path = f"{self.path}{INDEX_FILE_SUFFIX}.tmp"
+            Path(temporary_path).write_text(json.dumps(index))
+            os.replace(temporary_path, f"{self.path}{INDEX_FILE_SUFFIX}")
+
+    def close(self) -> None:
+        self.flush()
+        self._file.close()
+
+    def __enter__(self) -> "RecordingWriter":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class RecordingReader:
+    """Loads the index of a recording in memory (for O(1) lookups) and maps the data file, reading the bodies on demand."""
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path = os.fspath(path)
+        index = json.loads(Path(f"{self.path}{INDEX_FILE_SUFFIX}").read_text())
+
+        if index.get("version") != RECORDING_FORMAT_VERSION:
+            raise RecordingFormatError(self.path, f"unsupported version: {index.get('version')}")
+
+        self._index: Dict[str, List[RecordedResponse]] = {
+            key: [cast(RecordedResponse, tuple(item)) for item in items] for key, items in index["responses"].items()
+        }
+        self._positions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        with open(self.path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            self._data: Union[mmap.mmap, bytes] = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+
+    def __len__(self) -> int:
+        return sum(len(items) for items in self._index.values())
+
+    def lookup(self, method: str, url: str, body: Union[bytes, str, None]) -> Optional[Tuple[int, bytes, float]]:
+        """
+        Returns the next recorded response (status, body, latency) of the request. Once all the recorded responses
+        of a request have been served, the last one is served again.
+        """
+        key = get_request_key(method, url, body)
+        items = self._index.get(key)
+        if not items:
+            return None
+
+        with self._lock:
+            position = self._positions.get(key, 0)
+            self._positions[key] = min(position + 1, len(items) - 1)
+
+        offset, length, status_code, latency = items[position]
+        return status_code, zlib.decompress(self._data[offset:offset + length]), latency
+
+    def rewind(self) -> None:
+        """Restarts the replay from the first recorded responses."""
+        with self._lock:
+            self._positions.clear()
+
+    def close(self) -> None:
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+
+class RecordingAdapter(BaseAdapter):
+    """A transport adapter which sends the requests over the network (using the wrapped adapter) and records the responses."""
+
+    def __init__(self, writer: RecordingWriter, adapter: Optional[BaseAdapter] = None) -> None:
+        super().__init__()
+        self.writer = writer
+        self.adapter = adapter or HTTPAdapter()
+
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:
+        start = time.perf_counter()
+        response = self.adapter.send(request, *args, **kwargs)
+        content = response.content
+        latency = (time.perf_counter() - start) * ONE_SECOND_IN_MILLISECONDS
+
+        self.writer.record(request.method or "GET", request.url or "", request.body, response.status_code, content, latency)
+        return response
+
+    def close(self) -> None:
+        self.adapter.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """A transport adapter which serves recorded responses (see "RecordingReader"), optionally simulating the latency."""
+
+    def __init__(self, reader: RecordingReader, latency_in_milliseconds: Optional[float] = None, use_recorded_latency: bool = False) -> None:
+        """
+        Args:
+            reader (RecordingReader): The recording to replay.
+            latency_in_milliseconds (Optional[float]): If provided, each response is delayed by this long.
+            use_recorded_latency (bool): If set, each response is delayed as it was when recorded (takes precedence over "latency_in_milliseconds").
+        """
+        super().__init__()
+        self.reader = reader
+        self.latency_in_milliseconds = latency_in_milliseconds
+        self.use_recorded_latency = use_recorded_latency
+
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:
+        method = request.method or "GET"
+        url = request.url or ""
+        recorded = self.reader.lookup(method, url, request.body)
+
+        if recorded is None:
+            raise RecordingNotFoundError(method, url)
+
+        status_code, content, recorded_latency = recorded
+        latency = recorded_latency if self.use_recorded_latency else self.latency_in_milliseconds
+        if latency:
+            time.sleep(latency / ONE_SECOND_IN_MILLISECONDS)
+
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = content
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json", "Content-Length": str(len(content))})
+        response.url = url
+        response.request = request
+        response.encoding = "utf-8"
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def create_recording_session(writer: RecordingWriter) -> requests.Session:
+    """Creates a session (to be passed to a network provider) which records all the responses."""
+    session = requests.Session()
+    adapter = RecordingAdapter(writer)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def create_replay_session(reader: RecordingReader, latency_in_milliseconds: Optional[float] = None, use_recorded_latency: bool = False) -> requests.Session:
+    """Creates a session (to be passed to a network provider) which serves recorded responses, without any network access."""
+    session = requests.Session()
+    adapter = ReplayAdapter(reader, latency_in_milliseconds, use_recorded_latency)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
@@ -0,0 +1,96 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from multiversx_sdk.network_providers.errors import GenericError
+from multiversx_sdk.network_providers.proxy_network_provider import \
+    ProxyNetworkProvider
+from multiversx_sdk.network_providers.recording import (
+    RecordingReader, RecordingWriter, create_recording_session,
+    create_replay_session)
+from multiversx_sdk.testutils.mock_proxy_server import MockProxyServer
+
+
+def record_hyperblocks(path: Path, num_hyperblocks: int, num_transactions_per_hyperblock: int) -> int:
+    with MockProxyServer() as server, RecordingWriter(path) as writer:
+        server.serve_hyperblocks(highest_nonce=num_hyperblocks, num_transactions_per_hyperblock=num_transactions_per_hyperblock)
+        proxy = ProxyNetworkProvider(server.url, session=create_recording_session(writer))
+
+        for nonce in range(1, num_hyperblocks + 1):
+            proxy.get_hyperblock(nonce)
+
+        return server.num_requests
+
+
+def test_record_and_replay(tmp_path: Path):
+    path = tmp_path / "proxy.recording"
+
+    with MockProxyServer(latency_in_milliseconds=20) as server, RecordingWriter(path) as writer:
+        server.serve_hyperblocks(highest_nonce=5, num_transactions_per_hyperblock=3)
+        proxy = ProxyNetworkProvider(server.url, session=create_recording_session(writer))
+
+        recorded_status = proxy.get_network_status()
+        recorded_hyperblocks = [proxy.get_hyperblock(nonce) for nonce in range(1, 6)]
+        recorded_hashes = proxy.do_post_generic("transaction/send-multiple", [{"nonce": 1}, {"nonce": 2}]).to_dictionary()
+
+        server.highest_hyperblock_nonce = 6
+        assert proxy.get_network_status().highest_final_nonce == 6
+
+        with pytest.raises(GenericError):
+            proxy.get_hyperblock(7)
+
+    reader = RecordingReader(path)
+    assert len(reader) == 9
+
+    # Replayed against a different host, without any network access.
+    proxy = ProxyNetworkProvider("https://example.multiversx.com", session=create_replay_session(reader))
+
+    assert proxy.get_network_status().highest_final_nonce == recorded_status.highest_final_nonce
+    assert [proxy.get_hyperblock(nonce) for nonce in range(1, 6)] == recorded_hyperblocks
+    assert proxy.do_post_generic("transaction/send-multiple", [{"nonce": 1}, {"nonce": 2}]).to_dictionary() == recorded_hashes
+
+    # Responses of the same request are replayed in order, then the last one is repeated.
+    assert proxy.get_network_status().highest_final_nonce == 6
+    assert proxy.get_network_status().highest_final_nonce == 6
+
+    with pytest.raises(GenericError) as error:
+        proxy.get_hyperblock(7)
+    assert error.value.status_code == 404
+
+    with pytest.raises(GenericError, match="No recorded response"):
+        proxy.get_hyperblock(8)
+
+    with pytest.raises(GenericError, match="No recorded response"):
+        proxy.do_post_generic("transaction/send-multiple", [{"nonce": 3}])
+
+    reader.rewind()
+    assert proxy.get_network_status().highest_final_nonce == recorded_status.highest_final_nonce
+    reader.close()
+
+
+def test_replay_with_simulated_latency(tmp_path: Path):
+    path = tmp_path / "proxy.recording"
+    record_hyperblocks(path, num_hyperblocks=3, num_transactions_per_hyperblock=1)
+
+    proxy = ProxyNetworkProvider("http://localhost", session=create_replay_session(RecordingReader(path), latency_in_milliseconds=50))
+
+    start = time.perf_counter()
+    for nonce in range(1, 4):
+        proxy.get_hyperblock(nonce)
+    assert time.perf_counter() - start >= 0.15
+
+
+def test_recording_is_compact(tmp_path: Path):
+    path = tmp_path / "proxy.recording"
+    record_hyperblocks(path, num_hyperblocks=10, num_transactions_per_hyperblock=100)
+
+    raw_size = sum(len(ProxyNetworkProvider("").json_codec.dumps(proxy_response)) for proxy_response in _replay_hyperblocks(path, 10))
+    recorded_size = os.path.getsize(path) + os.path.getsize(f"{path}.index.json")
+    assert recorded_size < raw_size / 4
+
+
+def _replay_hyperblocks(path: Path, num_hyperblocks: int):
+    proxy = ProxyNetworkProvider("http://localhost", session=create_replay_session(RecordingReader(path)))
+    return [proxy.get_hyperblock(nonce) for nonce in range(1, num_hyperblocks + 1)]
@@ -20,6 +20,22 @@ class EmptyAddress:
         return ""
 
 
+class TransactionCostResponse:
+    def __init__(self, response: GenericResponse) -> None:
+        self.raw = response.to_dictionary()
+        self.gas_limit: int = response.get("txGasUnits", 0) or 0
+        self.return_message: str = response.get("returnMessage", "") or ""
+
+    def is_successful(self) -> bool:
+        return self.gas_limit > 0 and not self.return_message
+
+    def to_dictionary(self) -> Dict[str, Any]:
+        return {
+            "gasLimit": self.gas_limit,
+            "returnMessage": self.return_message
+        }
+
+
 class SmartContractResult:
     def __init__(self, raw: Dict[str, Any]) -> None:
         self.raw = raw
@@ -98,3 +98,13 @@ class NonFungibleTokenOfAccountOnNetwork:
         collection = '-'.join(parts[0:2])
 
         return collection
+
+
+class TokensOfAccountOnNetwork:
+    """The tokens held by an account, split into fungible and non-fungible ones (SFTs, NFTs, Meta ESDTs)."""
+
+    def __init__(self) -> None:
+        self.fungible_tokens: List[FungibleTokenOfAccountOnNetwork] = []
+        self.nonfungible_tokens: List[NonFungibleTokenOfAccountOnNetwork] = []
+        # Set if not all the tokens have been included (because of a limit).
+        self.is_truncated: bool = False
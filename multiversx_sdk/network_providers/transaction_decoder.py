@@ -1,5 +1,7 @@
 import binascii
-from typing import Any, Dict, List, Optional, Protocol
+import re
+from typing import (Any, Callable, Dict, Iterable, List, Optional, Protocol,
+                    Tuple)
 
 from multiversx_sdk.core import TokenTransfer
 from multiversx_sdk.core.address import Address
@@ -8,6 +10,9 @@ from multiversx_sdk.network_providers.interface import IAddress
 
 DEFAULT_HRP = "erd"
 
+# A function name, followed by arguments made of hex digits (pairs).
+_CALL_DATA_PATTERN = re.compile("[^@]*(?:@(?:[0-9a-fA-F]{2})*)*")
+
 
 class ITransactionToDecode(Protocol):
     sender: IAddress
@@ -55,40 +60,68 @@ class TransactionMetadata:
 
 
 class TransactionDecoder:
+    def __init__(self) -> None:
+        # The decoders of the (known) token transfers, by function name.
+        self._decode_transfer_by_function_name: Dict[str, Callable[[TransactionMetadata, Dict[Tuple[str, str], str]], Optional[TransactionMetadata]]] = {
+            "ESDTTransfer": self._get_esdt_transaction_metadata,
+            "ESDTNFTTransfer": self._get_nft_transfer_metadata,
+            "MultiESDTNFTTransfer": self._get_multi_transfer_metadata
+        }
+
     def get_transaction_metadata(self, transaction: ITransactionToDecode) -> TransactionMetadata:
-        metadata = self.get_normal_transaction_metadata(transaction)
+        return self._get_transaction_metadata(transaction, {})
 
-        esdt_metadata = self.get_esdt_transaction_metadata(metadata)
-        if esdt_metadata:
-            return esdt_metadata
+    def get_transactions_metadata(self, transactions: Iterable[ITransactionToDecode]) -> List[TransactionMetadata]:
+        """
+        Decodes the metadata of many transactions (e.g. a page of an activity feed).
+        The bech32 representations of the addresses are computed once for the whole batch.
 
-        nft_metadata = self.get_nft_transfer_metadata(metadata)
-        if nft_metadata:
-            return nft_metadata
+        Args:
+            transactions: the transactions to decode.
+        """
+        bech32_addresses: Dict[Tuple[str, str], str] = {}
+        return [self._get_transaction_metadata(transaction, bech32_addresses) for transaction in transactions]
 
-        multi_metadata = self.get_multi_transfer_metadata(metadata)
-        if multi_metadata:
-            return multi_metadata
+    def get_normal_transaction_metadata(self, transaction: ITransactionToDecode) -> TransactionMetadata:
+        return self._get_normal_transaction_metadata(transaction, {})
 
-        return metadata
+    def get_esdt_transaction_metadata(self, metadata: TransactionMetadata) -> Optional[TransactionMetadata]:
+        return self._get_esdt_transaction_metadata(metadata, {})
 
-    def get_normal_transaction_metadata(self, transaction: ITransactionToDecode) -> TransactionMetadata:
+    def get_nft_transfer_metadata(self, metadata: TransactionMetadata) -> Optional[TransactionMetadata]:
+        return self._get_nft_transfer_metadata(metadata, {})
+
+    def get_multi_transfer_metadata(self, metadata: TransactionMetadata) -> Optional[TransactionMetadata]:
+        return self._get_multi_transfer_metadata(metadata, {})
+
+    def _get_transaction_metadata(self, transaction: ITransactionToDecode, bech32_addresses: Dict[Tuple[str, str], str]) -> TransactionMetadata:
+        metadata = self._get_normal_transaction_metadata(transaction, bech32_addresses)
+
+        # At most one of the transfer decoders can handle a given function name.
+        decode_transfer = self._decode_transfer_by_function_name.get(metadata.function_name or "")
+        if decode_transfer is None:
+            return metadata
+
+        return decode_transfer(metadata, bech32_addresses) or metadata
+
+    def _get_normal_transaction_metadata(self, transaction: ITransactionToDecode, bech32_addresses: Dict[Tuple[str, str], str]) -> TransactionMetadata:
         metadata = TransactionMetadata()
-        metadata.sender = transaction.sender.to_bech32()
-        metadata.receiver = transaction.receiver.to_bech32()
+        metadata.sender = self._address_to_bech32(transaction.sender, bech32_addresses)
+        metadata.receiver = self._address_to_bech32(transaction.receiver, bech32_addresses)
         metadata.value = transaction.value
 
         if transaction.data:
             data_components = transaction.data.split("@")
 
             args = data_components[1:]
-            if all(self.is_smart_contract_call_argument(x) for x in args):
+            # Fast path: the whole data field is checked at once (the usual case), then the arguments are checked one by one.
+            if _CALL_DATA_PATTERN.fullmatch(transaction.data) or all(self.is_smart_contract_call_argument(x) for x in args):
                 metadata.function_name = data_components[0]
                 metadata.function_args = args
 
         return metadata
 
-    def get_esdt_transaction_metadata(self, metadata: TransactionMetadata) -> Optional[TransactionMetadata]:
+    def _get_esdt_transaction_metadata(self, metadata: TransactionMetadata, bech32_addresses: Dict[Tuple[str, str], str]) -> Optional[TransactionMetadata]:
         if metadata.function_name != "ESDTTransfer":
             return None
 
@@ -119,7 +152,7 @@ class TransactionDecoder:
         result.transfers.append(transfer)
         return result
 
-    def get_nft_transfer_metadata(self, metadata: TransactionMetadata) -> Optional[TransactionMetadata]:
+    def _get_nft_transfer_metadata(self, metadata: TransactionMetadata, bech32_addresses: Dict[Tuple[str, str], str]) -> Optional[TransactionMetadata]:
         if metadata.sender != metadata.receiver:
             return None
 
@@ -139,11 +172,10 @@ class TransactionDecoder:
         collection_identifier = self.hex_to_string(args[0])
         nonce = args[1]
         value = self.hex_to_number(args[2])
-        receiver = Address.new_from_hex(args[3], DEFAULT_HRP)
 
         result = TransactionMetadata()
         result.sender = metadata.sender
-        result.receiver = receiver.to_bech32()
+        result.receiver = self._hex_to_bech32(args[3], bech32_addresses)
         result.value = value
         result.transfers = []
 
@@ -157,7 +189,7 @@ class TransactionDecoder:
 
         return result
 
-    def get_multi_transfer_metadata(self, metadata: TransactionMetadata) -> Optional[TransactionMetadata]:
+    def _get_multi_transfer_metadata(self, metadata: TransactionMetadata, bech32_addresses: Dict[Tuple[str, str], str]) -> Optional[TransactionMetadata]:
         if metadata.sender != metadata.receiver:
             return None
 
@@ -174,7 +206,7 @@ class TransactionDecoder:
         if not self.is_address_valid(args[0]):
             return None
 
-        receiver = Address.new_from_hex(args[0], DEFAULT_HRP)
+        receiver = self._hex_to_bech32(args[0], bech32_addresses)
         transfer_count = self.hex_to_number(args[1])
 
         result = TransactionMetadata()
@@ -202,7 +234,7 @@ class TransactionDecoder:
                 result.transfers.append(transfer)
 
         result.sender = metadata.sender
-        result.receiver = receiver.to_bech32()
+        result.receiver = receiver
 
         if len(args) > index:
             result.function_name = self.hex_to_string(args[index])
@@ -212,6 +244,26 @@ class TransactionDecoder:
 
         return result
 
+    def _address_to_bech32(self, address: IAddress, bech32_addresses: Dict[Tuple[str, str], str]) -> str:
+        key = (getattr(address, "hrp", ""), address.to_hex())
+        bech32_address = bech32_addresses.get(key)
+
+        if bech32_address is None:
+            bech32_address = address.to_bech32()
+            bech32_addresses[key] = bech32_address
+
+        return bech32_address
+
+    def _hex_to_bech32(self, hex: str, bech32_addresses: Dict[Tuple[str, str], str]) -> str:
+        key = (DEFAULT_HRP, hex)
+        bech32_address = bech32_addresses.get(key)
+
+        if bech32_address is None:
+            bech32_address = Address.new_from_hex(hex, DEFAULT_HRP).to_bech32()
+            bech32_addresses[key] = bech32_address
+
+        return bech32_address
+
     def is_address_valid(self, address: str) -> bool:
         return len(binascii.unhexlify(address)) == 32
 
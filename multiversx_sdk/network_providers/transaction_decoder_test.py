@@ -1,9 +1,47 @@
 import base64
+from typing import List
+
+from hypothesis import given
+from hypothesis import strategies as st
 
 from multiversx_sdk.core.address import Address
 from multiversx_sdk.network_providers.transaction_decoder import \
     TransactionDecoder
 from multiversx_sdk.network_providers.transactions import TransactionOnNetwork
+from multiversx_sdk.testutils.addresses import ALICE, BOB
+
+CONTRACT_HEX = "00000000000000000500df3bebe1afa10c40925e833c14a460e10a849f50a468"
+
+
+def create_transaction(sender: str, receiver: str, data: str, value: int = 0) -> TransactionOnNetwork:
+    transaction = TransactionOnNetwork()
+    transaction.sender = Address.new_from_bech32(sender)
+    transaction.receiver = Address.new_from_bech32(receiver)
+    transaction.value = value
+    transaction.data = data
+    return transaction
+
+
+def create_transactions() -> List[TransactionOnNetwork]:
+    return [
+        create_transaction(ALICE, BOB, "", value=10**18),
+        create_transaction(ALICE, BOB, "hello world"),
+        create_transaction(ALICE, BOB, "withdrawGlobalOffer@0173d0"),
+        create_transaction(ALICE, BOB, "ESDTTransfer@544553542d326534306437@02540be400"),
+        create_transaction(ALICE, BOB, "ESDTTransfer@544553542d326534306437@02540be400@73776170@01"),
+        create_transaction(ALICE, ALICE, f"ESDTNFTTransfer@4c4b4d45582d616162393130@2fb4e9@e40f1699@{CONTRACT_HEX}@73776170@0b37@"),
+        create_transaction(ALICE, ALICE, f"MultiESDTNFTTransfer@{CONTRACT_HEX}@02@4c4b4d45582d616162393130@2fe3b0@09b9@555344432d333530633465@@0126@7061795f6d657461@0ede"),
+        create_transaction(ALICE, BOB, f"MultiESDTNFTTransfer@{CONTRACT_HEX}@01@4c4b4d45582d616162393130@@09b9")
+    ]
+
+
+def is_smart_contract_call_argument(arg: str) -> bool:
+    """The previous check of the arguments (one by one)."""
+    try:
+        bytes.fromhex(arg)
+    except ValueError:
+        return False
+    return len(arg) % 2 == 0
 
 
 class TestTransactionDecoder:
@@ -134,3 +172,35 @@ class TestTransactionDecoder:
 
             assert metadata.transfers[1].amount == 1389278024872597502641297
             assert metadata.transfers[1].token.identifier == "USDC-350c4e"
+
+    def test_get_transactions_metadata(self):
+        transactions = create_transactions()
+        metadata = self.transaction_decoder.get_transactions_metadata(transactions)
+
+        assert [item.to_dict() for item in metadata] == [self.transaction_decoder.get_transaction_metadata(transaction).to_dict() for transaction in transactions]
+        assert [item.function_name for item in metadata] == [None, "hello world", "withdrawGlobalOffer", None, "swap", "swap", "pay_meta", "MultiESDTNFTTransfer"]
+        assert [item.receiver for item in metadata[4:]] == [BOB, Address.new_from_hex(CONTRACT_HEX, "erd").to_bech32(), Address.new_from_hex(CONTRACT_HEX, "erd").to_bech32(), BOB]
+        assert metadata[6].to_dict()["transfers"] == [
+            {"value": 0x09b9, "token": "LKMEX-aab910", "nonce": 0x2fe3b0},
+            {"value": 0x0126, "token": "USDC-350c4e", "nonce": 0}
+        ]
+
+    def test_get_transactions_metadata_with_other_hrp(self):
+        alice = Address.new_from_bech32(ALICE)
+        transaction = TransactionOnNetwork()
+        transaction.sender = alice
+        transaction.receiver = Address(alice.pubkey, "test")
+
+        metadata = self.transaction_decoder.get_transactions_metadata([transaction, transaction])
+        assert metadata[1].sender == ALICE
+        assert metadata[1].receiver == Address(alice.pubkey, "test").to_bech32()
+
+    @given(st.text(alphabet="0123456789abcdefABCDEFxyz@ \n", max_size=40))
+    def test_split_data(self, data: str):
+        args = data.split("@")[1:]
+        is_call = all(is_smart_contract_call_argument(arg) for arg in args)
+
+        metadata = self.transaction_decoder.get_normal_transaction_metadata(create_transaction(ALICE, BOB, data))
+
+        assert metadata.function_name == (data.split("@")[0] if data and is_call else None)
+        assert metadata.function_args == (args if data and is_call else None)
@@ -94,39 +94,16 @@ class TransactionOnNetwork:
         tx_hash: str, response: Dict[str, Any]
     ) -> "TransactionOnNetwork":
         result = TransactionOnNetwork()
+        _set_scalar_fields(result, tx_hash, response)
 
-        result.hash = tx_hash
-        result.type = response.get("type", "")
-        result.nonce = response.get("nonce", 0)
-        result.round = response.get("round", 0)
-        result.epoch = response.get("epoch", 0)
-        result.value = response.get("value", 0)
-
-        sender = response.get("sender", "")
-        result.sender = Address.new_from_bech32(sender) if sender else EmptyAddress()
-
-        receiver = response.get("receiver", "")
-        result.receiver = Address.new_from_bech32(receiver) if receiver else EmptyAddress()
-
-        result.gas_price = response.get("gasPrice", 0)
-        result.gas_limit = response.get("gasLimit", 0)
-
-        data = response.get("data", "") or ""
-        result.function = response.get("function", "")
-
-        result.data = base64.b64decode(data).decode()
-        result.status = TransactionStatus(response.get("status"))
-        result.timestamp = response.get("timestamp", 0)
-
-        result.block_nonce = response.get("blockNonce", 0)
-        result.hyperblock_nonce = response.get("hyperblockNonce", 0)
-        result.hyperblock_hash = response.get("hyperblockHash", "")
+        result.sender = _parse_address(response.get("sender", ""))
+        result.receiver = _parse_address(response.get("receiver", ""))
+        result.data = _parse_data(response.get("data", ""))
 
         result.receipt = TransactionReceipt.from_http_response(
             response.get("receipt", {})
         )
         result.logs = TransactionLogs.from_http_response(response.get("logs", {}))
-        result.raw_response = response
 
         return result
 
@@ -155,6 +132,95 @@ class TransactionOnNetwork:
         }
 
 
+class LazyTransactionOnNetwork(TransactionOnNetwork):
+    """
+    Same as "TransactionOnNetwork", but the addresses, the data, the receipt, the contract results and the logs
+    are only parsed (from "raw_response") when they are first accessed.
+    Useful when many transactions are fetched, but only a few of their fields are needed (e.g. the status).
+    """
+    _lazy_fields = {
+        "sender": "_parse_sender",
+        "receiver": "_parse_receiver",
+        "data": "_parse_data",
+        "receipt": "_parse_receipt",
+        "contract_results": "_parse_contract_results",
+        "logs": "_parse_logs",
+    }
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Same as for "TransactionOnNetwork": the contract results are only parsed from the responses of the API ("results")
+        # or of the Proxy ("smartContractResults"); otherwise, there are none.
+        self._contract_results_key: Optional[str] = None
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not (yet) set on the instance.
+        parse_method = LazyTransactionOnNetwork._lazy_fields.get(name)
+        if parse_method is None:
+            raise AttributeError(name)
+
+        value = getattr(self, parse_method)()
+        setattr(self, name, value)
+        return value
+
+    @staticmethod
+    def from_api_http_response(
+        tx_hash: str, response: Dict[str, Any]
+    ) -> "LazyTransactionOnNetwork":
+        result = LazyTransactionOnNetwork.from_http_response(tx_hash, response)
+        result._contract_results_key = "results"
+        result.is_completed = not result.get_status().is_pending()
+        return result
+
+    @staticmethod
+    def from_proxy_http_response(
+        tx_hash: str, response: Dict[str, Any], process_status: Optional[TransactionStatus] = None
+    ) -> "LazyTransactionOnNetwork":
+        result = LazyTransactionOnNetwork.from_http_response(tx_hash, response)
+        result._contract_results_key = "smartContractResults"
+
+        if process_status:
+            result.status = process_status
+            result.is_completed = True if result.status.is_successful() or result.status.is_failed() else False
+
+        return result
+
+    @staticmethod
+    def from_http_response(
+        tx_hash: str, response: Dict[str, Any]
+    ) -> "LazyTransactionOnNetwork":
+        result = LazyTransactionOnNetwork()
+        _set_scalar_fields(result, tx_hash, response)
+
+        # The defaults set by the constructor are removed, so that the fields are parsed on first access.
+        for name in LazyTransactionOnNetwork._lazy_fields:
+            delattr(result, name)
+
+        return result
+
+    def _parse_sender(self) -> IAddress:
+        return _parse_address(self.raw_response.get("sender", ""))
+
+    def _parse_receiver(self) -> IAddress:
+        return _parse_address(self.raw_response.get("receiver", ""))
+
+    def _parse_data(self) -> str:
+        return _parse_data(self.raw_response.get("data", ""))
+
+    def _parse_receipt(self) -> TransactionReceipt:
+        return TransactionReceipt.from_http_response(self.raw_response.get("receipt", {}))
+
+    def _parse_contract_results(self) -> ContractResults:
+        if self._contract_results_key == "results":
+            return ContractResults.from_api_http_response(self.raw_response.get("results", []))
+        if self._contract_results_key == "smartContractResults":
+            return ContractResults.from_proxy_http_response(self.raw_response.get("smartContractResults", []))
+        return ContractResults([])
+
+    def _parse_logs(self) -> TransactionLogs:
+        return TransactionLogs.from_http_response(self.raw_response.get("logs", {}))
+
+
 class TransactionInMempool:
     def __init__(self) -> None:
         self.hash: str = ""
@@ -200,3 +266,31 @@ class TransactionInMempool:
             "gasPrice": self.gas_price,
             "data": self.data
         }
+
+
+def _set_scalar_fields(transaction: TransactionOnNetwork, tx_hash: str, response: Dict[str, Any]) -> None:
+    """Sets the fields which don't need parsing (shared by "TransactionOnNetwork" and "LazyTransactionOnNetwork")."""
+    transaction.hash = tx_hash
+    transaction.type = response.get("type", "")
+    transaction.nonce = response.get("nonce", 0)
+    transaction.round = response.get("round", 0)
+    transaction.epoch = response.get("epoch", 0)
+    transaction.value = response.get("value", 0)
+    transaction.gas_price = response.get("gasPrice", 0)
+    transaction.gas_limit = response.get("gasLimit", 0)
+    transaction.function = response.get("function", "")
+    transaction.status = TransactionStatus(response.get("status"))
+    transaction.timestamp = response.get("timestamp", 0)
+
+    transaction.block_nonce = response.get("blockNonce", 0)
+    transaction.hyperblock_nonce = response.get("hyperblockNonce", 0)
+    transaction.hyperblock_hash = response.get("hyperblockHash", "")
+    transaction.raw_response = response
+
+
+def _parse_address(address: str) -> IAddress:
+    return Address.new_from_bech32(address) if address else EmptyAddress()
+
+
+def _parse_data(data: Optional[str]) -> str:
+    return base64.b64decode(data or "").decode()
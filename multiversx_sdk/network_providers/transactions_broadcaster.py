@@ -0,0 +1,261 @@
+from concurrent.futures import (FIRST_COMPLETED, Future, ThreadPoolExecutor,
+                                wait)
+from typing import (AbstractSet, Dict, List, Optional, Protocol, Sequence, Set,
+                    Tuple)
+
+from multiversx_sdk.network_providers.rate_limiter import RetryPolicy
+from multiversx_sdk.network_providers.transactions import ITransaction
+
+DEFAULT_MAX_CHUNK_SIZE_IN_BYTES = 1024 * 1024
+DEFAULT_MAX_TRANSACTIONS_PER_CHUNK = 1000
+DEFAULT_NUM_WORKERS = 4
+DEFAULT_NUM_RETRIES = 3
+DEFAULT_RETRY_DELAY_IN_MILLISECONDS = 500
+
+# Size of the JSON representation of a transaction (see "TransactionsConverter.transaction_to_dictionary()"),
+# when all its fields are empty, plus the separator between the items of the array.
+TRANSACTION_JSON_OVERHEAD_IN_BYTES = 241
+
+
+class ITransactionsSender(Protocol):
+    def send_transactions(self, transactions: Sequence[ITransaction]) -> Tuple[int, Dict[str, str]]:
+        ...
+
+
+class BroadcastedTransaction:
+    def __init__(self, index: int, transaction: ITransaction) -> None:
+        self.index = index
+        self.transaction = transaction
+        self.hash: str = ""
+        self.is_sent: bool = False
+        self.error: str = ""
+        self.num_attempts: int = 0
+
+    def to_dictionary(self) -> Dict[str, object]:
+        return {
+            "index": self.index,
+            "sender": self.transaction.sender,
+            "nonce": self.transaction.nonce,
+            "hash": self.hash,
+            "isSent": self.is_sent,
+            "error": self.error,
+            "numAttempts": self.num_attempts
+        }
+
+
+class BroadcastResult:
+    def __init__(self, items: List[BroadcastedTransaction], num_chunks: int) -> None:
+        """
+        Args:
+            items (List[BroadcastedTransaction]): the outcome of each transaction, in the order they were given to the broadcaster.
+            num_chunks (int): the number of "send-multiple" requests (retries not included).
+        """
+        self.items = items
+        self.num_chunks = num_chunks
+
+    @property
+    def num_sent(self) -> int:
+        return sum(1 for item in self.items if item.is_sent)
+
+    @property
+    def num_failed(self) -> int:
+        return len(self.items) - self.num_sent
+
+    def get_hashes(self) -> List[str]:
+        return [item.hash for item in self.items]
+
+    def get_failed(self) -> List[BroadcastedTransaction]:
+        return [item for item in self.items if not item.is_sent]
+
+
+class _TransactionsNotAcceptedError(Exception):
+    def __init__(self) -> None:
+        super().__init__("transaction not accepted")
+
+
+class _Chunk:
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.items: List[BroadcastedTransaction] = []
+        self.size_in_bytes = 0
+        self.dependencies: Set[int] = set()
+
+
+class TransactionsBroadcaster:
+    """
+    TransactionsBroadcaster sends (very) large batches of transactions, by splitting them into chunks
+    which are sent in parallel using "send_transactions()" (i.e. "transaction/send-multiple").
+    """
+
+    def __init__(self,
+                 sender: ITransactionsSender,
+                 max_chunk_size_in_bytes: int = DEFAULT_MAX_CHUNK_SIZE_IN_BYTES,
+                 max_transactions_per_chunk: int = DEFAULT_MAX_TRANSACTIONS_PER_CHUNK,
+                 num_workers: int = DEFAULT_NUM_WORKERS,
+                 num_retries: int = DEFAULT_NUM_RETRIES,
+                 retry_delay_in_milliseconds: int = DEFAULT_RETRY_DELAY_IN_MILLISECONDS,
+                 preserve_order_per_sender: bool = True) -> None:
+        """
+        Args:
+            sender (ITransactionsSender): Used to send the chunks (e.g. a "ProxyNetworkProvider").
+            max_chunk_size_in_bytes (int): The maximum (estimated) size of the JSON payload of a chunk.
+            max_transactions_per_chunk (int): The maximum number of transactions in a chunk.
+            num_workers (int): The number of chunks sent in parallel.
+            num_retries (int): How many times a failed chunk (or the transactions of a chunk which were not accepted) is sent again. The delay between retries is doubled after each attempt.
+            retry_delay_in_milliseconds (int): The delay before the first retry, in milliseconds.
+            preserve_order_per_sender (bool): If set, the transactions of a sender are sent in the order of their nonces, and a chunk is only sent after all previous chunks holding transactions of the same senders have been sent. Once a transaction of a sender is not accepted, the following transactions of that sender are not sent at all (they would be stuck behind a nonce gap).
+        """
+        if max_transactions_per_chunk < 1:
+            raise ValueError("max_transactions_per_chunk must be at least 1")
+        if num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+
+        self.sender = sender
+        self.max_chunk_size_in_bytes = max_chunk_size_in_bytes
+        self.max_transactions_per_chunk = max_transactions_per_chunk
+        self.num_workers = num_workers
+        self.retry_policy = RetryPolicy(num_retries, retry_delay_in_milliseconds)
+        self.preserve_order_per_sender = preserve_order_per_sender
+
+    def broadcast(self, transactions: Sequence[ITransaction]) -> BroadcastResult:
+        items = [BroadcastedTransaction(index, transaction) for index, transaction in enumerate(transactions)]
+
+        ordered_items = self._order_by_sender_and_nonce(items) if self.preserve_order_per_sender else items
+        chunks = self._split_into_chunks(ordered_items)
+        self._send_chunks(chunks)
+
+        return BroadcastResult(items, len(chunks))
+
+    def _order_by_sender_and_nonce(self, items: List[BroadcastedTransaction]) -> List[BroadcastedTransaction]:
+        # Transactions of the same sender are kept together, so that as few chunks as possible depend on each other.
+        items_by_sender: Dict[str, List[BroadcastedTransaction]] = {}
+
+        for item in items:
+            items_by_sender.setdefault(item.transaction.sender, []).append(item)
+
+        ordered: List[BroadcastedTransaction] = []
+        for sender_items in items_by_sender.values():
+            ordered.extend(sorted(sender_items, key=lambda item: item.transaction.nonce))
+
+        return ordered
+
+    def _split_into_chunks(self, items: List[BroadcastedTransaction]) -> List[_Chunk]:
+        chunks: List[_Chunk] = []
+        last_chunk_by_sender: Dict[str, int] = {}
+        chunk: Optional[_Chunk] = None
+
+        for item in items:
+            size = estimate_transaction_size_in_bytes(item.transaction)
+            if chunk is None or self._is_chunk_full(chunk, size):
+                chunk = _Chunk(len(chunks))
+                chunks.append(chunk)
+
+            chunk.items.append(item)
+            chunk.size_in_bytes += size
+
+            if self.preserve_order_per_sender:
+                previous_chunk = last_chunk_by_sender.get(item.transaction.sender)
+                if previous_chunk is not None and previous_chunk != chunk.index:
+                    chunk.dependencies.add(previous_chunk)
+                last_chunk_by_sender[item.transaction.sender] = chunk.index
+
+        return chunks
+
+    def _is_chunk_full(self, chunk: _Chunk, size_of_next_transaction: int) -> bool:
+        if len(chunk.items) >= self.max_transactions_per_chunk:
+            return True
+        return chunk.size_in_bytes + size_of_next_transaction > self.max_chunk_size_in_bytes
+
+    def _send_chunks(self, chunks: List[_Chunk]) -> None:
+        pending: Dict[int, _Chunk] = {chunk.index: chunk for chunk in chunks}
+        completed: Set[int] = set()
+        failed_senders: Set[str] = set()
+        running: Dict["Future[None]", _Chunk] = {}
+
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            while pending or running:
+                ready = [chunk for chunk in pending.values() if chunk.dependencies <= completed]
+
+                for chunk in ready:
+                    del pending[chunk.index]
+                    running[executor.submit(self._send_chunk, chunk, frozenset(failed_senders))] = chunk
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in finished:
+                    chunk = running.pop(future)
+                    future.result()
+                    completed.add(chunk.index)
+
+                    if self.preserve_order_per_sender:
+                        failed_senders.update(item.transaction.sender for item in chunk.items if not item.is_sent)
+
+    def _send_chunk(self, chunk: _Chunk, failed_senders: AbstractSet[str]) -> None:
+        items: List[BroadcastedTransaction] = []
+
+        for item in chunk.items:
+            if item.transaction.sender in failed_senders:
+                item.error = "not sent, since a previous transaction of the sender was not accepted"
+            else:
+                items.append(item)
+
+        def send() -> None:
+            nonlocal items
+
+            for item in items:
+                item.num_attempts += 1
+
+            _, hashes = self.sender.send_transactions([item.transaction for item in items])
+            items = self._mark_as_sent(items, hashes or {})
+
+            # Only the transactions which were not accepted are sent again.
+            if items:
+                raise _TransactionsNotAcceptedError()
+
+        try:
+            if items:
+                self.retry_policy.run(send, is_retryable=lambda _: True)
+        except Exception as error:
+            for item in items:
+                item.error = str(error)
+
+    def _mark_as_sent(self, items: List[BroadcastedTransaction], hashes: Dict[str, str]) -> List[BroadcastedTransaction]:
+        """Records the hashes of the accepted transactions, and returns the ones which were not accepted."""
+        not_accepted: List[BroadcastedTransaction] = []
+
+        # The hashes are indexed by the position of the transaction within the request.
+        for position, item in enumerate(items):
+            tx_hash = hashes.get(str(position), "")
+
+            if tx_hash:
+                item.hash = tx_hash
+                item.is_sent = True
+                item.error = ""
+            else:
+                not_accepted.append(item)
+
+        return not_accepted
+
+
+def estimate_transaction_size_in_bytes(transaction: ITransaction) -> int:
+    """Estimates the size of the JSON representation of the transaction, as sent to the network."""
+    return TRANSACTION_JSON_OVERHEAD_IN_BYTES \
+        + len(str(transaction.nonce)) \
+        + len(str(transaction.value)) \
+        + len(transaction.receiver) \
+        + len(transaction.sender) \
+        + _base64_length(len(transaction.sender_username.encode())) \
+        + _base64_length(len(transaction.receiver_username.encode())) \
+        + len(str(transaction.gas_price)) \
+        + len(str(transaction.gas_limit)) \
+        + _base64_length(len(transaction.data)) \
+        + len(transaction.chain_id) \
+        + len(str(transaction.version)) \
+        + len(str(transaction.options)) \
+        + len(transaction.guardian) \
+        + 2 * len(transaction.signature) \
+        + 2 * len(transaction.guardian_signature)
+
+
+def _base64_length(num_bytes: int) -> int:
+    return 4 * ((num_bytes + 2) // 3)
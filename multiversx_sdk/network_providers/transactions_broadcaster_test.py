@@ -0,0 +1,171 @@
+import json
+import threading
+from typing import Dict, List, Sequence, Tuple
+
+from multiversx_sdk.converters.transactions_converter import \
+    TransactionsConverter
+from multiversx_sdk.core.transaction import Transaction
+from multiversx_sdk.network_providers.errors import GenericError
+from multiversx_sdk.network_providers.proxy_network_provider import \
+    ProxyNetworkProvider
+from multiversx_sdk.network_providers.transactions import ITransaction
+from multiversx_sdk.network_providers.transactions_broadcaster import (
+    TransactionsBroadcaster, estimate_transaction_size_in_bytes)
+from multiversx_sdk.testutils.addresses import ALICE, BOB, CAROL
+from multiversx_sdk.testutils.mock_proxy_server import MockProxyServer
+
+
+class FakeSender:
+    def __init__(self, num_failures: int = 0, rejected_nonces: Sequence[int] = ()) -> None:
+        self.num_failures = num_failures
+        self.rejected_nonces = set(rejected_nonces)
+        self.sent: List[List[ITransaction]] = []
+        self.lock = threading.Lock()
+
+    def send_transactions(self, transactions: Sequence[ITransaction]) -> Tuple[int, Dict[str, str]]:
+        with self.lock:
+            if self.num_failures > 0:
+                self.num_failures -= 1
+                raise GenericError("transaction/send-multiple", "injected failure")
+
+            self.sent.append(list(transactions))
+
+        hashes = {
+            str(index): f"{transaction.sender}-{transaction.nonce}"
+            for index, transaction in enumerate(transactions)
+            if transaction.nonce not in self.rejected_nonces
+        }
+        return len(hashes), hashes
+
+
+def create_transactions(sender: str, nonces: Sequence[int]) -> List[Transaction]:
+    return [Transaction(sender=sender, receiver=BOB, gas_limit=50000, chain_id="D", nonce=nonce, signature=bytes(64)) for nonce in nonces]
+
+
+def test_estimate_transaction_size():
+    converter = TransactionsConverter()
+    transaction = Transaction(
+        sender=ALICE,
+        receiver=BOB,
+        gas_limit=500000,
+        chain_id="D",
+        nonce=42,
+        value=10**18,
+        data=b"ESDTTransfer@54455354@0a",
+        sender_username="alice",
+        signature=bytes(64)
+    )
+
+    serialized = json.dumps(converter.transaction_to_dictionary(transaction))
+    # The separator between the items of the array is included, as well.
+    assert estimate_transaction_size_in_bytes(transaction) == len(serialized) + 2
+
+
+def test_broadcast_splits_into_chunks():
+    sender = FakeSender()
+    broadcaster = TransactionsBroadcaster(sender, max_transactions_per_chunk=3, retry_delay_in_milliseconds=0)
+    transactions = create_transactions(ALICE, range(10))
+
+    result = broadcaster.broadcast(transactions)
+
+    assert result.num_chunks == 4
+    assert [len(chunk) for chunk in sender.sent] == [3, 3, 3, 1]
+    assert result.num_sent == 10
+    assert result.get_hashes() == [f"{ALICE}-{nonce}" for nonce in range(10)]
+
+
+def test_broadcast_splits_by_size():
+    sender = FakeSender()
+    transaction_size = estimate_transaction_size_in_bytes(create_transactions(ALICE, [1])[0])
+    broadcaster = TransactionsBroadcaster(sender, max_chunk_size_in_bytes=transaction_size * 2, retry_delay_in_milliseconds=0)
+
+    result = broadcaster.broadcast(create_transactions(ALICE, range(1, 6)))
+
+    assert result.num_chunks == 3
+    assert result.num_sent == 5
+
+
+def test_broadcast_preserves_nonce_order_per_sender():
+    sender = FakeSender()
+    broadcaster = TransactionsBroadcaster(sender, max_transactions_per_chunk=2, num_workers=8, retry_delay_in_milliseconds=0)
+    transactions = create_transactions(ALICE, [3, 1, 2, 0]) + create_transactions(CAROL, [7, 5, 6])
+
+    result = broadcaster.broadcast(transactions)
+
+    alice_nonces = [tx.nonce for chunk in sender.sent for tx in chunk if tx.sender == ALICE]
+    carol_nonces = [tx.nonce for chunk in sender.sent for tx in chunk if tx.sender == CAROL]
+    assert alice_nonces == [0, 1, 2, 3]
+    assert carol_nonces == [5, 6, 7]
+
+    # Results are reported in the order of the input.
+    assert [item.transaction.nonce for item in result.items] == [3, 1, 2, 0, 7, 5, 6]
+    assert result.items[0].hash == f"{ALICE}-3"
+
+
+def test_broadcast_retries_failed_chunks():
+    sender = FakeSender(num_failures=2)
+    broadcaster = TransactionsBroadcaster(sender, max_transactions_per_chunk=5, num_workers=1, retry_delay_in_milliseconds=1)
+
+    result = broadcaster.broadcast(create_transactions(ALICE, range(5)))
+
+    assert result.num_sent == 5
+    assert all(item.num_attempts == 3 for item in result.items)
+
+
+def test_broadcast_reports_failures():
+    sender = FakeSender(num_failures=10, rejected_nonces=[6])
+    broadcaster = TransactionsBroadcaster(sender, max_transactions_per_chunk=5, num_workers=1, num_retries=1, retry_delay_in_milliseconds=1)
+
+    result = broadcaster.broadcast(create_transactions(ALICE, range(5)))
+    assert result.num_failed == 5
+    assert "injected failure" in result.items[0].error
+    assert result.items[0].num_attempts == 2
+
+    sender.num_failures = 0
+    result = broadcaster.broadcast(create_transactions(ALICE, range(5, 8)))
+    assert [item.is_sent for item in result.items] == [True, False, True]
+    assert result.get_failed()[0].transaction.nonce == 6
+    assert result.get_failed()[0].error == "transaction not accepted"
+    assert [item.num_attempts for item in result.items] == [1, 2, 1]
+
+
+def test_broadcast_retries_transactions_not_accepted():
+    sender = FakeSender(rejected_nonces=[6])
+    broadcaster = TransactionsBroadcaster(sender, max_transactions_per_chunk=5, num_workers=1, num_retries=2, retry_delay_in_milliseconds=1)
+
+    broadcaster.broadcast(create_transactions(ALICE, range(5, 8)))
+
+    # Only the rejected transaction is sent again.
+    assert [[tx.nonce for tx in chunk] for chunk in sender.sent] == [[5, 6, 7], [6], [6]]
+
+
+def test_broadcast_skips_the_next_transactions_of_a_failed_sender():
+    sender = FakeSender(rejected_nonces=[3])
+    broadcaster = TransactionsBroadcaster(sender, max_transactions_per_chunk=2, num_workers=4, num_retries=0)
+    transactions = create_transactions(ALICE, range(6)) + create_transactions(CAROL, range(10, 14))
+
+    result = broadcaster.broadcast(transactions)
+
+    # Alice's nonce 3 was not accepted: nonces 4 and 5 (in a later chunk) are not sent, to avoid a nonce gap.
+    assert [item.transaction.nonce for item in result.get_failed()] == [3, 4, 5]
+    assert result.items[4].error == "not sent, since a previous transaction of the sender was not accepted"
+    assert result.items[4].num_attempts == 0
+    assert all(tx.nonce not in [4, 5] for chunk in sender.sent for tx in chunk)
+
+    # Other senders are not affected.
+    assert all(item.is_sent for item in result.items[6:])
+
+
+def test_broadcast_against_mock_proxy():
+    with MockProxyServer() as server:
+        server.inject_failures(1)
+        proxy = ProxyNetworkProvider(server.url)
+        broadcaster = TransactionsBroadcaster(proxy, max_transactions_per_chunk=10, retry_delay_in_milliseconds=1)
+
+        transactions = create_transactions(ALICE, range(25)) + create_transactions(CAROL, range(25))
+        result = broadcaster.broadcast(transactions)
+
+    assert result.num_sent == 50
+    assert len(set(result.get_hashes())) == 50
+    assert result.num_chunks == 5
+    assert server.num_requests == 6
@@ -0,0 +1,101 @@
+import base64
+from typing import Any, Dict, List
+
+import pytest
+
+from multiversx_sdk.converters.transactions_converter import \
+    TransactionsConverter
+from multiversx_sdk.core.address import Address
+from multiversx_sdk.network_providers.transaction_status import \
+    TransactionStatus
+from multiversx_sdk.network_providers.transactions import (
+    LazyTransactionOnNetwork, TransactionOnNetwork)
+from multiversx_sdk.testutils.hyperblocks import load_hyperblock_response
+
+sample_transactions: List[Dict[str, Any]] = load_hyperblock_response()["data"]["hyperblock"]["transactions"]
+
+
+class TestLazyTransactionOnNetwork:
+    def test_lazy_parsing_is_equivalent_to_eager_parsing(self):
+        for response in sample_transactions:
+            eager = TransactionOnNetwork.from_proxy_http_response(response["hash"], response)
+            lazy = LazyTransactionOnNetwork.from_proxy_http_response(response["hash"], response)
+
+            assert lazy.to_dictionary() == eager.to_dictionary()
+            assert lazy.sender.to_bech32() == eager.sender.to_bech32()
+            assert lazy.receipt.hash == eager.receipt.hash
+
+    def test_contract_results_are_the_same_as_with_eager_parsing(self):
+        response = sample_transactions[2]
+
+        for create_eager, create_lazy in [
+            (TransactionOnNetwork.from_http_response, LazyTransactionOnNetwork.from_http_response),
+            (TransactionOnNetwork.from_proxy_http_response, LazyTransactionOnNetwork.from_proxy_http_response),
+            (TransactionOnNetwork.from_api_http_response, LazyTransactionOnNetwork.from_api_http_response),
+        ]:
+            eager = create_eager(response["hash"], response)
+            lazy = create_lazy(response["hash"], response)
+            assert lazy.to_dictionary() == eager.to_dictionary()
+
+        # Without knowing the source of the response, the contract results are not parsed (in both cases).
+        assert LazyTransactionOnNetwork.from_http_response(response["hash"], response).contract_results.items == []
+
+    def test_lazy_parsing_of_api_response(self):
+        response = {
+            "txHash": "abba",
+            "sender": "erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th",
+            "receiver": "erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx",
+            "data": base64.b64encode(b"hello").decode(),
+            "status": "success",
+            "results": [
+                {"hash": "b0", "nonce": 2, "data": base64.b64encode(b"@6f6b").decode(), "callType": "0"},
+                {"hash": "b1", "nonce": 1, "data": base64.b64encode(b"@6f6b@2a").decode(), "callType": "0"}
+            ]
+        }
+
+        eager = TransactionOnNetwork.from_api_http_response("abba", response)
+        lazy = LazyTransactionOnNetwork.from_api_http_response("abba", response)
+
+        assert lazy.is_completed
+        assert lazy.data == "hello"
+        assert [item.data for item in lazy.contract_results.items] == ["@6f6b@2a", "@6f6b"]
+        assert lazy.to_dictionary() == eager.to_dictionary()
+
+    def test_fields_are_parsed_on_first_access(self):
+        response = sample_transactions[2]
+        transaction = LazyTransactionOnNetwork.from_proxy_http_response(response["hash"], response, TransactionStatus("success"))
+
+        assert transaction.status.is_successful()
+        assert transaction.is_completed
+        assert "logs" not in transaction.__dict__
+        assert "contract_results" not in transaction.__dict__
+
+        assert len(transaction.logs.events) == 4
+        assert "logs" in transaction.__dict__
+        assert "contract_results" not in transaction.__dict__
+
+        assert len(transaction.contract_results.items) == 2
+        assert transaction.logs is transaction.logs
+
+    def test_fields_can_be_assigned(self):
+        response = sample_transactions[0]
+        transaction = LazyTransactionOnNetwork.from_proxy_http_response(response["hash"], response)
+
+        transaction.sender = Address.new_from_bech32("erd1k2s324ww2g0yj38qn2ch2jwctdy8mnfxep94q9arncc6xecg3xaq6mjse8")
+        assert transaction.sender.to_bech32() == "erd1k2s324ww2g0yj38qn2ch2jwctdy8mnfxep94q9arncc6xecg3xaq6mjse8"
+
+        with pytest.raises(AttributeError):
+            getattr(transaction, "foobar")
+
+    def test_conversion_to_outcome(self):
+        converter = TransactionsConverter()
+        response = sample_transactions[2]
+
+        eager = TransactionOnNetwork.from_proxy_http_response(response["hash"], response)
+        lazy = LazyTransactionOnNetwork.from_proxy_http_response(response["hash"], response)
+
+        eager_outcome = converter.transaction_on_network_to_outcome(eager)
+        lazy_outcome = converter.transaction_on_network_to_outcome(lazy)
+
+        assert [event.topics for event in lazy_outcome.logs.events] == [event.topics for event in eager_outcome.logs.events]
+        assert [result.data for result in lazy_outcome.transaction_results] == [result.data for result in eager_outcome.transaction_results]
@@ -0,0 +1,40 @@
+import time
+import tracemalloc
+from typing import Any, Callable, Tuple
+
+
+def measure_time(fn: Callable[[], Any], repeat: int = 1) -> Tuple[float, Any]:
+    """Runs the function `repeat` times; returns the best duration (in seconds) and the last result."""
+    best = float("inf")
+    result = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+
+    return best, result
+
+
+def measure_peak_memory(fn: Callable[[], Any]) -> Tuple[int, Any]:
+    """Runs the function once; returns the peak of the traced memory (in bytes) and the result."""
+    tracemalloc.start()
+
+    try:
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak, result
+
+
+def report(title: str, **metrics: Any) -> None:
+    formatted = ", ".join(f"{key} = {_format_metric(value)}" for key, value in metrics.items())
+    print(f"\n[benchmark] {title}: {formatted}")
+
+
+def _format_metric(value: Any) -> str:
+    if isinstance(value, float):
+        return f"{value:.4f}"
+    return str(value)
@@ -0,0 +1,42 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+testdata = Path(__file__).parent / "testdata"
+
+
+def load_hyperblock_response() -> Dict[str, Any]:
+    """
+    Loads a hand-made response of "hyperblock/by-nonce/{nonce}", in the format of the Proxy, holding 4 transactions of different kinds
+    (an EGLD transfer, an ESDT transfer, a contract call with results and logs, a failed multi-token transfer). Hashes and signatures are placeholders.
+    """
+    return json.loads((testdata / "hyperblock.json").read_text())
+
+
+def create_hyperblock(nonce: int, num_transactions: int) -> Dict[str, Any]:
+    """
+    Creates a hyperblock with the given number of transactions, by replicating the (4) transactions of the hand-made one
+    (see "load_hyperblock_response()"). Only the size is realistic, not the variety of the transactions.
+    """
+    hyperblock: Dict[str, Any] = load_hyperblock_response()["data"]["hyperblock"]
+    sample_transactions: List[Dict[str, Any]] = hyperblock["transactions"]
+    transactions: List[Dict[str, Any]] = []
+
+    for index in range(num_transactions):
+        # Shallow copies are enough, since the nested objects are never mutated.
+        transaction = dict(sample_transactions[index % len(sample_transactions)])
+        transaction["hash"] = hashlib.sha256(f"{nonce}/{index}".encode()).hexdigest()
+        transaction["nonce"] = index
+        transaction["hyperblockNonce"] = nonce
+        transactions.append(transaction)
+
+    hyperblock["nonce"] = nonce
+    hyperblock["hash"] = hashlib.sha256(f"{nonce}".encode()).hexdigest()
+    hyperblock["numTxs"] = num_transactions
+    hyperblock["transactions"] = transactions
+    return hyperblock
+
+
+def create_hyperblock_response(nonce: int, num_transactions: int) -> Dict[str, Any]:
+    return {"data": {"hyperblock": create_hyperblock(nonce, num_transactions)}, "error": "", "code": "successful"}
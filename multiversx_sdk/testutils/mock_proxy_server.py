@@ -0,0 +1,96 @@
+import hashlib
+import json
+from typing import Any, Dict, Tuple
+
+from multiversx_sdk.network_providers.local_proxy_server import (
+    LocalProxyServer, ProxyRequest, ProxyRoute, ProxyRouteHandler)
+from multiversx_sdk.testutils.addresses import ALICE
+from multiversx_sdk.testutils.hyperblocks import create_hyperblock_response
+
+MockRequest = ProxyRequest
+MockRoute = ProxyRoute
+MockRouteHandler = ProxyRouteHandler
+
+
+class MockProxyServer(LocalProxyServer):
+    """
+    A small, local HTTP server which mimics some of the Proxy routes (e.g. "transaction/send-multiple").
+    Meant to be used by tests and benchmarks, where a real network is not available.
+    """
+
+    def __init__(self, latency_in_milliseconds: int = 0) -> None:
+        super().__init__(latency_in_milliseconds)
+        self.highest_hyperblock_nonce = 0
+
+        self.on("POST", r"/transaction/send-multiple", self._handle_send_multiple)
+        self.on("POST", r"/transaction/send", self._handle_send)
+
+    def serve_hyperblocks(self, highest_nonce: int, num_transactions_per_hyperblock: int = 0) -> None:
+        """
+        Serves "hyperblock/by-nonce/{nonce}" (for nonces up to `highest_nonce`, inclusive) and the network status of the metachain.
+        The highest nonce can be changed later (e.g. to simulate the progress of the chain) by setting `highest_hyperblock_nonce`.
+        """
+        self.highest_hyperblock_nonce = highest_nonce
+
+        def handle_get_hyperblock(request: MockRequest) -> Tuple[int, Any]:
+            nonce = int(request.match.group(1))
+            if nonce > self.highest_hyperblock_nonce:
+                return 404, {"error": "getting hyperblock failed: block not found", "code": "internal_issue"}
+            return 200, create_hyperblock_response(nonce, num_transactions_per_hyperblock)
+
+        def handle_get_network_status(request: MockRequest) -> Tuple[int, Any]:
+            status = {"erd_nonce": self.highest_hyperblock_nonce + 1, "erd_highest_final_nonce": self.highest_hyperblock_nonce}
+            return 200, {"data": {"status": status}, "code": "successful"}
+
+        self.on("GET", r"/hyperblock/by-nonce/(\d+)", handle_get_hyperblock)
+        self.on("GET", r"/network/status/4294967295", handle_get_network_status)
+
+    def serve_tokens(self, num_fungible_tokens: int, num_nonfungible_tokens: int) -> None:
+        """Serves "address/{address}/esdt", with the given number of fungible and non-fungible tokens (the same, for any address)."""
+        response = _create_esdts_response(num_fungible_tokens, num_nonfungible_tokens)
+
+        def handle_get_esdts(request: MockRequest) -> Tuple[int, Any]:
+            return 200, response
+
+        self.on("GET", r"/address/(\w+)/esdt", handle_get_esdts)
+
+    def __enter__(self) -> "MockProxyServer":
+        self.start()
+        return self
+
+    def _handle_send(self, request: MockRequest) -> Tuple[int, Any]:
+        transaction = request.json()
+        return 200, {"data": {"txHash": _compute_fake_hash(transaction)}, "code": "successful"}
+
+    def _handle_send_multiple(self, request: MockRequest) -> Tuple[int, Any]:
+        transactions = request.json()
+        hashes = {str(index): _compute_fake_hash(transaction) for index, transaction in enumerate(transactions)}
+        return 200, {"data": {"numOfSentTxs": len(hashes), "txsHashes": hashes}, "code": "successful"}
+
+
+def _compute_fake_hash(transaction: Any) -> str:
+    serialized = json.dumps(transaction, sort_keys=True).encode()
+    return hashlib.sha256(serialized).hexdigest()
+
+
+def _create_esdts_response(num_fungible_tokens: int, num_nonfungible_tokens: int) -> Dict[str, Any]:
+    esdts: Dict[str, Any] = {}
+
+    for index in range(num_fungible_tokens):
+        identifier = f"FUNG{index}-abcdef"
+        esdts[identifier] = {"tokenIdentifier": identifier, "balance": str(index + 1)}
+
+    for index in range(num_nonfungible_tokens):
+        nonce = index + 1
+        identifier = f"NFT-abcdef-{nonce:02x}"
+        esdts[identifier] = {
+            "tokenIdentifier": identifier,
+            "balance": "1",
+            "nonce": nonce,
+            "attributes": "dGFnczo=",
+            "creator": ALICE,
+            "royalties": "750",
+            "uris": ["aHR0cHM6Ly9leGFtcGxlLmNvbS9uZnQuanNvbg=="]
+        }
+
+    return {"data": {"esdts": esdts}, "code": "successful"}